@@ -83,6 +83,7 @@ def _delete_owned_content(user) -> None:
         Review,
         ReviewLike,
     )
+    from .services.feed_counters import recompute_feed_post_counters
 
     # Ponuky + portfólio (S3 obrázky rieši post_delete signál na *Image modeloch).
     OfferedSkill.objects.filter(user=user).delete()
@@ -94,8 +95,15 @@ def _delete_owned_content(user) -> None:
     # rovnaká konvencia ako Review.reviewer/ReviewLike. Nahlásenia, ktoré user
     # podal na cudzí obsah, sa NEmažú (moderačný audit – ako Photo/Review/UserReport).
     FeedPost.objects.filter(author=user).delete()
+    # Denormalizované počítadlá cudzích príspevkov sa po hromadnom zmazaní
+    # prepočítajú jedným UPDATE-om (nie delta na každý zmazaný riadok).
+    touched_post_ids = set(
+        FeedPostComment.objects.filter(author=user).values_list("post_id", flat=True)
+    ) | set(FeedPostLike.objects.filter(user=user).values_list("post_id", flat=True))
     FeedPostComment.objects.filter(author=user).delete()
     FeedPostLike.objects.filter(user=user).delete()
+    if touched_post_ids:
+        recompute_feed_post_counters(FeedPost.objects.filter(pk__in=touched_post_ids))
     # Označenia tohto používateľa v CUDZÍCH príspevkoch. FeedPostTag.tagged_user
     # je síce CASCADE, ale User riadok sa nemaže (len anonymizuje), takže CASCADE
     # nevystrelí – bez tohto riadku by v cudzích príspevkoch ostalo označenie
@@ -196,12 +204,16 @@ def _scrub_user_messages(user) -> None:
 
     Používa bulk_update (jeden DB zápis) namiesto save() v slučke, aby
     operácia škálovala aj pri veľkom počte správ.
+
+    Obrázok zdieľaný forwardom (MessageImageBlob) sa len odreferencuje – súbory
+    zmaže až posledná správa, ktorá naň odkazuje.
     """
     from messaging.models import Message
+    from messaging.services.image_blobs import release_message_image_blobs
 
     messages = list(
         Message.objects.filter(sender=user, is_deleted=False).only(
-            "id", "image", "image_thumbnail"
+            "id", "conversation_id", "image", "image_thumbnail", "image_blob"
         )
     )
     if not messages:
@@ -211,23 +223,40 @@ def _scrub_user_messages(user) -> None:
     # konkrétneho FieldFile (image.storage / image_thumbnail.storage), lebo obrázky
     # správ môžu byť na privátnom S3 (PrivateMessageStorage), nie na default_storage.
     storage_refs: list[tuple] = []
+    blob_ids: list[int] = []
     for message in messages:
-        image_file = message.image
-        thumbnail_file = message.image_thumbnail
-        image_name = getattr(image_file, "name", "") or ""
-        thumbnail_name = getattr(thumbnail_file, "name", "") or ""
-        if image_name:
-            storage_refs.append((getattr(image_file, "storage", None), image_name))
-        if thumbnail_name:
-            storage_refs.append((getattr(thumbnail_file, "storage", None), thumbnail_name))
+        if message.image_blob_id:
+            blob_ids.append(message.image_blob_id)
+        else:
+            image_file = message.image
+            thumbnail_file = message.image_thumbnail
+            image_name = getattr(image_file, "name", "") or ""
+            thumbnail_name = getattr(thumbnail_file, "name", "") or ""
+            if image_name:
+                storage_refs.append((getattr(image_file, "storage", None), image_name))
+            if thumbnail_name:
+                storage_refs.append((getattr(thumbnail_file, "storage", None), thumbnail_name))
         message.is_deleted = True
         message.text = ""
         message.image = ""
         message.image_thumbnail = ""
+        message.image_blob = None
 
     Message.objects.bulk_update(
-        messages, ["is_deleted", "text", "image", "image_thumbnail"]
+        messages, ["is_deleted", "text", "image", "image_thumbnail", "image_blob"]
+    )
+    release_message_image_blobs(blob_ids)
+
+    # Zmazané správy sa už nerátajú do unread badge protistrán.
+    from messaging.models import ConversationParticipant
+    from messaging.services.inbox import refresh_inbox_entries
+    from messaging.services.unread_counters import recompute_unread_counts
+
+    conversation_ids = {message.conversation_id for message in messages}
+    recompute_unread_counts(
+        ConversationParticipant.objects.filter(conversation_id__in=conversation_ids)
     )
+    refresh_inbox_entries(conversation_ids=conversation_ids)
 
     # Súbory zmaž až po úspešnom commite (pri rollbacku sa on_commit zahodí).
     for storage, name in storage_refs:
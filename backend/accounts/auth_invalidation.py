@@ -0,0 +1,160 @@
+"""
+Cross-worker invalidácia per-process (L1) auth cache cez Redis pub/sub.
+
+`invalidate_user_auth_cache` po zmazaní Redis kľúča publikuje user_id na kanál;
+každý gunicorn worker má jedno daemon vlákno, ktoré kanál počúva a vyhodí
+príslušný záznam zo svojej L1. Kým vlákno nie je prihlásené na odber (štart,
+výpadok Redis, reconnect), listener hlási `healthy=False` a L1 sa v režime
+"auto" nepoužíva – worker tak nikdy nedrží snapshot, o ktorého zmene by sa
+nedozvedel. Po každom (re)subscribe sa L1 celá zahodí, lebo správy z obdobia
+výpadku sú stratené.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+AUTH_INVALIDATION_CHANNEL = "auth_user_invalidate"
+# Wildcard správa – zahoď celú L1 (napr. hromadný zásah cez update()).
+AUTH_INVALIDATION_ALL = "*"
+
+_RECONNECT_BACKOFF_SECONDS = (0.5, 1.0, 2.0, 5.0, 10.0)
+
+
+def redis_pubsub_available() -> bool:
+    """Pub/sub ide len cez django_redis; locmem/dev backend ho nemá."""
+    cache_backend = str(
+        (getattr(settings, "CACHES", {}) or {}).get("default", {}).get("BACKEND", "")
+    )
+    return cache_backend.startswith("django_redis.")
+
+
+def _redis_client():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def auth_invalidation_channel() -> str:
+    # make_key → rovnaký prefix/verzia ako cache kľúče (staging vs. produkcia).
+    return cache.make_key(AUTH_INVALIDATION_CHANNEL)
+
+
+def publish_user_auth_invalidation(user_id: int | str) -> bool:
+    """Best-effort broadcast; chyba Redis sa len zaloguje (TTL L1 je poistka)."""
+    if not redis_pubsub_available():
+        return False
+    try:
+        _redis_client().publish(auth_invalidation_channel(), str(user_id))
+        return True
+    except Exception as exc:
+        logger.warning("Auth invalidation publish failed for user_id=%s: %s", user_id, exc)
+        return False
+
+
+class AuthInvalidationListener:
+    """Daemon vlákno s jedným SUBSCRIBE spojením na proces."""
+
+    def __init__(
+        self,
+        *,
+        on_invalidate: Callable[[int], None],
+        on_reset: Callable[[], None],
+        client_factory: Callable[[], object] = _redis_client,
+    ):
+        self._on_invalidate = on_invalidate
+        self._on_reset = on_reset
+        self._client_factory = client_factory
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._subscribed = threading.Event()
+        self._stopped = threading.Event()
+
+    @property
+    def healthy(self) -> bool:
+        thread = self._thread
+        return (
+            self._pid == os.getpid()
+            and thread is not None
+            and thread.is_alive()
+            and self._subscribed.is_set()
+        )
+
+    def ensure_started(self) -> bool:
+        """Spusti vlákno (aj po fork-e gunicorn workera); vráti `healthy`."""
+        if self.healthy:
+            return True
+        with self._lock:
+            thread = self._thread
+            if self._pid != os.getpid() or thread is None or not thread.is_alive():
+                self._pid = os.getpid()
+                self._subscribed.clear()
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="auth-invalidation-listener",
+                    daemon=True,
+                )
+                self._thread.start()
+        return self.healthy
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._subscribed.clear()
+
+    def handle_message(self, data) -> None:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", "ignore")
+        data = str(data or "").strip()
+        if data == AUTH_INVALIDATION_ALL:
+            self._on_reset()
+            return
+        try:
+            user_id = int(data)
+        except ValueError:
+            return
+        if user_id > 0:
+            self._on_invalidate(user_id)
+
+    def _run(self) -> None:
+        attempt = 0
+        while not self._stopped.is_set():
+            pubsub = None
+            try:
+                pubsub = self._client_factory().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(auth_invalidation_channel())
+                # Čo prišlo pred subscribe, sme nepočuli – začni s prázdnou L1.
+                self._on_reset()
+                self._subscribed.set()
+                attempt = 0
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.handle_message(message.get("data"))
+            except Exception as exc:
+                logger.warning("Auth invalidation listener disconnected: %s", exc)
+            finally:
+                self._subscribed.clear()
+                self._on_reset()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            if self._stopped.is_set():
+                break
+            delay = _RECONNECT_BACKOFF_SECONDS[
+                min(attempt, len(_RECONNECT_BACKOFF_SECONDS) - 1)
+            ]
+            attempt += 1
+            time.sleep(delay)
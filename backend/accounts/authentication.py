@@ -2,7 +2,8 @@
 Custom JWT authentication for Swaply.
 
 - Uses Redis/Django cache for blacklist checks.
-- Keeps only minimal auth metadata in cross-process cache.
+- Keeps only minimal auth metadata in cross-process cache, fronted by an
+  optional per-process L1 tier invalidated over Redis pub/sub.
 - Returns a real User model instance on every request.
 - On auth-cache hit it may return a deferred/lazy User that materializes the
   full DB row only when non-auth profile fields are actually accessed.
@@ -34,6 +35,7 @@ from .authentication_helpers import (  # noqa: F401
     _redis_user_cache_key,
     _serialize_user_for_cache,
     _should_skip_auth_user_cache_set,
+    _user_cache_epoch,
     _user_cache_get,
     _user_cache_set,
     invalidate_user_auth_cache,
@@ -129,10 +131,14 @@ class SwaplyJWTAuthentication(JWTAuthentication):
             except Exception:
                 conn_was_none = False
 
-            cached_state = None
+            # L1 (per-process) → Redis → DB. Epocha sa číta pred Redis/DB, aby
+            # súbežná invalidácia nenechala v L1 starý stav.
+            l1_epoch = _user_cache_epoch()
+            cached_state = _user_cache_get(int(user_id))
+            l1_hit = cached_state is not None
             cache_get_ms = 0.0
-            cache_hit = False
-            if _USER_REDIS_TTL_SECONDS > 0:
+            cache_hit = l1_hit
+            if not l1_hit and _USER_REDIS_TTL_SECONDS > 0:
                 t_cache0 = time.perf_counter()
                 try:
                     cached_state = _parse_cached_auth_state(
@@ -154,6 +160,8 @@ class SwaplyJWTAuthentication(JWTAuthentication):
                 if not cached_state["is_active"]:
                     invalidate_user_auth_cache(int(user_id))
                     raise InvalidToken("User is inactive")
+                if not l1_hit:
+                    _user_cache_set(int(user_id), cached_state, epoch=l1_epoch)
                 user = _build_lazy_auth_user(User, cached_state)
             else:
                 t_db_connect0 = time.perf_counter()
@@ -171,6 +179,9 @@ class SwaplyJWTAuthentication(JWTAuthentication):
                 if not user.is_active:
                     invalidate_user_auth_cache(int(user_id))
                     raise InvalidToken("User is inactive")
+                _user_cache_set(
+                    int(user_id), _serialize_user_for_cache(user), epoch=l1_epoch
+                )
 
                 if _USER_REDIS_TTL_SECONDS > 0 and not _should_skip_auth_user_cache_set(
                     cache_get_ms
@@ -205,6 +216,7 @@ class SwaplyJWTAuthentication(JWTAuthentication):
                     if not isinstance(st, dict):
                         st = {}
                     st["auth_blacklist"] = (t_bl1 - t_bl0) * 1000.0
+                    st["auth_user_l1_hit"] = 1.0 if l1_hit else 0.0
                     st["auth_user_cache_get"] = cache_get_ms
                     st["auth_user_cache_hit"] = 1.0 if cache_hit else 0.0
                     st["auth_user_cache_miss"] = 0.0 if cache_hit else 1.0
@@ -14,6 +14,13 @@ from collections import OrderedDict
 from types import MethodType
 
 from django.core.cache import cache
+from django.db import transaction
+
+from .auth_invalidation import (
+    AuthInvalidationListener,
+    publish_user_auth_invalidation,
+    redis_pubsub_available,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +49,17 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
-# Per-process user cache is intentionally disabled. A worker-local cached User
-# object cannot be invalidated reliably across workers and caused stale profile
-# data after profile updates, refreshes, and re-logins.
-_USER_CACHE_TTL_SECONDS = 0
-_USER_CACHE_MAX = 0
+# Per-process (L1) tier drží len minimálny auth stav (rovnaký dict ako Redis
+# payload), nikdy User objekt – ten sa pri každom requeste skladá nanovo ako
+# lazy User, takže profilové polia sa čítajú čerstvo z DB (worker-local User
+# objekty kedysi spôsobovali zastarané profily po update/re-logine).
+#
+# AUTH_USER_L1_CACHE: "auto" (default) = L1 len kým beží pub/sub listener
+# (django_redis), "1" = vždy (jeden proces, invalidácia len lokálna), "0" = vypnuté.
+# TTL je horná hranica zastaranosti aj pri stratenej pub/sub správe.
+_USER_CACHE_MODE = (os.getenv("AUTH_USER_L1_CACHE") or "auto").strip().lower()
+_USER_CACHE_TTL_SECONDS = _env_float("AUTH_USER_L1_CACHE_TTL_SECONDS", 10.0)
+_USER_CACHE_MAX = _env_int("AUTH_USER_L1_CACHE_MAX", 10000)
 
 # Cross-process cache TTL (Redis via Django cache). We keep only auth metadata
 # here, never profile fields or unnecessary PII.
@@ -60,7 +73,10 @@ _AUTH_LAZY_USER_ENABLED = (
 )
 _AUTH_CACHE_FIELD_NAMES = ("id", "is_active", "is_staff", "is_superuser")
 _USER_CACHE_LOCK = threading.Lock()
-_USER_CACHE: "OrderedDict[int, tuple[float, object]]" = OrderedDict()
+_USER_CACHE: "OrderedDict[int, tuple[float, dict]]" = OrderedDict()
+# Zvyšuje sa pri každej invalidácii. Request, ktorý čítal stav pred invalidáciou,
+# ho do L1 nezapíše (inak by mohol prepísať práve zahodený záznam starým stavom).
+_USER_CACHE_EPOCH = 0
 
 _BLACKLIST_CACHE_TTL_SECONDS = _env_int("AUTH_BLACKLIST_CACHE_TTL_SECONDS", 60)
 _BLACKLIST_CACHE_MAX = _env_int("AUTH_BLACKLIST_CACHE_MAX", 20000)
@@ -109,16 +125,72 @@ def _bl_cache_set(jti: str, val: bool) -> None:
                 break
 
 
-def _user_cache_get(user_id: int):
-    # Disabled by design; keep helper for compatibility and explicit cleanup paths.
-    _ = user_id
-    return None
+def _user_cache_drop(user_id: int) -> None:
+    global _USER_CACHE_EPOCH
+    with _USER_CACHE_LOCK:
+        _USER_CACHE_EPOCH += 1
+        _USER_CACHE.pop(int(user_id), None)
+
+
+def _user_cache_clear() -> None:
+    global _USER_CACHE_EPOCH
+    with _USER_CACHE_LOCK:
+        _USER_CACHE_EPOCH += 1
+        _USER_CACHE.clear()
+
+
+_USER_CACHE_LISTENER = AuthInvalidationListener(
+    on_invalidate=_user_cache_drop,
+    on_reset=_user_cache_clear,
+)
+
+
+def _user_cache_enabled() -> bool:
+    if _USER_CACHE_TTL_SECONDS <= 0 or _USER_CACHE_MAX <= 0:
+        return False
+    if _USER_CACHE_MODE in {"0", "false", "no", "off"}:
+        return False
+    if _USER_CACHE_MODE in {"1", "true", "yes", "on"}:
+        return True
+    if not redis_pubsub_available():
+        return False
+    return _USER_CACHE_LISTENER.ensure_started()
 
 
-def _user_cache_set(user_id: int, user):
-    # Disabled by design; keep helper for compatibility and explicit cleanup paths.
-    _ = (user_id, user)
-    return
+def _user_cache_epoch() -> int:
+    return _USER_CACHE_EPOCH
+
+
+def _user_cache_get(user_id: int) -> dict | None:
+    """Auth stav z L1 alebo None (vypnutá L1, miss, expirácia)."""
+    if not _user_cache_enabled():
+        return None
+    now = time.monotonic()
+    key = int(user_id)
+    with _USER_CACHE_LOCK:
+        item = _USER_CACHE.get(key)
+        if not item:
+            return None
+        exp, state = item
+        if exp < now:
+            _USER_CACHE.pop(key, None)
+            return None
+        _USER_CACHE.move_to_end(key)
+        return dict(state)
+
+
+def _user_cache_set(user_id: int, state: dict | None, *, epoch: int | None = None) -> None:
+    """Ulož auth stav do L1; `epoch` = hodnota `_user_cache_epoch()` pred čítaním."""
+    if not state or not _user_cache_enabled():
+        return
+    key = int(user_id)
+    with _USER_CACHE_LOCK:
+        if epoch is not None and epoch != _USER_CACHE_EPOCH:
+            return
+        _USER_CACHE[key] = (time.monotonic() + float(_USER_CACHE_TTL_SECONDS), dict(state))
+        _USER_CACHE.move_to_end(key)
+        while len(_USER_CACHE) > _USER_CACHE_MAX:
+            _USER_CACHE.popitem(last=False)
 
 
 def _redis_user_cache_key(user_id: int) -> str:
@@ -260,10 +332,17 @@ def invalidate_user_auth_cache(user_id: int | None) -> None:
         )
 
     try:
-        with _USER_CACHE_LOCK:
-            _USER_CACHE.pop(int(user_id), None)
+        _user_cache_drop(int(user_id))
     except Exception:
         pass
+    # Ostatné workery sa o zmene dozvedia cez pub/sub (ich L1 záznam zahodí
+    # listener). Až po commite – skôr by si ho mohli znova načítať ešte starý.
+    try:
+        transaction.on_commit(
+            lambda user_id=int(user_id): publish_user_auth_invalidation(user_id)
+        )
+    except Exception:
+        publish_user_auth_invalidation(int(user_id))
 
 
 def warm_user_auth_cache(user) -> bool:
@@ -1,9 +1,9 @@
 """Spracovanie fotky FeedPost-u (Fáza 1).
 
-ZÁMERNE znovupoužíva low-level helpery z ``portfolio.image_processing``
-(decode + EXIF/GPS strip + WEBP varianty + storage upload/delete). Sú to čisté
-funkcie bez väzby na PortfolioImage model – kópia by časom rozišla GDPR logiku
-(EXIF strip) a moderáciu. Record-handling (select_for_update, status prechody)
+ZÁMERNE znovupoužíva zdieľaný engine ``swaply.image_variants`` (decode +
+EXIF/GPS strip + WEBP varianty + súbežný upload) a storage helpery z
+``portfolio.image_processing``. Sú to čisté funkcie bez väzby na PortfolioImage
+model – kópia by časom rozišla GDPR logiku (EXIF strip) a moderáciu. Record-handling (select_for_update, status prechody)
 je feed-špecifický, lebo fotka žije priamo na FeedPost (max 1), nie v child
 tabuľke ako PortfolioImage.
 """
@@ -20,18 +20,22 @@ from django.db import transaction
 from django.utils import timezone
 
 from portfolio.image_processing import (
-    _decode_image,
     _delete_local_key,
     _delete_s3_key,
     _read_local_key,
     _upload_local_variant,
     _upload_variant,
-    _variant_bytes,
     _variant_settings,
 )
 from portfolio.image_storage import get_s3_client as _s3_client
 from portfolio.local_upload import local_portfolio_upload_enabled
 from swaply.image_moderation import check_image_safety
+from swaply.image_variants import (
+    VariantSpec,
+    decode_image,
+    render_variants,
+    upload_variants,
+)
 
 from accounts.models import FeedPost
 
@@ -181,8 +185,9 @@ def process_feed_post_image_record(feed_post_id: int) -> None:
         )
         return
 
+    settings_map = _variant_settings()
     try:
-        decoded = _decode_image(raw_bytes)
+        decoded = decode_image(raw_bytes, max_side=settings_map["large"])
     except Exception:
         _reject_feed_image(
             feed_post_id,
@@ -192,20 +197,18 @@ def process_feed_post_image_record(feed_post_id: int) -> None:
         )
         return
 
-    settings_map = _variant_settings()
-    thumbnail_bytes, _thumbnail_size = _variant_bytes(
+    variants = render_variants(
         decoded,
-        max_side=settings_map["thumbnail"],
-        quality=settings_map["quality"],
-    )
-    large_bytes, large_size = _variant_bytes(
-        decoded,
-        max_side=settings_map["large"],
+        (
+            VariantSpec("large", settings_map["large"]),
+            VariantSpec("thumbnail", settings_map["thumbnail"]),
+        ),
         quality=settings_map["quality"],
     )
+    large = variants["large"]
 
     try:
-        check_image_safety(io.BytesIO(large_bytes))
+        check_image_safety(io.BytesIO(large.payload))
     except ValidationError:
         _reject_feed_image(
             feed_post_id,
@@ -219,22 +222,22 @@ def process_feed_post_image_record(feed_post_id: int) -> None:
     key_prefix = f"{storage_prefix}/{feed_post_id}/{os.urandom(16).hex()}"
     thumbnail_key = f"{key_prefix}-thumbnail.webp"
     large_key = f"{key_prefix}-large.webp"
-    uploaded_keys: list[str] = []
 
-    try:
-        for key, payload in (
-            (thumbnail_key, thumbnail_bytes),
-            (large_key, large_bytes),
-        ):
-            if use_local_storage:
-                _upload_local_variant(key, payload)
-            else:
-                _upload_variant(s3, bucket, key, payload)
-            uploaded_keys.append(key)
-    except Exception:
-        for key in uploaded_keys:
-            delete_key(key)
-        raise
+    if use_local_storage:
+        upload = _upload_local_variant
+    else:
+
+        def upload(key, payload):
+            return _upload_variant(s3, bucket, key, payload)
+
+    uploaded_keys = upload_variants(
+        (
+            (thumbnail_key, variants["thumbnail"].payload),
+            (large_key, large.payload),
+        ),
+        upload=upload,
+        delete=delete_key,
+    )
 
     try:
         with transaction.atomic():
@@ -257,9 +260,9 @@ def process_feed_post_image_record(feed_post_id: int) -> None:
             post.image_thumbnail_key = thumbnail_key
             post.image_approved_key = large_key
             post.image_content_type = "image/webp"
-            post.image_size_bytes = len(large_bytes)
-            post.image_width = large_size[0]
-            post.image_height = large_size[1]
+            post.image_size_bytes = len(large.payload)
+            post.image_width = large.size[0]
+            post.image_height = large.size[1]
             post.image_processed_at = timezone.now()
             post.image_rejected_reason = ""
             post.image_pending_key = ""
@@ -2,7 +2,8 @@
 
 Vzory: SearchUserResultSerializer (mini user payload s avatar_url),
 PortfolioItemSerializer (is_liked_by_me cez context set – 1 dotaz na stránku,
-anonym-guard → False; likes_count z anotácie).
+anonym-guard → False). likes_count/comments_count sú denormalizované
+stĺpce FeedPost (accounts.services.feed_counters) – žiadny COUNT na stránku.
 
 Obrázky sa NIKDY neserializujú ako S3 kľúče – vždy ako URL na proxy view
 (vzor portfolio/messaging: priama S3 URL je zablokovaná bucket policy).
@@ -252,16 +253,10 @@ class FeedPostSerializer(serializers.ModelSerializer):
         ).data
 
     def get_likes_count(self, obj):
-        annotated = getattr(obj, "_likes_count", None)
-        if annotated is not None:
-            return int(annotated)
-        return obj.likes.count()
+        return obj.likes_count
 
     def get_comments_count(self, obj):
-        annotated = getattr(obj, "_comments_count", None)
-        if annotated is not None:
-            return int(annotated)
-        return obj.comments.count()
+        return obj.comments_count
 
     def get_is_liked_by_me(self, obj):
         liked_ids = self.context.get("liked_feed_post_ids")
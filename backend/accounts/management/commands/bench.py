@@ -0,0 +1,464 @@
+"""
+Management príkaz na reprodukovateľný benchmark horúcich API endpointov (dev/test).
+
+Postup:
+1. Naseeduje dáta – zavolá existujúce seed_test_users / seed_test_conversations /
+   seed_test_portfolio / seed_test_reviews a doplní ich hromadnými dátami
+   (bench-user-* používatelia s ponukami, feed príspevky, dlhá história správ),
+   aby sa dotazy správali ako pri reálnom objeme.
+2. Cez Django test client (reálna cookie JWT autentifikácia + celý middleware
+   stack) opakovane volá sledované endpointy.
+3. Vypíše JSON s p50/p95/p99 latenciou (ms) a počtom DB dotazov pre každý
+   endpoint – výstup sa dá porovnať medzi commitmi pred deployom.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import DashboardSkillSearchProjection, FeedPost, OfferedSkill
+from accounts.search_projection import (
+    bulk_build_dashboard_skill_search_projection_objects,
+)
+from messaging.models import Conversation, ConversationParticipant, Message
+from messaging.services.inbox import refresh_inbox_entries
+from messaging.services.unread_counters import recompute_unread_counts
+
+from .seed_test_conversations import SVAPLY_USERNAME
+from .seed_test_users import DEFAULT_USERS
+
+User = get_user_model()
+
+BENCH_USERNAME_PREFIX = "bench-user-"
+BENCH_MESSAGE_PREFIX = "[bench] "
+
+# Kategórie / podkategórie / tagy pre hromadné ponuky – reálne slová, aby
+# search a odporúčania neboli triviálne (regex/unaccent vetvy sa naozaj vykonajú).
+BENCH_SKILL_TEMPLATES = (
+    ("remesla-a-vyroba", "Stolárstvo", ["drevo", "nábytok", "police"]),
+    ("domacnost-a-sluzby", "Upratovanie", ["upratovanie", "byt", "okná"]),
+    ("it-a-technologie", "Programovanie", ["python", "web", "aplikácie"]),
+    ("vzdelavanie", "Doučovanie matematiky", ["matematika", "maturita"]),
+    ("krasa-a-zdravie", "Masáže", ["masáž", "relax", "chrbát"]),
+    ("foto-a-video", "Fotografovanie", ["svadba", "portrét", "foto"]),
+    ("remesla-a-vyroba", "Elektroinštalácie", ["elektrikár", "zásuvky"]),
+    ("domacnost-a-sluzby", "Žehlenie", ["žehlenie", "bielizeň"]),
+)
+BENCH_LOCATIONS = (
+    ("Bratislava", "Bratislava I"),
+    ("Košice", "Košice I"),
+    ("Žilina", "Žilina"),
+    ("Nitra", "Nitra"),
+    ("Trnava", "Trnava"),
+    ("Prešov", "Prešov"),
+)
+
+DEFAULT_ITERATIONS = 30
+DEFAULT_WARMUP = 3
+DEFAULT_BENCH_USERS = 200
+DEFAULT_POSTS_PER_USER = 2
+DEFAULT_HISTORY_MESSAGES = 500
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentil s lineárnou interpoláciou (rovnaký ako numpy 'linear')."""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * (pct / 100.0)
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    weight = rank - low
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * weight
+
+
+def summarize_samples(durations_ms: list[float], query_counts: list[int]) -> dict:
+    ordered = sorted(durations_ms)
+    return {
+        "samples": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50), 2),
+        "p95_ms": round(_percentile(ordered, 95), 2),
+        "p99_ms": round(_percentile(ordered, 99), 2),
+        "mean_ms": round(statistics.fmean(ordered), 2) if ordered else 0.0,
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        "queries_min": min(query_counts) if query_counts else 0,
+        "queries_max": max(query_counts) if query_counts else 0,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Naseeduje dáta a zmeria p50/p95/p99 latenciu + počet DB dotazov "
+        "horúcich API endpointov (dev/test). Výstup je JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=DEFAULT_BENCH_USERS,
+            help=f"Počet hromadných bench používateľov s ponukou (default: {DEFAULT_BENCH_USERS})",
+        )
+        parser.add_argument(
+            "--posts-per-user",
+            type=int,
+            default=DEFAULT_POSTS_PER_USER,
+            help=f"Počet feed príspevkov na bench používateľa (default: {DEFAULT_POSTS_PER_USER})",
+        )
+        parser.add_argument(
+            "--messages",
+            type=int,
+            default=DEFAULT_HISTORY_MESSAGES,
+            help=f"Dĺžka histórie správ v meranej konverzácii (default: {DEFAULT_HISTORY_MESSAGES})",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=DEFAULT_ITERATIONS,
+            help=f"Počet meraných requestov na endpoint (default: {DEFAULT_ITERATIONS})",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=DEFAULT_WARMUP,
+            help=f"Počet nemeraných zahrievacích requestov (default: {DEFAULT_WARMUP})",
+        )
+        parser.add_argument(
+            "--skip-seed",
+            action="store_true",
+            help="Preskočí seedovanie (dáta už existujú z predošlého behu)",
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            default=None,
+            help="Meraj len zadaný endpoint (dá sa opakovať), napr. --endpoint dashboard_search",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default="",
+            help="Cesta k JSON súboru s výsledkom (inak stdout)",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError("bench je dostupný len v DEBUG režime (dev/test).")
+
+        iterations = max(int(options["iterations"]), 1)
+        warmup = max(int(options["warmup"]), 0)
+
+        if options["skip_seed"]:
+            owner = User.objects.filter(username=SVAPLY_USERNAME).first()
+            if owner is None:
+                raise CommandError(
+                    f"Používateľ '{SVAPLY_USERNAME}' neexistuje – spusti bench bez --skip-seed."
+                )
+        else:
+            owner = self._seed(options)
+
+        conversation = self._bench_conversation(owner)
+        scenarios = self._scenarios(owner=owner, conversation=conversation)
+        selected = options.get("endpoint")
+        if selected:
+            unknown = sorted(set(selected) - {name for name, _ in scenarios})
+            if unknown:
+                raise CommandError(f"Neznámy endpoint: {', '.join(unknown)}")
+            scenarios = [(name, url) for name, url in scenarios if name in selected]
+
+        client = self._authenticated_client(owner)
+        results = {}
+        # Stovky requestov z jednej IP by inak narazili na rate limit (429)
+        # a merali by sme len odmietnutie, nie samotný endpoint.
+        with override_settings(RATE_LIMIT_DISABLED=True):
+            for name, url in scenarios:
+                results[name] = self._measure(
+                    client, url=url, iterations=iterations, warmup=warmup
+                )
+
+        report = {
+            "database": connection.vendor,
+            "iterations": iterations,
+            "warmup": warmup,
+            "dataset": {
+                "users": User.objects.count(),
+                "offered_skills": OfferedSkill.objects.count(),
+                "feed_posts": FeedPost.objects.count(),
+                "conversation_messages": (
+                    Message.objects.filter(conversation=conversation).count()
+                    if conversation is not None
+                    else 0
+                ),
+            },
+            "endpoints": results,
+        }
+        payload = json.dumps(report, indent=2, ensure_ascii=False)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as fh:
+                fh.write(payload)
+                fh.write("\n")
+            self.stderr.write(self.style.SUCCESS(f"Výsledok zapísaný do {options['output']}"))
+        else:
+            self.stdout.write(payload)
+
+    # ------------------------------------------------------------------ seed
+
+    def _seed(self, options) -> User:
+        owner = self._ensure_owner()
+        offer = OfferedSkill.objects.filter(user=owner).order_by("id").first()
+
+        # Existujúce seed príkazy sú idempotentné (existujúce záznamy preskočia),
+        # ich výstup by rozbil JSON na stdout – zahadzujeme ho.
+        quiet = {"stdout": StringIO(), "stderr": StringIO()}
+        call_command("seed_test_users", count=len(DEFAULT_USERS), **quiet)
+        call_command("seed_test_conversations", offer_id=offer.id, **quiet)
+        call_command("seed_test_portfolio", username=owner.username, **quiet)
+        call_command("seed_test_reviews", offer_id=offer.id, **quiet)
+
+        self._seed_bulk_users(
+            count=max(int(options["users"]), 0),
+            posts_per_user=max(int(options["posts_per_user"]), 0),
+        )
+        self._seed_message_history(owner, count=max(int(options["messages"]), 0))
+        return owner
+
+    def _ensure_owner(self) -> User:
+        owner = User.objects.filter(username=SVAPLY_USERNAME).first()
+        if owner is None:
+            owner = User.objects.create_user(
+                username=SVAPLY_USERNAME,
+                email=f"{SVAPLY_USERNAME}@svaply.test",
+                password=None,
+                first_name="Svaply",
+                last_name="Bench",
+                location="Bratislava",
+                district="Bratislava I",
+                is_public=True,
+                is_verified=True,
+            )
+        if not OfferedSkill.objects.filter(user=owner).exists():
+            OfferedSkill.objects.create(
+                user=owner,
+                category="remesla-a-vyroba",
+                subcategory="Stolárstvo",
+                description="Nábytok na mieru, police a skrine.",
+                tags=["drevo", "nábytok", "stolár"],
+                location="Bratislava",
+                district="Bratislava I",
+            )
+        return owner
+
+    def _seed_bulk_users(self, *, count: int, posts_per_user: int) -> None:
+        existing = set(
+            User.objects.filter(username__startswith=BENCH_USERNAME_PREFIX).values_list(
+                "username", flat=True
+            )
+        )
+        new_users = []
+        for index in range(count):
+            username = f"{BENCH_USERNAME_PREFIX}{index + 1}"
+            if username in existing:
+                continue
+            location, district = BENCH_LOCATIONS[index % len(BENCH_LOCATIONS)]
+            user = User(
+                username=username,
+                email=f"{username}@svaply.test",
+                first_name="Bench",
+                last_name=f"User{index + 1}",
+                slug=username,
+                location=location,
+                district=district,
+                is_public=True,
+                is_verified=index % 3 == 0,
+            )
+            user.set_unusable_password()
+            new_users.append(user)
+        if not new_users:
+            return
+
+        now = timezone.now()
+        with transaction.atomic():
+            # bulk_create obchádza post_save signály – projekciu dopočítame nižšie
+            # rovnakým builderom, aký používa signál.
+            User.objects.bulk_create(new_users, batch_size=500)
+            users = list(
+                User.objects.filter(username__in=[u.username for u in new_users]).order_by("id")
+            )
+            skills = []
+            posts = []
+            for index, user in enumerate(users):
+                category, subcategory, tags = BENCH_SKILL_TEMPLATES[
+                    index % len(BENCH_SKILL_TEMPLATES)
+                ]
+                skills.append(
+                    OfferedSkill(
+                        user=user,
+                        category=category,
+                        subcategory=subcategory,
+                        description=f"{subcategory} – {', '.join(tags)}",
+                        tags=list(tags),
+                        location=user.location,
+                        district=user.district,
+                        price_from=10 + (index % 40),
+                        is_seeking=index % 5 == 0,
+                    )
+                )
+                for post_index in range(posts_per_user):
+                    posts.append(
+                        FeedPost(
+                            author=user,
+                            post_type=FeedPost.PostType.FREE_POST,
+                            caption=f"{subcategory}: ukážka práce #{post_index + 1}",
+                        )
+                    )
+            OfferedSkill.objects.bulk_create(skills, batch_size=500)
+            created_skills = OfferedSkill.objects.select_related("user").filter(
+                user__in=users
+            )
+            DashboardSkillSearchProjection.objects.bulk_create(
+                bulk_build_dashboard_skill_search_projection_objects(created_skills),
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+            FeedPost.objects.bulk_create(posts, batch_size=500)
+            # created_at je auto_now_add – rozložíme ho v čase, aby kurzorové
+            # stránkovanie a "čerstvosť" v odporúčaniach nemali všetko v jednom okamihu.
+            for offset, post_id in enumerate(
+                FeedPost.objects.filter(author__in=users).values_list("id", flat=True)
+            ):
+                FeedPost.objects.filter(pk=post_id).update(
+                    created_at=now - timedelta(minutes=offset * 7)
+                )
+
+    def _seed_message_history(self, owner: User, *, count: int) -> None:
+        conversation = self._bench_conversation(owner)
+        if conversation is None or count <= 0:
+            return
+        peer_id = (
+            ConversationParticipant.objects.filter(conversation=conversation)
+            .exclude(user=owner)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        existing = Message.objects.filter(
+            conversation=conversation, text__startswith=BENCH_MESSAGE_PREFIX
+        ).count()
+        missing = count - existing
+        if missing <= 0:
+            return
+
+        oldest = (
+            Message.objects.filter(conversation=conversation)
+            .order_by("created_at")
+            .values_list("created_at", flat=True)
+            .first()
+        ) or timezone.now()
+        messages = [
+            Message(
+                conversation=conversation,
+                sender_id=owner.id if index % 2 else (peer_id or owner.id),
+                text=f"{BENCH_MESSAGE_PREFIX}história #{existing + index + 1}",
+            )
+            for index in range(missing)
+        ]
+        with transaction.atomic():
+            created = Message.objects.bulk_create(messages, batch_size=500)
+            # História ide pred existujúce správy (staršia), aby posledná správa
+            # v sidebare zostala z pôvodného seedu.
+            for index, message in enumerate(created):
+                Message.objects.filter(pk=message.pk).update(
+                    created_at=oldest - timedelta(minutes=(existing + index + 1) * 3)
+                )
+            recompute_unread_counts(
+                ConversationParticipant.objects.filter(conversation=conversation)
+            )
+            refresh_inbox_entries(conversation_ids=[conversation.id])
+
+    @staticmethod
+    def _bench_conversation(owner: User) -> Conversation | None:
+        return (
+            Conversation.objects.filter(
+                participants__user=owner,
+                is_group=False,
+                messages__isnull=False,
+            )
+            .distinct()
+            .order_by("id")
+            .first()
+        )
+
+    # --------------------------------------------------------------- measure
+
+    @staticmethod
+    def _scenarios(*, owner: User, conversation: Conversation | None) -> list[tuple[str, str]]:
+        scenarios = [
+            ("dashboard_search", f"{reverse('accounts:dashboard_search')}?q=drevo&page=1"),
+            ("dashboard_search_deep", f"{reverse('accounts:dashboard_search')}?q=drevo&page=5"),
+            ("global_search", f"{reverse('accounts:search_global')}?q=bench"),
+            ("feed_list", reverse("accounts:feed_posts")),
+            (
+                "dashboard_recommendations",
+                reverse("accounts:dashboard_search_recommendations"),
+            ),
+            ("conversation_list", reverse("accounts:messaging_list_conversations")),
+        ]
+        if conversation is not None:
+            scenarios.append(
+                (
+                    "message_list",
+                    reverse(
+                        "accounts:messaging_list_messages",
+                        kwargs={"conversation_id": conversation.id},
+                    ),
+                )
+            )
+        return scenarios
+
+    @staticmethod
+    def _authenticated_client(user: User) -> Client:
+        # Cookie-only JWT ako v produkcii – meriame aj SwaplyJWTAuthentication.
+        # Mimo pytestu "testserver" nie je v ALLOWED_HOSTS → použijeme prvý povolený host.
+        allowed_hosts = [h for h in settings.ALLOWED_HOSTS if h and not h.startswith(".")]
+        client = Client(HTTP_HOST=allowed_hosts[0] if allowed_hosts else "localhost")
+        client.cookies["access_token"] = str(RefreshToken.for_user(user).access_token)
+        return client
+
+    def _measure(self, client: Client, *, url: str, iterations: int, warmup: int) -> dict:
+        for _ in range(warmup):
+            client.get(url)
+
+        durations_ms: list[float] = []
+        query_counts: list[int] = []
+        statuses: set[int] = set()
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as ctx:
+                t0 = time.perf_counter()
+                response = client.get(url)
+                durations_ms.append((time.perf_counter() - t0) * 1000.0)
+            query_counts.append(len(ctx.captured_queries))
+            statuses.add(response.status_code)
+
+        summary = summarize_samples(durations_ms, query_counts)
+        summary["url"] = url
+        summary["status_codes"] = sorted(statuses)
+        if any(code >= 400 for code in statuses):
+            self.stderr.write(
+                self.style.WARNING(f"{url} vrátil chybový status: {sorted(statuses)}")
+            )
+        return summary
@@ -0,0 +1,72 @@
+"""
+Predpočíta dashboard odporúčania (``DashboardRecommendationSet``).
+
+Beží cez Celery beat: často s ``--stale-only`` (zoznamy, ktoré signály
+označili po zmene viewera alebo jeho ponúk) a raz za hodinu pre viewerov,
+ktorí odporúčania nedávno čítali, aby sa do zoznamov dostali aj nové ponuky
+ostatných.
+
+* ``--stale-only`` iba zoznamy s ``is_stale=True``.
+* ``--user-id`` zúži na konkrétnych používateľov (opakovateľné).
+* ``--active-days`` okno posledného čítania odporúčaní (``last_read_at``) pre plný beh.
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from accounts.models import DashboardRecommendationSet
+from accounts.views.dashboard_views.recommendations import (
+    precompute_dashboard_recommendations,
+    recently_read_dashboard_recommendation_sets,
+)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Predpočíta kandidátov dashboard odporúčaní pre aktívnych používateľov."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-only",
+            action="store_true",
+            help="Len zoznamy označené signálmi ako zastarané.",
+        )
+        parser.add_argument(
+            "--user-id",
+            action="append",
+            type=int,
+            default=[],
+            help="Obmedz na používateľa (možno zadať viackrát).",
+        )
+        parser.add_argument(
+            "--active-days",
+            type=int,
+            default=30,
+            help="Plný beh: vieweri, ktorí čítali odporúčania za posledných N dní.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options["user_id"]:
+            users = users.filter(pk__in=options["user_id"])
+        elif options["stale_only"]:
+            users = users.filter(
+                pk__in=DashboardRecommendationSet.objects.filter(is_stale=True).values(
+                    "viewer_id"
+                )
+            )
+        else:
+            users = users.filter(
+                pk__in=recently_read_dashboard_recommendation_sets(
+                    active_days=options["active_days"]
+                ).values("viewer_id")
+            )
+
+        refreshed = 0
+        for user in users.order_by("pk").iterator(chunk_size=200):
+            precompute_dashboard_recommendations(user)
+            refreshed += 1
+        self.stdout.write(self.style.SUCCESS(f"Predpočítané: {refreshed} používateľov."))
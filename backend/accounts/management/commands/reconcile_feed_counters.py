@@ -0,0 +1,81 @@
+"""
+Údržbový príkaz: prepočíta denormalizované ``FeedPost.likes_count`` /
+``FeedPost.comments_count``.
+
+Počítadlá sa udržiavajú F() deltami pri lajku/komentári; tento príkaz ich
+nastaví od nuly rovnakým COUNT-om, aký predtým bežal pri každej feed stránke.
+Beží nočne cez Celery beat (``reconcile-feed-counters-daily``), ručne po
+hromadných zásahoch mimo API alebo pri podozrení na drift.
+
+* ``--dry-run`` iba vypíše počet príspevkov s nesediacimi počítadlami.
+* ``--post-id`` zúži prepočet na jeden príspevok (opakovateľné).
+* ``--batch-size`` – koľko príspevkov s driftom sa prepočíta v jednej krátkej
+  transakcii (default 1000).
+
+Prepočítavajú sa iba príspevky s driftom, po dávkach – jeden UPDATE cez celú
+tabuľku by držal zámky riadkov počas celého behu a blokoval lajky/komentáre.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import FeedPost
+from accounts.services.feed_counters import (
+    drifted_feed_posts,
+    recompute_feed_post_counters,
+)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Prepočíta FeedPost.likes_count / comments_count z lajkov a komentárov."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Len zistí drift, nič nezapíše.",
+        )
+        parser.add_argument(
+            "--post-id",
+            action="append",
+            type=int,
+            default=[],
+            help="Obmedz na príspevok (možno zadať viackrát).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Počet príspevkov na transakciu (default {DEFAULT_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        posts = FeedPost.objects.all()
+        if options["post_id"]:
+            posts = posts.filter(pk__in=options["post_id"])
+
+        drifted_ids = list(
+            drifted_feed_posts(posts).order_by("pk").values_list("pk", flat=True)
+        )
+        drifted = len(drifted_ids)
+        if options["dry_run"]:
+            self.stdout.write(f"Drift: {drifted} príspevkov (dry-run, nič nezapísané).")
+            return
+
+        batch_size = max(1, int(options["batch_size"]))
+        updated = 0
+        for start in range(0, drifted, batch_size):
+            batch = drifted_ids[start : start + batch_size]
+            with transaction.atomic():
+                updated += recompute_feed_post_counters(
+                    FeedPost.objects.filter(pk__in=batch)
+                )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Prepočítané: {updated} príspevkov, opravený drift: {drifted}."
+            )
+        )
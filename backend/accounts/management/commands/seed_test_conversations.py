@@ -16,6 +16,8 @@ from accounts.models import OfferedSkill
 from messaging.models import Conversation, ConversationParticipant, Message
 from messaging.services.conversations import find_direct_conversation, open_or_create_direct_conversation
 from messaging.services.offer_shares import OFFER_SHARE_METADATA_OFFER_ID
+from messaging.services.inbox import refresh_inbox_entries
+from messaging.services.unread_counters import recompute_unread_counts
 
 User = get_user_model()
 
@@ -464,6 +466,11 @@ class Command(BaseCommand):
                 contact_participant.last_read_at = last_message_at
                 owner_participant.save(update_fields=["last_read_at"])
                 contact_participant.save(update_fields=["last_read_at"])
+                # Správy a last_read_at sú zapísané priamo (mimo služieb).
+                recompute_unread_counts(
+                    ConversationParticipant.objects.filter(conversation=convo)
+                )
+                refresh_inbox_entries(conversation_ids=[convo.id])
 
                 created_count += 1
                 self.stdout.write(
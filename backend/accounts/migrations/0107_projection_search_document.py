@@ -0,0 +1,102 @@
+import unicodedata
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+# Kópia accounts.search_projection.normalize_search_text / sekcií – migrácia nesmie
+# závisieť od runtime kódu, ktorý sa môže neskôr zmeniť.
+def _normalize(value):
+    normalized = unicodedata.normalize("NFD", str(value or ""))
+    stripped = "".join(ch for ch in normalized if unicodedata.category(ch) != "Mn")
+    return " ".join(stripped.lower().split())
+
+
+def _sections(row):
+    primary = _normalize(f"{row.category} {row.subcategory}")
+    tags = _normalize(row.tags_text)
+    places = _normalize(
+        " ".join(
+            (row.skill_location, row.skill_district, row.user_location, row.user_district)
+        )
+    )
+    return primary, tags, places
+
+
+POSTGRES_UPDATE_SQL = (
+    "UPDATE accounts_dashboardskillsearchprojection SET "
+    "search_document = %s, "
+    "search_vector = setweight(to_tsvector('simple', %s), 'A') "
+    "|| setweight(to_tsvector('simple', %s), 'B') "
+    "|| setweight(to_tsvector('simple', %s), 'C') "
+    "WHERE id = %s"
+)
+
+
+def backfill_search_document(apps, schema_editor):
+    Projection = apps.get_model("accounts", "DashboardSkillSearchProjection")
+    is_postgres = schema_editor.connection.vendor == "postgresql"
+
+    batch = []
+
+    def flush():
+        if not batch:
+            return
+        if is_postgres:
+            with schema_editor.connection.cursor() as cursor:
+                cursor.executemany(
+                    POSTGRES_UPDATE_SQL,
+                    [
+                        (" ".join(s for s in sections if s), *sections, pk)
+                        for pk, sections in batch
+                    ],
+                )
+        else:
+            for pk, sections in batch:
+                Projection.objects.filter(pk=pk).update(
+                    search_document=" ".join(s for s in sections if s)
+                )
+        batch.clear()
+
+    rows = Projection.objects.only(
+        "pk",
+        "category",
+        "subcategory",
+        "tags_text",
+        "skill_location",
+        "skill_district",
+        "user_location",
+        "user_district",
+    ).iterator(chunk_size=500)
+    for row in rows:
+        batch.append((row.pk, _sections(row)))
+        if len(batch) >= 500:
+            flush()
+    flush()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0106_feed_post_reshare"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dashboardskillsearchprojection",
+            name="search_document",
+            field=models.TextField(
+                blank=True, default="", verbose_name="Vyhľadávací dokument"
+            ),
+        ),
+        migrations.AddField(
+            model_name="dashboardskillsearchprojection",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, null=True, verbose_name="Fulltext vektor"
+            ),
+        ),
+        migrations.RunPython(
+            backfill_search_document,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
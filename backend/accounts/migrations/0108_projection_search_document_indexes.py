@@ -0,0 +1,48 @@
+from django.db import migrations
+
+
+TABLE = "accounts_dashboardskillsearchprojection"
+
+# (index_name, definícia) – GIN nad tsvectorom pre `search_vector @@ tsquery`
+# a trigram GIN nad search_document pre `LIKE '%term%'` (substring v strede slova,
+# ktorý prefixový tsquery nepokryje).
+_INDEXES = [
+    ("acc_dsh_skl_prj_fts_idx", "USING gin (search_vector)"),
+    ("acc_dsh_skl_prj_doc_trgm_idx", "USING gin (search_document public.gin_trgm_ops)"),
+]
+
+
+def create_search_document_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public")
+        for name, definition in _INDEXES:
+            cursor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {TABLE} {definition}"
+            )
+
+
+def drop_search_document_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name, _definition in _INDEXES:
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0107_projection_search_document"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_search_document_indexes,
+            reverse_code=drop_search_document_indexes,
+        ),
+    ]
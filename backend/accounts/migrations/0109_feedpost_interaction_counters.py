@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:45
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _related_count_subquery(model):
+    # Kópia accounts.services.feed_counters – migrácia nesmie importovať app kód.
+    return Coalesce(
+        Subquery(
+            model.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def backfill_feed_post_counters(apps, schema_editor):
+    FeedPost = apps.get_model("accounts", "FeedPost")
+    FeedPostComment = apps.get_model("accounts", "FeedPostComment")
+    FeedPostLike = apps.get_model("accounts", "FeedPostLike")
+    FeedPost.objects.update(
+        likes_count=_related_count_subquery(FeedPostLike),
+        comments_count=_related_count_subquery(FeedPostComment),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0108_projection_search_document_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedpost',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Počet komentárov'),
+        ),
+        migrations.AddField(
+            model_name='feedpost',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Počet lajkov'),
+        ),
+        migrations.RunPython(backfill_feed_post_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:53
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_author_district(apps, schema_editor):
+    FeedPost = apps.get_model("accounts", "FeedPost")
+    User = apps.get_model("accounts", "User")
+    FeedPost.objects.update(
+        author_district=Subquery(
+            User.objects.filter(pk=OuterRef("author_id")).values("district")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0109_feedpost_interaction_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedpost',
+            name='author_district',
+            field=models.CharField(blank=True, default='', max_length=100, verbose_name='Okres autora'),
+        ),
+        migrations.AddIndex(
+            model_name='feedpost',
+            index=models.Index(fields=['author_district', '-created_at', '-id'], name='acc_fpost_district_feed_idx'),
+        ),
+        migrations.RunPython(backfill_author_district, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0110_feedpost_author_district'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardRecommendationSet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('algo_version', models.CharField(max_length=8, verbose_name='Verzia algoritmu')),
+                ('candidates', models.JSONField(blank=True, default=list, verbose_name='Kandidáti')),
+                ('is_stale', models.BooleanField(default=False, verbose_name='Zastarané')),
+                ('computed_at', models.DateTimeField(verbose_name='Prepočítané')),
+                ('viewer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_recommendation_set', to=settings.AUTH_USER_MODEL, verbose_name='Používateľ')),
+            ],
+            options={
+                'verbose_name': 'Predpočítané odporúčania',
+                'verbose_name_plural': 'Predpočítané odporúčania',
+                'indexes': [models.Index(fields=['is_stale', 'computed_at'], name='acc_dash_rec_stale_idx')],
+            },
+        ),
+    ]
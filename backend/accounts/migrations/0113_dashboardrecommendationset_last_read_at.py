@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0112_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dashboardrecommendationset',
+            name='last_read_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Naposledy čítané'),
+        ),
+    ]
@@ -17,6 +17,7 @@ from .enums import (
 from .user import User, UserProfile
 from .verification import AccountDeletionRequest, EmailVerification
 from .skills import (
+    DashboardRecommendationSet,
     DashboardSkillSearchProjection,
     OfferedSkill,
     OfferedSkillImage,
@@ -52,6 +53,7 @@ from .bug_reports import (
     BugReportPriority,
     BugReportStatus,
 )
+from .email_outbox import EmailOutbox, EmailOutboxCategory
 
 # WebPushSubscription žije v samostatnom module; re-export zachováva pôvodné
 # `from accounts.models import WebPushSubscription`.
@@ -64,6 +66,8 @@ __all__ = [
     "BugReportNotificationOutbox",
     "BugReportPriority",
     "BugReportStatus",
+    "EmailOutbox",
+    "EmailOutboxCategory",
     "decrypt_mfa_secret",
     "encrypt_mfa_secret",
     "UserType",
@@ -77,6 +81,7 @@ __all__ = [
     "AccountDeletionRequest",
     "OfferedSkill",
     "DashboardSkillSearchProjection",
+    "DashboardRecommendationSet",
     "OfferedSkillImage",
     "SkillRequest",
     "SkillRequestStatus",
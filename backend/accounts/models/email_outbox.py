@@ -0,0 +1,47 @@
+"""Transakčný outbox odchádzajúcich e-mailov (overenie, reset hesla, kontakt)."""
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class EmailOutboxCategory(models.TextChoices):
+    VERIFICATION = "verification", _("Overenie e-mailu")
+    PASSWORD_RESET = "password_reset", _("Reset hesla")
+    ACCOUNT_DELETION = "account_deletion", _("Zmazanie účtu")
+    CONTACT = "contact", _("Kontaktný formulár")
+
+
+class EmailOutbox(models.Model):
+    """
+    Durable intent to send one transactional email.
+
+    Riadok vzniká v transakcii zmeny, ktorá e-mail spúšťa; odoslanie beží až
+    po commite (Celery) a úspešne odoslaný riadok sa zmaže, takže tokeny a
+    obsah správ v DB neostávajú.
+    """
+
+    category = models.CharField(max_length=32, choices=EmailOutboxCategory.choices)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list, blank=True)
+    attempt_count = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True)
+    claimed_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.CharField(max_length=255, blank=True, default="")
+    # Po vyčerpaní pokusov ostáva riadok na diagnostiku, kým ho nezmaže retencia.
+    failed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = _("Čakajúci e-mail")
+        verbose_name_plural = _("Čakajúce e-maily")
+
+    def __str__(self) -> str:
+        # Bez adresáta (PII) v reprezentácii.
+        return f"Email outbox {self.pk} ({self.category})"
@@ -175,6 +175,21 @@ class FeedPost(FeedPostSharingMixin, models.Model):
         _("Snapshot: text príspevku"), max_length=500, blank=True, default=""
     )
 
+    # Denormalizované počítadlá pre feed (žiadny COUNT na každý príspevok
+    # stránky). Udržiava ``accounts.services.feed_counters`` F() deltami pri
+    # lajku/komentári, presnosť poisťuje nočný ``reconcile_feed_counters``.
+    likes_count = models.PositiveIntegerField(_("Počet lajkov"), default=0)
+    comments_count = models.PositiveIntegerField(_("Počet komentárov"), default=0)
+
+    # Kópia ``author.district`` pre lokálny feed: „rovnaký okres" je tak
+    # rovnosť na vlastnom stĺpci a (author_district, created_at, id) index
+    # obslúži lokálny prúd bez JOIN-u na používateľa a bez triedenia celej
+    # množiny. Plní sa pri vzniku (save), zmenu okresu autora prepisuje
+    # post_save signál User (accounts.signals).
+    author_district = models.CharField(
+        _("Okres autora"), max_length=100, blank=True, default=""
+    )
+
     created_at = models.DateTimeField(_("Vytvorené"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Upravené"), auto_now=True)
 
@@ -244,6 +259,11 @@ class FeedPost(FeedPostSharingMixin, models.Model):
             ),
             # Chronologický feed.
             models.Index(fields=["created_at"], name="acc_fpost_created_idx"),
+            # Lokálny prúd hlavného feedu (viď FeedLocalityCursorPagination).
+            models.Index(
+                fields=["author_district", "-created_at", "-id"],
+                name="acc_fpost_district_feed_idx",
+            ),
         ]
 
     def __str__(self):
@@ -264,6 +284,8 @@ class FeedPost(FeedPostSharingMixin, models.Model):
         ensure_text_within_limit(self.caption, field_label="Text príspevku")
         if self._state.adding:
             self._apply_shared_source()
+            if not self.author_district:
+                self.author_district = self.author.district or ""
         else:
             refreshed = self._revalidate_changed_shared_source(
                 kwargs.get("update_fields")
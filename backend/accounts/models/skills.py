@@ -1,6 +1,7 @@
 """Ponuky zručností a ich obrázky + dashboard search projekcia – z models.py."""
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -150,6 +151,11 @@ class DashboardSkillSearchProjection(models.Model):
     price_from = models.DecimalField(
         _("Cena od"), max_digits=10, decimal_places=2, null=True, blank=True
     )
+    # Odakcentovaný lowercase text všetkých vyhľadávaných polí (plní
+    # search_projection). Na PostgreSQL nad ním stojí trigram GIN index (LIKE),
+    # search_vector je jeho váhovaná tsvector podoba s GIN indexom (migrácia 0108).
+    search_document = models.TextField(_("Vyhľadávací dokument"), blank=True, default="")
+    search_vector = SearchVectorField(_("Fulltext vektor"), null=True, blank=True)
     created_at = models.DateTimeField(_("VytvorenÃ©"))
     updated_at = models.DateTimeField(_("AktualizovanÃ©"), auto_now=True)
 
@@ -178,6 +184,43 @@ class DashboardSkillSearchProjection(models.Model):
         return f"Search projection pre skill_id={self.skill_id}"
 
 
+class DashboardRecommendationSet(models.Model):
+    """
+    Predpočítaní kandidáti dashboard odporúčaní jedného viewera.
+
+    Drahé skórovanie (regex Q nad projekciou + vnorené Case) beží v Celery
+    (``precompute_dashboard_recommendations``), nie pri requeste. ``candidates``
+    je zoradený zoznam ``[skill_id, user_id, match, locality, verified,
+    created_at ISO]`` – čerstvosť, skryté ponuky a bloky sa aplikujú až pri
+    čítaní. ``is_stale`` nastavujú signály pri zmene viewera alebo jeho ponúk.
+    ``last_read_at`` zapisuje view – podľa neho hodinový beh vyberá aktívnych viewerov.
+    """
+
+    viewer = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="dashboard_recommendation_set",
+        verbose_name=_("Používateľ"),
+    )
+    algo_version = models.CharField(_("Verzia algoritmu"), max_length=8)
+    candidates = models.JSONField(_("Kandidáti"), default=list, blank=True)
+    is_stale = models.BooleanField(_("Zastarané"), default=False)
+    computed_at = models.DateTimeField(_("Prepočítané"))
+    last_read_at = models.DateTimeField(
+        _("Naposledy čítané"), null=True, blank=True, db_index=True
+    )
+
+    class Meta:
+        verbose_name = _("Predpočítané odporúčania")
+        verbose_name_plural = _("Predpočítané odporúčania")
+        indexes = [
+            models.Index(fields=["is_stale", "computed_at"], name="acc_dash_rec_stale_idx"),
+        ]
+
+    def __str__(self):
+        return f"Odporúčania pre user_id={self.viewer_id}"
+
+
 class OfferedSkillImage(models.Model):
     """Obrázok priradený k ponúkanej zručnosti (ponuke)."""
 
@@ -3,11 +3,12 @@
 import uuid
 
 from django.conf import settings
-from django.core.mail import send_mail
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from .email_outbox import EmailOutboxCategory
+
 
 class EmailVerification(models.Model):
     """Model pre email verifikáciu"""
@@ -34,7 +35,7 @@ class EmailVerification(models.Model):
         return timezone.now() > self.created_at + timezone.timedelta(hours=48)
 
     def send_verification_email(self, request=None):
-        """Odoslanie verifikačného emailu"""
+        """Zaradenie verifikačného emailu do outboxu (odošle sa po commite)."""
         import logging
 
         logger = logging.getLogger(__name__)
@@ -57,59 +58,20 @@ Tím Svaply
         """
 
         try:
-            import time
-
-            _start = time.time()
-            logger.info(
-                "EMAIL_SEND_START",
-                extra={
-                    "host": getattr(settings, "EMAIL_HOST", None),
-                    "port": getattr(settings, "EMAIL_PORT", None),
-                    "use_tls": getattr(settings, "EMAIL_USE_TLS", None),
-                    "timeout": getattr(settings, "EMAIL_TIMEOUT", None),
-                    "backend": getattr(settings, "EMAIL_BACKEND", None),
-                },
-            )
-            if getattr(settings, "DEBUG", False):
-                # Bez PII/citlivých údajov: token (verification_url), to_email ani
-                # email_host_user nikdy nelogujeme (aj DEBUG logy končia v Railway).
-                logger.info(
-                    "📧 DEBUG EMAIL: Sending verification email",
-                    extra={
-                        "user_id": self.user_id,
-                        "email_backend": getattr(settings, "EMAIL_BACKEND", None),
-                        "subject": subject,
-                    },
-                )
-            result = send_mail(
+            # Lokálny import: služba importuje accounts.models.
+            from accounts.services.email_outbox import queue_email
+
+            # Zápis do outboxu v transakcii volajúceho; SMTP/API beží až po commite.
+            queue_email(
+                category=EmailOutboxCategory.VERIFICATION,
                 subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[self.user.email],
-                fail_silently=False,
-            )
-            logger.info(
-                "EMAIL_SEND_DONE",
-                extra={"duration_ms": int((time.time() - _start) * 1000)},
+                body=message,
+                to=[self.user.email],
             )
-            if getattr(settings, "DEBUG", False):
-                logger.info(f"📧 DEBUG EMAIL: send_mail() returned: {result}")
-            logger.info("Verification email sent")
+            logger.info("Verification email queued", extra={"user_id": self.user_id})
             return True
-        except Exception as e:
-            if getattr(settings, "DEBUG", False):
-                import traceback
-
-                logger.error(f"📧 DEBUG EMAIL: Exception during send_mail(): {e}")
-                logger.error(f"📧 DEBUG EMAIL: Traceback: {traceback.format_exc()}")
-            logger.error(
-                "EMAIL_SEND_FAILED",
-                extra={
-                    "duration_ms": int((time.time() - _start) * 1000),
-                    "error": str(e),
-                },
-            )
-            logger.error("Verification email failed")
+        except Exception:
+            logger.exception("Verification email could not be queued")
             return False
 
     def get_verification_url(self, request=None):
@@ -167,7 +129,7 @@ class AccountDeletionRequest(models.Model):
         return f"{base_url}/delete-account/confirm?token={self.token}"
 
     def send_deletion_email(self):
-        """Pošle email s jednorazovým odkazom na potvrdenie zmazania účtu."""
+        """Zaradí email s jednorazovým odkazom na potvrdenie zmazania účtu do outboxu."""
         import logging
 
         logger = logging.getLogger(__name__)
@@ -190,17 +152,18 @@ S pozdravom,
 Tím Svaply
         """
         try:
-            send_mail(
+            from accounts.services.email_outbox import queue_email
+
+            queue_email(
+                category=EmailOutboxCategory.ACCOUNT_DELETION,
                 subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[self.user.email],
-                fail_silently=False,
+                body=message,
+                to=[self.user.email],
             )
-            logger.info("Account deletion email sent")
+            logger.info("Account deletion email queued")
             return True
         except Exception:
-            logger.error("Account deletion email failed")
+            logger.error("Account deletion email could not be queued")
             return False
 
 
@@ -5,7 +5,11 @@ Tento modul držíme malý a bezpečný:
 - ak channel layer nie je dostupný, funkcie fail-open (nezhodia request).
 """
 
+import asyncio
+from collections.abc import Iterable, Mapping
+
 from asgiref.sync import async_to_sync
+from django.db import transaction
 
 
 def notify_user(user_id: int, event: dict) -> None:
@@ -30,3 +34,70 @@ def notify_user(user_id: int, event: dict) -> None:
     except Exception:
         # fail-open: notifikácia je best-effort, nech nespadne API request
         return
+
+
+def _normalize_batch(
+    events_by_user: Mapping[int, dict | Iterable[dict]],
+) -> dict[int, list[dict]]:
+    pending: dict[int, list[dict]] = {}
+    for user_id, events in (events_by_user or {}).items():
+        if not user_id:
+            continue
+        if isinstance(events, Mapping):
+            events = (events,)
+        pending.setdefault(int(user_id), []).extend(events)
+    return {user_id: events for user_id, events in pending.items() if events}
+
+
+def _send_batch(pending: dict[int, list[dict]]) -> None:
+    try:
+        from channels.layers import get_channel_layer
+    except Exception:
+        return
+
+    try:
+        channel_layer = get_channel_layer()
+        if not channel_layer:
+            return
+
+        async def _send_user(user_id: int, events: list[dict]):
+            # Eventy jedného používateľa idú sériovo – klient ich musí dostať
+            # v poradí (napr. message_created pred message_updated). Chyba
+            # jedného eventu nezhodí nasledujúce.
+            for event in events:
+                try:
+                    await channel_layer.group_send(
+                        f"user_{user_id}",
+                        {"type": "notify", "event": event},
+                    )
+                except Exception:
+                    continue
+
+        async def _send_all():
+            # Súbežne len naprieč používateľmi, v jednom event loope – pri
+            # channels_redis sa príkazy prekrývajú na zdieľanom pooli namiesto
+            # N sériových async_to_sync hopov.
+            await asyncio.gather(
+                *(_send_user(user_id, events) for user_id, events in pending.items()),
+                return_exceptions=True,
+            )
+
+        async_to_sync(_send_all)()
+    except Exception:
+        # fail-open: notifikácia je best-effort
+        return
+
+
+def notify_users(events_by_user: Mapping[int, dict | Iterable[dict]]) -> None:
+    """
+    Batch verzia notify_user: ``{user_id: event}`` alebo ``{user_id: [event, ...]}``.
+
+    Eventy sa pošlú v jednom async kontexte (súbežne naprieč používateľmi,
+    v poradí pre každého z nich) a až po commite
+    transakcie (``on_commit``), takže klient nedostane event o stave, ktorý
+    sa ešte môže rollbacknúť. Mimo transakcie sa odošlú hneď.
+    """
+    pending = _normalize_batch(events_by_user)
+    if not pending:
+        return
+    transaction.on_commit(lambda: _send_batch(pending))
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import unicodedata
 from typing import Iterable
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import TextField, Value
 
 from .models import DashboardSkillSearchProjection, OfferedSkill
 
 User = get_user_model()
 
+# Text search konfigurácia pre `search_vector`. Slovenčina v PostgreSQL nemá
+# vstavaný stemmer – dokument je už v Pythone odakcentovaný a lowercase, takže
+# stačí `simple` (len tokenizácia, žiadne stop-slová ani stemming).
+SEARCH_VECTOR_CONFIG = "simple"
+
+
+def normalize_search_text(value: object) -> str:
+    """Lowercase + bez diakritiky + zlúčené medzery (tvar `search_document`)."""
+    normalized = unicodedata.normalize("NFD", str(value or ""))
+    stripped = "".join(ch for ch in normalized if unicodedata.category(ch) != "Mn")
+    return " ".join(stripped.lower().split())
+
 
 def _tags_to_search_text(tags: object) -> str:
     if not isinstance(tags, list):
@@ -15,10 +30,67 @@ def _tags_to_search_text(tags: object) -> str:
     return " ".join(str(tag).strip() for tag in tags if str(tag).strip())
 
 
+def build_search_document_sections(
+    *,
+    category: str,
+    subcategory: str,
+    tags_text: str,
+    skill_location: str,
+    skill_district: str,
+    user_location: str,
+    user_district: str,
+) -> tuple[str, str, str]:
+    """Rozdelí vyhľadávané polia do váhových sekcií (A, B, C) pre ts_rank.
+
+    Váhy kopírujú pôvodnú `relevance` škálu: kategória/podkategória (3) >
+    tagy (2) > lokalita (1).
+    """
+    primary = normalize_search_text(f"{category} {subcategory}")
+    tags = normalize_search_text(tags_text)
+    places = normalize_search_text(
+        " ".join((skill_location, skill_district, user_location, user_district))
+    )
+    return primary, tags, places
+
+
+def build_search_document(sections: tuple[str, str, str]) -> str:
+    return " ".join(section for section in sections if section)
+
+
+def build_search_vector(sections: tuple[str, str, str]):
+    """Výraz pre `search_vector` (len PostgreSQL; inde None – stĺpec ostane NULL).
+
+    Vektor sa počíta z hodnôt (nie zo stĺpcov), takže výraz funguje v INSERT aj
+    UPDATE a `update_or_create`/`bulk_create` ho zapíšu v rovnakom dotaze.
+    """
+    if connection.vendor != "postgresql":
+        return None
+
+    from django.contrib.postgres.search import SearchVector
+
+    primary, tags, places = sections
+    return (
+        SearchVector(
+            Value(primary, output_field=TextField()),
+            config=SEARCH_VECTOR_CONFIG,
+            weight="A",
+        )
+        + SearchVector(
+            Value(tags, output_field=TextField()),
+            config=SEARCH_VECTOR_CONFIG,
+            weight="B",
+        )
+        + SearchVector(
+            Value(places, output_field=TextField()),
+            config=SEARCH_VECTOR_CONFIG,
+            weight="C",
+        )
+    )
+
+
 def build_dashboard_skill_search_projection_defaults(skill: OfferedSkill) -> dict:
     user = skill.user
-    return {
-        "user_id": skill.user_id,
+    searchable = {
         "category": skill.category,
         "subcategory": skill.subcategory,
         "tags_text": _tags_to_search_text(skill.tags),
@@ -26,6 +98,13 @@ def build_dashboard_skill_search_projection_defaults(skill: OfferedSkill) -> dic
         "skill_district": skill.district or "",
         "user_location": getattr(user, "location", "") or "",
         "user_district": getattr(user, "district", "") or "",
+    }
+    sections = build_search_document_sections(**searchable)
+    return {
+        "user_id": skill.user_id,
+        **searchable,
+        "search_document": build_search_document(sections),
+        "search_vector": build_search_vector(sections),
         "user_is_public": bool(getattr(user, "is_public", False)),
         "user_is_verified": bool(getattr(user, "is_verified", False)),
         "user_is_active": bool(getattr(user, "is_active", False)),
@@ -0,0 +1,232 @@
+"""
+Transakčné e-maily cez outbox (overenie, reset hesla, zmazanie účtu, kontakt).
+
+`queue_email` zapíše `EmailOutbox` v transakcii volajúceho – request tak nečaká
+na SMTP/HTTP API a e-mail neodíde pre zmenu, ktorá sa nakoniec rollbackne. Po
+commite sa spustí `deliver_pending_emails` (Celery task, alebo inline podľa
+`settings.EMAIL_OUTBOX_DELIVERY`), ktorý dávku riadkov odošle cez jedno
+otvorené spojenie backendu (anymail drží jednu HTTP session na celú dávku).
+
+Claim je podmienený `update()` ako pri `BugReportNotificationOutbox`: token je
+hodnota `claimed_at`, zaseknutý claim sa po `EMAIL_OUTBOX_STALE_CLAIM_SECONDS`
+uvoľní. Neúspešný riadok dostane exponenciálny `next_attempt_at`; po
+`EMAIL_OUTBOX_MAX_ATTEMPTS` sa označí `failed_at` a obsah aj adresy sa
+vymažú. Čakajúce riadky (výpadok brokera, backoff) dobehne beat task
+`send_pending_emails_task`.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from accounts.models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_DELIVERY_CELERY = "celery"
+EMAIL_OUTBOX_DELIVERY_INLINE = "inline"
+EMAIL_OUTBOX_STALE_CLAIM_SECONDS = 300
+EMAIL_OUTBOX_FAILED_RETENTION_DAYS = 30
+_RETRY_BASE_SECONDS = 30
+_RETRY_MAX_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class EmailOutboxDeliveryResult:
+    sent: int = 0
+    failed: int = 0
+
+
+def _delivery_mode() -> str:
+    mode = str(
+        getattr(settings, "EMAIL_OUTBOX_DELIVERY", EMAIL_OUTBOX_DELIVERY_CELERY) or ""
+    ).strip().lower()
+    if mode == EMAIL_OUTBOX_DELIVERY_INLINE:
+        return EMAIL_OUTBOX_DELIVERY_INLINE
+    return EMAIL_OUTBOX_DELIVERY_CELERY
+
+
+def queue_email(
+    *,
+    category: str,
+    subject: str,
+    body: str,
+    to: Iterable[str],
+    html_body: str = "",
+    reply_to: Iterable[str] = (),
+    from_email: str | None = None,
+) -> EmailOutbox:
+    """Zapíš e-mail do outboxu; odoslanie sa naplánuje až po commite."""
+
+    # Savepoint: chyba zápisu nesmie rozbiť transakciu volajúceho (registrácia).
+    with transaction.atomic():
+        entry = EmailOutbox.objects.create(
+            category=category,
+            subject=str(subject)[:255],
+            body=str(body),
+            html_body=str(html_body or ""),
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            to=[str(address) for address in to],
+            reply_to=[str(address) for address in reply_to],
+        )
+    transaction.on_commit(_schedule_delivery)
+    return entry
+
+
+def _schedule_delivery() -> None:
+    if _delivery_mode() == EMAIL_OUTBOX_DELIVERY_CELERY:
+        try:
+            from accounts.tasks import send_pending_emails_task
+
+            send_pending_emails_task.delay()
+            return
+        except Exception:
+            logger.warning(
+                "Email outbox task could not be enqueued; "
+                "pending emails will be sent by the recovery beat.",
+                exc_info=True,
+            )
+            return
+    try:
+        deliver_pending_emails()
+    except Exception:
+        # Riadky ostávajú v outboxe; request už je commitnutý.
+        logger.exception("Inline email outbox delivery failed")
+
+
+def _stale_claim_cutoff(now: datetime) -> datetime:
+    return now - timedelta(seconds=EMAIL_OUTBOX_STALE_CLAIM_SECONDS)
+
+
+def _due_entries(now: datetime):
+    return EmailOutbox.objects.filter(
+        failed_at__isnull=True,
+        next_attempt_at__lte=now,
+    ).filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=_stale_claim_cutoff(now)))
+
+
+def _retry_delay(attempt_count: int) -> timedelta:
+    exponent = max(int(attempt_count) - 1, 0)
+    return timedelta(seconds=min(_RETRY_BASE_SECONDS * (2**exponent), _RETRY_MAX_SECONDS))
+
+
+def _build_message(entry: EmailOutbox, connection) -> EmailMultiAlternatives:
+    message = EmailMultiAlternatives(
+        subject=entry.subject,
+        body=entry.body,
+        from_email=entry.from_email,
+        to=list(entry.to or []),
+        reply_to=list(entry.reply_to or []) or None,
+        connection=connection,
+    )
+    if entry.html_body:
+        message.attach_alternative(entry.html_body, "text/html")
+    return message
+
+
+def _record_failure(entry: EmailOutbox, claimed_at: datetime, error: Exception) -> bool:
+    """Uvoľni claim s backoffom; `True` ak boli pokusy vyčerpané."""
+
+    exhausted = entry.attempt_count >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+    updates = {
+        "claimed_at": None,
+        "last_error": f"{type(error).__name__}: {error}"[:255],
+    }
+    if exhausted:
+        # Zlyhaný riadok sa už neodošle – obsah (tokeny) a adresy netreba držať
+        # počas retencie, na diagnostiku stačí kategória a last_error.
+        updates.update(
+            failed_at=timezone.now(),
+            subject="",
+            body="",
+            html_body="",
+            to=[],
+            reply_to=[],
+        )
+    else:
+        updates["next_attempt_at"] = timezone.now() + _retry_delay(entry.attempt_count)
+    EmailOutbox.objects.filter(id=entry.id, claimed_at=claimed_at).update(**updates)
+    return exhausted
+
+
+def deliver_pending_emails(*, batch_size: int | None = None) -> EmailOutboxDeliveryResult:
+    """Claimni dávku splatných e-mailov a pošli ju jedným spojením backendu."""
+
+    limit = int(batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE)
+    claimed_at = timezone.now()
+    candidate_ids = list(
+        _due_entries(claimed_at).order_by("id").values_list("id", flat=True)[:limit]
+    )
+    if not candidate_ids:
+        return EmailOutboxDeliveryResult()
+
+    # Súbežný worker mohol časť riadkov claimnuť medzi SELECT a UPDATE.
+    _due_entries(claimed_at).filter(id__in=candidate_ids).update(
+        claimed_at=claimed_at,
+        attempt_count=F("attempt_count") + 1,
+        last_attempt_at=claimed_at,
+    )
+    entries = list(
+        EmailOutbox.objects.filter(id__in=candidate_ids, claimed_at=claimed_at).order_by(
+            "id"
+        )
+    )
+    if not entries:
+        return EmailOutboxDeliveryResult()
+
+    sent_ids: list[int] = []
+    failures: list[tuple[EmailOutbox, Exception]] = []
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        failures = [(entry, exc) for entry in entries]
+        entries = []
+    try:
+        for entry in entries:
+            try:
+                if connection.send_messages([_build_message(entry, connection)]) < 1:
+                    raise RuntimeError("Email backend did not accept the message.")
+            except Exception as exc:
+                failures.append((entry, exc))
+            else:
+                sent_ids.append(entry.id)
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            logger.warning("Email backend connection could not be closed", exc_info=True)
+
+    if sent_ids:
+        EmailOutbox.objects.filter(id__in=sent_ids, claimed_at=claimed_at).delete()
+    exhausted = 0
+    for entry, error in failures:
+        if _record_failure(entry, claimed_at, error):
+            exhausted += 1
+            logger.error(
+                "Email outbox entry failed permanently",
+                extra={"email_outbox_id": entry.id, "category": entry.category},
+            )
+    if failures:
+        logger.warning(
+            "Email outbox delivery had failures",
+            extra={"failed_count": len(failures), "exhausted_count": exhausted},
+        )
+    return EmailOutboxDeliveryResult(sent=len(sent_ids), failed=len(failures))
+
+
+def purge_failed_emails(*, now: datetime | None = None) -> int:
+    """Zmaž zlyhané riadky po retencii (už len kategória a posledná chyba)."""
+
+    cutoff = (now or timezone.now()) - timedelta(days=EMAIL_OUTBOX_FAILED_RETENTION_DAYS)
+    deleted, _ = EmailOutbox.objects.filter(failed_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,73 @@
+"""
+Denormalizované ``FeedPost.likes_count`` / ``FeedPost.comments_count``.
+
+Feed stránka predtým rátala lajky aj komentáre dvoma korelovanými COUNT
+subquery na každý príspevok. Počítadlá sa teraz udržiavajú pri zápise:
+
+* nový lajk / komentár → ``adjust_feed_post_counters`` s +1 (F() delta,
+  v tej istej transakcii ako INSERT),
+* odlajkovanie / zmazanie komentára → delta so záporným počtom zmazaných riadkov,
+* hromadné zásahy (GDPR zmazanie účtu) → ``recompute_feed_post_counters``
+  pre dotknuté príspevky (presný prepočet, rovnaký ako nočný
+  ``manage.py reconcile_feed_counters``).
+"""
+
+from __future__ import annotations
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from ..models import FeedPost, FeedPostComment, FeedPostLike
+
+
+def adjust_feed_post_counters(*, post_id: int, likes: int = 0, comments: int = 0) -> int:
+    """Pripočítaj delty k počítadlám príspevku (záporné sa orežú na 0)."""
+    updates = {}
+    if likes:
+        updates["likes_count"] = Greatest(F("likes_count") + likes, Value(0))
+    if comments:
+        updates["comments_count"] = Greatest(F("comments_count") + comments, Value(0))
+    if not updates:
+        return 0
+    return FeedPost.objects.filter(pk=post_id).update(**updates)
+
+
+def _related_count_subquery(model) -> Coalesce:
+    # ``order_by()`` – Meta.ordering by inak pribudol do GROUP BY.
+    return Coalesce(
+        Subquery(
+            model.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def drifted_feed_posts(posts=None):
+    """Príspevky, ktorých uložené počítadlá nesedia s prepočtom."""
+    qs = FeedPost.objects.all() if posts is None else posts
+    return qs.annotate(
+        expected_likes_count=_related_count_subquery(FeedPostLike),
+        expected_comments_count=_related_count_subquery(FeedPostComment),
+    ).filter(
+        ~Q(likes_count=F("expected_likes_count"))
+        | ~Q(comments_count=F("expected_comments_count"))
+    )
+
+
+def recompute_feed_post_counters(posts=None) -> int:
+    """
+    Prepočítaj počítadlá od nuly jedným UPDATE-om s korelovanými COUNT.
+
+    ``posts`` je voliteľný queryset FeedPost na zúženie; bez neho sa prepočítajú
+    všetky príspevky. Vracia počet aktualizovaných riadkov.
+    """
+    qs = FeedPost.objects.all() if posts is None else posts
+    return qs.update(
+        likes_count=_related_count_subquery(FeedPostLike),
+        comments_count=_related_count_subquery(FeedPostComment),
+    )
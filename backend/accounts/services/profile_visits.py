@@ -1,25 +1,234 @@
-"""Retencia návštev profilu (Fáza 4.1).
+"""Zápis (write-behind buffer) a retencia návštev profilu (Fáza 4.1).
 
-Vzor prevzatý z ``accounts.services.notifications`` (retenčná konštanta + batch
-purge). Maže podľa ``created_at`` (UTC datetime), NIE podľa ``visit_date`` –
-90-dňová hranica je hrubá a nezávisí na lokálnom dni (viď prieskum: DB v UTC,
-appka v Europe/Bratislava).
+Zápis: GET cudzieho profilu nerobí DB zápis. Návšteva sa deduplikuje v Redis
+(set viewerov na (profil, deň)) a nová kombinácia sa zaradí do pending setu;
+Celery beat (``flush_profile_visits_task``) ju dávkovo zapíše cez
+``bulk_create(ignore_conflicts=True)``. Populárny profil tak nesúperí
+o unique index pri každom zobrazení. Bez Redis (locmem/dev/testy) ide zápis
+priamo – jeden INSERT ... ON CONFLICT DO NOTHING, bez savepointu.
+
+Retencia: vzor prevzatý z ``accounts.services.notifications`` (retenčná
+konštanta + batch purge). Maže podľa ``created_at`` (UTC datetime), NIE podľa
+``visit_date`` – 90-dňová hranica je hrubá a nezávisí na lokálnom dni (viď
+prieskum: DB v UTC, appka v Europe/Bratislava).
 """
 
 from __future__ import annotations
 
-from datetime import timedelta
+import logging
+from datetime import date, timedelta
 
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 
 from accounts.models import ProfileVisit
 
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
 # Retencia (dni) pre návštevy profilu. Anchor = created_at (GDPR minimalizácia
 # dát – staršie záznamy sa nedržia).
 PROFILE_VISIT_RETENTION_DAYS = 90
 
 _PURGE_BATCH_SIZE = 1000
 
+PROFILE_VISIT_BUFFER_PREFIX = "profile_visit_buffer"
+# Dedup set (profil, deň) musí prežiť celý lokálny deň aj posun voči UTC.
+PROFILE_VISIT_DEDUP_TTL_SECONDS = 2 * 24 * 60 * 60
+PROFILE_VISIT_FLUSH_BATCH_SIZE = 1000
+
+
+def _visit_member(profile_user_id: int, viewer_id: int, visit_date: date) -> str:
+    return f"{int(profile_user_id)}:{int(viewer_id)}:{visit_date.isoformat()}"
+
+
+def _parse_visit_member(raw) -> ProfileVisit | None:
+    if isinstance(raw, bytes):
+        raw = raw.decode()
+    try:
+        profile_user_id, viewer_id, visit_date = str(raw).split(":")
+        return ProfileVisit(
+            profile_user_id=int(profile_user_id),
+            viewer_id=int(viewer_id),
+            visit_date=date.fromisoformat(visit_date),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class DirectProfileVisitBuffer:
+    """Bez Redis: okamžitý idempotentný INSERT (locmem/dev/testy)."""
+
+    def record(self, *, profile_user_id: int, viewer_id: int, visit_date: date) -> None:
+        ProfileVisit.objects.bulk_create(
+            [
+                ProfileVisit(
+                    profile_user_id=profile_user_id,
+                    viewer_id=viewer_id,
+                    visit_date=visit_date,
+                )
+            ],
+            ignore_conflicts=True,
+        )
+
+    def peek_pending(self, count: int) -> list:
+        return []
+
+    def ack(self, members) -> None:
+        return None
+
+
+# KEYS[1] = dedup set viewerov pre (profil, deň), KEYS[2] = pending set.
+# ARGV = viewer_id, člen pending setu, TTL dedup setu.
+# Do pending setu ide len PRVÁ návšteva kombinácie za deň.
+_REDIS_RECORD_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 1 then
+  redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+  redis.call('SADD', KEYS[2], ARGV[2])
+  return 1
+end
+return 0
+"""
+
+
+class RedisProfileVisitBuffer:
+    """
+    Write-behind buffer v Redis: jeden Lua skript na návštevu (dedup + zaradenie),
+    flush cez ``SRANDMEMBER`` + ``SREM`` až po úspešnom INSERT-e – pád workera
+    medzi čítaním a zápisom tak návštevu nestratí (ostane v pending sete).
+    Súbežné flushe môžu ten istý člen zapísať dvakrát; ``ignore_conflicts``
+    z toho robí no-op.
+    Kľúče idú cez ``cache.make_key`` (KEY_PREFIX/verzia ako zvyšok cache).
+    """
+
+    def __init__(self, client=None):
+        self._client = client
+        self._script = None
+
+    def _get_client(self):
+        if self._client is None:
+            from django_redis import get_redis_connection
+
+            self._client = get_redis_connection("default")
+        return self._client
+
+    def _get_script(self):
+        if self._script is None:
+            self._script = self._get_client().register_script(_REDIS_RECORD_SCRIPT)
+        return self._script
+
+    @staticmethod
+    def dedup_key(profile_user_id: int, visit_date: date) -> str:
+        return cache.make_key(
+            f"{PROFILE_VISIT_BUFFER_PREFIX}:seen:{int(profile_user_id)}:{visit_date.isoformat()}"
+        )
+
+    @staticmethod
+    def pending_key() -> str:
+        return cache.make_key(f"{PROFILE_VISIT_BUFFER_PREFIX}:pending")
+
+    def record(self, *, profile_user_id: int, viewer_id: int, visit_date: date) -> None:
+        self._get_script()(
+            keys=[self.dedup_key(profile_user_id, visit_date), self.pending_key()],
+            args=[
+                int(viewer_id),
+                _visit_member(profile_user_id, viewer_id, visit_date),
+                PROFILE_VISIT_DEDUP_TTL_SECONDS,
+            ],
+        )
+
+    def peek_pending(self, count: int) -> list:
+        return list(self._get_client().srandmember(self.pending_key(), count) or [])
+
+    def ack(self, members) -> None:
+        if members:
+            self._get_client().srem(self.pending_key(), *members)
+
+
+_direct_buffer = DirectProfileVisitBuffer()
+_redis_buffer = None
+
+
+def get_profile_visit_buffer():
+    """
+    Buffer podľa ``settings.PROFILE_VISIT_BUFFER_BACKEND``: ``"redis"``,
+    ``"direct"`` alebo ``"auto"`` (default) – Redis, ak default cache beží na
+    django_redis (rovnaké pravidlo ako presence backend).
+    """
+    global _redis_buffer
+
+    choice = str(getattr(settings, "PROFILE_VISIT_BUFFER_BACKEND", "auto") or "auto").lower()
+    if choice == "auto":
+        cache_backend = str(
+            (getattr(settings, "CACHES", {}) or {}).get("default", {}).get("BACKEND", "")
+        )
+        choice = "redis" if cache_backend.startswith("django_redis.") else "direct"
+    if choice != "redis":
+        return _direct_buffer
+    if _redis_buffer is None:
+        _redis_buffer = RedisProfileVisitBuffer()
+    return _redis_buffer
+
+
+def record_profile_visit(*, profile_user_id: int, viewer_id: int) -> None:
+    """Zaznamenaj návštevu cudzieho profilu (lokálny deň). Volajúci rieši fail-open."""
+    get_profile_visit_buffer().record(
+        profile_user_id=int(profile_user_id),
+        viewer_id=int(viewer_id),
+        visit_date=timezone.localdate(),
+    )
+
+
+def flush_buffered_profile_visits(
+    *, batch_size: int = PROFILE_VISIT_FLUSH_BATCH_SIZE, buffer=None
+) -> int:
+    """
+    Zapíš čakajúce návštevy do DB v dávkach; vracia počet spracovaných členov.
+
+    Člen sa z pending setu odoberie až po úspešnom zápise dávky – pri chybe
+    (aj páde workera) ostáva čakať a výnimka ide ďalej, Celery task ju zopakuje.
+    """
+    buffer = buffer or get_profile_visit_buffer()
+    flushed = 0
+    while True:
+        members = buffer.peek_pending(batch_size)
+        if not members:
+            break
+        visits = [visit for visit in map(_parse_visit_member, members) if visit]
+        try:
+            # Účet zmazaný medzi návštevou a flushom by FK chybou zablokoval
+            # celú dávku – takéto návštevy sa zahodia.
+            existing_user_ids = set(
+                User.objects.filter(
+                    pk__in={visit.profile_user_id for visit in visits}
+                    | {visit.viewer_id for visit in visits}
+                ).values_list("pk", flat=True)
+            )
+            # ignore_conflicts: opakovaný flush/duplicita s priamym zápisom je no-op.
+            ProfileVisit.objects.bulk_create(
+                [
+                    visit
+                    for visit in visits
+                    if visit.profile_user_id in existing_user_ids
+                    and visit.viewer_id in existing_user_ids
+                ],
+                ignore_conflicts=True,
+            )
+        except Exception:
+            logger.warning(
+                "Profile visit flush failed, batch left pending",
+                extra={"batch_size": len(members)},
+            )
+            raise
+        buffer.ack(members)
+        flushed += len(members)
+        if len(members) < batch_size:
+            break
+    return flushed
+
 
 def purge_old_profile_visits(*, dry_run: bool = True) -> int:
     """
@@ -1,15 +1,25 @@
 """Shared user-blocking operations and queries."""
 
+import os
 from collections.abc import Iterable
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Q, QuerySet
 
+from accounts.cache_versioning import next_cache_version_token
 from accounts.models import FavoriteUser, ProfileLike, UserBlock
 
 User = get_user_model()
 
+USER_BLOCK_SET_CACHE_TTL_SECONDS = int(
+    os.getenv("USER_BLOCK_SET_CACHE_TTL_SECONDS", "600") or "600"
+)
+USER_BLOCK_SET_CACHE_VERSION_TTL_SECONDS = int(
+    os.getenv("USER_BLOCK_SET_CACHE_VERSION_TTL_SECONDS", "86400") or "86400"
+)
+
 
 class BlockedUserInteractionError(Exception):
     """Raised when a blocked user pair attempts a protected interaction."""
@@ -19,21 +29,27 @@ def exclude_blocked_users(
     queryset: QuerySet,
     *,
     viewer_user_id: int | None,
-    user_id_field: str = "pk",
+    user_id_field: str | tuple[str, ...] = "pk",
 ) -> QuerySet:
-    """Exclude users who have either side of a block with the viewer."""
+    """Exclude users who have either side of a block with the viewer.
+
+    The viewer's block set comes from ``cached_blocked_user_ids_for`` and is
+    applied as a literal ID list, so the common case (no blocks) adds no SQL
+    at all. Pass a tuple of fields to exclude several user columns with one
+    block-set lookup.
+    """
     if not viewer_user_id:
         return queryset
 
-    outgoing_ids = UserBlock.objects.filter(
-        blocker_id=viewer_user_id,
-    ).values("blocked_user_id")
-    incoming_ids = UserBlock.objects.filter(
-        blocked_user_id=viewer_user_id,
-    ).values("blocker_id")
-    return queryset.exclude(**{f"{user_id_field}__in": outgoing_ids}).exclude(
-        **{f"{user_id_field}__in": incoming_ids}
-    )
+    blocked_ids = cached_blocked_user_ids_for(user_id=viewer_user_id)
+    if not blocked_ids:
+        return queryset
+
+    fields = (user_id_field,) if isinstance(user_id_field, str) else user_id_field
+    blocked_id_list = sorted(blocked_ids)
+    for field in fields:
+        queryset = queryset.exclude(**{f"{field}__in": blocked_id_list})
+    return queryset
 
 
 def lock_users_for_update(*, user_ids: Iterable[int]) -> None:
@@ -85,6 +101,82 @@ def blocked_user_ids_for(*, user_id: int | None) -> set[int]:
     }
 
 
+def _user_block_set_cache_version_key(user_id: int) -> str:
+    return f"user_block_set_version_v1:{int(user_id)}"
+
+
+def _user_block_set_cache_key(user_id: int) -> str:
+    try:
+        version = cache.get(_user_block_set_cache_version_key(user_id))
+    except Exception:
+        version = None
+    return f"user_block_set_v1:{int(user_id)}:{version or '1'}"
+
+
+def cached_blocked_user_ids_for(*, user_id: int | None) -> frozenset[int]:
+    """Return ``blocked_user_ids_for`` through a per-user versioned cache.
+
+    Fails open to the database when the cache is unavailable; the version is
+    bumped by ``invalidate_user_block_set_cache`` on every block change.
+    """
+    if not user_id:
+        return frozenset()
+    if USER_BLOCK_SET_CACHE_TTL_SECONDS <= 0:
+        return frozenset(blocked_user_ids_for(user_id=user_id))
+
+    cache_key = _user_block_set_cache_key(user_id)
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        cached = None
+    if isinstance(cached, (list, tuple, set, frozenset)):
+        return frozenset(int(blocked_id) for blocked_id in cached)
+
+    blocked_ids = frozenset(blocked_user_ids_for(user_id=user_id))
+    try:
+        cache.set(
+            cache_key,
+            sorted(blocked_ids),
+            timeout=USER_BLOCK_SET_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        pass
+    return blocked_ids
+
+
+def invalidate_user_block_set_cache(user_id: int | None) -> None:
+    if not user_id:
+        return
+    try:
+        cache.set(
+            _user_block_set_cache_version_key(int(user_id)),
+            next_cache_version_token(),
+            timeout=USER_BLOCK_SET_CACHE_VERSION_TTL_SECONDS,
+        )
+    except Exception:
+        pass
+
+
+def schedule_user_block_set_cache_invalidation(
+    *, first_user_id: int, second_user_id: int
+) -> None:
+    """Bump the cached block sets of a pair now AND once the transaction commits.
+
+    The block set is symmetric (it holds both directions), so both users are
+    bumped. The immediate bump makes the change visible to the writing request
+    itself; the ``on_commit`` bump discards any entry a concurrent read
+    repopulated from the not-yet-committed state in between — the same race
+    _schedule_skill_request_cache_invalidation guards against.
+    """
+
+    def _invalidate() -> None:
+        invalidate_user_block_set_cache(first_user_id)
+        invalidate_user_block_set_cache(second_user_id)
+
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
 def _schedule_skill_request_cache_invalidation(
     *, first_user_id: int, second_user_id: int
 ) -> None:
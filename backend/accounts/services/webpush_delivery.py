@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
@@ -30,6 +34,14 @@ MESSAGE_PUSH_TTL_SECONDS = 60
 MESSAGE_PUSH_TAG_PREFIX = "messages-conversation-"
 TEMPORARY_PUSH_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
 GONE_PUSH_STATUS_CODES = {404, 410}
+DEFAULT_PUSH_DELIVERY_MAX_WORKERS = 8
+DEFAULT_PUSH_REQUEST_TIMEOUT_SECONDS = 10
+
+# Keep-alive sessions per push-service origin (fcm.googleapis.com,
+# updates.push.services.mozilla.com, web.push.apple.com, ...). They live for the
+# whole worker process, so consecutive tasks reuse the TLS connections as well.
+_push_sessions: dict[str, requests.Session] = {}
+_push_sessions_lock = threading.Lock()
 
 
 class WebPushSubscriptionGone(Exception):
@@ -50,6 +62,18 @@ class MessagePushDeliveryResult:
     retry_subscription_ids: tuple[int, ...] = ()
 
 
+@dataclass(frozen=True)
+class _PushJob:
+    subscription: object
+    endpoint: str
+    p256dh: str
+    auth: str
+
+    @property
+    def origin(self) -> str:
+        return push_service_origin(self.endpoint)
+
+
 def _normalize_positive_ids(values) -> tuple[int, ...]:
     normalized: list[int] = []
     for value in values or []:
@@ -120,6 +144,62 @@ def _import_pywebpush():
     return webpush, WebPushException
 
 
+def _get_push_delivery_max_workers() -> int:
+    try:
+        value = int(
+            getattr(
+                settings,
+                "WEB_PUSH_DELIVERY_MAX_WORKERS",
+                DEFAULT_PUSH_DELIVERY_MAX_WORKERS,
+            )
+        )
+    except (TypeError, ValueError):
+        return DEFAULT_PUSH_DELIVERY_MAX_WORKERS
+    return max(value, 1)
+
+
+def _get_push_request_timeout_seconds() -> float:
+    try:
+        value = float(
+            getattr(
+                settings,
+                "WEB_PUSH_REQUEST_TIMEOUT_SECONDS",
+                DEFAULT_PUSH_REQUEST_TIMEOUT_SECONDS,
+            )
+        )
+    except (TypeError, ValueError):
+        return float(DEFAULT_PUSH_REQUEST_TIMEOUT_SECONDS)
+    return value if value > 0 else float(DEFAULT_PUSH_REQUEST_TIMEOUT_SECONDS)
+
+
+def push_service_origin(endpoint: str) -> str:
+    parts = urlsplit(endpoint or "")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_push_session(origin: str) -> requests.Session:
+    with _push_sessions_lock:
+        session = _push_sessions.get(origin)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_get_push_delivery_max_workers(),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _push_sessions[origin] = session
+        return session
+
+
+def close_push_sessions() -> None:
+    with _push_sessions_lock:
+        sessions = list(_push_sessions.values())
+        _push_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
 def ensure_web_push_delivery_ready() -> None:
     _get_web_push_vapid_private_key()
     _get_web_push_vapid_subject()
@@ -143,6 +223,7 @@ def send_web_push_request(
     p256dh: str,
     auth: str,
     payload: dict[str, object],
+    session: requests.Session | None = None,
 ):
     webpush, WebPushException = _import_pywebpush()
 
@@ -159,6 +240,8 @@ def send_web_push_request(
             vapid_private_key=_get_web_push_vapid_private_key(),
             vapid_claims={"sub": _get_web_push_vapid_subject()},
             ttl=MESSAGE_PUSH_TTL_SECONDS,
+            timeout=_get_push_request_timeout_seconds(),
+            requests_session=session,
         )
     except WebPushException as exc:
         response = getattr(exc, "response", None)
@@ -178,6 +261,58 @@ def send_web_push_request(
         raise TemporaryWebPushDeliveryError("Temporary web push network failure.") from exc
 
 
+_PUSH_OUTCOME_ERRORS = (
+    ImproperlyConfigured,
+    WebPushSubscriptionGone,
+    TemporaryWebPushDeliveryError,
+    PermanentWebPushDeliveryError,
+)
+
+
+def _send_push_jobs(
+    jobs: list[_PushJob],
+    *,
+    payload: dict[str, object],
+) -> list[Exception | None]:
+    """Send all jobs concurrently; one outcome per job, in input order.
+
+    Jobs are grouped by push-service origin so every origin gets one pooled
+    keep-alive session. Workers only do HTTP – subscription bookkeeping (DB
+    writes) stays on the calling thread.
+    """
+    sessions = {
+        origin: get_push_session(origin) for origin in {job.origin for job in jobs}
+    }
+
+    def send(job: _PushJob) -> Exception | None:
+        try:
+            send_web_push_request(
+                endpoint=job.endpoint,
+                p256dh=job.p256dh,
+                auth=job.auth,
+                payload=payload,
+                session=sessions[job.origin],
+            )
+        except _PUSH_OUTCOME_ERRORS as exc:
+            return exc
+        return None
+
+    order = sorted(range(len(jobs)), key=lambda index: jobs[index].origin)
+    workers = min(_get_push_delivery_max_workers(), len(jobs))
+    if workers <= 1:
+        results = [send(jobs[index]) for index in order]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="webpush"
+        ) as pool:
+            results = list(pool.map(send, [jobs[index] for index in order]))
+
+    outcomes: list[Exception | None] = [None] * len(jobs)
+    for index, outcome in zip(order, results):
+        outcomes[index] = outcome
+    return outcomes
+
+
 def deliver_message_push(
     *,
     message_id: int,
@@ -294,11 +429,17 @@ def deliver_message_push(
     gone_count = 0
     permanent_failure_count = 0
 
+    jobs: list[_PushJob] = []
     for subscription in subscriptions:
         try:
-            endpoint = subscription.endpoint
-            p256dh = subscription.p256dh
-            auth = subscription.auth
+            jobs.append(
+                _PushJob(
+                    subscription=subscription,
+                    endpoint=subscription.endpoint,
+                    p256dh=subscription.p256dh,
+                    auth=subscription.auth,
+                )
+            )
         except ImproperlyConfigured:
             logger.warning(
                 "Web push subscription could not be decrypted.",
@@ -308,16 +449,12 @@ def deliver_message_push(
             )
             mark_web_push_delivery_failure(subscription=subscription)
             permanent_failure_count += 1
-            continue
 
-        try:
-            send_web_push_request(
-                endpoint=endpoint,
-                p256dh=p256dh,
-                auth=auth,
-                payload=payload,
-            )
-        except ImproperlyConfigured:
+    outcomes = _send_push_jobs(jobs, payload=payload) if jobs else []
+
+    for job, outcome in zip(jobs, outcomes):
+        subscription = job.subscription
+        if isinstance(outcome, ImproperlyConfigured):
             logger.warning(
                 "Web push delivery skipped because sender configuration is invalid.",
                 extra={"message_id": int(message_id)},
@@ -339,10 +476,10 @@ def deliver_message_push(
                 delivered_count=delivered_count,
                 retry_subscription_ids=tuple(sorted(set(retry_subscription_ids))),
             )
-        except WebPushSubscriptionGone:
+        if isinstance(outcome, WebPushSubscriptionGone):
             mark_web_push_delivery_failure(subscription=subscription, deactivate=True)
             gone_count += 1
-        except TemporaryWebPushDeliveryError:
+        elif isinstance(outcome, TemporaryWebPushDeliveryError):
             mark_web_push_delivery_failure(subscription=subscription)
             retry_subscription_ids.append(subscription.id)
             logger.warning(
@@ -352,7 +489,7 @@ def deliver_message_push(
                     "message_id": int(message_id),
                 },
             )
-        except PermanentWebPushDeliveryError:
+        elif isinstance(outcome, PermanentWebPushDeliveryError):
             mark_web_push_delivery_failure(subscription=subscription)
             permanent_failure_count += 1
             logger.warning(
@@ -11,6 +11,7 @@ from .models import (
     OfferedSkillLike,
     Review,
     SkillRequest,
+    UserBlock,
 )
 from .authentication import invalidate_user_auth_cache
 from .search_projection import (
@@ -48,6 +49,22 @@ def _user_save_touches_projection(update_fields) -> bool:
     return bool(_PROJECTION_RELEVANT_USER_FIELDS.intersection(update_fields))
 
 
+def _sync_feed_post_author_district(user, update_fields) -> None:
+    """Prepíš ``FeedPost.author_district`` po zmene okresu autora.
+
+    Rovnaké pravidlo ako pri projekcii: ``update_fields=None`` → konzervatívne
+    áno. ``exclude`` drží UPDATE prázdny, keď sa okres v skutočnosti nezmenil.
+    """
+    if not getattr(user, "pk", None):
+        return
+    if update_fields is not None and "district" not in update_fields:
+        return
+    district = user.district or ""
+    FeedPost.objects.filter(author_id=user.pk).exclude(author_district=district).update(
+        author_district=district
+    )
+
+
 def _sync_dashboard_search_projection_for_user_safely(user_id):
     if not user_id:
         return
@@ -84,6 +101,9 @@ def invalidate_auth_cache_after_user_save(sender, instance, **kwargs):
     # by sme zbytočne iterovali a prepisovali projekcie všetkých skills používateľa.
     if _user_save_touches_projection(kwargs.get("update_fields")):
         _sync_dashboard_search_projection_for_user_safely(getattr(instance, "pk", None))
+        # Lokalita/aktivita viewera mení aj jeho predpočítané odporúčania.
+        _mark_dashboard_recommendations_stale_for_user(getattr(instance, "pk", None))
+    _sync_feed_post_author_district(instance, kwargs.get("update_fields"))
 
 
 @receiver(post_delete, sender=User)
@@ -142,6 +162,23 @@ def _invalidate_dashboard_recommendations_cache_for_user(user_id):
         pass
 
 
+def _mark_dashboard_recommendations_stale_for_user(user_id):
+    # Označí zoznam a po commite naplánuje prepočet pre tohto viewera; čítanie
+    # medzitým slúži starý zoznam. Záloha: refresh_stale_dashboard_recommendations_task.
+    if not user_id:
+        return
+    try:
+        from .views.dashboard_views.recommendations import (
+            mark_dashboard_recommendations_stale,
+            schedule_dashboard_recommendations_refresh,
+        )
+
+        if mark_dashboard_recommendations_stale(user_id):
+            schedule_dashboard_recommendations_refresh(user_id)
+    except DatabaseError:
+        pass
+
+
 def _owner_id_for_skill_image(instance):
     skill = getattr(instance, "skill", None)
     user_id = getattr(skill, "user_id", None)
@@ -210,6 +247,7 @@ def invalidate_skills_cache_after_skill_change(sender, instance, **kwargs):
     _invalidate_skills_list_cache_for_user(user_id)
     _invalidate_dashboard_user_skills_cache_for_user(user_id)
     _invalidate_dashboard_recommendations_cache_for_user(user_id)
+    _mark_dashboard_recommendations_stale_for_user(user_id)
 
 
 @receiver(post_save, sender=OfferedSkillImage)
@@ -293,3 +331,18 @@ def invalidate_dashboard_user_skills_cache_after_skill_request_change(
     _invalidate_dashboard_user_skills_cache_for_user(
         _owner_id_for_skill_request(instance)
     )
+
+
+@receiver(post_save, sender=UserBlock)
+@receiver(post_delete, sender=UserBlock)
+def invalidate_user_block_set_cache_after_block_change(sender, instance, **kwargs):
+    # Pokrýva service (create/delete_user_block) aj priame zápisy (admin, skripty).
+    try:
+        from .services.user_blocks import schedule_user_block_set_cache_invalidation
+
+        schedule_user_block_set_cache_invalidation(
+            first_user_id=getattr(instance, "blocker_id", None),
+            second_user_id=getattr(instance, "blocked_user_id", None),
+        )
+    except Exception:
+        pass
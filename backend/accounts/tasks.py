@@ -16,6 +16,7 @@ from django.utils import timezone
 
 from .models import BugReport, BugReportNotificationOutbox
 from .services.bug_reports import purge_old_bug_reports
+from .services.email_outbox import deliver_pending_emails, purge_failed_emails
 
 logger = logging.getLogger(__name__)
 _NOTIFICATION_RECOVERY_BATCH_SIZE = 100
@@ -164,3 +165,35 @@ def purge_old_bug_reports_task(self) -> int:
         extra={"deleted_bug_report_count": deleted_count},
     )
     return deleted_count
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=120,
+)
+def send_pending_emails_task(self) -> int:
+    """Send due transactional emails from the outbox over one pooled connection."""
+
+    result = deliver_pending_emails()
+    return result.sent
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=300,
+)
+def purge_failed_emails_task(self) -> int:
+    """Drop permanently failed outbox emails after their retention period."""
+
+    deleted_count = purge_failed_emails()
+    logger.info(
+        "Failed email outbox purge finished.",
+        extra={"deleted_email_outbox_count": deleted_count},
+    )
+    return deleted_count
@@ -19,10 +19,9 @@ class TestAuthEndpoints(APITestCase):
         assert r.status_code == status.HTTP_200_OK
         assert "required_fields" in r.data
 
-    @patch("accounts.models.verification.send_mail")
+    @patch("accounts.services.email_outbox.queue_email")
     @override_settings(EMAIL_VERIFICATION_REQUIRED=True, ALLOW_UNVERIFIED_LOGIN=True)
-    def test_register_post_success(self, mock_send_mail):
-        mock_send_mail.return_value = True
+    def test_register_post_success(self, mock_queue_email):
         url = reverse("accounts:register")
         payload = {
             "username": "reg",
@@ -95,10 +94,9 @@ class TestRegistrationFieldKeywordFalsePositive(APITestCase):
     neplatný formát musí zostať odmietnutý cez štruktúrované validátory.
     """
 
-    @patch("accounts.models.verification.send_mail")
+    @patch("accounts.services.email_outbox.queue_email")
     @override_settings(EMAIL_VERIFICATION_REQUIRED=False)
-    def test_register_with_keyword_username_email_website_succeeds(self, mock_send_mail):
-        mock_send_mail.return_value = True
+    def test_register_with_keyword_username_email_website_succeeds(self, mock_queue_email):
         url = reverse("accounts:register")
         payload = {
             "username": "update select guru",
@@ -0,0 +1,222 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from accounts import authentication_helpers as helpers
+from accounts.auth_invalidation import (
+    AuthInvalidationListener,
+    auth_invalidation_channel,
+    publish_user_auth_invalidation,
+)
+from accounts.authentication import (
+    SwaplyJWTAuthentication,
+    _redis_user_cache_key,
+    _serialize_user_for_cache,
+    _user_cache_get,
+    invalidate_user_auth_cache,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def l1_enabled():
+    helpers._user_cache_clear()
+    with patch.object(helpers, "_USER_CACHE_MODE", "1"):
+        yield
+    helpers._user_cache_clear()
+
+
+def _user(username="l1-user", **extra):
+    return User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        password="StrongPass123",
+        **extra,
+    )
+
+
+def _authenticate(user):
+    auth = SwaplyJWTAuthentication()
+    return auth.get_user(validated_token={"user_id": user.id, "token_type": "access"})
+
+
+@pytest.mark.django_db
+def test_second_request_is_served_from_l1_without_redis(l1_enabled):
+    user = _user()
+    cache.set(_redis_user_cache_key(user.id), _serialize_user_for_cache(user), 300)
+    _authenticate(user)
+
+    with patch("accounts.authentication.cache.get") as redis_get:
+        got = _authenticate(user)
+
+    redis_get.assert_not_called()
+    assert got.id == user.id
+    assert got.is_active is True
+
+
+@pytest.mark.django_db
+def test_deactivation_drops_l1_entry_and_next_request_is_rejected(l1_enabled):
+    user = _user("l1-deactivated")
+    _authenticate(user)
+    assert _user_cache_get(user.id) is not None
+
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+
+    assert _user_cache_get(user.id) is None
+    with pytest.raises(InvalidToken):
+        _authenticate(user)
+
+
+@pytest.mark.django_db
+def test_state_read_before_invalidation_is_not_written_to_l1(l1_enabled):
+    user = _user("l1-race")
+    epoch = helpers._user_cache_epoch()
+
+    invalidate_user_auth_cache(user.id)
+    helpers._user_cache_set(user.id, _serialize_user_for_cache(user), epoch=epoch)
+
+    assert _user_cache_get(user.id) is None
+
+
+def test_l1_entries_expire_after_ttl(l1_enabled):
+    with patch.object(helpers, "_USER_CACHE_TTL_SECONDS", 0.01):
+        helpers._user_cache_set(7, {"id": 7, "is_active": True})
+        time.sleep(0.02)
+        assert _user_cache_get(7) is None
+
+
+def test_auto_mode_without_redis_pubsub_keeps_l1_off():
+    helpers._user_cache_clear()
+    with patch.object(helpers, "_USER_CACHE_MODE", "auto"):
+        helpers._user_cache_set(8, {"id": 8, "is_active": True})
+        assert _user_cache_get(8) is None
+
+
+class _StubPubSub:
+    def __init__(self, messages, *, fail_after=False):
+        self.messages = list(messages)
+        self.fail_after = fail_after
+        self.channels = []
+        self.closed = False
+
+    def subscribe(self, channel):
+        self.channels.append(channel)
+
+    def get_message(self, timeout=None):
+        if self.messages:
+            return self.messages.pop(0)
+        if self.fail_after:
+            raise ConnectionError("redis gone")
+        time.sleep(0.01)
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+class _StubRedis:
+    def __init__(self, pubsub=None):
+        self._pubsub = pubsub
+        self.published = []
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return self._pubsub
+
+    def publish(self, channel, data):
+        self.published.append((channel, data))
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_listener_drops_invalidated_user_and_resets_on_subscribe():
+    invalidated = []
+    resets = threading.Event()
+    pubsub = _StubPubSub(
+        [
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": b"42"},
+            {"type": "message", "data": b"not-an-id"},
+        ]
+    )
+    listener = AuthInvalidationListener(
+        on_invalidate=invalidated.append,
+        on_reset=resets.set,
+        client_factory=lambda: _StubRedis(pubsub),
+    )
+
+    try:
+        listener.ensure_started()
+        assert _wait_for(lambda: invalidated == [42])
+        assert listener.healthy
+        assert resets.is_set()
+        assert pubsub.channels == [auth_invalidation_channel()]
+    finally:
+        listener.stop()
+
+
+def test_listener_disconnect_reports_unhealthy_and_clears_l1():
+    resets = []
+    pubsub = _StubPubSub([], fail_after=True)
+    listener = AuthInvalidationListener(
+        on_invalidate=lambda user_id: None,
+        on_reset=lambda: resets.append(True),
+        client_factory=lambda: _StubRedis(pubsub),
+    )
+
+    try:
+        listener.ensure_started()
+        # Subscribe reset + reset po páde spojenia.
+        assert _wait_for(lambda: len(resets) >= 2 and pubsub.closed)
+        assert not listener.healthy
+    finally:
+        listener.stop()
+
+
+def test_wildcard_message_clears_whole_cache():
+    resets = []
+    listener = AuthInvalidationListener(
+        on_invalidate=lambda user_id: None,
+        on_reset=lambda: resets.append(True),
+    )
+
+    listener.handle_message(b"*")
+
+    assert resets == [True]
+
+
+def test_publish_targets_prefixed_channel_when_redis_is_configured():
+    client = _StubRedis()
+    with patch(
+        "accounts.auth_invalidation.redis_pubsub_available", return_value=True
+    ), patch("accounts.auth_invalidation._redis_client", return_value=client):
+        assert publish_user_auth_invalidation(5) is True
+
+    assert client.published == [(auth_invalidation_channel(), "5")]
+
+
+def test_publish_is_noop_without_redis():
+    assert publish_user_auth_invalidation(5) is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_invalidation_is_broadcast_after_commit():
+    with patch(
+        "accounts.authentication_helpers.publish_user_auth_invalidation"
+    ) as publish:
+        invalidate_user_auth_cache(11)
+
+    publish.assert_called_once_with(11)
@@ -0,0 +1,69 @@
+"""manage.py bench – guard, seedovanie a JSON report s percentilmi."""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from accounts.management.commands.bench import _percentile, summarize_samples
+
+
+@override_settings(DEBUG=False)
+def test_bench_blocked_when_not_debug():
+    with pytest.raises(CommandError):
+        call_command("bench", "--skip-seed")
+
+
+def test_percentile_interpolates_linearly():
+    values = [10.0, 20.0, 30.0, 40.0]
+    assert _percentile(values, 50) == pytest.approx(25.0)
+    assert _percentile(values, 100) == pytest.approx(40.0)
+    assert _percentile([], 95) == 0.0
+    summary = summarize_samples([3.0, 1.0, 2.0], [4, 6, 5])
+    assert summary["p50_ms"] == 2.0
+    assert summary["queries_min"] == 4
+    assert summary["queries_max"] == 6
+
+
+@pytest.mark.django_db
+def test_bench_seeds_and_reports_every_endpoint(settings, tmp_path):
+    # DEBUG cez `settings` fixture, nie @override_settings: teardown fixture by
+    # inak obnovil settings z vnútra dekorátora a DEBUG=True by presiakol ďalej.
+    settings.DEBUG = True
+    # seed_test_portfolio ukladá placeholder obrázky – nie do repo media/.
+    settings.MEDIA_ROOT = str(tmp_path)
+    out = StringIO()
+    call_command(
+        "bench",
+        "--users",
+        "4",
+        "--messages",
+        "5",
+        "--iterations",
+        "2",
+        "--warmup",
+        "0",
+        stdout=out,
+        stderr=StringIO(),
+    )
+    report = json.loads(out.getvalue())
+
+    assert report["dataset"]["offered_skills"] >= 5
+    assert report["dataset"]["conversation_messages"] >= 5
+    endpoints = report["endpoints"]
+    for name in (
+        "dashboard_search",
+        "global_search",
+        "feed_list",
+        "dashboard_recommendations",
+        "conversation_list",
+        "message_list",
+    ):
+        assert name in endpoints
+        assert endpoints[name]["samples"] == 2
+        assert endpoints[name]["status_codes"] == [200]
+        assert endpoints[name]["p99_ms"] >= endpoints[name]["p50_ms"]
+        assert endpoints[name]["queries_max"] > 0
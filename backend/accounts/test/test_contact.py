@@ -6,6 +6,8 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from unittest.mock import patch
 
+from accounts.models import EmailOutbox
+
 
 @pytest.mark.django_db
 class TestContactForm(APITestCase):
@@ -23,7 +25,8 @@ class TestContactForm(APITestCase):
             "email": "user@example.com",
             "message": "Potrebujem pomoc s účtom.",
         }
-        response = self.client.post(self.url, payload, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, payload, format="json")
         assert response.status_code == status.HTTP_200_OK
         assert "message" in response.data
         assert len(mail.outbox) == 1
@@ -81,7 +84,7 @@ class TestContactForm(APITestCase):
         SUPPORT_EMAIL="info@svaply.com",
     )
     def test_contact_console_backend_skips_smtp_send(self):
-        with patch("accounts.views.contact.EmailMultiAlternatives.send") as mock_send:
+        with patch("accounts.views.contact.queue_email") as mock_send:
             response = self.client.post(
                 self.url,
                 {"email": "user@example.com", "message": "Pomoc s účtom"},
@@ -96,14 +99,22 @@ class TestContactForm(APITestCase):
         EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
         SUPPORT_EMAIL="info@svaply.com",
     )
-    def test_contact_send_zero_raises_500(self):
-        with patch("accounts.views.contact.EmailMultiAlternatives.send", return_value=0):
+    def test_contact_send_zero_keeps_email_pending_for_retry(self):
+        # Odoslanie beží po commite z outboxu; odmietnutie providera request nezhodí.
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages", return_value=0
+        ), self.captureOnCommitCallbacks(execute=True):
             response = self.client.post(
                 self.url,
                 {"email": "user@example.com", "message": "Pomoc"},
                 format="json",
             )
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.status_code == status.HTTP_200_OK
+        entry = EmailOutbox.objects.get()
+        assert entry.attempt_count == 1
+        assert entry.claimed_at is None
+        assert entry.failed_at is None
+        assert "did not accept" in entry.last_error
 
     @override_settings(CAPTCHA_ENABLED=False, RATE_LIMITING_ENABLED=False)
     @patch("accounts.views.contact._send_contact_email")
@@ -129,11 +140,12 @@ class TestContactForm(APITestCase):
             "Chcel by som update svojej objednávky, prosím select správneho "
             "produktu a delete toho starého."
         )
-        response = self.client.post(
-            self.url,
-            {"email": "user@example.com", "message": message},
-            format="json",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                {"email": "user@example.com", "message": message},
+                format="json",
+            )
         assert response.status_code == status.HTTP_200_OK
         assert len(mail.outbox) == 1
         assert message in mail.outbox[0].body
@@ -146,14 +158,15 @@ class TestContactForm(APITestCase):
     )
     def test_contact_message_script_is_sanitized_not_blocked(self):
         # XSS pokus nesmie byť blokovaný 400, ale sanitizovaný (bleach odstráni <script>).
-        response = self.client.post(
-            self.url,
-            {
-                "email": "user@example.com",
-                "message": "<script>alert('xss')</script>Ahoj",
-            },
-            format="json",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                {
+                    "email": "user@example.com",
+                    "message": "<script>alert('xss')</script>Ahoj",
+                },
+                format="json",
+            )
         assert response.status_code == status.HTTP_200_OK
         assert len(mail.outbox) == 1
         body = mail.outbox[0].body
@@ -1,11 +1,17 @@
+from io import StringIO
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from accounts.models import OfferedSkill
+from accounts.models import DashboardRecommendationSet, OfferedSkill, UserBlock
 
 User = get_user_model()
 
@@ -264,21 +270,242 @@ class DashboardRecommendationsTestCase(TestCase):
         self.assertEqual(first_response.status_code, status.HTTP_200_OK)
         self.assertEqual(first_response.data["skills"][0]["id"], cold_skill.id)
 
+        # Prepočet zastaraného zoznamu beží po commite (Celery / inline v testoch).
+        with self.captureOnCommitCallbacks(execute=True):
+            OfferedSkill.objects.create(
+                user=self.viewer,
+                category="Grafika",
+                subcategory="Logo",
+                description="Ponukam logo",
+                detailed_description="Detaily",
+                tags=["branding"],
+                is_hidden=False,
+                is_seeking=False,
+            )
+
+        second_response = self.client.get(url, {"limit": "5"})
+
+        self.assertEqual(second_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_response.data["skills"][0]["id"], hot_skill.id)
+
+    def _owner_with_skill(self, username):
+        owner = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password="testpass123",
+            first_name="Owner",
+            last_name="Pre",
+            user_type="individual",
+            is_public=True,
+            location="Bratislava",
+            district="Bratislava I",
+        )
+        skill = OfferedSkill.objects.create(
+            user=owner,
+            category="Grafika",
+            subcategory="Logo",
+            description="Hladam logo",
+            detailed_description="Detaily",
+            location="Bratislava",
+            district="Bratislava I",
+            is_hidden=False,
+            is_seeking=True,
+        )
+        return owner, skill
+
+    def test_precomputed_set_serves_reads_without_scoring_query(self):
+        _, first_skill = self._owner_with_skill("pre-first")
+        blocked_owner, blocked_skill = self._owner_with_skill("pre-blocked")
+        _, hidden_skill = self._owner_with_skill("pre-hidden")
+        call_command(
+            "precompute_dashboard_recommendations",
+            "--user-id",
+            str(self.viewer.id),
+            stdout=StringIO(),
+        )
+        entry = DashboardRecommendationSet.objects.get(viewer=self.viewer)
+        self.assertEqual(len(entry.candidates), 3)
+
+        # Zmeny po predpočte rieši čítanie: blok a skrytie ponuky.
+        UserBlock.objects.create(blocker=self.viewer, blocked_user=blocked_owner)
+        hidden_skill.is_hidden = True
+        hidden_skill.save()
+        cache.clear()
+
+        url = reverse("accounts:dashboard_search_recommendations")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, {"limit": "5"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([skill["id"] for skill in response.data["skills"]], [first_skill.id])
+        sql = " ".join(query["sql"] for query in ctx.captured_queries)
+        self.assertNotIn("REGEXP", sql.upper())
+        self.assertNotIn(blocked_skill.id, [skill["id"] for skill in response.data["skills"]])
+
+    def test_stale_only_command_refreshes_marked_sets(self):
+        _, skill = self._owner_with_skill("pre-stale")
+        call_command(
+            "precompute_dashboard_recommendations",
+            "--user-id",
+            str(self.viewer.id),
+            stdout=StringIO(),
+        )
+        self.assertFalse(DashboardRecommendationSet.objects.get(viewer=self.viewer).is_stale)
+
         OfferedSkill.objects.create(
             user=self.viewer,
             category="Grafika",
             subcategory="Logo",
             description="Ponukam logo",
             detailed_description="Detaily",
-            tags=["branding"],
             is_hidden=False,
             is_seeking=False,
         )
+        self.assertTrue(DashboardRecommendationSet.objects.get(viewer=self.viewer).is_stale)
 
-        second_response = self.client.get(url, {"limit": "5"})
+        out = StringIO()
+        call_command("precompute_dashboard_recommendations", "--stale-only", stdout=out)
 
-        self.assertEqual(second_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(second_response.data["skills"][0]["id"], hot_skill.id)
+        self.assertIn("Predpočítané: 1", out.getvalue())
+        entry = DashboardRecommendationSet.objects.get(viewer=self.viewer)
+        self.assertFalse(entry.is_stale)
+        self.assertEqual(entry.candidates[0][0], skill.id)
+
+    def test_skill_change_refreshes_viewer_set_after_commit(self):
+        _, skill = self._owner_with_skill("pre-signal")
+        call_command(
+            "precompute_dashboard_recommendations",
+            "--user-id",
+            str(self.viewer.id),
+            stdout=StringIO(),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            OfferedSkill.objects.create(
+                user=self.viewer,
+                category="Grafika",
+                subcategory="Logo",
+                description="Ponukam logo",
+                detailed_description="Detaily",
+                is_hidden=False,
+                is_seeking=False,
+            )
+            self.assertTrue(
+                DashboardRecommendationSet.objects.get(viewer=self.viewer).is_stale
+            )
+
+        entry = DashboardRecommendationSet.objects.get(viewer=self.viewer)
+        self.assertFalse(entry.is_stale)
+        self.assertEqual(entry.candidates[0][0], skill.id)
+
+    def test_stale_set_is_served_without_inline_recompute(self):
+        _, skill = self._owner_with_skill("pre-served")
+        call_command(
+            "precompute_dashboard_recommendations",
+            "--user-id",
+            str(self.viewer.id),
+            stdout=StringIO(),
+        )
+        DashboardRecommendationSet.objects.filter(viewer=self.viewer).update(is_stale=True)
+        cache.clear()
+
+        with patch(
+            "accounts.views.dashboard_views.recommendations.precompute_dashboard_recommendations"
+        ) as precompute:
+            response = self.client.get(
+                reverse("accounts:dashboard_search_recommendations"), {"limit": "5"}
+            )
+
+        precompute.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.data["skills"]], [skill.id])
+
+    def test_hourly_refresh_fans_out_viewer_chunks(self):
+        from django.utils import timezone
+
+        from swaply.tasks import dashboard_recommendations as tasks
+
+        active = [self._owner_with_skill(f"fanout-{index}")[0] for index in range(3)]
+        unread = self._owner_with_skill("fanout-unread")[0]
+        for user in [*active, unread]:
+            call_command(
+                "precompute_dashboard_recommendations",
+                "--user-id",
+                str(user.pk),
+                stdout=StringIO(),
+            )
+        DashboardRecommendationSet.objects.filter(
+            viewer_id__in=[user.pk for user in active]
+        ).update(last_read_at=timezone.now())
+
+        with patch.object(tasks, "REFRESH_CHUNK_SIZE", 2), patch.object(
+            tasks.refresh_dashboard_recommendations_chunk_task, "delay"
+        ) as delay:
+            self.assertEqual(tasks.refresh_dashboard_recommendations_task.run(), 2)
+
+        ids = sorted(user.pk for user in active)
+        self.assertEqual(
+            [call.args[0] for call in delay.call_args_list], [ids[:2], ids[2:]]
+        )
+
+        self.assertEqual(tasks.refresh_dashboard_recommendations_chunk_task.run(ids), 3)
+
+    def test_read_stamps_last_read_at_for_hourly_refresh(self):
+        from accounts.views.dashboard_views.recommendations import (
+            dashboard_recommendation_viewer_ids,
+        )
+
+        self._owner_with_skill("read-owner")
+        url = reverse("accounts:dashboard_search_recommendations")
+
+        response = self.client.get(url, {"limit": "5"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        entry = DashboardRecommendationSet.objects.get(viewer=self.viewer)
+        self.assertIsNotNone(entry.last_read_at)
+        self.assertIn(self.viewer.pk, dashboard_recommendation_viewer_ids())
+
+        # Ďalší cache miss v krátkom čase last_read_at neprepisuje.
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url, {"limit": "5"})
+        self.assertFalse(
+            any(
+                query["sql"].upper().startswith("UPDATE")
+                and "LAST_READ_AT" in query["sql"].upper()
+                for query in ctx.captured_queries
+            )
+        )
+
+    def test_old_set_is_served_and_refreshed_after_read(self):
+        from django.utils import timezone
+
+        _, first_skill = self._owner_with_skill("aged-first")
+        call_command(
+            "precompute_dashboard_recommendations",
+            "--user-id",
+            str(self.viewer.id),
+            stdout=StringIO(),
+        )
+        DashboardRecommendationSet.objects.filter(viewer=self.viewer).update(
+            computed_at=timezone.now() - timezone.timedelta(days=1)
+        )
+        _, new_skill = self._owner_with_skill("aged-new")
+        cache.clear()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(
+                reverse("accounts:dashboard_search_recommendations"), {"limit": "5"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.data["skills"]], [first_skill.id])
+        entry = DashboardRecommendationSet.objects.get(viewer=self.viewer)
+        self.assertFalse(entry.is_stale)
+        self.assertGreater(entry.computed_at, timezone.now() - timezone.timedelta(minutes=5))
+        self.assertEqual(
+            {row[0] for row in entry.candidates}, {first_skill.id, new_skill.id}
+        )
 
     def tearDown(self):
         cache.clear()
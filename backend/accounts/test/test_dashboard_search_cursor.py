@@ -0,0 +1,202 @@
+"""Keyset (cursor) stránkovanie skills vetvy dashboard searchu."""
+
+import unittest
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import DashboardSkillSearchProjection, OfferedSkill
+from accounts.views.search_query_builders import (
+    InvalidSearchCursor,
+    decode_search_cursor,
+    encode_search_cursor,
+)
+
+User = get_user_model()
+
+
+class DashboardSearchCursorTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.viewer = User.objects.create_user(
+            username="cursorviewer",
+            email="cursorviewer@example.com",
+            password="testpass123",
+        )
+        self.client.force_authenticate(user=self.viewer)
+        self.url = reverse("accounts:dashboard_search")
+
+        # Rovnaký created_at pre časť riadkov – poradie musí rozhodnúť skill_id.
+        same_moment = timezone.now()
+        for index in range(7):
+            owner = User.objects.create_user(
+                username=f"cursorowner{index}",
+                email=f"cursorowner{index}@example.com",
+                password="testpass123",
+                is_public=True,
+                is_verified=index % 3 == 0,
+            )
+            skill = OfferedSkill.objects.create(
+                user=owner,
+                category="Stolárstvo" if index % 2 else "Remeslá",
+                subcategory=f"Stolár {index}",
+                tags=["drevo"],
+            )
+            if index >= 3:
+                DashboardSkillSearchProjection.objects.filter(skill=skill).update(
+                    created_at=same_moment
+                )
+
+    def _walk_pages(self, params):
+        ids = []
+        page = 1
+        while True:
+            response = self.client.get(self.url, {**params, "per_page": 3, "page": page})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(skill["id"] for skill in response.data["skills"])
+            if not response.data["pagination"]["has_next_skills"]:
+                return ids
+            page += 1
+
+    def _walk_cursor(self, params):
+        ids = []
+        cursor = ""
+        while True:
+            query = {**params, "per_page": 3}
+            if cursor:
+                query["cursor"] = cursor
+            response = self.client.get(self.url, query)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(skill["id"] for skill in response.data["skills"])
+            pagination = response.data["pagination"]
+            if not pagination["has_next_skills"]:
+                self.assertIsNone(pagination["next_cursor_skills"])
+                return ids
+            cursor = pagination["next_cursor_skills"]
+            self.assertTrue(cursor)
+
+    def test_cursor_walk_matches_page_number_walk(self):
+        for params in ({"q": "stolar"}, {"q": "drevo"}):
+            by_page = self._walk_pages(params)
+            by_cursor = self._walk_cursor(params)
+            self.assertEqual(len(by_page), 7)
+            self.assertEqual(by_cursor, by_page)
+
+    def test_cursor_page_does_not_use_offset(self):
+        first = self.client.get(self.url, {"q": "drevo", "per_page": 3})
+        cursor = first.data["pagination"]["next_cursor_skills"]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                self.url, {"q": "drevo", "per_page": 3, "cursor": cursor}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        projection_queries = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if "accounts_dashboardskillsearchprojection" in q["sql"]
+        ]
+        self.assertTrue(projection_queries)
+        self.assertFalse(any("OFFSET" in sql.upper() for sql in projection_queries))
+
+    def test_invalid_cursor_returns_400(self):
+        for cursor in ("not-a-cursor", "x" * 600):
+            response = self.client.get(self.url, {"q": "drevo", "cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_roundtrip_and_shape_validation(self):
+        created_at = timezone.now()
+        cursor = encode_search_cursor((3, True, created_at, 42))
+        # Float relevance (starý cursor) sa odmietne – seek ide len cez celé čísla.
+        with self.assertRaises(InvalidSearchCursor):
+            decode_search_cursor(
+                encode_search_cursor((0.25, True, created_at, 42)), with_relevance=True
+            )
+        self.assertEqual(
+            decode_search_cursor(cursor, with_relevance=True),
+            [3, True, created_at, 42],
+        )
+        # Cursor s relevance nepatrí k dotazu bez relevance.
+        with self.assertRaises(InvalidSearchCursor):
+            decode_search_cursor(cursor, with_relevance=False)
+        plain = encode_search_cursor((False, created_at, 7))
+        self.assertEqual(
+            decode_search_cursor(plain, with_relevance=False),
+            [False, created_at, 7],
+        )
+
+
+@unittest.skipUnless(
+    connection.vendor == "postgresql",
+    "fulltext relevance (ts_rank + word_similarity) beží len na PostgreSQL",
+)
+class DashboardSearchCursorPostgresTests(APITestCase):
+    """Zlomkové aj zhodné relevance nesmú na hranici stránky zdvojiť/stratiť riadok."""
+
+    def setUp(self):
+        cache.clear()
+        self.viewer = User.objects.create_user(
+            username="pgcursorviewer",
+            email="pgcursorviewer@example.com",
+            password="testpass123",
+        )
+        self.client.force_authenticate(user=self.viewer)
+        self.url = reverse("accounts:dashboard_search")
+
+        same_moment = timezone.now()
+        descriptions = [
+            # Zhodné dokumenty → zhodná relevance, poradie rozhodne kľúč za ňou.
+            "stolár",
+            "stolár",
+            "stolár",
+            # Rôzne dlhé dokumenty → rôzne zlomkové ts_rank/word_similarity.
+            "stolár nábytok na mieru",
+            "stolárske práce, kuchyne, skrine a stolárstvo",
+            "oprava nábytku, stolár aj montáž, doprava po celom kraji",
+            "stolárstvo",
+        ]
+        for index, description in enumerate(descriptions):
+            owner = User.objects.create_user(
+                username=f"pgcursorowner{index}",
+                email=f"pgcursorowner{index}@example.com",
+                password="testpass123",
+                is_public=True,
+            )
+            skill = OfferedSkill.objects.create(
+                user=owner,
+                category="Remeslá",
+                subcategory="Stolár",
+                description=description,
+            )
+            DashboardSkillSearchProjection.objects.filter(skill=skill).update(
+                created_at=same_moment
+            )
+        self.expected_count = len(descriptions)
+
+    def test_cursor_walk_has_no_duplicates_or_gaps(self):
+        for per_page in (1, 2, 3):
+            by_cursor = []
+            cursor = ""
+            while True:
+                query = {"q": "stolar", "per_page": per_page}
+                if cursor:
+                    query["cursor"] = cursor
+                response = self.client.get(self.url, query)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                by_cursor.extend(skill["id"] for skill in response.data["skills"])
+                cursor = response.data["pagination"]["next_cursor_skills"]
+                if not response.data["pagination"]["has_next_skills"]:
+                    break
+
+            first_page = self.client.get(
+                self.url, {"q": "stolar", "per_page": self.expected_count}
+            )
+            by_offset = [skill["id"] for skill in first_page.data["skills"]]
+            self.assertEqual(len(by_cursor), len(set(by_cursor)))
+            self.assertEqual(len(by_cursor), self.expected_count)
+            self.assertEqual(by_cursor, by_offset)
@@ -27,6 +27,7 @@ from accounts.models import (
     SkillRequestTermination,
     SkillRequestTerminationReason,
 )
+from accounts.services.user_blocks import cached_blocked_user_ids_for
 from accounts.viewer_location_cache import (
     _viewer_location_cache_key,
     get_viewer_location_snapshot,
@@ -243,6 +244,9 @@ class DashboardViewsTestCase(TestCase):
         self.user.save(update_fields=["location", "district"])
 
         url = reverse("accounts:dashboard_search")
+        # Block-set viewera je cachovaný (1 dotaz len pri studenej cache);
+        # meriame ustálený stav.
+        cached_blocked_user_ids_for(user_id=self.user.id)
         with CaptureQueriesContext(connection) as ctx:
             response = self.client.get(
                 url,
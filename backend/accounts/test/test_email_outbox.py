@@ -0,0 +1,160 @@
+"""Transakčný outbox e-mailov (accounts.services.email_outbox)."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core import mail
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import EmailOutbox, EmailOutboxCategory
+from accounts.services import email_outbox
+from accounts.services.email_outbox import (
+    deliver_pending_emails,
+    purge_failed_emails,
+    queue_email,
+)
+
+LOCMEM = override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_OUTBOX_DELIVERY="inline",
+    EMAIL_OUTBOX_MAX_ATTEMPTS=2,
+)
+
+
+def _queue(index=0, **overrides):
+    data = {
+        "category": EmailOutboxCategory.CONTACT,
+        "subject": f"Predmet {index}",
+        "body": f"Telo {index}",
+        "to": [f"user{index}@example.com"],
+    }
+    data.update(overrides)
+    return queue_email(**data)
+
+
+@LOCMEM
+class EmailOutboxTests(TestCase):
+    def test_email_is_sent_only_after_commit_and_row_removed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            _queue(html_body="<p>Telo</p>", reply_to=["reply@example.com"])
+            self.assertEqual(len(mail.outbox), 0)
+            self.assertEqual(EmailOutbox.objects.count(), 1)
+
+        self.assertEqual(len(mail.outbox), 1)
+        sent = mail.outbox[0]
+        self.assertEqual(sent.to, ["user0@example.com"])
+        self.assertEqual(sent.reply_to, ["reply@example.com"])
+        self.assertEqual(sent.alternatives[0][1], "text/html")
+        self.assertFalse(EmailOutbox.objects.exists())
+
+    def test_rolled_back_change_never_sends(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    _queue()
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+
+        self.assertFalse(EmailOutbox.objects.exists())
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_batch_is_sent_over_one_connection(self):
+        for index in range(3):
+            _queue(index)
+
+        with patch.object(
+            email_outbox, "get_connection", wraps=email_outbox.get_connection
+        ) as get_connection:
+            result = deliver_pending_emails()
+
+        get_connection.assert_called_once()
+        self.assertEqual(result.sent, 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(EmailOutbox.objects.exists())
+
+    def test_failure_backs_off_and_marks_failed_after_max_attempts(self):
+        entry = _queue()
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("provider down"),
+        ):
+            result = deliver_pending_emails()
+            entry.refresh_from_db()
+            self.assertEqual(result.failed, 1)
+            self.assertEqual(entry.attempt_count, 1)
+            self.assertIsNone(entry.claimed_at)
+            self.assertGreater(entry.next_attempt_at, timezone.now())
+            self.assertIn("provider down", entry.last_error)
+
+            # Backoff: ďalší beh pred next_attempt_at riadok nechá tak.
+            self.assertEqual(deliver_pending_emails().failed, 0)
+
+            EmailOutbox.objects.filter(id=entry.id).update(next_attempt_at=timezone.now())
+            deliver_pending_emails()
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.attempt_count, 2)
+        self.assertIsNotNone(entry.failed_at)
+        # Trvalo zlyhaný riadok nedrží obsah ani adresy.
+        self.assertEqual(
+            (entry.subject, entry.body, entry.html_body, entry.to, entry.reply_to),
+            ("", "", "", [], []),
+        )
+        self.assertEqual(entry.category, EmailOutboxCategory.CONTACT)
+        self.assertIn("provider down", entry.last_error)
+        self.assertEqual(deliver_pending_emails().sent, 0)
+
+    def test_fresh_claim_is_skipped_and_stale_claim_recovered(self):
+        entry = _queue()
+        EmailOutbox.objects.filter(id=entry.id).update(claimed_at=timezone.now())
+
+        self.assertEqual(deliver_pending_emails().sent, 0)
+
+        EmailOutbox.objects.filter(id=entry.id).update(
+            claimed_at=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(deliver_pending_emails().sent, 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(EMAIL_OUTBOX_DELIVERY="celery")
+    def test_celery_mode_enqueues_task_after_commit(self):
+        with patch("accounts.tasks.send_pending_emails_task.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                _queue()
+            delay.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        delay.assert_called_once_with()
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(EMAIL_OUTBOX_DELIVERY="celery")
+    def test_broker_outage_keeps_row_pending(self):
+        with patch(
+            "accounts.tasks.send_pending_emails_task.delay",
+            side_effect=ConnectionError("broker down"),
+        ), self.captureOnCommitCallbacks(execute=True):
+            entry = _queue()
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.attempt_count, 0)
+        self.assertIsNone(entry.failed_at)
+
+    def test_purge_drops_only_old_failed_rows(self):
+        old_failed = _queue(0)
+        recent_failed = _queue(1)
+        pending = _queue(2)
+        now = timezone.now()
+        EmailOutbox.objects.filter(id=old_failed.id).update(
+            failed_at=now - timedelta(days=31)
+        )
+        EmailOutbox.objects.filter(id=recent_failed.id).update(failed_at=now)
+
+        self.assertEqual(purge_failed_emails(now=now), 1)
+        self.assertEqual(
+            set(EmailOutbox.objects.values_list("id", flat=True)),
+            {recent_failed.id, pending.id},
+        )
@@ -9,7 +9,7 @@ from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from datetime import timedelta
 from django.utils import timezone
 
@@ -95,22 +95,20 @@ class TestEmailVerificationModel(TestCase):
 
         self.assertFalse(result)
 
-    @patch("accounts.models.verification.send_mail")
-    def test_send_verification_email(self, mock_send_mail):
-        """Test odosielania verifikačného emailu"""
-        mock_send_mail.return_value = True
-
+    @patch("accounts.services.email_outbox.queue_email")
+    def test_send_verification_email(self, mock_queue_email):
+        """Test zaradenia verifikačného emailu do outboxu"""
         verification = EmailVerification.objects.create(user=self.user)
         result = verification.send_verification_email()
 
         self.assertTrue(result)
-        mock_send_mail.assert_called_once()
+        mock_queue_email.assert_called_once()
 
         # Skontroluj argumenty
-        call_args = mock_send_mail.call_args
+        call_args = mock_queue_email.call_args
         self.assertIn("Potvrdenie registrácie - Svaply", call_args[1]["subject"])
-        self.assertIn(self.user.email, call_args[1]["recipient_list"])
-        self.assertIn(str(verification.token), call_args[1]["message"])
+        self.assertIn(self.user.email, call_args[1]["to"])
+        self.assertIn(str(verification.token), call_args[1]["body"])
 
     def test_get_verification_url(self):
         """Test generovania verifikačného URL"""
@@ -231,25 +229,10 @@ class TestEmailVerificationAPI(APITestCase):
 class TestRegistrationWithEmailVerification(APITestCase):
     """Testy pre registráciu s email verifikáciou"""
 
-    @patch("accounts.models.verification.send_mail")
-    @patch("threading.Thread")
+    @patch("accounts.services.email_outbox.queue_email")
     @override_settings(EMAIL_VERIFICATION_REQUIRED=True, ALLOW_UNVERIFIED_LOGIN=False)
-    def test_registration_creates_verification(self, mock_thread_class, mock_send_mail):
+    def test_registration_creates_verification(self, mock_queue_email):
         """Test, že registrácia vytvorí verifikačný token"""
-        mock_send_mail.return_value = True
-
-        # Spustiť email thread synchronne (inak test nechytí async send_mail)
-        def run_target_on_start():
-            if mock_thread_class.called:
-                target = mock_thread_class.call_args[1].get("target")
-                args = mock_thread_class.call_args[1].get("args", ())
-                if target:
-                    target(*args)
-
-        mock_thread = MagicMock()
-        mock_thread.start.side_effect = run_target_on_start
-        mock_thread_class.return_value = mock_thread
-
         url = reverse("accounts:register")
         data = {
             "username": "newuser",
@@ -274,8 +257,8 @@ class TestRegistrationWithEmailVerification(APITestCase):
         verification = EmailVerification.objects.get(user=user)
         self.assertIsNotNone(verification)
 
-        # Skontroluj, že email bol odoslaný (thread beží synchronne vďaka mocku)
-        mock_send_mail.assert_called_once()
+        # Skontroluj, že email bol zaradený do outboxu v rámci registrácie
+        mock_queue_email.assert_called_once()
 
     @override_settings(EMAIL_VERIFICATION_REQUIRED=True, ALLOW_UNVERIFIED_LOGIN=False)
     def test_login_without_verification_blocked(self):
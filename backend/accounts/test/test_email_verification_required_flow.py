@@ -6,8 +6,6 @@ override_settings a pokrývajú: registráciu (neoverený účet + odoslaný ema
 login gate, GET verifikačný link a jeho idempotenciu (prefetch/StrictMode).
 """
 
-from unittest.mock import patch
-
 from django.contrib.auth import get_user_model
 from django.core import mail
 from django.test import override_settings
@@ -41,11 +39,8 @@ class EmailVerificationRequiredFlowTests(APITestCase):
         return data
 
     def test_registration_creates_unverified_user_and_sends_email(self):
-        with patch("threading.Thread") as thread_mock:
-            # Thread mock: e-mail pošleme synchrónne, aby bol test deterministický.
-            thread_mock.side_effect = lambda target, args, daemon: type(
-                "T", (), {"start": lambda self: target(*args)}
-            )()
+        # E-mail z outboxu odchádza až po commite registrácie.
+        with self.captureOnCommitCallbacks(execute=True):
             response = self.client.post(
                 reverse("accounts:register"), self._register_payload(), format="json"
             )
@@ -6,7 +6,9 @@ viditeľnosť feedu (is_public, blokovanie, anonym), cursor stránkovanie
 a absencia N+1.
 """
 
+import io
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.db import connection
@@ -17,6 +19,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from accounts.models import FeedPost, OfferedSkill, UserBlock
+from accounts.services.feed_counters import recompute_feed_post_counters
 from accounts.services.feed_tagging import REASON_TAG_BLOCKED
 from portfolio.models import PortfolioItem
 
@@ -430,7 +433,12 @@ class FeedListApiTests(APITestCase):
 
 
 class FeedCountsApiTests(APITestCase):
-    """Počty lajkov/komentárov pri oboch reverse vzťahoch naraz (fan-out)."""
+    """Počty lajkov/komentárov pri oboch reverse vzťahoch naraz (fan-out).
+
+    Riadky sa tu zakladajú priamo cez ORM (mimo API), takže denormalizované
+    počítadlá dorovná ``recompute_feed_post_counters`` – ten istý prepočet,
+    aký robí nočný reconcile.
+    """
 
     def test_likes_and_comments_counts_are_not_multiplied(self):
         from accounts.models import FeedPostComment, FeedPostLike
@@ -443,6 +451,7 @@ class FeedCountsApiTests(APITestCase):
             FeedPostLike.objects.create(post=post, user=liker)
         for commenter in commenters:
             FeedPostComment.objects.create(post=post, author=commenter, text="Ahoj")
+        recompute_feed_post_counters()
 
         entry = self.client.get(reverse(LIST_URL_NAME)).data["results"][0]
 
@@ -478,6 +487,7 @@ class FeedCountsApiTests(APITestCase):
                 )
             if index < 1:
                 FeedPostLike.objects.create(post=quiet, user=liker)
+        recompute_feed_post_counters()
 
         results = self.client.get(reverse(LIST_URL_NAME)).data["results"]
         by_id = {entry["id"]: entry for entry in results}
@@ -489,25 +499,16 @@ class FeedCountsApiTests(APITestCase):
         self.assertEqual(by_id[empty.id]["likes_count"], 0)
         self.assertEqual(by_id[empty.id]["comments_count"], 0)
 
-    def test_counts_do_not_cross_join_like_and_comment_tables(self):
-        """Výkon: lajky/komentáre sa počítajú v subquery, nie krížovým joinom.
-
-        Krížový join by pred agregáciou vyrobil lajky × komentáre riadkov;
-        v subquery ostáva hlavný dotaz jeden riadok na príspevok.
-        """
-        import re
-
+    def test_feed_query_does_not_touch_like_and_comment_tables(self):
+        """Výkon: počty sú uložené na FeedPost – feed ich nepočíta ani
+        subquery, ani JOIN-om (pôvodný krížový súčin lajky × komentáre)."""
         from accounts.views.feed_posts import _annotated_queryset
 
         sql = str(_annotated_queryset().query)
 
+        self.assertIn("likes_count", sql)
         for table in ("accounts_feedpostlike", "accounts_feedpostcomment"):
-            # Tabuľka sa v SQL musí vyskytovať (počítame ju), ale NIE ako JOIN.
-            self.assertIn(table, sql)
-            self.assertIsNone(
-                re.search(rf'JOIN\s+"?{table}"?', sql, flags=re.IGNORECASE),
-                f"{table} sa pripája cez JOIN – krížový súčin sa vrátil",
-            )
+            self.assertNotIn(table, sql)
 
 
 class FeedLocalityOrderingTests(APITestCase):
@@ -632,6 +633,56 @@ class FeedLocalityOrderingTests(APITestCase):
             ],
         )
 
+    def test_author_district_change_moves_posts_between_streams(self):
+        self.assertEqual(
+            FeedPost.objects.get(pk=self.old_local.pk).author_district, "Bratislava I"
+        )
+        viewer = _user("feed-loc-viewer4")
+        viewer.district = "Košice II"
+        viewer.save(update_fields=["district"])
+        self.client.force_authenticate(user=viewer)
+
+        self.local_author.district = "Košice II"
+        self.local_author.save()
+
+        ids = self._ids(self.client.get(self.url))
+        # Oba autori sú teraz v okrese viewera → jeden chronologický lokálny prúd.
+        self.assertEqual(
+            ids,
+            [
+                self.newest_remote.id,
+                self.new_remote.id,
+                self.old_local.id,
+                self.older_local.id,
+            ],
+        )
+
+    def test_locality_streams_are_plain_keyset_queries(self):
+        viewer = _user("feed-loc-viewer5")
+        viewer.district = "Bratislava I"
+        viewer.save(update_fields=["district"])
+        self.client.force_authenticate(user=viewer)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"{self.url}?page_size=3")
+
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNone(response.data["previous"])
+        feed_sql = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if query["sql"].startswith('SELECT "accounts_feedpost"."id"')
+        ]
+        # Lokálny prúd (2) nestačí → jeden dopĺňací dotaz do zvyšku.
+        self.assertEqual(len(feed_sql), 2)
+        for sql in feed_sql:
+            self.assertNotIn("CASE", sql)
+            self.assertIn('"accounts_feedpost"."author_district"', sql)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(f"{self.url}?cursor=nonsense")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 
 class FeedDetailApiTests(APITestCase):
     def setUp(self):
@@ -890,6 +941,49 @@ class FeedImageFileApiTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_approved_image_revalidates_with_304_without_storage(self):
+        post = _free_post(self.author)
+        FeedPost.objects.filter(pk=post.pk).update(
+            image_status=FeedPost.ImageStatus.APPROVED,
+            image_approved_key="media/feed/1/abc-large.webp",
+        )
+        with patch(
+            "swaply.image_delivery.default_storage.open",
+            return_value=io.BytesIO(b"webp-bytes"),
+        ):
+            first = self.client.get(self._image_url(post))
+
+        with patch("swaply.image_delivery.default_storage.open") as open_mock:
+            response = self.client.get(
+                self._image_url(post), HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            first["Cache-Control"], "private, max-age=31536000, immutable"
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        open_mock.assert_not_called()
+
+    def test_shared_thumbnail_etag_does_not_bypass_visibility(self):
+        offer = _offer(self.owner)
+        post = self._shared_post(offer)
+        with patch(
+            "swaply.image_delivery.default_storage.open",
+            return_value=io.BytesIO(b"webp-bytes"),
+        ):
+            first = self.client.get(self._shared_thumb_url(post))
+        # Snapshot zdroja, ktorý sa dá skryť – bez immutable.
+        self.assertEqual(first["Cache-Control"], "private, max-age=3600")
+
+        offer.is_hidden = True
+        offer.save(update_fields=["is_hidden"])
+        response = self.client.get(
+            self._shared_thumb_url(post), HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 
 class FeedImageSerializationTests(APITestCase):
     """get_image: verejne len APPROVED, autor vidí aj stav spracovania."""
@@ -1,6 +1,9 @@
 """Feed Fáza 2b – API testy interakcií: lajk, komentáre, nahlásenie."""
 
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -457,6 +460,8 @@ class FeedInteractionsAccountDeletionTests(APITestCase):
         # …nahlásenie ostáva (moderačný audit), autorove notifikácie od aktéra
         # sú scrubnuté na neutrálny text (nie zmazané – patria autorovi).
         self.assertTrue(FeedPostReport.objects.filter(id=report.id).exists())
+        post.refresh_from_db()
+        self.assertEqual((post.likes_count, post.comments_count), (0, 0))
         for notification in Notification.objects.filter(user=author):
             self.assertEqual(notification.title, "Zmazaný používateľ")
 
@@ -478,3 +483,65 @@ class FeedInteractionsAccountDeletionTests(APITestCase):
         self.assertFalse(Notification.objects.filter(user=author).exists())
         self.assertFalse(FeedPost.objects.filter(id=post.id).exists())
         self.assertFalse(FeedPostLike.objects.filter(post_id=post.id).exists())
+
+
+class FeedPostCounterTests(APITestCase):
+    """Denormalizované likes_count/comments_count + reconcile príkaz."""
+
+    def setUp(self):
+        self.author = _user("feed-counter-author")
+        self.post = _free_post(self.author)
+
+    def _counts(self):
+        self.post.refresh_from_db()
+        return self.post.likes_count, self.post.comments_count
+
+    def test_api_keeps_counters_exact(self):
+        liker = _user("feed-counter-liker")
+        like_url = reverse("accounts:feed_post_like", args=[self.post.id])
+        comments_url = reverse("accounts:feed_post_comments", args=[self.post.id])
+        self.client.force_authenticate(user=liker)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(like_url)
+            self.client.post(like_url)
+            first = self.client.post(comments_url, data={"text": "a"}, format="json")
+            self.client.post(comments_url, data={"text": "b"}, format="json")
+        self.assertEqual(self._counts(), (1, 2))
+
+        self.client.delete(like_url)
+        self.client.delete(like_url)
+        self.client.delete(
+            reverse(
+                "accounts:feed_post_comment_delete",
+                args=[self.post.id, first.data["id"]],
+            )
+        )
+        self.assertEqual(self._counts(), (0, 1))
+
+    def test_reconcile_command_repairs_drift(self):
+        FeedPostLike.objects.create(post=self.post, user=_user("feed-counter-raw"))
+        other = _free_post(self.author, caption="Iný")
+        FeedPost.objects.filter(pk=other.pk).update(likes_count=7, comments_count=3)
+
+        out = StringIO()
+        call_command("reconcile_feed_counters", "--dry-run", stdout=out)
+        self.assertIn("Drift: 2", out.getvalue())
+        self.assertEqual(self._counts(), (0, 0))
+
+        call_command("reconcile_feed_counters", stdout=StringIO())
+        other.refresh_from_db()
+        self.assertEqual(self._counts(), (1, 0))
+        self.assertEqual((other.likes_count, other.comments_count), (0, 0))
+
+    def test_reconcile_command_recomputes_only_drifted_posts_in_batches(self):
+        drifted = [_free_post(self.author, caption=f"Drift {i}") for i in range(3)]
+        FeedPost.objects.filter(pk__in=[p.pk for p in drifted]).update(likes_count=5)
+
+        out = StringIO()
+        with self.assertNumQueries(1 + 3 * 3):  # SELECT driftu + 3× (savepoint, UPDATE, release)
+            call_command("reconcile_feed_counters", "--batch-size", "1", stdout=out)
+
+        self.assertIn("Prepočítané: 3 príspevkov", out.getvalue())
+        self.assertFalse(
+            FeedPost.objects.filter(pk__in=[p.pk for p in drifted], likes_count=5).exists()
+        )
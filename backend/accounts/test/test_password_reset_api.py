@@ -22,13 +22,14 @@ class TestPasswordResetAPI(APITestCase):
             is_verified=True,
         )
 
-    @patch("accounts.views.password_reset.send_mail")
-    def test_password_reset_request_existing_email(self, mock_send_mail):
-        mock_send_mail.return_value = True
+    @patch("accounts.views.password_reset.queue_email")
+    def test_password_reset_request_existing_email(self, mock_queue_email):
         url = reverse("accounts:password_reset_request")
         r = self.client.post(url, {"email": "reset@example.com"}, format="json")
         assert r.status_code == status.HTTP_200_OK
-        mock_send_mail.assert_called_once()
+        mock_queue_email.assert_called_once()
+        assert mock_queue_email.call_args.kwargs["to"] == ["reset@example.com"]
+        assert mock_queue_email.call_args.kwargs["html_body"]
 
     def test_password_reset_request_unknown_email(self):
         url = reverse("accounts:password_reset_request")
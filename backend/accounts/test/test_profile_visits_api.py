@@ -4,12 +4,20 @@ Zápisový bod: dashboard_user_profile_detail_view a jeho slug-varianta, presne
 za _enforce_public_or_owner, len pre cudzí (viditeľný) profil.
 """
 
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from accounts.models import ProfileVisit
+from accounts.services.profile_visits import (
+    RedisProfileVisitBuffer,
+    flush_buffered_profile_visits,
+)
 
 User = get_user_model()
 
@@ -130,3 +138,110 @@ class ProfileVisitApiTests(APITestCase):
             ).count(),
             1,
         )
+
+
+class _StubVisitRedis:
+    """Sety v pamäti; Lua skript emuluje rovnakú logiku v Pythone."""
+
+    def __init__(self):
+        self.sets = {}
+
+    def register_script(self, _source):
+        def run(*, keys, args):
+            dedup_key, pending_key = keys
+            viewer_id, member, _ttl = args
+            seen = self.sets.setdefault(dedup_key, set())
+            if str(viewer_id) in seen:
+                return 0
+            seen.add(str(viewer_id))
+            self.sets.setdefault(pending_key, set()).add(member)
+            return 1
+
+        return run
+
+    def srandmember(self, key, count):
+        members = sorted(self.sets.get(key, set()))
+        return [member.encode() for member in members[:count]]
+
+    def srem(self, key, *members):
+        self.sets.setdefault(key, set()).difference_update(
+            member.decode() if isinstance(member, bytes) else member
+            for member in members
+        )
+
+
+class BufferedProfileVisitTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="pvb-owner",
+            email="pvb-owner@example.com",
+            password="testpass123",
+            is_public=True,
+        )
+        self.visitors = [
+            User.objects.create_user(
+                username=f"pvb-visitor-{index}",
+                email=f"pvb-visitor-{index}@example.com",
+                password="testpass123",
+                is_public=True,
+            )
+            for index in range(3)
+        ]
+        self.buffer = RedisProfileVisitBuffer(client=_StubVisitRedis())
+        patcher = patch(
+            "accounts.services.profile_visits.get_profile_visit_buffer",
+            return_value=self.buffer,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_profile_view_does_not_write_and_flush_persists_deduplicated(self):
+        url = reverse("accounts:dashboard_user_profile_detail", args=[self.owner.id])
+        for visitor in self.visitors:
+            self.client.force_authenticate(user=visitor)
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(url)
+                self.client.get(url)
+            self.assertFalse(
+                any("accounts_profilevisit" in query["sql"] for query in ctx.captured_queries)
+            )
+        self.assertEqual(ProfileVisit.objects.count(), 0)
+
+        flushed = flush_buffered_profile_visits(batch_size=2)
+
+        self.assertEqual(flushed, 3)
+        self.assertEqual(
+            set(ProfileVisit.objects.values_list("viewer_id", flat=True)),
+            {visitor.id for visitor in self.visitors},
+        )
+        self.assertEqual(flush_buffered_profile_visits(), 0)
+
+    def test_failed_flush_keeps_batch_pending(self):
+        self.client.force_authenticate(user=self.visitors[0])
+        self.client.get(
+            reverse("accounts:dashboard_user_profile_detail", args=[self.owner.id])
+        )
+
+        with patch.object(
+            ProfileVisit.objects, "bulk_create", side_effect=RuntimeError("db down")
+        ):
+            with self.assertRaises(RuntimeError):
+                flush_buffered_profile_visits()
+
+        self.assertEqual(flush_buffered_profile_visits(), 1)
+        self.assertEqual(ProfileVisit.objects.count(), 1)
+
+
+    def test_worker_crash_mid_flush_keeps_batch_pending(self):
+        self.client.force_authenticate(user=self.visitors[0])
+        self.client.get(
+            reverse("accounts:dashboard_user_profile_detail", args=[self.owner.id])
+        )
+
+        # Ukončenie workera (SystemExit) obíde except – člen nesmie zmiznúť.
+        with patch.object(ProfileVisit.objects, "bulk_create", side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                flush_buffered_profile_visits()
+
+        self.assertEqual(flush_buffered_profile_visits(), 1)
+        self.assertEqual(ProfileVisit.objects.count(), 1)
@@ -0,0 +1,80 @@
+"""Batch WS fan-out – notify_users."""
+
+import asyncio
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from accounts.realtime import notify_users
+
+
+class _RecordingChannelLayer:
+    def __init__(self, fail_for=None, delays=None):
+        self.sent = []
+        self.fail_for = fail_for
+        self.delays = delays or {}
+
+    async def group_send(self, group, message):
+        if group == self.fail_for:
+            raise ConnectionError("redis down")
+        await asyncio.sleep(self.delays.get(message["event"]["type"], 0))
+        self.sent.append((group, message))
+
+
+class NotifyUsersTests(TestCase):
+    def test_batch_is_sent_after_commit_in_one_async_context(self):
+        layer = _RecordingChannelLayer()
+        with patch("channels.layers.get_channel_layer", return_value=layer), patch(
+            "accounts.realtime.async_to_sync", wraps=async_to_sync
+        ) as async_to_sync_spy:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                notify_users({1: {"type": "a"}, 2: [{"type": "b"}, {"type": "c"}]})
+            self.assertEqual(layer.sent, [])
+            self.assertEqual(len(callbacks), 1)
+
+            callbacks[0]()
+
+        self.assertEqual(async_to_sync_spy.call_count, 1)
+        self.assertEqual(
+            layer.sent,
+            [
+                ("user_1", {"type": "notify", "event": {"type": "a"}}),
+                ("user_2", {"type": "notify", "event": {"type": "b"}}),
+                ("user_2", {"type": "notify", "event": {"type": "c"}}),
+            ],
+        )
+
+    def test_one_failing_group_does_not_drop_the_rest(self):
+        layer = _RecordingChannelLayer(fail_for="user_1")
+        with patch("channels.layers.get_channel_layer", return_value=layer):
+            with self.captureOnCommitCallbacks(execute=True):
+                notify_users({1: {"type": "a"}, 2: {"type": "b"}})
+        self.assertEqual(
+            layer.sent, [("user_2", {"type": "notify", "event": {"type": "b"}})]
+        )
+
+    def test_events_for_one_user_keep_their_order(self):
+        # Prvý event je pomalší – pri súbežnom odoslaní by ho druhý predbehol.
+        layer = _RecordingChannelLayer(delays={"created": 0.05})
+        with patch("channels.layers.get_channel_layer", return_value=layer):
+            with self.captureOnCommitCallbacks(execute=True):
+                notify_users(
+                    {
+                        1: [{"type": "created"}, {"type": "updated"}],
+                        2: {"type": "other"},
+                    }
+                )
+
+        user_1_events = [
+            message["event"]["type"] for group, message in layer.sent if group == "user_1"
+        ]
+        self.assertEqual(user_1_events, ["created", "updated"])
+        # Iný používateľ nečaká na pomalý event prvého.
+        self.assertEqual(layer.sent[0][0], "user_2")
+
+    def test_empty_batch_registers_nothing(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            notify_users({})
+            notify_users({0: {"type": "a"}})
+        self.assertEqual(callbacks, [])
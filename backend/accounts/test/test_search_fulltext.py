@@ -0,0 +1,160 @@
+"""
+Testy pre fulltext + trigram ranking dashboard searchu nad projekciou.
+
+Pozn.: testy bežia na sqlite – search_document sa plní a regex fallback ostáva
+aktívny. PostgreSQL vetvu (tsquery + LIKE nad search_document, ts_rank +
+word_similarity) overujeme na úrovni konštrukcie dotazu (mock vendor); využitie
+GIN indexov z migrácie 0108 treba overiť EXPLAIN-om na staging Postgrese.
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import DashboardSkillSearchProjection, OfferedSkill
+from accounts.search_projection import (
+    build_search_document,
+    build_search_document_sections,
+    build_search_vector,
+    normalize_search_text,
+)
+from accounts.views import search_query_builders
+from accounts.views.search_query_builders import (
+    _build_projection_skills_page_qs,
+    _build_projection_tsquery,
+)
+
+User = get_user_model()
+
+
+def _page_qs(raw_query, skill_terms):
+    return _build_projection_skills_page_qs(
+        viewer_user_id=0,
+        raw_query=raw_query,
+        skill_terms=skill_terms,
+        country_filter="",
+        offer_type="",
+        price_min=None,
+        price_max=None,
+        projection_skill_loc_q=None,
+        only_my_location=False,
+    )
+
+
+class SearchDocumentTests(TestCase):
+    def test_normalize_strips_diacritics_case_and_whitespace(self):
+        self.assertEqual(normalize_search_text("  Stolár   ŽILINA "), "stolar zilina")
+        self.assertEqual(normalize_search_text(None), "")
+
+    def test_sections_follow_relevance_tiers(self):
+        sections = build_search_document_sections(
+            category="Remeslá",
+            subcategory="Stolárstvo",
+            tags_text="drevo nábytok",
+            skill_location="Žilina",
+            skill_district="",
+            user_location="Žilina",
+            user_district="Žilina",
+        )
+        self.assertEqual(
+            sections,
+            ("remesla stolarstvo", "drevo nabytok", "zilina zilina zilina"),
+        )
+        self.assertEqual(
+            build_search_document(("a", "", "c")),
+            "a c",
+        )
+
+    def test_search_vector_is_postgres_only(self):
+        self.assertIsNone(build_search_vector(("a", "b", "c")))
+        with patch("accounts.search_projection.connection") as conn:
+            conn.vendor = "postgresql"
+            self.assertIsNotNone(build_search_vector(("a", "b", "c")))
+
+    def test_projection_sync_fills_search_document(self):
+        owner = User.objects.create_user(
+            username="docowner",
+            email="docowner@example.com",
+            password="testpass123",
+            is_public=True,
+            location="Košice",
+        )
+        skill = OfferedSkill.objects.create(
+            user=owner,
+            category="Remeslá",
+            subcategory="Stolárstvo",
+            tags=["Drevo"],
+            location="Košice",
+        )
+        projection = DashboardSkillSearchProjection.objects.get(skill=skill)
+        self.assertEqual(
+            projection.search_document, "remesla stolarstvo drevo kosice kosice"
+        )
+        self.assertIsNone(projection.search_vector)
+
+
+class ProjectionTsqueryTests(TestCase):
+    def test_prefix_tokens_and_terms_are_ored(self):
+        self.assertEqual(
+            _build_projection_tsquery({"Stolár", "web dizajn"}),
+            "(stolar:*) | (web:* & dizajn:*)",
+        )
+
+    def test_tsquery_operators_in_input_are_dropped(self):
+        self.assertEqual(_build_projection_tsquery({"a&b|!c:*()"}), "(a:* & b:* & c:*)")
+        self.assertEqual(_build_projection_tsquery({"&|!"}), "")
+
+
+class ProjectionQueryBranchTests(TestCase):
+    def test_postgresql_branch_filters_on_search_document_and_ranks(self):
+        with patch.object(search_query_builders, "connection") as conn:
+            conn.vendor = "postgresql"
+            qs = _page_qs("Stolár", {"Stolár"})
+
+        where = str(qs.query.where)
+        self.assertIn("search_vector", where)
+        self.assertIn("search_document", where)
+        self.assertNotIn("iregex", repr(qs.query.where).lower())
+        self.assertIn("relevance", qs.query.annotations)
+        self.assertEqual(
+            list(qs.query.order_by),
+            ["-relevance", "-user_is_verified", "-created_at", "-skill_id"],
+        )
+
+    def test_sqlite_branch_keeps_regex_fallback(self):
+        qs = _page_qs("Stolár", {"Stolár"})
+        self.assertIn("iregex", repr(qs.query.where).lower())
+        self.assertNotIn("search_document", str(qs.query.where))
+
+
+class DashboardSearchFallbackResultsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.viewer = User.objects.create_user(
+            username="viewer",
+            email="viewer@example.com",
+            password="testpass123",
+        )
+        owner = User.objects.create_user(
+            username="woodworker",
+            email="woodworker@example.com",
+            password="testpass123",
+            is_public=True,
+        )
+        OfferedSkill.objects.create(
+            user=owner,
+            category="Remeslá",
+            subcategory="Stolárstvo",
+            tags=["drevo"],
+        )
+        self.client.force_authenticate(user=self.viewer)
+
+    def test_sqlite_search_still_matches_without_diacritics(self):
+        response = self.client.get(reverse("accounts:dashboard_search"), {"q": "stolar"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["skills"]), 1)
@@ -0,0 +1,155 @@
+"""Dávkový upload obrázkov ponuky (batch-upload-init / batch-upload-complete)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import OfferedSkill, OfferedSkillImage
+from swaply.tasks.offer_images import process_offered_skill_image_batch
+
+User = get_user_model()
+
+
+def _s3_mock():
+    s3 = MagicMock()
+    s3.generate_presigned_post.return_value = {
+        "url": "https://upload.example",
+        "fields": {"key": "value"},
+    }
+    s3.head_object.return_value = {"ContentLength": 1000, "ContentType": "image/jpeg"}
+    return s3
+
+
+@pytest.fixture
+def offer_owner(settings):
+    settings.AWS_STORAGE_BUCKET_NAME = "test-bucket"
+    settings.SAFESEARCH_ENABLED = False
+    owner = User.objects.create_user(
+        "batch-up", "batch-up@example.com", "StrongPass123", is_verified=True
+    )
+    skill = OfferedSkill.objects.create(user=owner, category="IT", subcategory="Web")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    return client, skill
+
+
+@pytest.mark.django_db
+def test_batch_init_presigns_each_file_with_one_client(offer_owner):
+    client, skill = offer_owner
+    s3 = _s3_mock()
+
+    with patch(
+        "accounts.views.skills_upload._get_s3_client", return_value=s3
+    ) as client_mock:
+        response = client.post(
+            reverse("accounts:skill_images_batch_upload_init", args=[skill.id]),
+            {"files": [{"filename": f"a{i}.jpg", "size_bytes": 100} for i in range(4)]},
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    keys = [upload["key"] for upload in response.data["uploads"]]
+    assert len(set(keys)) == 4
+    assert all(key.startswith(f"uploads/offers/{skill.id}/") for key in keys)
+    client_mock.assert_called_once_with()
+    assert s3.generate_presigned_post.call_count == 4
+
+
+@pytest.mark.django_db
+def test_batch_init_rejects_more_files_than_free_slots(offer_owner):
+    client, skill = offer_owner
+    for order in range(5):
+        OfferedSkillImage.objects.create(skill=skill, order=order)
+
+    response = client.post(
+        reverse("accounts:skill_images_batch_upload_init", args=[skill.id]),
+        {"files": [{"filename": f"a{i}.jpg", "size_bytes": 100} for i in range(2)]},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_complete_creates_pending_images_and_enqueues_one_task(offer_owner):
+    client, skill = offer_owner
+    keys = [f"uploads/offers/{skill.id}/img{i}.jpg" for i in range(3)]
+
+    with patch(
+        "accounts.views.skills_upload._get_s3_client", return_value=_s3_mock()
+    ), patch(
+        "swaply.tasks.offer_images.process_offered_skill_image_batch.delay"
+    ) as delay_mock:
+        response = client.post(
+            reverse("accounts:skill_images_batch_upload_complete", args=[skill.id]),
+            {"uploads": [{"key": key, "filename": "img.jpg"} for key in keys]},
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    image_ids = [image["id"] for image in response.data["images"]]
+    assert [image["order"] for image in response.data["images"]] == [0, 1, 2]
+    assert list(
+        OfferedSkillImage.objects.filter(skill=skill)
+        .order_by("order")
+        .values_list("pending_key", flat=True)
+    ) == keys
+    delay_mock.assert_called_once_with(image_ids)
+
+
+@pytest.mark.django_db
+def test_batch_complete_rejects_duplicate_keys(offer_owner):
+    client, skill = offer_owner
+    key = f"uploads/offers/{skill.id}/img.jpg"
+
+    response = client.post(
+        reverse("accounts:skill_images_batch_upload_complete", args=[skill.id]),
+        {"uploads": [{"key": key}, {"key": key}]},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not OfferedSkillImage.objects.filter(skill=skill).exists()
+
+
+@pytest.mark.django_db
+def test_batch_task_shares_s3_client_and_hands_off_failures():
+    s3 = object()
+    processed = []
+
+    def _process(image_id, *, s3=None):
+        processed.append((image_id, s3))
+        if image_id == 2:
+            raise RuntimeError("S3 down")
+
+    with patch("swaply.tasks.offer_images._s3_client", return_value=s3), patch(
+        "swaply.tasks.offer_images._process_offered_skill_image", side_effect=_process
+    ), patch(
+        "swaply.tasks.offer_images.process_offered_skill_image.delay"
+    ) as delay_mock:
+        process_offered_skill_image_batch.run([1, 2, 3])
+
+    assert processed == [(1, s3), (2, s3), (3, s3)]
+    delay_mock.assert_called_once_with(2)
+
+
+@pytest.mark.django_db
+def test_batch_task_hand_off_failure_does_not_drop_remaining_images():
+    def _process(image_id, *, s3=None):
+        if image_id == 1:
+            raise SoftTimeLimitExceeded()
+
+    with patch("swaply.tasks.offer_images._s3_client", return_value=object()), patch(
+        "swaply.tasks.offer_images._process_offered_skill_image", side_effect=_process
+    ), patch(
+        "swaply.tasks.offer_images.process_offered_skill_image.delay",
+        side_effect=[ConnectionError("broker down"), None, None],
+    ) as delay_mock:
+        process_offered_skill_image_batch.run([1, 2, 3])
+
+    assert [call.args for call in delay_mock.call_args_list] == [(1,), (2,), (3,)]
@@ -334,7 +334,7 @@ class UserBlockEnforcementTests(APITestCase):
         )
 
         with patch(
-            "portfolio.image_file_views.default_storage.open",
+            "swaply.image_delivery.default_storage.open",
             return_value=io.BytesIO(b"webp-bytes"),
         ):
             warm_response = self.client.get(image_url)
@@ -354,7 +354,7 @@ class UserBlockEnforcementTests(APITestCase):
                     reverse("accounts:portfolio_like", args=[item.id])
                 )
                 with patch(
-                    "portfolio.image_file_views.default_storage.open"
+                    "swaply.image_delivery.default_storage.open"
                 ) as open_mock:
                     blocked_image_response = self.client.get(image_url)
 
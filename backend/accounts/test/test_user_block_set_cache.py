@@ -0,0 +1,84 @@
+"""Cachovaný block-set viewera pre exclude_blocked_users."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import UserBlock
+from accounts.services.user_blocks import (
+    cached_blocked_user_ids_for,
+    create_user_block,
+    delete_user_block,
+    exclude_blocked_users,
+)
+
+User = get_user_model()
+
+
+class UserBlockSetCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.viewer = self._user("blockset-viewer")
+        self.other = self._user("blockset-other")
+        self.third = self._user("blockset-third")
+
+    def tearDown(self):
+        cache.clear()
+
+    @staticmethod
+    def _user(username):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password="testpass123",
+        )
+
+    def test_empty_block_set_adds_no_filter(self):
+        qs = User.objects.all()
+        self.assertIs(exclude_blocked_users(qs, viewer_user_id=self.viewer.id), qs)
+        self.assertNotIn("userblock", str(qs.query).lower())
+
+    def test_block_set_is_cached_and_applied_as_literal_ids(self):
+        UserBlock.objects.create(blocker=self.other, blocked_user=self.viewer)
+        self.assertEqual(
+            cached_blocked_user_ids_for(user_id=self.viewer.id), {self.other.id}
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            ids = list(
+                exclude_blocked_users(
+                    User.objects.all(), viewer_user_id=self.viewer.id
+                ).values_list("id", flat=True)
+            )
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertNotIn("userblock", ctx.captured_queries[0]["sql"].lower())
+        self.assertNotIn(self.other.id, ids)
+        self.assertIn(self.third.id, ids)
+
+    def test_block_and_unblock_invalidate_both_users(self):
+        self.assertEqual(cached_blocked_user_ids_for(user_id=self.viewer.id), set())
+        self.assertEqual(cached_blocked_user_ids_for(user_id=self.other.id), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_user_block(blocker=self.viewer, blocked_user=self.other)
+        self.assertEqual(
+            cached_blocked_user_ids_for(user_id=self.viewer.id), {self.other.id}
+        )
+        self.assertEqual(
+            cached_blocked_user_ids_for(user_id=self.other.id), {self.viewer.id}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_user_block(blocker=self.viewer, blocked_user_id=self.other.id)
+        self.assertEqual(cached_blocked_user_ids_for(user_id=self.viewer.id), set())
+        self.assertEqual(cached_blocked_user_ids_for(user_id=self.other.id), set())
+
+    def test_multiple_fields_share_one_lookup(self):
+        UserBlock.objects.create(blocker=self.viewer, blocked_user=self.other)
+        qs = exclude_blocked_users(
+            UserBlock.objects.all(),
+            viewer_user_id=self.viewer.id,
+            user_id_field=("blocker_id", "blocked_user_id"),
+        )
+        self.assertEqual(list(qs), [])
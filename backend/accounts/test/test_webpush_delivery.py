@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import unittest
 from cryptography.fernet import Fernet
 from django.contrib.auth import get_user_model
@@ -14,6 +15,7 @@ from accounts.services.webpush_delivery import (
     MessagePushDeliveryResult,
     TemporaryWebPushDeliveryError,
     WebPushSubscriptionGone,
+    close_push_sessions,
     deliver_message_push,
 )
 from messaging.services.presence import store_message_presence
@@ -244,3 +246,60 @@ class WebPushDeliveryTests(TestCase):
             },
             countdown=60,
         )
+
+    def test_deliver_message_push_sends_concurrently_with_session_per_origin(self):
+        self.addCleanup(close_push_sessions)
+        extra = {}
+        for name, endpoint in (
+            ("fcm-2", "https://push.example.test/subscriptions/device-2"),
+            ("gone", "https://other-push.example.test/gone"),
+            ("retry", "https://other-push.example.test/retry"),
+        ):
+            extra[name], _ = upsert_web_push_subscription(
+                user=self.recipient,
+                endpoint=endpoint,
+                p256dh="p256dh-test-key",
+                auth="auth-test-key",
+            )
+
+        barrier = threading.Barrier(4, timeout=5)
+        sessions_by_endpoint = {}
+
+        def fake_send(*, endpoint, p256dh, auth, payload, session):
+            # Prejde len ak všetky 4 requesty bežia súčasne.
+            barrier.wait()
+            sessions_by_endpoint[endpoint] = session
+            if endpoint.endswith("/gone"):
+                raise WebPushSubscriptionGone("gone")
+            if endpoint.endswith("/retry"):
+                raise TemporaryWebPushDeliveryError("temporary")
+            return object()
+
+        with patch(
+            "accounts.services.webpush_delivery.send_web_push_request",
+            side_effect=fake_send,
+        ):
+            result = deliver_message_push(
+                message_id=self.message.id,
+                recipient_user_ids=[self.recipient.id],
+            )
+
+        self.assertEqual(result.delivered_count, 2)
+        self.assertEqual(result.retry_subscription_ids, (extra["retry"].id,))
+
+        first_origin = {
+            sessions_by_endpoint["https://push.example.test/subscriptions/device-1"],
+            sessions_by_endpoint["https://push.example.test/subscriptions/device-2"],
+        }
+        second_origin = {
+            sessions_by_endpoint["https://other-push.example.test/gone"],
+            sessions_by_endpoint["https://other-push.example.test/retry"],
+        }
+        self.assertEqual(len(first_origin), 1)
+        self.assertEqual(len(second_origin), 1)
+        self.assertNotEqual(first_origin, second_origin)
+
+        extra["gone"].refresh_from_db()
+        self.assertFalse(extra["gone"].is_active)
+        extra["fcm-2"].refresh_from_db()
+        self.assertIsNotNone(extra["fcm-2"].last_success_at)
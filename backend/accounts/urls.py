@@ -239,6 +239,16 @@ urlpatterns = [
         views.skill_images_upload_complete_view,
         name="skill_images_upload_complete",
     ),
+    path(
+        "skills/<int:skill_id>/images/batch-upload-init/",
+        views.skill_images_batch_upload_init_view,
+        name="skill_images_batch_upload_init",
+    ),
+    path(
+        "skills/<int:skill_id>/images/batch-upload-complete/",
+        views.skill_images_batch_upload_complete_view,
+        name="skill_images_batch_upload_complete",
+    ),
     path(
         "skills/<int:skill_id>/images/<int:image_id>/report/",
         views.offer_image_report_view,
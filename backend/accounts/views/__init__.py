@@ -28,6 +28,10 @@ from .skills import (
     skill_images_upload_init_view,
     skill_images_upload_complete_view,
 )
+from .skills_upload import (
+    skill_images_batch_upload_complete_view,
+    skill_images_batch_upload_init_view,
+)
 from .skill_requests import (
     skill_requests_view,
     skill_requests_status_view,
@@ -121,6 +125,8 @@ __all__ = [
     "skill_image_detail_view",
     "skill_images_upload_init_view",
     "skill_images_upload_complete_view",
+    "skill_images_batch_upload_init_view",
+    "skill_images_batch_upload_complete_view",
     "skill_requests_view",
     "skill_requests_status_view",
     "skill_requests_proposed_status_view",
@@ -107,30 +107,16 @@ def register_view(request):
                         "📝 DEBUG REGISTRATION: Registration logged successfully"
                     )
 
-            email_verification_required = getattr(
-                settings,
-                "EMAIL_VERIFICATION_REQUIRED",
-                False,
-            )
-
-            # Odošli verifikačný email MIMO transakcie a s ochranou pred timeoutom
-            import threading
-
-            def _send_email_async(verification, request):
-                try:
-                    verification.send_verification_email(request)
-                except Exception as email_error:
-                    logger.warning(
-                        "Verification email failed but registration succeeded",
-                        extra={
-                            "user_id": getattr(verification.user, "id", None),
-                            "error": str(email_error),
-                        },
-                    )
+                email_verification_required = getattr(
+                    settings,
+                    "EMAIL_VERIFICATION_REQUIRED",
+                    False,
+                )
 
-            verification = None
-            if email_verification_required:
-                try:
+                # Verifikačný email ide do outboxu v tej istej transakcii – odošle
+                # sa až po commite (Celery), request na SMTP/API nečaká.
+                verification = None
+                if email_verification_required:
                     from accounts.models import EmailVerification
 
                     verification = (
@@ -138,15 +124,13 @@ def register_view(request):
                         .order_by("-created_at")
                         .first()
                     )
-                    if verification:
-                        t = threading.Thread(
-                            target=_send_email_async,
-                            args=(verification, request),
-                            daemon=True,
+                    if verification and not verification.send_verification_email(
+                        request
+                    ):
+                        logger.warning(
+                            "Verification email could not be queued but registration succeeded",
+                            extra={"user_id": getattr(user, "id", None)},
                         )
-                        t.start()
-                except Exception as e:
-                    logger.warning("Could not start email thread", extra={"error": str(e)})
 
             if getattr(settings, "DEBUG", False):
                 logger.info(
@@ -4,10 +4,8 @@ Kontaktný formulár – verejný endpoint.
 
 import html
 import logging
-import time
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
 from django.utils.translation import gettext as _
 from django.utils.translation import gettext_lazy as _lazy
 from rest_framework import status
@@ -18,6 +16,8 @@ from rest_framework.response import Response
 from swaply.rate_limiting import contact_form_rate_limit
 
 from ..contact_serializers import ContactFormSerializer
+from ..models import EmailOutboxCategory
+from ..services.email_outbox import queue_email
 
 logger = logging.getLogger(__name__)
 
@@ -53,18 +53,6 @@ def _send_contact_email(*, user_email: str, message: str) -> None:
     """
 
     backend = getattr(settings, "EMAIL_BACKEND", "")
-    started = time.time()
-    logger.info(
-        "CONTACT_EMAIL_SEND_START",
-        extra={
-            "backend": backend,
-            "host": getattr(settings, "EMAIL_HOST", None),
-            "port": getattr(settings, "EMAIL_PORT", None),
-            "use_tls": getattr(settings, "EMAIL_USE_TLS", None),
-            "timeout": getattr(settings, "EMAIL_TIMEOUT", None),
-            "recipient_domain": recipient.split("@")[-1] if "@" in recipient else None,
-        },
-    )
 
     # Console backend na Windows nevie vypísať UTF-8 (slovenčina) – logujeme náhľad.
     if backend.endswith("console.EmailBackend"):
@@ -80,25 +68,19 @@ def _send_contact_email(*, user_email: str, message: str) -> None:
         )
         return
 
-    msg = EmailMultiAlternatives(
+    # Do outboxu – odoslanie (a retry pri chybe providera) beží po commite.
+    queue_email(
+        category=EmailOutboxCategory.CONTACT,
         subject=str(subject),
         body=str(text_message),
-        from_email=settings.DEFAULT_FROM_EMAIL,
         to=[recipient],
+        html_body=str(html_message),
         reply_to=[user_email],
     )
-    msg.attach_alternative(str(html_message), "text/html")
-    sent_count = msg.send(fail_silently=False)
-
     logger.info(
-        "CONTACT_EMAIL_SEND_DONE",
-        extra={
-            "duration_ms": int((time.time() - started) * 1000),
-            "sent_count": sent_count,
-        },
+        "CONTACT_EMAIL_QUEUED",
+        extra={"recipient_domain": recipient.split("@")[-1] if "@" in recipient else None},
     )
-    if sent_count < 1:
-        raise RuntimeError("SMTP backend returned 0 for contact email")
 
 
 @api_view(["POST"])
@@ -123,7 +105,7 @@ def contact_form_view(request):
         _send_contact_email(user_email=user_email, message=message)
     except Exception:
         logger.exception(
-            "Contact form email delivery failed",
+            "Contact form email could not be queued",
             extra={
                 "backend": getattr(settings, "EMAIL_BACKEND", None),
                 "email_host": getattr(settings, "EMAIL_HOST", None),
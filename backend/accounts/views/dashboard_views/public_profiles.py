@@ -4,19 +4,18 @@ from time import perf_counter
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.db import IntegrityError, transaction
 from django.db.models import Count, Exists, OuterRef
-from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from accounts.cache_versioning import next_cache_version_token
+from accounts.services.profile_visits import record_profile_visit
 from accounts.services.user_blocks import exclude_blocked_users
 from swaply.rate_limiting import api_rate_limit
 
-from ...models import OfferedSkill, ProfileLike, ProfileVisit
+from ...models import OfferedSkill, ProfileLike
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -52,11 +51,11 @@ def _record_profile_visit(request, profile_user) -> None:
 
     Volá sa až PO ``_enforce_public_or_owner`` (profil je pre viewera viditeľný,
     blokovanie/súkromie je vyriešené). Vlastné prezretie sa nepočíta
-    (viewer == owner → skip). Idempotentné cez ``get_or_create`` +
-    unique(profile_user, viewer, visit_date); ``visit_date`` je lokálny deň
-    (``timezone.localdate()``), nie UTC. Súbežná návšteva v ten istý deň, ktorá
-    prehrá race na unique, je neškodná a ignoruje sa. Akékoľvek zlyhanie zápisu
-    NIKDY nezhodí načítanie profilu – len warning (fail-open).
+    (viewer == owner → skip). Návšteva ide do write-behind bufferu
+    (``services.profile_visits.record_profile_visit``) – dedup na (profil,
+    viewer, lokálny deň) rieši Redis, do DB ju dávkovo zapíše Celery beat.
+    Akékoľvek zlyhanie zápisu NIKDY nezhodí načítanie profilu – len warning
+    (fail-open).
     """
     viewer = getattr(request, "user", None)
     viewer_id = int(getattr(viewer, "id", 0) or 0)
@@ -64,16 +63,7 @@ def _record_profile_visit(request, profile_user) -> None:
         return  # neprihlásený alebo vlastný profil → nič nezapisujeme
 
     try:
-        # Vlastný atomic (savepoint) izoluje prípadný IntegrityError z race, aby
-        # nerozbil spojenie; get_or_create ho aj tak zvládne idempotentne.
-        with transaction.atomic():
-            ProfileVisit.objects.get_or_create(
-                profile_user=profile_user,
-                viewer=viewer,
-                visit_date=timezone.localdate(),
-            )
-    except IntegrityError:
-        pass  # súbežná návšteva prehrala race na unique → OK, netreba nič
+        record_profile_visit(profile_user_id=profile_user.id, viewer_id=viewer_id)
     except Exception:
         logger.warning(
             "Profile visit recording failed",
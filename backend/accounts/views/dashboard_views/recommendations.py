@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import logging
 import os
+from datetime import datetime
 
+from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Case, F, IntegerField, Q, Value, When
 from django.utils import timezone
 from rest_framework import status
@@ -11,10 +15,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from accounts.cache_versioning import next_cache_version_token
-from accounts.services.user_blocks import exclude_blocked_users
+from accounts.services.user_blocks import (
+    cached_blocked_user_ids_for,
+    exclude_blocked_users,
+)
 from swaply.rate_limiting import api_rate_limit
 
-from ...models import DashboardSkillSearchProjection, OfferedSkill
+from ...models import DashboardRecommendationSet, DashboardSkillSearchProjection, OfferedSkill
 from ...search_visibility import searchable_projection_filters
 from ...viewer_location_cache import get_viewer_location_snapshot
 from .search import SMART_KEYWORD_INDEX, _serialize_search_skills_page
@@ -25,6 +32,8 @@ MAX_LIMIT = 20
 MAX_CANDIDATES = 80
 MAX_TERMS_PER_SKILL = 12
 PER_USER_LIMIT = 2
+# Koľko kandidátov sa predpočíta – pokryje aj MAX_LIMIT (limit * 8 pri čítaní).
+PRECOMPUTED_CANDIDATES = max(MAX_LIMIT * 8, MAX_CANDIDATES)
 
 RECOMMENDATIONS_CACHE_TTL_SECONDS = int(
     os.getenv("DASHBOARD_RECOMMENDATIONS_CACHE_TTL_SECONDS", "120") or "120"
@@ -33,12 +42,21 @@ RECOMMENDATIONS_CACHE_VERSION_TTL_SECONDS = int(
     os.getenv("DASHBOARD_RECOMMENDATIONS_CACHE_VERSION_TTL_SECONDS", "86400")
     or "86400"
 )
+# Horná hranica veku uloženého zoznamu – pri staršom sa pri čítaní naplánuje prepočet
+# (záloha, ak hodinový beh viewera vynechal).
+RECOMMENDATIONS_MAX_AGE_SECONDS = int(
+    os.getenv("DASHBOARD_RECOMMENDATIONS_MAX_AGE_SECONDS", "7200") or "7200"
+)
+# last_read_at stačí obnoviť raz za pár minút – nie pri každom cache miss.
+RECOMMENDATIONS_READ_TOUCH_SECONDS = 600
 RECOMMENDATIONS_V2_ENABLED = (
     os.getenv("DASHBOARD_RECOMMENDATIONS_V2_ENABLED", "1").strip().lower()
     in {"1", "true", "yes", "on"}
 )
 RECOMMENDATIONS_ALGO_VERSION = "v2" if RECOMMENDATIONS_V2_ENABLED else "v1"
 
+logger = logging.getLogger(__name__)
+
 COMPLEMENTARY_SUBCATEGORY_SCORE = 60
 COMPLEMENTARY_CATEGORY_SCORE = 42
 EXACT_SUBCATEGORY_SCORE = 34
@@ -374,6 +392,200 @@ def _ranked_recommendations_queryset(*, base_qs, viewer_location, personalizatio
     )
 
 
+def _ranked_candidates_queryset(viewer):
+    viewer_location = get_viewer_location_snapshot(viewer)
+    viewer_skills = list(
+        OfferedSkill.objects.filter(user=viewer, is_hidden=False)
+        .only(
+            "id",
+            "category",
+            "subcategory",
+            "tags",
+            "is_seeking",
+        )
+        .order_by("-updated_at")[:10]
+    )
+    personalization_queries = _build_personalization_queries(viewer_skills)
+
+    base_qs = DashboardSkillSearchProjection.objects.filter(
+        is_hidden=False,
+        **searchable_projection_filters(),
+    ).exclude(user_id=viewer.pk)
+    base_qs = exclude_blocked_users(
+        base_qs,
+        viewer_user_id=viewer.pk,
+        user_id_field="user_id",
+    )
+
+    return _ranked_recommendations_queryset(
+        base_qs=base_qs,
+        viewer_location=viewer_location,
+        personalization_queries=personalization_queries,
+    )
+
+
+def _candidate_score_fields() -> tuple[str, str, str]:
+    # Zložky skóre bez čerstvosti – tú dopočíta čítanie (mení sa s časom).
+    if RECOMMENDATIONS_V2_ENABLED:
+        return ("match_score", "locality_score", "verified_score")
+    return ("personalization_rank", "locality_rank", "user_is_verified")
+
+
+def precompute_dashboard_recommendations(viewer) -> DashboardRecommendationSet:
+    """Prepočítaj a ulož kandidátov odporúčaní viewera (Celery / prvé čítanie)."""
+    computed_at = timezone.now()
+    rows = _ranked_candidates_queryset(viewer).values_list(
+        "skill_id", "user_id", *_candidate_score_fields(), "created_at"
+    )[:PRECOMPUTED_CANDIDATES]
+    candidates = [
+        [skill_id, user_id, int(match), int(locality), int(verified), created_at.isoformat()]
+        for skill_id, user_id, match, locality, verified, created_at in rows
+    ]
+    entry, _ = DashboardRecommendationSet.objects.update_or_create(
+        viewer=viewer,
+        defaults={
+            "algo_version": RECOMMENDATIONS_ALGO_VERSION,
+            "candidates": candidates,
+            "is_stale": False,
+            "computed_at": computed_at,
+        },
+    )
+    return entry
+
+
+def recently_read_dashboard_recommendation_sets(*, active_days: int = 30):
+    """Zoznamy, ktoré viewer čítal za posledných N dní (``last_read_at`` zapisuje view)."""
+    since = timezone.now() - timezone.timedelta(days=max(int(active_days), 1))
+    return DashboardRecommendationSet.objects.filter(
+        last_read_at__gte=since, viewer__is_active=True
+    )
+
+
+def dashboard_recommendation_viewer_ids(*, active_days: int = 30) -> list[int]:
+    """Aktívni vieweri pre plný prepočet (čítali odporúčania za posledných N dní)."""
+    return list(
+        recently_read_dashboard_recommendation_sets(active_days=active_days)
+        .order_by("viewer_id")
+        .values_list("viewer_id", flat=True)
+    )
+
+
+def mark_dashboard_recommendations_stale(viewer_user_id: int | None) -> int:
+    """Signály: predpočítaný zoznam viewera už nezodpovedá jeho ponukám/lokalite."""
+    if not viewer_user_id:
+        return 0
+    return DashboardRecommendationSet.objects.filter(
+        viewer_id=int(viewer_user_id)
+    ).update(is_stale=True)
+
+
+def refresh_stale_dashboard_recommendations(viewer_user_id: int) -> bool:
+    """Prepočítaj zoznam viewera, ak je stále zastaraný (task / inline po commite)."""
+    entry = (
+        DashboardRecommendationSet.objects.filter(viewer_id=int(viewer_user_id))
+        .select_related("viewer")
+        .first()
+    )
+    # Viac signálov v jednej transakcii naplánuje viac refreshov – prvý stačí.
+    if entry is None or (
+        not entry.is_stale and entry.algo_version == RECOMMENDATIONS_ALGO_VERSION
+    ):
+        return False
+    if not entry.viewer.is_active:
+        return False
+    precompute_dashboard_recommendations(entry.viewer)
+    invalidate_dashboard_recommendations_cache(entry.viewer_id)
+    return True
+
+
+def schedule_dashboard_recommendations_refresh(viewer_user_id: int | None) -> None:
+    """Po commite prepočítaj zoznam viewera (Celery task, alebo inline podľa settings)."""
+    if not viewer_user_id:
+        return
+    normalized_viewer_id = int(viewer_user_id)
+
+    def _refresh() -> None:
+        mode = str(getattr(settings, "DASHBOARD_RECOMMENDATIONS_REFRESH", "celery") or "")
+        if mode.strip().lower() == "inline":
+            try:
+                refresh_stale_dashboard_recommendations(normalized_viewer_id)
+            except Exception:
+                logger.exception(
+                    "Inline dashboard recommendations refresh failed",
+                    extra={"viewer_id": normalized_viewer_id},
+                )
+            return
+        try:
+            from swaply.tasks.dashboard_recommendations import (
+                refresh_viewer_dashboard_recommendations_task,
+            )
+
+            refresh_viewer_dashboard_recommendations_task.delay(normalized_viewer_id)
+        except Exception:
+            # Zoznam ostáva is_stale – dobehne ho refresh_stale_dashboard_recommendations_task.
+            logger.warning(
+                "Dashboard recommendations refresh could not be enqueued",
+                extra={"viewer_id": normalized_viewer_id},
+                exc_info=True,
+            )
+
+    transaction.on_commit(_refresh)
+
+
+def _touch_dashboard_recommendations_read(entry: DashboardRecommendationSet, now) -> None:
+    if entry.last_read_at and entry.last_read_at >= now - timezone.timedelta(
+        seconds=RECOMMENDATIONS_READ_TOUCH_SECONDS
+    ):
+        return
+    DashboardRecommendationSet.objects.filter(pk=entry.pk).update(last_read_at=now)
+    entry.last_read_at = now
+
+
+def _freshness_score(created_at, now) -> int:
+    if created_at >= now - timezone.timedelta(days=7):
+        return FRESH_7D_SCORE
+    if created_at >= now - timezone.timedelta(days=30):
+        return FRESH_30D_SCORE
+    return 0
+
+
+def _rank_precomputed_candidates(candidates, *, viewer_user_id: int) -> list[tuple[int, int]]:
+    """Read-time filter + poradie: bloky, skryté/neverejné ponuky, čerstvosť."""
+    blocked_ids = cached_blocked_user_ids_for(user_id=viewer_user_id)
+    candidates = [row for row in candidates if row[1] not in blocked_ids]
+    visible_skill_ids = set(
+        DashboardSkillSearchProjection.objects.filter(
+            skill_id__in=[row[0] for row in candidates],
+            is_hidden=False,
+            **searchable_projection_filters(),
+        ).values_list("skill_id", flat=True)
+    )
+
+    now = timezone.now()
+    ranked = []
+    for skill_id, user_id, match, locality, verified, created_at_raw in candidates:
+        if skill_id not in visible_skill_ids:
+            continue
+        created_at = datetime.fromisoformat(created_at_raw)
+        if RECOMMENDATIONS_V2_ENABLED:
+            # Rovnaké poradie ako _ranked_recommendations_queryset (v2).
+            freshness = _freshness_score(created_at, now)
+            key = (
+                match + locality + verified + freshness,
+                match,
+                locality,
+                verified,
+                freshness,
+                created_at,
+            )
+        else:
+            key = (match, locality, verified, created_at)
+        ranked.append((key, skill_id, user_id))
+
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return [(skill_id, user_id) for _key, skill_id, user_id in ranked]
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 @api_rate_limit
@@ -393,39 +605,28 @@ def dashboard_recommendations_view(request):
             selected_skill_ids = cached_value
 
     if selected_skill_ids is None:
-        viewer_location = get_viewer_location_snapshot(request.user)
-        viewer_skills = list(
-            OfferedSkill.objects.filter(user=request.user, is_hidden=False)
-            .only(
-                "id",
-                "category",
-                "subcategory",
-                "tags",
-                "is_seeking",
-            )
-            .order_by("-updated_at")[:10]
-        )
-        personalization_queries = _build_personalization_queries(viewer_skills)
-
-        base_qs = DashboardSkillSearchProjection.objects.filter(
-            is_hidden=False,
-            **searchable_projection_filters(),
-        ).exclude(user_id=request.user.pk)
-        base_qs = exclude_blocked_users(
-            base_qs,
-            viewer_user_id=request.user.id,
-            user_id_field="user_id",
-        )
-
-        ranked_qs = _ranked_recommendations_queryset(
-            base_qs=base_qs,
-            viewer_location=viewer_location,
-            personalization_queries=personalization_queries,
+        now = timezone.now()
+        entry = DashboardRecommendationSet.objects.filter(viewer_id=request.user.pk).first()
+        if entry is None:
+            # Nový viewer – prepočet raz, ďalšie čítania už idú z uloženého zoznamu.
+            entry = precompute_dashboard_recommendations(request.user)
+        elif not entry.is_stale and (
+            entry.algo_version != RECOMMENDATIONS_ALGO_VERSION
+            or entry.computed_at
+            < now - timezone.timedelta(seconds=RECOMMENDATIONS_MAX_AGE_SECONDS)
+        ):
+            # Po zmene algoritmu alebo pri príliš starom zozname slúžime uložený zoznam
+            # a prepočet necháme na pozadí; zastarané zoznamy už naplánoval signál
+            # (záloha: --stale-only beat).
+            mark_dashboard_recommendations_stale(request.user.pk)
+            schedule_dashboard_recommendations_refresh(request.user.pk)
+        _touch_dashboard_recommendations_read(entry, now)
+        candidate_rows = _rank_precomputed_candidates(
+            entry.candidates, viewer_user_id=request.user.pk
         )
-        candidate_rows = list(
-            ranked_qs.values_list("skill_id", "user_id")[: max(limit * 8, MAX_CANDIDATES)]
+        selected_skill_ids = _select_diverse_skill_ids(
+            candidate_rows[: max(limit * 8, MAX_CANDIDATES)], limit=limit
         )
-        selected_skill_ids = _select_diverse_skill_ids(candidate_rows, limit=limit)
 
         if RECOMMENDATIONS_CACHE_TTL_SECONDS > 0:
             try:
@@ -23,8 +23,9 @@ from ..search_query_builders import (
     _build_legacy_skills_page_qs,
     _build_only_my_location_filters,
     _build_projection_only_my_location_filters,
+    InvalidSearchCursor,
     _build_projection_skills_page_qs,
-    _slice_page_ids,
+    _slice_search_page,
 )
 from .utils import (
     _build_accent_insensitive_pattern,
@@ -38,7 +39,10 @@ logger = logging.getLogger("swaply")
 
 # Horná hranica čísla stránky (ochrana pred obrovským OFFSET pri manuálnom/škodlivom
 # requeste). Pri per_page≤50 to je max ~50k offset – dosť veľkorysé pre reálne stránkovanie.
+# Nekonečný scroll má používať `cursor` (pagination.next_cursor_skills) – seek
+# za posledný riadok bez OFFSET, takže hlboké stránky nestoja viac než prvá.
 MAX_DASHBOARD_SEARCH_PAGE = 1000
+MAX_DASHBOARD_SEARCH_CURSOR_LEN = 512
 
 
 def _serialize_search_skills_page(request, page_skill_ids):
@@ -140,6 +144,7 @@ def dashboard_search_view(request):
                     "total_pages_users": 0,
                     "has_next_skills": False,
                     "has_next_users": False,
+                    "next_cursor_skills": None,
                 },
             },
             status=status.HTTP_200_OK,
@@ -167,6 +172,14 @@ def dashboard_search_view(request):
         per_page = 20
     per_page = min(per_page, 50)
 
+    # Keyset cursor má prednosť pred page (skills vetva); page ostáva pre
+    # spätnú kompatibilitu a users vetvu.
+    skills_cursor = (request.GET.get("cursor") or "").strip()
+    if len(skills_cursor) > MAX_DASHBOARD_SEARCH_CURSOR_LEN:
+        return Response(
+            {"error": "Neplatný cursor."}, status=status.HTTP_400_BAD_REQUEST
+        )
+
     base_terms = [term for term in raw_query.replace(",", " ").split() if term]
 
     location_terms = []
@@ -237,11 +250,17 @@ def dashboard_search_view(request):
             viewer_user_id=request.user.id,
             user_id_field="user_id",
         )
-        page_skill_ids, has_next_skills = _slice_page_ids(
+        page_skill_ids, has_next_skills, next_cursor_skills = _slice_search_page(
             projection_skills_page_qs,
             page=page,
             per_page=per_page,
+            verified_field="user_is_verified",
             id_field="skill_id",
+            cursor=skills_cursor,
+        )
+    except InvalidSearchCursor:
+        return Response(
+            {"error": "Neplatný cursor."}, status=status.HTTP_400_BAD_REQUEST
         )
     except DatabaseError:
         # Denormalizovaná projekcia zlyhala (napr. chýbajúca/poškodená tabuľka,
@@ -269,11 +288,18 @@ def dashboard_search_view(request):
             viewer_user_id=request.user.id,
             user_id_field="user_id",
         )
-        page_skill_ids, has_next_skills = _slice_page_ids(
-            legacy_skills_page_qs,
-            page=page,
-            per_page=per_page,
-        )
+        try:
+            page_skill_ids, has_next_skills, next_cursor_skills = _slice_search_page(
+                legacy_skills_page_qs,
+                page=page,
+                per_page=per_page,
+                verified_field="user__is_verified",
+                cursor=skills_cursor,
+            )
+        except InvalidSearchCursor:
+            return Response(
+                {"error": "Neplatný cursor."}, status=status.HTTP_400_BAD_REQUEST
+            )
     t_sk_page1 = perf_counter()
 
     t_sk_load0 = perf_counter()
@@ -411,6 +437,7 @@ def dashboard_search_view(request):
                 "total_pages_users": total_pages_users,
                 "has_next_skills": has_next_skills,
                 "has_next_users": has_next_users,
+                "next_cursor_skills": next_cursor_skills,
             },
         },
         status=status.HTTP_200_OK,
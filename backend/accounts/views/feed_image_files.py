@@ -7,15 +7,14 @@ autor vidí vlastné vždy; blokovanie sa vyhodnocuje len pre prihláseného.
 """
 
 import logging
-import mimetypes
 
-from django.core.files.storage import default_storage
-from django.http import FileResponse, Http404
+from django.http import Http404
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from swaply.image_delivery import protected_image_response
 from swaply.rate_limiting import api_rate_limit
 
 from ..models import FeedPost
@@ -43,25 +42,17 @@ def _visible_post_or_404(request, post_id: int) -> FeedPost:
     return post
 
 
-def _stream_key(key: str):
-    """FileResponse zo storage kľúča – zhodné hlavičky ako portfólio proxy."""
+def _stream_key(request, key: str, *, immutable: bool = False):
+    """Obrázok zo storage kľúča – zhodné hlavičky/mód doručenia ako portfólio proxy."""
     if not key:
         return Response(status=status.HTTP_404_NOT_FOUND)
-    try:
-        stored_file = default_storage.open(key, "rb")
-    except Exception:
+    response = protected_image_response(key, request=request, immutable=immutable)
+    if response is None:
         # Súbor už v storage nie je (napr. zmazaný originál zdieľania) – FE
         # zobrazí placeholder; presne dokumentovaný fallback snapshot kľúča.
         # Kľúč zámerne NElogujeme (interná cesta v storage).
-        logger.warning("Feed image unavailable in storage", exc_info=True)
+        logger.warning("Feed image unavailable in storage")
         return Response(status=status.HTTP_404_NOT_FOUND)
-
-    content_type = mimetypes.guess_type(key)[0]
-    if content_type is None and key.lower().endswith(".webp"):
-        content_type = "image/webp"
-    response = FileResponse(stored_file, content_type=content_type or "application/octet-stream")
-    response["Cache-Control"] = "private, max-age=3600"
-    response["X-Content-Type-Options"] = "nosniff"
     return response
 
 
@@ -82,7 +73,11 @@ def feed_post_image_file_view(request, post_id: int):
     key = (
         post.image_thumbnail_key if variant == "thumbnail" else post.image_approved_key
     )
-    return _stream_key(key)
+    return _stream_key(
+        request,
+        key,
+        immutable=post.image_status == FeedPost.ImageStatus.APPROVED,
+    )
 
 
 @api_view(["GET"])
@@ -100,4 +95,6 @@ def feed_post_shared_thumbnail_view(request, post_id: int):
         raise Http404
     if not post.is_shared_content_currently_visible:
         raise Http404
-    return _stream_key(post.shared_thumbnail_key)
+    # Bez ``immutable``: zdroj sa dá neskôr skryť a snapshot má potom zmiznúť
+    # aj z cache prehliadača (ETag revalidácia ostáva).
+    return _stream_key(request, post.shared_thumbnail_key)
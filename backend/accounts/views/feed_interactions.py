@@ -7,6 +7,8 @@ prezradenia existencie.
 Lajk: presne vzor offer_like_view/portfolio_item_like_view – idempotentné
 get_or_create pod lock_user_pair_for_update (blok-vs-lajk race), notifikácia
 cez transaction.on_commit, dedup rieši create_feed_post_liked_notification.
+Denormalizované likes_count/comments_count sa posúvajú deltou v tej istej
+transakcii ako INSERT/DELETE (services.feed_counters).
 
 Zmazanie komentára: autor komentára ALEBO autor príspevku. Appka priamy
 precedens nemá (prvý komentárový model); najbližšie vzory sa líšia – recenziu
@@ -30,6 +32,7 @@ from swaply.rate_limiting import api_rate_limit
 
 from ..feed_serializers import FeedPostCommentSerializer
 from ..models import FeedPost, FeedPostComment, FeedPostLike, FeedPostReport
+from ..services.feed_counters import adjust_feed_post_counters
 from ..services.notifications import (
     create_feed_post_commented_notification,
     create_feed_post_liked_notification,
@@ -74,7 +77,12 @@ def _like_payload(*, post_id: int, user_id: int) -> dict:
         "is_liked_by_me": FeedPostLike.objects.filter(
             post_id=post_id, user_id=user_id
         ).exists(),
-        "likes_count": FeedPostLike.objects.filter(post_id=post_id).count(),
+        "likes_count": (
+            FeedPost.objects.filter(pk=post_id)
+            .values_list("likes_count", flat=True)
+            .first()
+            or 0
+        ),
     }
 
 
@@ -116,6 +124,7 @@ def feed_post_like_view(request, post_id: int):
                 user=request.user,
             )
             if created:
+                adjust_feed_post_counters(post_id=post.id, likes=1)
                 transaction.on_commit(notify_author_about_like)
 
         payload = _like_payload(post_id=post.id, user_id=request.user.id)
@@ -124,7 +133,10 @@ def feed_post_like_view(request, post_id: int):
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
 
-    FeedPostLike.objects.filter(post=post, user=request.user).delete()
+    with transaction.atomic():
+        deleted, _ = FeedPostLike.objects.filter(post=post, user=request.user).delete()
+        if deleted:
+            adjust_feed_post_counters(post_id=post.id, likes=-deleted)
     payload = _like_payload(post_id=post.id, user_id=request.user.id)
     return Response(payload, status=status.HTTP_200_OK)
 
@@ -155,6 +167,7 @@ def _create_comment(request, post: FeedPost) -> Response:
             comment = FeedPostComment.objects.create(
                 post=post, author=request.user, text=text
             )
+            adjust_feed_post_counters(post_id=post.id, comments=1)
             transaction.on_commit(notify_author_about_comment)
     except ValidationError as exc:
         # Model vynucuje limit 500 znakov (ensure_text_within_limit).
@@ -220,7 +233,12 @@ def feed_post_comment_delete_view(request, post_id: int, comment_id: int):
             status=status.HTTP_403_FORBIDDEN,
         )
 
-    comment.delete()
+    with transaction.atomic():
+        # Súbežné zmazanie (autor komentára + autor príspevku) zníži počítadlo
+        # len raz – rovnako ako unlike vyššie.
+        deleted, _ = FeedPostComment.objects.filter(pk=comment.pk).delete()
+        if deleted:
+            adjust_feed_post_counters(post_id=post.id, comments=-1)
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
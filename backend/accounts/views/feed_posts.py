@@ -11,6 +11,8 @@ statických zoznamoch (recenzie/notifikácie), ale pre nekonečne scrollovaný
 feed s priebežne pribúdajúcimi príspevkami by number-based spôsoboval
 duplicity/preskoky; DRF cursor (opaque, position-based) je jediné stránkovanie
 v DRF, ktoré to rieši, a appka už DRF pagination triedy používa (messaging).
+Hlavný feed s uprednostnením okresu stránkuje vlastný keyset nad dvoma
+prúdmi (FeedLocalityCursorPagination) – tvar odpovede ostáva DRF cursor.
 
 Fotka voľného príspevku: príspevok vzniká NAJPRV (caption je povinný, fotka
 voliteľná – validný stav), fotka sa naň pripája existujúcim upload flow
@@ -18,37 +20,26 @@ z Fázy 1 (upload-init/upload-complete berú post_id) – žiadny draft mechaniz
 """
 
 import logging
-from datetime import timedelta
+from datetime import datetime
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import (
-    Case,
-    Count,
-    DateTimeField,
-    F,
-    IntegerField,
-    OuterRef,
-    Prefetch,
-    Q,
-    Subquery,
-    Value,
-    When,
-)
-from django.db.models.functions import Coalesce
+from django.db.models import Prefetch, Q
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 from swaply.rate_limiting import api_rate_limit
 
 from ..feed_serializers import FeedPostSerializer
 from ..models import (
     FeedPost,
-    FeedPostComment,
     FeedPostLike,
     FeedPostTag,
     OfferedSkill,
@@ -73,73 +64,89 @@ class FeedCursorPagination(CursorPagination):
 class FeedLocalityCursorPagination(FeedCursorPagination):
     """Hlavný feed: najprv rovnaký okres, potom chronologicky zvyšok.
 
-    Zoradenie ide cez JEDNO pole ``feed_rank`` zámerne. DRF CursorPagination
-    filtruje kurzor len podľa ``ordering[0]`` (pagination.py: ``order =
-    self.ordering[0]`` → ``__lt``/``__gt``), takže dvojica ``("-is_local",
-    "-created_at")`` by kurzor postavila na boolean s dvoma hodnotami a
-    stránkovanie by sa rozsypalo (duplicity/preskoky). ``feed_rank`` je
-    monotónny datetime, ktorý obe úrovne spája do jednej – kurzor tak ostáva
-    stabilný a poradie je pritom dvojúrovňové.
+    Feed sa číta ako dva prúdy, oba zoradené po ``(-created_at, -id)``:
+    lokálny (``author_district`` = okres viewera, obslúži ho
+    ``acc_fpost_district_feed_idx``) a zvyšok (``acc_fpost_created_idx``).
+    Stránka seekuje od kurzora a číta najviac ``page_size + 1`` riadkov – keď
+    lokálny prúd dôjde, dopĺňa sa od začiatku zvyšku. Pôvodný jediný kľúč
+    ``Case(When(author__district=...))`` žiadny index neobslúžil, takže DB pred
+    každou stránkou zoradila všetky viditeľné príspevky.
+
+    Kurzor ``"<prúd>,<created_at ISO>,<id>"`` ukazuje na posledný vrátený
+    príspevok (vzor ``encode_message_cursor``). DRF CursorPagination ho
+    nevyjadrí – filtruje len podľa ``ordering[0]``. Feed je nekonečný scroll
+    dopredu, ``previous`` je preto vždy ``None``. Anonym aj viewer bez okresu
+    majú jediný chronologický prúd – presne pôvodné poradie.
     """
 
-    ordering = ("-feed_rank", "-id")
-
-
-# Posun „do budúcnosti" pre lokálne príspevky. 100 rokov je bezpečne viac než
-# rozptyl reálnych created_at, takže každý lokálny príspevok je nad každým
-# nelokálnym, a vnútri oboch skupín ostáva chronológia nedotknutá.
-LOCAL_FEED_RANK_BOOST = timedelta(days=36500)
-
-
-def _feed_rank_expression(viewer):
-    """Zoraďovací kľúč: created_at, lokálnym príspevkom pripočítaný boost.
-
-    Anonym aj prihlásený bez vyplneného okresu dostanú čistý ``created_at`` –
-    teda presne pôvodné chronologické poradie, žiadne uprednostňovanie.
-    Okres sa berie z AUTORA príspevku (``author__district``) pre všetky typy
-    vrátane zdieľaní – rozhoduje, kto zdieľal, nie odkiaľ je pôvodná ponuka.
-    """
-    district = ""
-    if getattr(viewer, "is_authenticated", False):
-        district = (getattr(viewer, "district", "") or "").strip()
-    if not district:
-        return F("created_at")
-
-    return Case(
-        When(
-            author__district=district,
-            then=F("created_at") + Value(LOCAL_FEED_RANK_BOOST),
-        ),
-        default=F("created_at"),
-        output_field=DateTimeField(),
-    )
-
-
-def _related_count_subquery(model):
-    """Korelovaný COUNT väzieb jedného príspevku.
-
-    Prečo nie ``Count("likes", distinct=True)``: dva nezávislé „many" vzťahy
-    v jednom dotaze sa spoja krížom, takže DB najprv vyrobí lajky × komentáre
-    riadkov a až potom ich deduplikuje. Čísla sú síce správne (to zabezpečí
-    ``distinct``), ale pri populárnom príspevku (1000 lajkov × 100 komentárov)
-    je to 100k riadkov na jeden príspevok. Subquery počíta každý vzťah zvlášť,
-    takže hlavný dotaz ostáva jeden riadok na príspevok.
+    def __init__(self, *, district: str = ""):
+        self.district = (district or "").strip()
+        self.next_cursor = None
+
+    def _streams(self, queryset):
+        if not self.district:
+            return [queryset]
+        return [
+            queryset.filter(author_district=self.district),
+            queryset.exclude(author_district=self.district),
+        ]
+
+    def _decode_feed_cursor(self, raw: str, stream_count: int):
+        # Neescapované "+" z časovej zóny príde v query stringu ako medzera.
+        parts = (raw or "").strip().replace(" ", "+").split(",")
+        try:
+            if len(parts) != 3:
+                raise ValueError("parts")
+            stream = int(parts[0])
+            created_at = datetime.fromisoformat(parts[1])
+            post_id = int(parts[2])
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not 0 <= stream < stream_count or timezone.is_naive(created_at) or post_id < 1:
+            raise NotFound(self.invalid_cursor_message)
+        return stream, created_at, post_id
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        streams = self._streams(queryset)
+
+        start_stream, position = 0, None
+        raw_cursor = request.query_params.get(self.cursor_query_param)
+        if raw_cursor:
+            start_stream, *position = self._decode_feed_cursor(raw_cursor, len(streams))
+
+        rows = []
+        for stream in range(start_stream, len(streams)):
+            stream_qs = streams[stream]
+            if stream == start_stream and position:
+                created_at, post_id = position
+                stream_qs = stream_qs.filter(created_at__lte=created_at).filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=post_id)
+                )
+            remaining = self.page_size + 1 - len(rows)
+            rows.extend(
+                (stream, post) for post in stream_qs.order_by(*self.ordering)[:remaining]
+            )
+            if len(rows) > self.page_size:
+                break
+
+        page = rows[: self.page_size]
+        self.next_cursor = None
+        if len(rows) > self.page_size:
+            stream, post = page[-1]
+            self.next_cursor = f"{stream},{post.created_at.isoformat()},{post.id}"
+        return [post for _stream, post in page]
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor
+        )
 
-    ``order_by()`` je nutné: modely majú Meta.ordering a tie stĺpce by inak
-    pribudli do GROUP BY a rozbili agregáciu na jeden riadok.
-    ``Coalesce`` drží 0 pre príspevky bez väzieb (subquery by vrátila NULL).
-    """
-    return Coalesce(
-        Subquery(
-            model.objects.filter(post=OuterRef("pk"))
-            .order_by()
-            .values("post")
-            .annotate(count=Count("pk"))
-            .values("count"),
-            output_field=IntegerField(),
-        ),
-        Value(0),
-    )
+    def get_previous_link(self):
+        return None
 
 
 def _annotated_queryset():
@@ -160,10 +167,6 @@ def _annotated_queryset():
                 ),
             )
         )
-        .annotate(
-            _likes_count=_related_count_subquery(FeedPostLike),
-            _comments_count=_related_count_subquery(FeedPostComment),
-        )
     )
 
 
@@ -184,11 +187,12 @@ def visible_feed_posts(viewer, *, queryset=None):
 
     # Blokovanie voči autorovi AJ voči vlastníkovi zdieľaného obsahu
     # (shared_owner prežíva aj zmazanie originálu – presne na toto tam je).
-    qs = exclude_blocked_users(qs, viewer_user_id=viewer_id, user_id_field="author_id")
-    qs = exclude_blocked_users(
-        qs, viewer_user_id=viewer_id, user_id_field="shared_owner_id"
+    # Jeden lookup block-setu pre oba stĺpce.
+    return exclude_blocked_users(
+        qs,
+        viewer_user_id=viewer_id,
+        user_id_field=("author_id", "shared_owner_id"),
     )
-    return qs
 
 
 def _liked_post_ids(viewer, posts) -> set[int]:
@@ -413,11 +417,13 @@ def feed_posts_view(request):
             )
         return _create_feed_post(request)
 
-    queryset = visible_feed_posts(request.user).annotate(
-        feed_rank=_feed_rank_expression(request.user)
-    )
+    district = ""
+    if request.user.is_authenticated:
+        district = request.user.district or ""
     return _paginated_response(
-        request, queryset, paginator=FeedLocalityCursorPagination()
+        request,
+        visible_feed_posts(request.user),
+        paginator=FeedLocalityCursorPagination(district=district),
     )
 
 
@@ -9,7 +9,6 @@ from django.contrib.sites.shortcuts import get_current_site
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.template.loader import render_to_string
-from django.core.mail import send_mail
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.conf import settings
 from django.contrib import messages
@@ -22,7 +21,8 @@ from swaply.rate_limiting import (
     password_reset_rate_limit,
     password_reset_verify_rate_limit,
 )
-from ..models import User
+from ..models import EmailOutboxCategory, User
+from ..services.email_outbox import queue_email
 import logging
 
 logger = logging.getLogger(__name__)
@@ -122,20 +122,19 @@ def password_reset_request_view(request):
         Svaply - Výmenná platforma zručností
         """
 
-        # Pošli email
-        send_mail(
+        # Do outboxu – odošle sa po commite, odpoveď nečaká na SMTP/API.
+        queue_email(
+            category=EmailOutboxCategory.PASSWORD_RESET,
             subject=subject,
-            message=text_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            html_message=html_message,
-            fail_silently=False,
+            body=text_message,
+            to=[user.email],
+            html_body=html_message,
         )
 
         if getattr(settings, "DEBUG", False):
-            logger.info(f"Password reset email sent to {user.email}")
+            logger.info(f"Password reset email queued for {user.email}")
         else:
-            logger.info("Password reset email sent")
+            logger.info("Password reset email queued")
 
         return JsonResponse(
             {
@@ -8,9 +8,17 @@ view/request, takže ich logika ostáva identická naprieč volajúcimi.
 
 from __future__ import annotations
 
-from django.db.models import Case, IntegerField, Q, When
+import json
+import re
+from datetime import datetime
+
+from django.db import connection
+from django.db.models import BigIntegerField, Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Cast, Round
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
 from ..models import DashboardSkillSearchProjection, OfferedSkill
+from ..search_projection import SEARCH_VECTOR_CONFIG, normalize_search_text
 from ..search_visibility import searchable_projection_filters, searchable_user_q
 from .dashboard_views.smart_search import SMART_KEYWORD_GROUPS
 from .dashboard_views.utils import (
@@ -24,6 +32,9 @@ from .dashboard_views.utils import (
 # drahému COUNT(*) na neindexovanom/veľkom výsledku.
 SEARCH_COUNT_CAP = 500
 
+# Fulltext relevance (float) → celé číslo pre stabilné triedenie a keyset cursor.
+RELEVANCE_KEY_SCALE = 1_000_000
+
 
 def capped_count(queryset) -> tuple[int, bool]:
     """Spočíta výsledky max do SEARCH_COUNT_CAP+1 a vráti (count, is_capped).
@@ -119,6 +130,91 @@ def _build_skill_search_query(skill_terms, *, projection=False):
     return skill_query
 
 
+# Tokeny pre tsquery – len písmená/číslice, aby užívateľský vstup nemohol
+# rozbiť syntax `to_tsquery` (operátory &, |, !, :, zátvorky...).
+_TSQUERY_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _projection_fulltext_enabled() -> bool:
+    """Fulltext + trigram ranking beží len na PostgreSQL; sqlite ide cez regex."""
+    return connection.vendor == "postgresql"
+
+
+def _build_projection_tsquery(skill_terms) -> str:
+    """Prefixový tsquery: slová termu cez AND, termy (vrátane synoným) cez OR.
+
+    Prefix (`slovo:*`) zachováva "obsahuje od začiatku slova" správanie regex
+    cesty, napr. `stol` nájde `stolarstvo`.
+    """
+    clauses = set()
+    for term in skill_terms:
+        words = _TSQUERY_TOKEN_RE.findall(normalize_search_text(term))
+        if words:
+            clauses.add(" & ".join(f"{word}:*" for word in words))
+    return " | ".join(f"({clause})" for clause in sorted(clauses))
+
+
+def _build_projection_fulltext_filter(skill_terms):
+    """Filter nad search_vector (GIN) alebo search_document (trigram GIN).
+
+    tsquery pokrýva zhodu na začiatku slova, `LIKE '%term%'` nad odakcentovaným
+    dokumentom pokrýva substring v strede slova (ako pôvodný `__iregex`) – obe
+    vetvy sú indexované, plánovač ich spojí cez BitmapOr.
+    """
+    from django.contrib.postgres.search import SearchQuery
+
+    skill_query = Q()
+    tsquery = _build_projection_tsquery(skill_terms)
+    if tsquery:
+        skill_query |= Q(
+            search_vector=SearchQuery(
+                tsquery, config=SEARCH_VECTOR_CONFIG, search_type="raw"
+            )
+        )
+    for term in skill_terms:
+        normalized = normalize_search_text(term)
+        if normalized:
+            skill_query |= Q(search_document__contains=normalized)
+    return skill_query, tsquery
+
+
+def _annotate_projection_fulltext_relevance(qs, *, raw_query, tsquery):
+    """`relevance` = ts_rank (váhy A/B/C zo sekcií) + trigram word similarity k q.
+
+    word_similarity (nie similarity) – porovnáva q s najpodobnejším úsekom
+    dokumentu, takže dlhý dokument s presnou zhodou nie je penalizovaný.
+
+    Súčet je `real` (float4); cursor by ho cez JSON vrátil ako float8 a rovnosť
+    v seeku by nikdy nesedela (duplicitný/preskočený riadok na hranici stránky).
+    Triedi sa preto podľa celočíselného kľúča (skóre × RELEVANCE_KEY_SCALE) –
+    ten istý výraz ide do ORDER BY, cursoru aj seek filtra.
+    """
+    from django.contrib.postgres.search import (
+        SearchQuery,
+        SearchRank,
+        TrigramWordSimilarity,
+    )
+
+    similarity = TrigramWordSimilarity(
+        normalize_search_text(raw_query), "search_document"
+    )
+    if tsquery:
+        relevance = (
+            SearchRank(
+                F("search_vector"),
+                SearchQuery(tsquery, config=SEARCH_VECTOR_CONFIG, search_type="raw"),
+            )
+            + similarity
+        )
+    else:
+        relevance = similarity
+    return qs.annotate(
+        relevance=Cast(
+            Round(relevance * Value(RELEVANCE_KEY_SCALE)), output_field=BigIntegerField()
+        )
+    )
+
+
 def _apply_skill_country_filter(qs, country_filter, *, projection=False):
     country_terms = COUNTRY_LOCATION_MAPPING.get(country_filter)
     if not country_terms:
@@ -155,22 +251,118 @@ def _apply_skill_search_scalar_filters(qs, *, offer_type, price_min, price_max):
     return qs
 
 
-def _slice_page_ids(qs, *, page: int, per_page: int, id_field: str = "id"):
+# ---------------------------------------------------------------------------
+# Keyset (seek) stránkovanie dashboard searchu
+# ---------------------------------------------------------------------------
+# Cursor kóduje hodnoty triediaceho kľúča posledného riadku stránky
+# (relevance?, verified, created_at, id). Ďalšia stránka sa neposúva cez OFFSET
+# (ktorý musí zoradiť a zahodiť všetko pred ňou), ale filtruje "za" týmto kľúčom –
+# stránka 50 stojí rovnako ako stránka 1.
+
+# v2: relevance je celé číslo (kľúč z _annotate_projection_fulltext_relevance).
+SEARCH_CURSOR_VERSION = 2
+
+
+class InvalidSearchCursor(ValueError):
+    """Cursor sa nedá dekódovať alebo nepatrí k aktuálnemu triedeniu."""
+
+
+def _search_keyset_fields(qs, *, verified_field: str, id_field: str) -> list[str]:
+    """Polia triediaceho kľúča (všetky DESC) – zhodné s order_by query builderov."""
+    fields = ["relevance"] if "relevance" in qs.query.annotations else []
+    return [*fields, verified_field, "created_at", id_field]
+
+
+def encode_search_cursor(values) -> str:
+    has_relevance = len(values) == 4
+    payload = {
+        "v": SEARCH_CURSOR_VERSION,
+        "r": values[0] if has_relevance else None,
+        "u": bool(values[-3]),
+        "c": values[-2].isoformat(),
+        "i": int(values[-1]),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return urlsafe_base64_encode(raw)
+
+
+def decode_search_cursor(raw: str, *, with_relevance: bool) -> list:
+    try:
+        payload = json.loads(urlsafe_base64_decode(raw).decode("utf-8"))
+        if not isinstance(payload, dict) or payload.get("v") != SEARCH_CURSOR_VERSION:
+            raise InvalidSearchCursor("version")
+        relevance = payload.get("r")
+        verified = payload["u"]
+        created_at = datetime.fromisoformat(payload["c"])
+        skill_id = payload["i"]
+    except InvalidSearchCursor:
+        raise
+    except (KeyError, TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise InvalidSearchCursor(str(exc)) from exc
+
+    if not isinstance(verified, bool) or type(skill_id) is not int:
+        raise InvalidSearchCursor("types")
+    if with_relevance:
+        # Cursor z dotazu bez q (bez relevance) nepatrí k dotazu s q a naopak.
+        if type(relevance) is not int:
+            raise InvalidSearchCursor("relevance")
+        return [relevance, verified, created_at, skill_id]
+    if relevance is not None:
+        raise InvalidSearchCursor("relevance")
+    return [verified, created_at, skill_id]
+
+
+def _apply_search_keyset(qs, fields, values):
+    """Riadky striktne "za" kľúčom pri zostupnom triedení všetkých polí.
+
+    (a, b, c) < (x, y, z) rozpísané ako OR reťaz – Django 4.2 nemá row-value
+    porovnanie. Redundantný `a <= x` na začiatku dáva plánovaču sargable hranicu
+    na prvom stĺpci indexu.
     """
-    Slice one page plus one sentinel row to determine whether a next page exists.
+    seek_q = Q()
+    for position, field in enumerate(fields):
+        clause = Q(**{f"{field}__lt": values[position]})
+        for prev_field, prev_value in zip(fields[:position], values[:position]):
+            clause &= Q(**{prev_field: prev_value})
+        seek_q |= clause
+    return qs.filter(Q(**{f"{fields[0]}__lte": values[0]}) & seek_q)
 
-    This avoids exact COUNT(*) on the skills branch, which is the main source of
-    production latency for dashboard search.
-    """
 
-    safe_page = max(int(page or 1), 1)
+def _slice_search_page(
+    qs,
+    *,
+    page: int,
+    per_page: int,
+    verified_field: str,
+    id_field: str = "id",
+    cursor: str = "",
+):
+    """Jedna stránka id + has_next + cursor na ďalšiu stránku.
+
+    S `cursor` sa stránka seekuje za kľúč z cursoru (page sa ignoruje), inak
+    sa použije OFFSET podľa `page` ako doteraz. `next_cursor` vraciame v oboch
+    režimoch, aby klient mohol po prvej (číslovanej) stránke prejsť na cursor.
+    Rovnako ako predtým: +1 sentinel riadok namiesto COUNT(*) na skills vetve
+    (hlavný zdroj latencie dashboard searchu). Vyhadzuje InvalidSearchCursor
+    pri neplatnom cursore.
+    """
+    fields = _search_keyset_fields(qs, verified_field=verified_field, id_field=id_field)
     safe_per_page = max(int(per_page or 1), 1)
-    offset = (safe_page - 1) * safe_per_page
-    raw_ids = list(
-        qs.values_list(id_field, flat=True)[offset : offset + safe_per_page + 1]
-    )
-    has_next = len(raw_ids) > safe_per_page
-    return raw_ids[:safe_per_page], has_next
+    if cursor:
+        values = decode_search_cursor(cursor, with_relevance=len(fields) == 4)
+        rows = list(
+            _apply_search_keyset(qs, fields, values).values_list(*fields)[
+                : safe_per_page + 1
+            ]
+        )
+    else:
+        offset = (max(int(page or 1), 1) - 1) * safe_per_page
+        rows = list(qs.values_list(*fields)[offset : offset + safe_per_page + 1])
+
+    has_next = len(rows) > safe_per_page
+    rows = rows[:safe_per_page]
+    next_cursor = encode_search_cursor(rows[-1]) if has_next and rows else None
+    return [row[-1] for row in rows], has_next, next_cursor
 
 
 def _build_projection_skills_page_qs(
@@ -191,10 +383,16 @@ def _build_projection_skills_page_qs(
     skills_qs = skills_qs.exclude(user_id=viewer_user_id)
     skills_qs = skills_qs.filter(is_hidden=False)
 
+    use_fulltext = _projection_fulltext_enabled()
+    tsquery = ""
     if skill_terms:
-        skills_qs = skills_qs.filter(
-            _build_skill_search_query(skill_terms, projection=True)
-        )
+        if use_fulltext:
+            fulltext_q, tsquery = _build_projection_fulltext_filter(skill_terms)
+            skills_qs = skills_qs.filter(fulltext_q)
+        else:
+            skills_qs = skills_qs.filter(
+                _build_skill_search_query(skill_terms, projection=True)
+            )
 
     if country_filter:
         skills_qs = _apply_skill_country_filter(
@@ -213,6 +411,11 @@ def _build_projection_skills_page_qs(
     if only_my_location and projection_skill_loc_q:
         skills_qs = skills_qs.filter(projection_skill_loc_q)
 
+    if raw_query and use_fulltext:
+        return _annotate_projection_fulltext_relevance(
+            skills_qs, raw_query=raw_query, tsquery=tsquery
+        ).order_by("-relevance", "-user_is_verified", "-created_at", "-skill_id")
+
     if raw_query:
         return skills_qs.annotate(
             relevance=Case(
@@ -224,9 +427,9 @@ def _build_projection_skills_page_qs(
                 default=0,
                 output_field=IntegerField(),
             )
-        ).order_by("-relevance", "-user_is_verified", "-created_at")
+        ).order_by("-relevance", "-user_is_verified", "-created_at", "-skill_id")
 
-    return skills_qs.order_by("-user_is_verified", "-created_at")
+    return skills_qs.order_by("-user_is_verified", "-created_at", "-skill_id")
 
 
 def _build_legacy_skills_page_qs(
@@ -274,6 +477,6 @@ def _build_legacy_skills_page_qs(
                 default=0,
                 output_field=IntegerField(),
             )
-        ).order_by("-relevance", "-user__is_verified", "-created_at")
+        ).order_by("-relevance", "-user__is_verified", "-created_at", "-id")
 
-    return skills_qs.order_by("-user__is_verified", "-created_at")
+    return skills_qs.order_by("-user__is_verified", "-created_at", "-id")
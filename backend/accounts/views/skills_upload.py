@@ -1,10 +1,15 @@
 """
 Skill image upload views (vyčlenené z skills.py kvôli dĺžke).
 
-S3 presigned upload (init/complete) pre obrázky ponúk + S3 klient. Ostatné skill
-views (list/detail/images/image-detail) ostávajú v skills.py.
+S3 presigned upload (init/complete, jednotlivo aj dávkovo) pre obrázky ponúk + S3
+klient. Ostatné skill views (list/detail/images/image-detail) ostávajú v skills.py.
 """
 
+import os
+import uuid
+
+from django.conf import settings
+from django.db import transaction
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -18,7 +23,6 @@ from .skill_helpers import _skills_list_cache_invalidate
 
 def _get_s3_client():
     import boto3
-    from django.conf import settings
 
     return boto3.client(
         "s3",
@@ -28,55 +32,39 @@ def _get_s3_client():
     )
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-@api_rate_limit
-def skill_images_upload_init_view(request, skill_id):
-    """
-    Init direct-to-S3 upload for offer images.
+MAX_OFFER_IMAGES = 6
+UPLOAD_EXPIRES_SECONDS = 120
 
-    Returns a presigned POST payload:
-      { url, fields, key, expires_in }
-    Client uploads to S3 under `uploads/` prefix, then calls complete endpoint.
-    """
-    from django.conf import settings
-    import os
-    import uuid
 
-    try:
-        skill = OfferedSkill.objects.get(id=skill_id, user=request.user)
-    except OfferedSkill.DoesNotExist:
-        return Response({"error": "Zručnosť nebola nájdená"}, status=status.HTTP_404_NOT_FOUND)
+def _skill_not_found_response():
+    return Response({"error": "Zručnosť nebola nájdená"}, status=status.HTTP_404_NOT_FOUND)
 
-    if skill.images.count() >= 6:
-        return Response(
-            {"error": "Maximálny počet obrázkov je 6"},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
 
-    filename = str(request.data.get("filename") or "").strip()
-    content_type = str(request.data.get("content_type") or "").strip()
-    try:
-        size_bytes = int(request.data.get("size_bytes") or 0)
-    except Exception:
-        size_bytes = 0
+def _images_limit_response():
+    return Response(
+        {"error": "Maximálny počet obrázkov je 6"},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
 
-    if not filename or size_bytes <= 0:
-        return Response({"error": "Neplatný súbor."}, status=status.HTTP_400_BAD_REQUEST)
 
+def _storage_not_configured_response():
+    return Response(
+        {"error": "Storage nie je nakonfigurované."},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+def _max_upload_bytes() -> int:
     # Enforce max size (reuse same limit as validator)
     try:
         max_mb = int(getattr(settings, "IMAGE_MAX_SIZE_MB", 5))
     except Exception:
         max_mb = 5
-    if size_bytes > max_mb * 1024 * 1024:
-        return Response(
-            {"error": f"Obrázok je príliš veľký. Maximálna veľkosť je {max_mb}MB."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+    return max_mb * 1024 * 1024
 
-    ext = os.path.splitext(filename)[1].lower()
-    allowed_extensions = [
+
+def _allowed_extensions() -> list[str]:
+    return [
         e.strip().lower()
         for e in getattr(
             settings,
@@ -84,71 +72,66 @@ def skill_images_upload_init_view(request, skill_id):
             [".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif"],
         )
     ]
-    if ext not in allowed_extensions:
-        return Response(
-            {"error": "Neplatný typ súboru."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
 
-    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
-    if not bucket:
-        return Response({"error": "Storage nie je nakonfigurované."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    # Randomized key under uploads/; include skill_id for easy server-side validation
-    key = f"uploads/offers/{skill_id}/{uuid.uuid4().hex}{ext}"
 
-    expires_in = 120
+def _validate_upload_metadata(data):
+    """(filename, content_type, size_bytes, error_response) pre upload-init."""
+    filename = str(data.get("filename") or "").strip()
+    content_type = str(data.get("content_type") or "").strip()
     try:
-        s3 = _get_s3_client()
-        presigned = s3.generate_presigned_post(
-            Bucket=bucket,
-            Key=key,
-            Conditions=[
-                ["content-length-range", 1, max_mb * 1024 * 1024],
-            ],
-            ExpiresIn=expires_in,
-        )
+        size_bytes = int(data.get("size_bytes") or 0)
     except Exception:
-        return Response(
-            {"error": "Nepodarilo sa pripraviť upload."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        size_bytes = 0
+
+    if not filename or size_bytes <= 0:
+        return None, None, 0, Response(
+            {"error": "Neplatný súbor."}, status=status.HTTP_400_BAD_REQUEST
         )
 
-    return Response(
-        {
-            "url": presigned.get("url"),
-            "fields": presigned.get("fields", {}),
-            "key": key,
-            "expires_in": expires_in,
-            "content_type": content_type or None,
-        },
-        status=status.HTTP_200_OK,
-    )
+    max_bytes = _max_upload_bytes()
+    if size_bytes > max_bytes:
+        return None, None, 0, Response(
+            {
+                "error": (
+                    "Obrázok je príliš veľký. Maximálna veľkosť je "
+                    f"{max_bytes // (1024 * 1024)}MB."
+                )
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _allowed_extensions():
+        return None, None, 0, Response(
+            {"error": "Neplatný typ súboru."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
+    return filename, content_type, size_bytes, None
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-@api_rate_limit
-def skill_images_upload_complete_view(request, skill_id):
-    """
-    Confirm a direct-to-S3 upload and create DB record as PENDING.
-    Enqueues background processing (HEIC decode, resize, SafeSearch, move to media/).
-    """
-    from django.conf import settings
-    import os
 
-    try:
-        skill = OfferedSkill.objects.get(id=skill_id, user=request.user)
-    except OfferedSkill.DoesNotExist:
-        return Response({"error": "Zručnosť nebola nájdená"}, status=status.HTTP_404_NOT_FOUND)
+def _presigned_upload(s3, *, bucket, skill_id, filename, content_type) -> dict:
+    # Randomized key under uploads/; include skill_id for easy server-side validation
+    ext = os.path.splitext(filename)[1].lower()
+    key = f"uploads/offers/{skill_id}/{uuid.uuid4().hex}{ext}"
+    presigned = s3.generate_presigned_post(
+        Bucket=bucket,
+        Key=key,
+        Conditions=[
+            ["content-length-range", 1, _max_upload_bytes()],
+        ],
+        ExpiresIn=UPLOAD_EXPIRES_SECONDS,
+    )
+    return {
+        "url": presigned.get("url"),
+        "fields": presigned.get("fields", {}),
+        "key": key,
+        "expires_in": UPLOAD_EXPIRES_SECONDS,
+        "content_type": content_type or None,
+    }
 
-    if skill.images.count() >= 6:
-        return Response(
-            {"error": "Maximálny počet obrázkov je 6"},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
 
-    key = str(request.data.get("key") or "").strip()
+def _validate_complete_key(key: str, *, skill_id):
     if not key:
         return Response({"error": "Chýba key."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -157,34 +140,29 @@ def skill_images_upload_complete_view(request, skill_id):
         return Response({"error": "Neplatný key."}, status=status.HTTP_400_BAD_REQUEST)
 
     ext = os.path.splitext(key)[1].lower()
-    allowed_extensions = [
-        e.strip().lower()
-        for e in getattr(
-            settings,
-            "ALLOWED_IMAGE_EXTENSIONS",
-            [".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif"],
-        )
-    ]
-    if ext not in allowed_extensions:
+    if ext not in _allowed_extensions():
         return Response({"error": "Neplatný typ súboru."}, status=status.HTTP_400_BAD_REQUEST)
+    return None
 
-    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
-    if not bucket:
-        return Response({"error": "Storage nie je nakonfigurované."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def _verify_staged_upload(s3, *, bucket, key):
+    """(size_bytes, content_type, error_response) pre nahraný staging objekt."""
     # Verify object exists in S3 and capture metadata
     try:
-        s3 = _get_s3_client()
         head = s3.head_object(Bucket=bucket, Key=key)
     except Exception:
-        return Response({"error": "Upload nebol nájdený."}, status=status.HTTP_400_BAD_REQUEST)
+        return 0, "", Response(
+            {"error": "Upload nebol nájdený."}, status=status.HTTP_400_BAD_REQUEST
+        )
 
     size_bytes = int(head.get("ContentLength") or 0)
     content_type = str(head.get("ContentType") or "")
 
     max_bytes = getattr(settings, "SKILL_IMAGE_MAX_BYTES", 10 * 1024 * 1024)
     if size_bytes > max_bytes:
-        return Response({"error": "Súbor je príliš veľký."}, status=status.HTTP_400_BAD_REQUEST)
+        return 0, "", Response(
+            {"error": "Súbor je príliš veľký."}, status=status.HTTP_400_BAD_REQUEST
+        )
 
     # Preflight SafeSearch moderation — before creating any DB record
     if getattr(settings, "SAFESEARCH_ENABLED", False):
@@ -202,11 +180,109 @@ def skill_images_upload_complete_view(request, skill_id):
                 s3.delete_object(Bucket=bucket, Key=key)
             except Exception:
                 pass
-            return Response(
+            return 0, "", Response(
                 {"error": e.user_message, "code": e.code},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    return size_bytes, content_type, None
+
+
+def _batch_entries(value):
+    """Zoznam 1..MAX_OFFER_IMAGES objektov z batch requestu."""
+    if (
+        not isinstance(value, list)
+        or not 1 <= len(value) <= MAX_OFFER_IMAGES
+        or not all(isinstance(entry, dict) for entry in value)
+    ):
+        return None, Response(
+            {"error": "Neplatný zoznam súborov."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return value, None
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def skill_images_upload_init_view(request, skill_id):
+    """
+    Init direct-to-S3 upload for offer images.
+
+    Returns a presigned POST payload:
+      { url, fields, key, expires_in }
+    Client uploads to S3 under `uploads/` prefix, then calls complete endpoint.
+    """
+    try:
+        skill = OfferedSkill.objects.get(id=skill_id, user=request.user)
+    except OfferedSkill.DoesNotExist:
+        return _skill_not_found_response()
+
+    if skill.images.count() >= MAX_OFFER_IMAGES:
+        return _images_limit_response()
+
+    filename, content_type, _size_bytes, error_response = _validate_upload_metadata(
+        request.data
+    )
+    if error_response is not None:
+        return error_response
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket:
+        return _storage_not_configured_response()
+
+    try:
+        payload = _presigned_upload(
+            _get_s3_client(),
+            bucket=bucket,
+            skill_id=skill_id,
+            filename=filename,
+            content_type=content_type,
+        )
+    except Exception:
+        return Response(
+            {"error": "Nepodarilo sa pripraviť upload."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    return Response(payload, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def skill_images_upload_complete_view(request, skill_id):
+    """
+    Confirm a direct-to-S3 upload and create DB record as PENDING.
+    Enqueues background processing (HEIC decode, resize, SafeSearch, move to media/).
+    """
+    try:
+        skill = OfferedSkill.objects.get(id=skill_id, user=request.user)
+    except OfferedSkill.DoesNotExist:
+        return _skill_not_found_response()
+
+    if skill.images.count() >= MAX_OFFER_IMAGES:
+        return _images_limit_response()
+
+    key = str(request.data.get("key") or "").strip()
+    error_response = _validate_complete_key(key, skill_id=skill_id)
+    if error_response is not None:
+        return error_response
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket:
+        return _storage_not_configured_response()
+
+    try:
+        s3 = _get_s3_client()
+    except Exception:
+        return Response({"error": "Upload nebol nájdený."}, status=status.HTTP_400_BAD_REQUEST)
+    size_bytes, content_type, error_response = _verify_staged_upload(
+        s3, bucket=bucket, key=key
+    )
+    if error_response is not None:
+        return error_response
+
     order = skill.images.count()
     img = OfferedSkillImage.objects.create(
         skill=skill,
@@ -237,3 +313,184 @@ def skill_images_upload_complete_view(request, skill_id):
         },
         status=status.HTTP_201_CREATED,
     )
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def skill_images_batch_upload_init_view(request, skill_id):
+    """
+    Init direct-to-S3 upload for several offer images at once.
+
+    Body `{"files": [{filename, content_type, size_bytes}, ...]}`; one ownership
+    check, one limit count and one S3 client. Returns `{"uploads": [...]}` with
+    the same per-file payload as upload-init.
+    """
+    try:
+        skill = OfferedSkill.objects.get(id=skill_id, user=request.user)
+    except OfferedSkill.DoesNotExist:
+        return _skill_not_found_response()
+
+    entries, error_response = _batch_entries(request.data.get("files"))
+    if error_response is not None:
+        return error_response
+
+    if skill.images.count() + len(entries) > MAX_OFFER_IMAGES:
+        return _images_limit_response()
+
+    validated = []
+    for index, entry in enumerate(entries):
+        filename, content_type, _size_bytes, error_response = _validate_upload_metadata(
+            entry
+        )
+        if error_response is not None:
+            return Response(
+                {**error_response.data, "index": index},
+                status=error_response.status_code,
+            )
+        validated.append((filename, content_type))
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket:
+        return _storage_not_configured_response()
+
+    try:
+        s3 = _get_s3_client()
+        uploads = [
+            _presigned_upload(
+                s3,
+                bucket=bucket,
+                skill_id=skill_id,
+                filename=filename,
+                content_type=content_type,
+            )
+            for filename, content_type in validated
+        ]
+    except Exception:
+        return Response(
+            {"error": "Nepodarilo sa pripraviť upload."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    return Response({"uploads": uploads}, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def skill_images_batch_upload_complete_view(request, skill_id):
+    """
+    Confirm several direct-to-S3 uploads in one transaction.
+
+    Body `{"uploads": [{key, filename}, ...]}`. An invalid key rejects the whole
+    request; a missing or moderation-rejected upload is reported in `errors`
+    while the rest are created. The image limit is checked once under
+    `select_for_update` on the offer and the batch is processed by one task.
+    """
+    try:
+        OfferedSkill.objects.only("id", "user_id").get(id=skill_id, user=request.user)
+    except OfferedSkill.DoesNotExist:
+        return _skill_not_found_response()
+
+    entries, error_response = _batch_entries(request.data.get("uploads"))
+    if error_response is not None:
+        return error_response
+
+    uploads = []
+    for index, entry in enumerate(entries):
+        key = str(entry.get("key") or "").strip()
+        error_response = _validate_complete_key(key, skill_id=skill_id)
+        if error_response is not None:
+            return Response(
+                {**error_response.data, "index": index},
+                status=error_response.status_code,
+            )
+        uploads.append((key, str(entry.get("filename") or "")))
+    if len({key for key, _ in uploads}) != len(uploads):
+        return Response({"error": "Duplicitný key."}, status=status.HTTP_400_BAD_REQUEST)
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket:
+        return _storage_not_configured_response()
+
+    try:
+        s3 = _get_s3_client()
+    except Exception:
+        return Response({"error": "Upload nebol nájdený."}, status=status.HTTP_400_BAD_REQUEST)
+
+    verified = []
+    errors = []
+    for index, (key, filename) in enumerate(uploads):
+        size_bytes, content_type, error_response = _verify_staged_upload(
+            s3, bucket=bucket, key=key
+        )
+        if error_response is not None:
+            errors.append({"index": index, "key": key, **error_response.data})
+            continue
+        verified.append((key, filename, size_bytes, content_type))
+
+    if not verified:
+        return Response(
+            {"error": "Žiadny obrázok nebol prijatý.", "errors": errors},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    with transaction.atomic():
+        try:
+            skill = OfferedSkill.objects.select_for_update().get(
+                id=skill_id, user=request.user
+            )
+        except OfferedSkill.DoesNotExist:
+            return _skill_not_found_response()
+        first_order = skill.images.count()
+        if first_order + len(verified) > MAX_OFFER_IMAGES:
+            verified_keys = [key for key, *_ in verified]
+
+            def _delete_staged_uploads():
+                for key in verified_keys:
+                    try:
+                        s3.delete_object(Bucket=bucket, Key=key)
+                    except Exception:
+                        pass
+
+            transaction.on_commit(_delete_staged_uploads)
+            return _images_limit_response()
+
+        images = [
+            OfferedSkillImage.objects.create(
+                skill=skill,
+                order=first_order + offset,
+                status=OfferedSkillImage.Status.PENDING,
+                pending_key=key,
+                approved_key="",
+                original_filename=filename,
+                content_type=content_type,
+                size_bytes=size_bytes or None,
+            )
+            for offset, (key, filename, size_bytes, content_type) in enumerate(verified)
+        ]
+        image_ids = [img.id for img in images]
+
+        def _enqueue_processing():
+            try:
+                from swaply.tasks.offer_images import process_offered_skill_image_batch
+
+                process_offered_skill_image_batch.delay(image_ids)
+            except Exception:
+                # Fail-open ako upload-complete: záznamy ostanú PENDING
+                # (reprocess_pending_offer_images).
+                pass
+
+        transaction.on_commit(_enqueue_processing)
+    _skills_list_cache_invalidate(request.user.id)
+
+    return Response(
+        {
+            "images": [
+                {"id": img.id, "status": img.status, "order": img.order}
+                for img in images
+            ],
+            "errors": errors,
+        },
+        status=status.HTTP_201_CREATED,
+    )
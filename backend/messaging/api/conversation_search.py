@@ -2,23 +2,41 @@ from __future__ import annotations
 
 from django.db.models import Q
 
+# Polia anotovaného Conversation querysetu vs. materializovaného InboxEntry.
+CONVERSATION_SEARCH_FIELDS = (
+    "name",
+    "other_user_first_name",
+    "other_user_last_name",
+    "other_user_company_name",
+    "other_user_username",
+)
+INBOX_ENTRY_SEARCH_FIELDS = (
+    "conversation__name",
+    "peer_first_name",
+    "peer_last_name",
+    "peer_company_name",
+    "peer_username",
+)
+
 
 def normalize_conversation_search_query(value: str | None) -> str:
     return " ".join((value or "").split())
 
 
-def apply_conversation_list_search(queryset, search_query: str):
+def apply_conversation_list_search(
+    queryset,
+    search_query: str,
+    *,
+    fields: tuple[str, ...] = CONVERSATION_SEARCH_FIELDS,
+):
     normalized_query = normalize_conversation_search_query(search_query)
     if not normalized_query:
         return queryset
 
     for token in normalized_query.split(" "):
-        queryset = queryset.filter(
-            Q(name__icontains=token)
-            | Q(other_user_first_name__icontains=token)
-            | Q(other_user_last_name__icontains=token)
-            | Q(other_user_company_name__icontains=token)
-            | Q(other_user_username__icontains=token)
-        )
+        token_filter = Q()
+        for field in fields:
+            token_filter |= Q(**{f"{field}__icontains": token})
+        queryset = queryset.filter(token_filter)
 
     return queryset
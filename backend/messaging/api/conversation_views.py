@@ -37,7 +37,7 @@ from ..services.messages import (
     mark_conversation_read,
     set_conversation_pinned_state_for_user,
 )
-from .conversation_search import apply_conversation_list_search
+from .conversation_search import INBOX_ENTRY_SEARCH_FIELDS, apply_conversation_list_search
 from . import notification_dispatch
 from .serializers import (
     ConversationListItemSerializer,
@@ -51,7 +51,9 @@ from .view_helpers import (
     _can_open_direct_target,
     _conversation_list_queryset_for_user,
     _conversation_for_user_or_404,
+    _conversations_from_inbox_entries,
     _has_requestable_offers_for_user_id,
+    _inbox_entry_list_queryset_for_user,
     _message_request_list_queryset_for_user,
     _total_unread_messages_count_for_user,
 )
@@ -81,7 +83,10 @@ def _classify_conversations_sql(sql: str) -> str:
     ):
         return "count"
 
-    if 'from "messaging_conversation"' in normalized and " order by " in normalized:
+    if (
+        'from "messaging_conversation"' in normalized
+        or 'from "messaging_inboxentry"' in normalized
+    ) and " order by " in normalized:
         return "page"
 
     if (
@@ -264,6 +269,8 @@ class ConversationListView(ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ConversationListItemSerializer
     pagination_class = ConversationListPagination
+    # Ordering: pinned conversations first, then newest activity.
+    list_ordering = ("-is_pinned", "-last_message_at", "-conversation__updated_at", "-conversation_id")
 
     def get_validated_query_params(self):
         serializer = getattr(self, "_validated_query_params", None)
@@ -273,12 +280,16 @@ class ConversationListView(ListAPIView):
             self._validated_query_params = serializer
         return serializer
 
+    def get_inbox_queryset(self):
+        return _inbox_entry_list_queryset_for_user(self.request.user)
+
     def get_queryset(self):
-        qs = _conversation_list_queryset_for_user(self.request.user)
+        # Sidebar číta materializované InboxEntry riadky (index user/pinned/
+        # last_message_at); na Conversation sa preklopia až po stránkovaní.
+        qs = self.get_inbox_queryset()
         search_query = self.get_validated_query_params().validated_data.get("search", "")
-        qs = apply_conversation_list_search(qs, search_query)
-        # Ordering: pinned conversations first, then newest activity.
-        return qs.order_by("-is_pinned", "-last_message_at", "-updated_at", "-id")
+        qs = apply_conversation_list_search(qs, search_query, fields=INBOX_ENTRY_SEARCH_FIELDS)
+        return qs.order_by(*self.list_ordering)
 
     def list(self, request, *args, **kwargs):
         conn = connections["default"]
@@ -304,7 +315,9 @@ class ConversationListView(ListAPIView):
         t_sql0 = perf_counter()
         with conn.execute_wrapper(query_collector):
             page = self.paginate_queryset(queryset)
-            items = page if page is not None else list(queryset)
+            items = _conversations_from_inbox_entries(
+                page if page is not None else list(queryset)
+            )
         conversations_sql_ms = (perf_counter() - t_sql0) * 1000.0
 
         t_ser0 = perf_counter()
@@ -338,11 +351,12 @@ class ConversationListView(ListAPIView):
 
 
 class MessageRequestListView(ConversationListView):
-    def get_queryset(self):
-        qs = _message_request_list_queryset_for_user(self.request.user)
-        search_query = self.get_validated_query_params().validated_data.get("search", "")
-        qs = apply_conversation_list_search(qs, search_query)
-        return qs.order_by("-last_message_at", "-updated_at", "-id")
+    list_ordering = ("-last_message_at", "-conversation__updated_at", "-conversation_id")
+
+    def get_inbox_queryset(self):
+        return _inbox_entry_list_queryset_for_user(
+            self.request.user, only_incoming_requests=True
+        )
 
 
 class HideConversationView(APIView):
@@ -412,15 +426,14 @@ class MarkConversationReadView(APIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         total_unread_count = _total_unread_messages_count_for_user(request.user)
-        notification_dispatch.notify_user(
-            request.user.id,
-            {
+        events_by_user = {
+            request.user.id: {
                 "type": "messaging_read",
                 "conversation_id": convo.id,
                 "conversation_unread_count": 0,
                 "total_unread_count": total_unread_count,
             },
-        )
+        }
         if not is_pending_message_request(convo):
             peer_read_event = {
                 "type": "messaging_peer_read",
@@ -441,7 +454,8 @@ class MarkConversationReadView(APIView):
                 .values_list("user_id", flat=True)
             )
             for participant_id in recipient_ids:
-                notification_dispatch.notify_user(int(participant_id), peer_read_event)
+                events_by_user[int(participant_id)] = peer_read_event
+        notification_dispatch.notify_users(events_by_user)
 
         return Response(
             {
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from rest_framework import serializers, status
@@ -68,6 +70,7 @@ class ForwardMessageView(APIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         sent = []
+        events_by_user = defaultdict(list)
         for delivery in result.sent:
             event = {
                 "type": "messaging_message",
@@ -81,9 +84,8 @@ class ForwardMessageView(APIView):
                 recipient_user_ids=delivery.recipient_user_ids,
             )
             for participant_id in delivery.recipient_user_ids:
-                notification_dispatch.notify_user(
-                    participant_id,
-                    {**event, **unread_by_user[participant_id]},
+                events_by_user[participant_id].append(
+                    {**event, **unread_by_user[participant_id]}
                 )
 
             sent.append(
@@ -97,6 +99,9 @@ class ForwardMessageView(APIView):
                 }
             )
 
+        if events_by_user:
+            notification_dispatch.notify_users(events_by_user)
+
         return Response(
             {
                 "sent": sent,
@@ -100,15 +100,17 @@ class GroupConversationCreateView(APIView):
                 ConversationParticipant.Status.INVITED,
             ],
         ).values_list("user_id", flat=True)
-        for participant_id in notify_ids:
-            if participant_id != request.user.id:
-                notification_dispatch.notify_user(
-                    int(participant_id),
-                    {
-                        "type": "messaging_group_updated",
-                        "conversation_id": result.conversation.id,
-                    },
-                )
+        event = {
+            "type": "messaging_group_updated",
+            "conversation_id": result.conversation.id,
+        }
+        notification_dispatch.notify_users(
+            {
+                int(participant_id): event
+                for participant_id in notify_ids
+                if participant_id != request.user.id
+            }
+        )
         return Response(data, status=status.HTTP_201_CREATED)
 
 
@@ -134,8 +136,9 @@ class GroupConversationDetailView(APIView):
                 "type": "messaging_group_updated",
                 "conversation_id": result.conversation.id,
             }
-            for participant_id in result.participant_user_ids:
-                notification_dispatch.notify_user(participant_id, event)
+            notification_dispatch.notify_users(
+                {participant_id: event for participant_id in result.participant_user_ids}
+            )
 
         data = _serialize_conversation_for_user(request=request, conversation_id=conversation_id)
         return Response(data, status=status.HTTP_200_OK)
@@ -152,8 +155,9 @@ class GroupConversationDetailView(APIView):
             "type": "messaging_group_deleted",
             "conversation_id": conversation_id,
         }
-        for participant_id in result.participant_user_ids:
-            notification_dispatch.notify_user(participant_id, event)
+        notification_dispatch.notify_users(
+            {participant_id: event for participant_id in result.participant_user_ids}
+        )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -193,11 +197,12 @@ class GroupInviteView(APIView):
         unread_by_user = unread_payload_for_recipients(
             conversation_id=convo.id, recipient_user_ids=result.participant_user_ids
         )
-        for participant_id in result.participant_user_ids:
-            notification_dispatch.notify_user(
-                participant_id,
-                {**event, **unread_by_user[participant_id]},
-            )
+        notification_dispatch.notify_users(
+            {
+                participant_id: {**event, **unread_by_user[participant_id]}
+                for participant_id in result.participant_user_ids
+            }
+        )
 
         return Response(
             MessageSerializer(result.message, context={"request": request}).data
@@ -230,8 +235,9 @@ class GroupInvitationResponseView(APIView):
             "invitation_id": invitation_id,
             "accepted": action == "accept",
         }
-        for participant_id in result.participant_user_ids:
-            notification_dispatch.notify_user(participant_id, event)
+        notification_dispatch.notify_users(
+            {participant_id: event for participant_id in result.participant_user_ids}
+        )
         return Response(
             _serialize_conversation_for_user(
                 request=request,
@@ -260,8 +266,12 @@ class GroupMemberDetailView(APIView):
             "type": "messaging_group_members_updated",
             "conversation_id": conversation_id,
         }
-        for participant_id in result.participant_user_ids + (user_id,):
-            notification_dispatch.notify_user(participant_id, event)
+        notification_dispatch.notify_users(
+            {
+                participant_id: event
+                for participant_id in result.participant_user_ids + (user_id,)
+            }
+        )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -280,6 +290,10 @@ class GroupLeaveView(APIView):
             "type": "messaging_group_members_updated",
             "conversation_id": conversation_id,
         }
-        for participant_id in result.participant_user_ids + (request.user.id,):
-            notification_dispatch.notify_user(participant_id, event)
+        notification_dispatch.notify_users(
+            {
+                participant_id: event
+                for participant_id in result.participant_user_ids + (request.user.id,)
+            }
+        )
         return Response(status=status.HTTP_200_OK)
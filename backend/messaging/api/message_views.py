@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import mimetypes
+from datetime import datetime
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.http import FileResponse
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.exceptions import NotFound
@@ -13,8 +14,10 @@ from rest_framework.generics import ListAPIView
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
 
+from swaply.image_delivery import protected_image_response
 from swaply.rate_limiting import messaging_send_rate_limit
 from accounts.services.user_blocks import BlockedUserInteractionError
 from ..models import Conversation, ConversationParticipant, Message
@@ -34,20 +37,18 @@ from ..services.messages import (
 from ..services.pins import InvalidPinnedMessage, set_conversation_pinned_message
 from . import notification_dispatch
 from .serializers import (
+    ConversationListItemSerializer,
     MessageSerializer,
     PinMessageSerializer,
     SendMessageSerializer,
     StartDirectMessageSerializer,
 )
 from .view_helpers import (
+    MessageListContext,
     _can_open_direct_target,
     _conversation_for_user_or_404,
     _conversation_unread_messages_count_for_user,
-    _participant_hidden_at_for_conversation,
-    _participant_status_for_conversation,
-    _peer_last_read_at_for_conversation,
-    _serialize_conversation_for_user,
-    _serialize_pinned_message,
+    _message_list_context_for_user_or_404,
     _total_unread_messages_count_for_user,
     unread_payload_for_recipients,
 )
@@ -80,10 +81,109 @@ def _recipient_unavailable_response(*, not_found: bool = False):
     )
 
 
+def encode_message_cursor(message: Message) -> str:
+    return f"{message.created_at.isoformat()},{message.id}"
+
+
+def decode_message_cursor(raw: str):
+    """``"<created_at ISO>,<id>"`` → (created_at, id); NotFound pri neplatnom."""
+    # Neescapované "+" z časovej zóny príde v query stringu ako medzera.
+    created_at_raw, separator, id_raw = (raw or "").strip().replace(" ", "+").rpartition(",")
+    try:
+        if not separator:
+            raise ValueError("separator")
+        created_at = datetime.fromisoformat(created_at_raw)
+        message_id = int(id_raw)
+    except ValueError:
+        raise NotFound("Invalid cursor.")
+    if timezone.is_naive(created_at) or message_id < 1:
+        raise NotFound("Invalid cursor.")
+    return created_at, message_id
+
+
 class MessagePagination(PageNumberPagination):
+    """
+    Číslované stránky (pôvodné správanie) alebo keyset cursor.
+
+    ``?before=<created_at,id>`` vráti staršie správy, ``?after=<created_at,id>``
+    novšie – vždy zoradené od najnovšej. Cursor režim seekuje cez
+    ``msg_conv_created_at_idx`` bez COUNT(*) a bez OFFSET-u, takže stránka
+    hlboko v histórii stojí rovnako ako prvá. ``next_cursor`` sa vracia aj v
+    číslovanom režime, aby klient mohol po prvej stránke prejsť na cursor.
+    """
+
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+    before_query_param = "before"
+    after_query_param = "after"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        before = request.query_params.get(self.before_query_param)
+        after = request.query_params.get(self.after_query_param)
+        self.cursor_mode = bool(before or after)
+        if not self.cursor_mode:
+            page = super().paginate_queryset(queryset, request, view=view)
+            self.next_cursor = (
+                encode_message_cursor(page[-1]) if page and self.page.has_next() else None
+            )
+            return page
+
+        self.request = request
+        page_size = self.get_page_size(request) or self.page_size
+        if before and after:
+            raise NotFound("Invalid cursor.")
+        if before:
+            created_at, message_id = decode_message_cursor(before)
+            items = list(
+                queryset.filter(created_at__lte=created_at)
+                .filter(
+                    Q(created_at__lt=created_at)
+                    | Q(created_at=created_at, id__lt=message_id)
+                )
+                .order_by("-created_at", "-id")[: page_size + 1]
+            )
+            has_more = len(items) > page_size
+            items = items[:page_size]
+            self.next_cursor = encode_message_cursor(items[-1]) if has_more else None
+            self.previous_cursor = encode_message_cursor(items[0]) if items else before
+        else:
+            created_at, message_id = decode_message_cursor(after)
+            items = list(
+                queryset.filter(created_at__gte=created_at)
+                .filter(
+                    Q(created_at__gt=created_at)
+                    | Q(created_at=created_at, id__gt=message_id)
+                )
+                .order_by("created_at", "id")[: page_size + 1]
+            )
+            has_more = len(items) > page_size
+            items = items[:page_size][::-1]
+            self.previous_cursor = encode_message_cursor(items[0]) if has_more else None
+            self.next_cursor = encode_message_cursor(items[-1]) if items else after
+        return items
+
+    def _cursor_link(self, param: str, value: str | None):
+        if value is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        other = self.after_query_param if param == self.before_query_param else self.before_query_param
+        return replace_query_param(remove_query_param(url, other), param, value)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            response = super().get_paginated_response(data)
+            response.data["next_cursor"] = self.next_cursor
+            return response
+        return Response(
+            {
+                "next": self._cursor_link(self.before_query_param, self.next_cursor),
+                "previous": self._cursor_link(self.after_query_param, self.previous_cursor),
+                "next_cursor": self.next_cursor,
+                "previous_cursor": self.previous_cursor,
+                "results": data,
+            }
+        )
 
 
 class MessageListView(ListAPIView):
@@ -91,37 +191,33 @@ class MessageListView(ListAPIView):
     serializer_class = MessageSerializer
     pagination_class = MessagePagination
 
-    def get_conversation(self) -> Conversation:
-        conversation = getattr(self, "_conversation", None)
-        if conversation is None:
-            conversation_id = int(self.kwargs["conversation_id"])
-            conversation = _conversation_for_user_or_404(
-                conversation_id=conversation_id,
+    def get_list_context(self) -> MessageListContext:
+        # Jeden dotaz na request, zdieľaný medzi get_queryset a list.
+        context = getattr(self, "_list_context", None)
+        if context is None:
+            context = _message_list_context_for_user_or_404(
+                conversation_id=int(self.kwargs["conversation_id"]),
                 user=self.request.user,
             )
-            self._conversation = conversation
-        return conversation
+            self._list_context = context
+        return context
+
+    def get_conversation(self) -> Conversation:
+        return self.get_list_context().conversation
 
     def get_queryset(self):
-        convo = self.get_conversation()
-        participant_status = _participant_status_for_conversation(
-            conversation_id=convo.id,
-            user_id=self.request.user.id,
-        )
-        hidden_at = _participant_hidden_at_for_conversation(
-            conversation_id=convo.id,
-            user_id=self.request.user.id,
-        )
+        context = self.get_list_context()
+        convo = context.conversation
         qs = Message.objects.filter(conversation=convo)
-        if convo.is_group and participant_status == ConversationParticipant.Status.INVITED:
+        if convo.is_group and context.participant_status == ConversationParticipant.Status.INVITED:
             qs = qs.filter(
                 message_type=Message.Type.GROUP_INVITATION,
                 group_invitation__invited_user_id=self.request.user.id,
             )
-        if hidden_at is not None:
+        if context.hidden_at is not None:
             # >= aby správa doručená presne v takte skrytia (created_at == hidden_at)
             # ostala viditeľná – konzistentné s viditeľnosťou konverzácie v sidebar.
-            qs = qs.filter(created_at__gte=hidden_at)
+            qs = qs.filter(created_at__gte=context.hidden_at)
         return qs.select_related(
             "sender",
             "group_invitation",
@@ -130,34 +226,31 @@ class MessageListView(ListAPIView):
         ).order_by("-created_at", "-id")
 
     def list(self, request, *args, **kwargs):
-        conversation = self.get_conversation()
-        participant_status = _participant_status_for_conversation(
-            conversation_id=conversation.id,
-            user_id=request.user.id,
-        )
+        context = self.get_list_context()
+        conversation = context.conversation
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
         serializer = self.get_serializer(page if page is not None else queryset, many=True)
         peer_last_read_at = (
             None
             if conversation.is_group or is_pending_message_request(conversation)
-            else _peer_last_read_at_for_conversation(
-                conversation_id=conversation.id,
-                user_id=request.user.id,
-            )
+            else context.peer_last_read_at
         )
         peer_last_read_at_value = (
             peer_last_read_at.isoformat() if peer_last_read_at is not None else None
         )
         pinned_message_data = None
-        if participant_status != ConversationParticipant.Status.INVITED:
-            pinned_message_data = _serialize_pinned_message(
-                request=request,
-                conversation=conversation,
-            )
-        conversation_data = _serialize_conversation_for_user(
-            request=request,
-            conversation_id=conversation.id,
+        if (
+            context.participant_status != ConversationParticipant.Status.INVITED
+            and context.pinned_message is not None
+        ):
+            pinned_message_data = MessageSerializer(
+                context.pinned_message, context={"request": request}
+            ).data
+        conversation_data = (
+            ConversationListItemSerializer(conversation, context={"request": request}).data
+            if context.is_list_accessible
+            else None
         )
 
         if page is not None:
@@ -209,22 +302,19 @@ def _message_image_response(request, conversation_id: int, message_id: int, fiel
         )
     )
     image_field = getattr(message, field_name, None)
-    if not image_field:
+    # Nespracovaný originál (PROCESSING) môže ešte niesť EXIF/GPS – nevydávame.
+    if not image_field or message.image_status != Message.ImageStatus.READY:
         return Response(status=status.HTTP_404_NOT_FOUND)
 
-    try:
-        image_field.open("rb")
-        image_file = image_field.file
-    except Exception:
+    # Príloha sa po odoslaní nemení – kľúč aj obsah sú nemenné.
+    response = protected_image_response(
+        image_field.name,
+        request=request,
+        storage=image_field.storage,
+        immutable=True,
+    )
+    if response is None:
         return Response(status=status.HTTP_404_NOT_FOUND)
-
-    content_type = mimetypes.guess_type(image_field.name or "")[0]
-    if content_type is None and (image_field.name or "").lower().endswith(".webp"):
-        content_type = "image/webp"
-    content_type = content_type or "application/octet-stream"
-    response = FileResponse(image_file, content_type=content_type)
-    response["Cache-Control"] = "private, max-age=3600"
-    response["X-Content-Type-Options"] = "nosniff"
     return response
 
 
@@ -275,11 +365,12 @@ class SendMessageView(APIView):
         unread_by_user = unread_payload_for_recipients(
             conversation_id=convo.id, recipient_user_ids=result.recipient_user_ids
         )
-        for participant_id in result.recipient_user_ids:
-            notification_dispatch.notify_user(
-                participant_id,
-                {**event, **unread_by_user[participant_id]},
-            )
+        notification_dispatch.notify_users(
+            {
+                participant_id: {**event, **unread_by_user[participant_id]}
+                for participant_id in result.recipient_user_ids
+            }
+        )
 
         return Response(
             MessageSerializer(result.message, context={"request": request}).data,
@@ -318,11 +409,12 @@ class DeleteMessageView(APIView):
             unread_by_user = unread_payload_for_recipients(
                 conversation_id=convo.id, recipient_user_ids=result.participant_user_ids
             )
-            for participant_id in result.participant_user_ids:
-                notification_dispatch.notify_user(
-                    participant_id,
-                    {**event, **unread_by_user[participant_id]},
-                )
+            notification_dispatch.notify_users(
+                {
+                    participant_id: {**event, **unread_by_user[participant_id]}
+                    for participant_id in result.participant_user_ids
+                }
+            )
 
         return Response(
             {
@@ -375,8 +467,9 @@ class PinMessageView(APIView):
                 "pinned_message": pinned_message_data,
                 "actor_id": request.user.id,
             }
-            for participant_id in result.participant_user_ids:
-                notification_dispatch.notify_user(participant_id, event)
+            notification_dispatch.notify_users(
+                {participant_id: event for participant_id in result.participant_user_ids}
+            )
 
         return Response(
             {
@@ -430,11 +523,12 @@ class StartDirectMessageView(APIView):
             conversation_id=result.conversation.id,
             recipient_user_ids=result.recipient_user_ids,
         )
-        for participant_id in result.recipient_user_ids:
-            notification_dispatch.notify_user(
-                participant_id,
-                {**event, **unread_by_user[participant_id]},
-            )
+        notification_dispatch.notify_users(
+            {
+                participant_id: {**event, **unread_by_user[participant_id]}
+                for participant_id in result.recipient_user_ids
+            }
+        )
 
         return Response(
             {
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-# Priamy re-export realtime notify_user pre messaging views.
-# Views volajú `notification_dispatch.notify_user(...)` (cez modul, nie cez
+# Priamy re-export realtime notify helperov pre messaging views.
+# Views volajú `notification_dispatch.notify_users(...)` (cez modul, nie cez
 # naviazaný názov), takže testy vedia patchnúť jediný cieľ
-# `messaging.api.notification_dispatch.notify_user` a zachytiť práve messaging
-# dispatch volania.
-from accounts.realtime import notify_user
+# `messaging.api.notification_dispatch.notify_users` a zachytiť práve messaging
+# dispatch volania. Fan-out na viac príjemcov ide vždy cez batch `notify_users`
+# (jeden async kontext, odoslanie po commite), nie cez slučku `notify_user`.
+from accounts.realtime import notify_user, notify_users
 
-__all__ = ["notify_user"]
+__all__ = ["notify_user", "notify_users"]
@@ -9,10 +9,38 @@ from rest_framework.views import APIView
 from swaply.rate_limiting import api_rate_limit
 
 from ..models import ConversationParticipant
-from ..services.presence import store_message_presence
+from ..services.presence import record_message_presence
+from . import notification_dispatch
 from .serializers import MessagePresenceSerializer
 
 
+def _publish_presence_change(*, user_id: int, update) -> None:
+    """Pošli ``messaging_presence`` ostatným aktívnym účastníkom konverzácií,
+    v ktorých sa používateľova aktívnosť zmenila (nie pri každom heartbeate)."""
+    if not update.changed_conversation_ids:
+        return
+    active_conversation_id = update.payload["active_conversation_id"]
+    events_by_user: dict[int, list[dict]] = {}
+    for conversation_id, participant_user_id in (
+        ConversationParticipant.objects.filter(
+            conversation_id__in=update.changed_conversation_ids,
+            status=ConversationParticipant.Status.ACTIVE,
+        )
+        .exclude(user_id=user_id)
+        .values_list("conversation_id", "user_id")
+    ):
+        events_by_user.setdefault(participant_user_id, []).append(
+            {
+                "type": "messaging_presence",
+                "conversation_id": conversation_id,
+                "user_id": user_id,
+                "active": conversation_id == active_conversation_id,
+            }
+        )
+    if events_by_user:
+        notification_dispatch.notify_users(events_by_user)
+
+
 class MessagePresenceView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -41,9 +69,12 @@ class MessagePresenceView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-        payload = store_message_presence(
+        update = record_message_presence(
             user_id=request.user.id,
             visible=visible,
             active_conversation_id=active_conversation_id,
         )
-        return Response({"ok": True, "presence": payload}, status=status.HTTP_200_OK)
+        _publish_presence_change(user_id=request.user.id, update=update)
+        return Response(
+            {"ok": True, "presence": update.payload}, status=status.HTTP_200_OK
+        )
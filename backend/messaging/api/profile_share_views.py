@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
@@ -76,6 +78,7 @@ class ProfileShareSendView(APIView):
             )
 
         sent = []
+        events_by_user = defaultdict(list)
         for delivery in result.sent:
             event = {
                 "type": "messaging_message",
@@ -89,9 +92,8 @@ class ProfileShareSendView(APIView):
                 recipient_user_ids=delivery.recipient_user_ids,
             )
             for participant_id in delivery.recipient_user_ids:
-                notification_dispatch.notify_user(
-                    participant_id,
-                    {**event, **unread_by_user[participant_id]},
+                events_by_user[participant_id].append(
+                    {**event, **unread_by_user[participant_id]}
                 )
 
             sent.append(
@@ -105,6 +107,9 @@ class ProfileShareSendView(APIView):
                 }
             )
 
+        if events_by_user:
+            notification_dispatch.notify_users(events_by_user)
+
         return Response(
             {
                 "sent": sent,
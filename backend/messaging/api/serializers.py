@@ -100,6 +100,7 @@ class MessageSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
     image_thumbnail_url = serializers.SerializerMethodField()
     has_image = serializers.SerializerMethodField()
+    image_status = serializers.SerializerMethodField()
     group_invitation = serializers.SerializerMethodField()
     profile_share = serializers.SerializerMethodField()
     offer_share = serializers.SerializerMethodField()
@@ -114,6 +115,7 @@ class MessageSerializer(serializers.ModelSerializer):
             "image_url",
             "image_thumbnail_url",
             "has_image",
+            "image_status",
             "created_at",
             "edited_at",
             "is_deleted",
@@ -141,8 +143,15 @@ class MessageSerializer(serializers.ModelSerializer):
             return {}
         return obj.metadata or {}
 
+    def _image_ready(self, obj: Message) -> bool:
+        return bool(
+            not obj.is_deleted
+            and obj.image
+            and obj.image_status == Message.ImageStatus.READY
+        )
+
     def get_image_url(self, obj: Message):
-        if obj.is_deleted or not obj.image:
+        if not self._image_ready(obj):
             return None
 
         request = self.context.get("request")
@@ -156,7 +165,7 @@ class MessageSerializer(serializers.ModelSerializer):
         return request.build_absolute_uri(url) if request else url
 
     def get_image_thumbnail_url(self, obj: Message):
-        if obj.is_deleted or not obj.image or not obj.image_thumbnail:
+        if not self._image_ready(obj) or not obj.image_thumbnail:
             return None
 
         request = self.context.get("request")
@@ -172,6 +181,12 @@ class MessageSerializer(serializers.ModelSerializer):
     def get_has_image(self, obj: Message):
         return bool(not obj.is_deleted and obj.image)
 
+    def get_image_status(self, obj: Message):
+        # URL obrázka príde až s READY (event `messaging_message_updated`).
+        if obj.is_deleted or not obj.image_status:
+            return None
+        return obj.image_status
+
     def get_group_invitation(self, obj: Message):
         if obj.message_type != Message.Type.GROUP_INVITATION:
             return None
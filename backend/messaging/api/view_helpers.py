@@ -13,12 +13,16 @@ existujúce importy sa nemenia.
 from __future__ import annotations
 
 from .view_helpers_conversations import (  # noqa: F401
+    MessageListContext,
     _can_open_direct_target,
     _conversation_accessible_queryset_for_user,
     _conversation_annotated_queryset_for_user,
     _conversation_for_user_or_404,
     _conversation_list_queryset_for_user,
+    _conversations_from_inbox_entries,
     _has_requestable_offers_for_user_id,
+    _inbox_entry_list_queryset_for_user,
+    _message_list_context_for_user_or_404,
     _message_request_list_queryset_for_user,
     _participant_hidden_at_for_conversation,
     _participant_status_for_conversation,
@@ -2,11 +2,14 @@
 Konverzačné helpery pre messaging (vyčlenené z view_helpers.py kvôli dĺžke).
 
 Prístup k jednej konverzácii (404 podľa členstva), stav účastníka (last_read/hidden/
-status), pinned message, a anotované querysety pre list/detail/message-requests.
+status), pinned message, anotované querysety pre list/detail/message-requests a sidebar
+z materializovaných ``InboxEntry`` riadkov.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from django.db.models import (
     BooleanField,
     Case,
@@ -26,7 +29,7 @@ from django.shortcuts import get_object_or_404
 
 from accounts.models import OfferedSkill, UserBlock
 from accounts.services.user_blocks import user_block_exists_between
-from ..models import Conversation, ConversationParticipant, Message
+from ..models import Conversation, ConversationParticipant, InboxEntry, Message
 from ..services.conversations import SelfConversationNotAllowed, find_direct_conversation
 from .serializers import ConversationListItemSerializer, MessageSerializer
 from .view_helpers_unread import _conversation_unread_count_expression_for_user
@@ -169,6 +172,40 @@ def _can_open_direct_target(*, actor, target) -> bool:
         return True
 
 
+def _list_participants_prefetch(lookup: str) -> Prefetch:
+    """Účastníci pre avatar_members/participants v zozname (bez ďalších dotazov)."""
+    return Prefetch(
+        lookup,
+        queryset=ConversationParticipant.objects.filter(
+            status__in=[
+                ConversationParticipant.Status.ACTIVE,
+                ConversationParticipant.Status.INVITED,
+            ],
+        )
+        .select_related("user")
+        .only(
+            "id",
+            "conversation_id",
+            "user_id",
+            "role",
+            "status",
+            "joined_at",
+            "user__id",
+            "user__first_name",
+            "user__last_name",
+            "user__company_name",
+            "user__username",
+            "user__slug",
+            "user__user_type",
+            "user__avatar",
+            "user__is_active",
+            "user__is_verified",
+        )
+        .order_by("role", "status", "joined_at", "id"),
+        to_attr="_prefetched_participants",
+    )
+
+
 def _conversation_annotated_queryset_for_user(user):
     """
     Participant conversations with list/detail serializer annotations.
@@ -294,36 +331,7 @@ def _conversation_annotated_queryset_for_user(user):
                 output_field=BooleanField(),
             )
         )
-        .prefetch_related(
-            Prefetch(
-                "participants",
-                queryset=ConversationParticipant.objects.filter(
-                    status__in=[
-                        ConversationParticipant.Status.ACTIVE,
-                        ConversationParticipant.Status.INVITED,
-                    ],
-                )
-                .select_related("user")
-                .only(
-                    "id",
-                    "conversation_id",
-                    "user_id",
-                    "role",
-                    "status",
-                    "joined_at",
-                    "user__id",
-                    "user__first_name",
-                    "user__last_name",
-                    "user__company_name",
-                    "user__username",
-                    "user__slug",
-                    "user__user_type",
-                    "user__avatar",
-                )
-                .order_by("role", "status", "joined_at", "id"),
-                to_attr="_prefetched_participants",
-            )
-        )
+        .prefetch_related(_list_participants_prefetch("participants"))
     )
     return qs
 
@@ -358,3 +366,149 @@ def _conversation_list_queryset_for_user(user, *, only_incoming_requests: bool =
 
 def _message_request_list_queryset_for_user(user):
     return _conversation_list_queryset_for_user(user, only_incoming_requests=True)
+
+
+@dataclass(frozen=True)
+class MessageListContext:
+    conversation: Conversation
+    participant_status: str | None
+    hidden_at: object
+    peer_last_read_at: object
+    pinned_message: Message | None
+    # Sidebar riadok konverzácie; None ak ju list nezobrazuje (prichádzajúca
+    # žiadosť o správu) – rovnako ako ``_serialize_conversation_for_user``.
+    is_list_accessible: bool
+
+
+def _message_list_context_for_user_or_404(*, conversation_id: int, user) -> MessageListContext:
+    """
+    Všetko, čo MessageListView potrebuje mimo samotných správ, jedným dotazom
+    (+ prefetch účastníkov pre skupinu): prístup/404, stav a hidden_at
+    účastníka, last_read_at protistrany, pinned message a anotácie sidebar
+    riadku. Nahrádza samostatné status/hidden/peer/pinned/sidebar dotazy.
+    """
+    conversation = get_object_or_404(
+        _conversation_annotated_queryset_for_user(user)
+        .filter(
+            Q(participant_hidden_at__isnull=True)
+            | Q(last_message_at__gte=F("participant_hidden_at"))
+        )
+        .filter(Q(is_group=True) | ~Q(request_status=Conversation.RequestStatus.DELETED))
+        .annotate(
+            peer_last_read_at=Subquery(
+                ConversationParticipant.objects.filter(conversation_id=OuterRef("pk"))
+                .exclude(user_id=user.id)
+                .order_by("id")
+                .values("last_read_at")[:1]
+            )
+        )
+        .select_related("pinned_message__sender"),
+        id=conversation_id,
+    )
+    pinned_message = conversation.pinned_message if conversation.pinned_message_id else None
+    if pinned_message is not None and (
+        pinned_message.is_deleted or pinned_message.conversation_id != conversation.id
+    ):
+        pinned_message = None
+    return MessageListContext(
+        conversation=conversation,
+        participant_status=conversation.current_user_status,
+        hidden_at=conversation.participant_hidden_at,
+        peer_last_read_at=conversation.peer_last_read_at,
+        pinned_message=pinned_message,
+        is_list_accessible=(
+            conversation.is_group
+            or conversation.request_status == Conversation.RequestStatus.ACCEPTED
+            or conversation.requested_by_id == user.id
+        ),
+    )
+
+
+def _inbox_entry_list_queryset_for_user(user, *, only_incoming_requests: bool = False):
+    """
+    Sidebar z materializovaných ``InboxEntry`` riadkov používateľa.
+
+    Rovnaké pravidlá viditeľnosti ako ``_conversation_list_queryset_for_user``,
+    no bez korelovaných subquery na každý riadok – stav účastníka, posledná
+    správa aj protistrana sú uložené v riadku. Živé ostávajú len polia
+    konverzácie (join) a offer/block príznaky (EXISTS nad peer_user_id).
+    """
+    qs = InboxEntry.objects.filter(
+        user=user,
+        status__in=[
+            ConversationParticipant.Status.ACTIVE,
+            ConversationParticipant.Status.INVITED,
+        ],
+        last_message_at__isnull=False,
+    ).filter(Q(hidden_at__isnull=True) | Q(last_message_at__gte=F("hidden_at")))
+    if only_incoming_requests:
+        qs = qs.filter(
+            conversation__is_group=False,
+            conversation__request_status=Conversation.RequestStatus.PENDING,
+            conversation__requested_to=user,
+        )
+    else:
+        qs = qs.filter(
+            Q(conversation__is_group=True)
+            | Q(conversation__request_status=Conversation.RequestStatus.ACCEPTED)
+            | Q(conversation__requested_by=user)
+        )
+    return (
+        qs.select_related("conversation")
+        .annotate(
+            has_requestable_offers=Exists(
+                OfferedSkill.objects.filter(
+                    user_id=OuterRef("peer_user_id"),
+                    is_hidden=False,
+                    is_seeking=False,
+                    user__is_active=True,
+                    user__is_public=True,
+                )
+            ),
+            is_blocked_by_me=Exists(
+                UserBlock.objects.filter(
+                    blocker_id=user.id,
+                    blocked_user_id=OuterRef("peer_user_id"),
+                )
+            ),
+        )
+        .prefetch_related(_list_participants_prefetch("conversation__participants"))
+    )
+
+
+def _conversations_from_inbox_entries(entries) -> list[Conversation]:
+    """
+    Preklop ``InboxEntry`` riadky na ``Conversation`` objekty s rovnakými
+    atribútmi, aké ``ConversationListItemSerializer`` číta z anotácií.
+    """
+    conversations: list[Conversation] = []
+    for entry in entries:
+        conversation = entry.conversation
+        conversation.participant_hidden_at = entry.hidden_at
+        conversation.participant_pinned_at = entry.pinned_at
+        conversation.current_user_role = entry.role
+        conversation.current_user_status = entry.status
+        conversation.participant_count = entry.participant_count
+        conversation.last_message_preview = entry.last_message_preview
+        conversation.last_message_sender_id = entry.last_message_sender_id
+        conversation.last_message_is_deleted = entry.last_message_is_deleted
+        conversation.last_message_has_image = entry.last_message_has_image
+        conversation.last_message_type = entry.last_message_type
+        conversation.last_read_at = entry.last_read_at
+        conversation.other_user_id = entry.peer_user_id
+        conversation.other_user_first_name = entry.peer_first_name
+        conversation.other_user_last_name = entry.peer_last_name
+        conversation.other_user_company_name = entry.peer_company_name
+        conversation.other_user_username = entry.peer_username
+        conversation.other_user_slug = entry.peer_slug
+        conversation.other_user_type = entry.peer_user_type
+        conversation.other_user_avatar_name = entry.peer_avatar
+        conversation.other_user_is_active = entry.peer_is_active
+        conversation.other_user_is_verified = entry.peer_is_verified
+        conversation.has_requestable_offers = entry.has_requestable_offers
+        conversation.is_blocked_by_me = entry.is_blocked_by_me
+        conversation.unread_count = entry.unread_count
+        conversation.is_pinned = entry.is_pinned
+        conversation.has_unread = entry.unread_count > 0
+        conversations.append(conversation)
+    return conversations
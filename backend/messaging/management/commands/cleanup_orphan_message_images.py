@@ -12,8 +12,9 @@ nevznikne. Môže však vzniknúť pri:
 * historických dátach z čias pred privátnym úložiskom.
 
 Tento príkaz prejde všetky S3 objekty pod prefixom ``messages/`` a pre každý
-skontroluje, či naň odkazuje nejaký ``Message`` (cez ``image`` alebo
-``image_thumbnail``). Objekty bez DB referencie sú orphan a dajú sa zmazať.
+skontroluje, či naň odkazuje nejaký ``Message`` alebo ``MessageImageBlob``
+(zdieľané obrázky ``messages/blobs/…`` s počítadlom referencií; cez ``image``
+alebo ``image_thumbnail``). Objekty bez DB referencie sú orphan a dajú sa zmazať.
 
 Bezpečnosť:
 
@@ -36,7 +37,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db.models import Q
 from django.utils import timezone
 
-from messaging.models import Message
+from messaging.models import Message, MessageImageBlob
 from messaging.storage import get_message_image_storage
 
 MESSAGE_IMAGE_PREFIX = "messages/"
@@ -192,18 +193,23 @@ class Command(BaseCommand):
         return key
 
     def _referenced_names(self, names) -> set:
-        """Vráti množinu kľúčov, na ktoré odkazuje aspoň jeden Message (1 dotaz/strana)."""
+        """Vráti množinu kľúčov, na ktoré odkazuje Message alebo živý MessageImageBlob.
+
+        Blob riadok existuje len kým má referencie (ref_count > 0), takže jeho
+        súbory nie sú orphan ani vtedy, keď ich práve žiadna správa nemá v poli.
+        """
         referenced: set = set()
-        rows = (
-            Message.objects.filter(Q(image__in=names) | Q(image_thumbnail__in=names))
-            .values_list("image", "image_thumbnail")
-            .iterator()
-        )
-        for image, thumbnail in rows:
-            if image:
-                referenced.add(image)
-            if thumbnail:
-                referenced.add(thumbnail)
+        for model in (Message, MessageImageBlob):
+            rows = (
+                model.objects.filter(Q(image__in=names) | Q(image_thumbnail__in=names))
+                .values_list("image", "image_thumbnail")
+                .iterator()
+            )
+            for image, thumbnail in rows:
+                if image:
+                    referenced.add(image)
+                if thumbnail:
+                    referenced.add(thumbnail)
         return referenced
 
     def _iter_object_pages(self, storage, prefix):
@@ -0,0 +1,61 @@
+"""
+Údržbový príkaz: prepočíta materializované ``InboxEntry`` riadky sidebaru.
+
+Riadky sa udržiavajú v službách (send/read/hide/pin, skupiny, pozvánky) v tej
+istej transakcii ako zdroj. Tento príkaz ich prepočíta od nuly – po hromadných
+zásahoch mimo služieb (ručné SQL, import) alebo pri podozrení na drift – a
+zmaže riadky, ku ktorým už neexistuje účastník.
+
+* ``--conversation-id`` zúži prepočet na jednu konverzáciu (opakovateľné).
+* ``--batch-size`` počet konverzácií na jednu transakciu.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from messaging.models import Conversation
+from messaging.services.inbox import delete_orphan_inbox_entries, refresh_inbox_entries
+
+
+class Command(BaseCommand):
+    help = "Prepočíta InboxEntry riadky z konverzácií, účastníkov a správ."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--conversation-id",
+            action="append",
+            type=int,
+            default=[],
+            help="Obmedz na konverzáciu (možno zadať viackrát).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Počet konverzácií na jednu transakciu.",
+        )
+
+    def handle(self, *args, **options):
+        conversation_ids = Conversation.objects.order_by("id").values_list("id", flat=True)
+        if options["conversation_id"]:
+            conversation_ids = conversation_ids.filter(id__in=options["conversation_id"])
+        conversation_ids = list(conversation_ids)
+        batch_size = max(int(options["batch_size"]), 1)
+
+        refreshed = 0
+        for start in range(0, len(conversation_ids), batch_size):
+            with transaction.atomic():
+                refreshed += refresh_inbox_entries(
+                    conversation_ids=conversation_ids[start:start + batch_size]
+                )
+        deleted = delete_orphan_inbox_entries(
+            conversation_ids=options["conversation_id"] or None
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Prepočítané: {refreshed} riadkov v {len(conversation_ids)} konverzáciách, "
+                f"zmazané osirelé: {deleted}."
+            )
+        )
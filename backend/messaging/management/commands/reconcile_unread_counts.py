@@ -0,0 +1,60 @@
+"""
+Údržbový príkaz: prepočíta denormalizované ``ConversationParticipant.unread_count``.
+
+Počítadlá sa udržiavajú inkrementálne (nová správa / prečítanie / soft-delete),
+tento príkaz ich nastaví od nuly rovnakým COUNT-om, aký predtým bežal pri každom
+čítaní badge. Použitie po hromadných zásahoch do správ mimo služieb (ručné SQL,
+import) alebo pri podozrení na drift.
+
+* ``--dry-run`` iba vypíše počet účastníkov s nesediacim počítadlom.
+* ``--conversation-id`` zúži prepočet na jednu konverzáciu (opakovateľné).
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from messaging.models import ConversationParticipant
+from messaging.services.unread_counters import (
+    drifted_participants,
+    recompute_unread_counts,
+)
+
+
+class Command(BaseCommand):
+    help = "Prepočíta ConversationParticipant.unread_count zo správ."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Len zistí drift, nič nezapíše.",
+        )
+        parser.add_argument(
+            "--conversation-id",
+            action="append",
+            type=int,
+            default=[],
+            help="Obmedz na konverzáciu (možno zadať viackrát).",
+        )
+
+    def handle(self, *args, **options):
+        participants = ConversationParticipant.objects.all()
+        if options["conversation_id"]:
+            participants = participants.filter(
+                conversation_id__in=options["conversation_id"]
+            )
+
+        drifted = drifted_participants(participants).count()
+        if options["dry_run"]:
+            self.stdout.write(f"Drift: {drifted} účastníkov (dry-run, nič nezapísané).")
+            return
+
+        with transaction.atomic():
+            updated = recompute_unread_counts(participants)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Prepočítané: {updated} účastníkov, opravený drift: {drifted}."
+            )
+        )
@@ -0,0 +1,55 @@
+from django.db import migrations, models
+from django.db.models import Case, Count, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+
+def _unread_messages_subquery(Message, *, since_last_read):
+    # Kópia messaging.services.unread_counters – migrácia nesmie importovať app kód.
+    messages = (
+        Message.objects.filter(conversation_id=OuterRef("conversation_id"), is_deleted=False)
+        .exclude(message_type="system")
+        .exclude(sender_id=OuterRef("user_id"))
+    )
+    if since_last_read:
+        messages = messages.filter(created_at__gt=OuterRef("last_read_at"))
+    return Subquery(
+        messages.order_by()
+        .values("conversation_id")
+        .annotate(c=Count("id"))
+        .values("c")[:1],
+        output_field=IntegerField(),
+    )
+
+
+def backfill_unread_counts(apps, schema_editor):
+    ConversationParticipant = apps.get_model("messaging", "ConversationParticipant")
+    Message = apps.get_model("messaging", "Message")
+    ConversationParticipant.objects.update(
+        unread_count=Case(
+            When(
+                last_read_at__isnull=True,
+                then=Coalesce(
+                    _unread_messages_subquery(Message, since_last_read=False), Value(0)
+                ),
+            ),
+            default=Coalesce(
+                _unread_messages_subquery(Message, since_last_read=True), Value(0)
+            ),
+            output_field=IntegerField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("messaging", "0014_alter_message_image_alter_message_image_thumbnail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversationparticipant",
+            name="unread_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_unread_counts, migrations.RunPython.noop),
+    ]
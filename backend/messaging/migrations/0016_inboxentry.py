@@ -0,0 +1,148 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:18
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _peer_fields(user):
+    # Kópia messaging.services.inbox.peer_fields_for_user – migrácia nesmie
+    # importovať app kód.
+    if user is None:
+        return {"peer_user": None}
+    return {
+        "peer_user": user,
+        "peer_first_name": user.first_name or "",
+        "peer_last_name": user.last_name or "",
+        "peer_company_name": user.company_name or "",
+        "peer_username": user.username or "",
+        "peer_slug": user.slug,
+        "peer_user_type": user.user_type,
+        "peer_avatar": getattr(user.avatar, "name", None) or None,
+        "peer_is_active": user.is_active,
+        "peer_is_verified": bool(user.is_verified),
+    }
+
+
+def backfill_inbox_entries(apps, schema_editor):
+    Conversation = apps.get_model("messaging", "Conversation")
+    ConversationParticipant = apps.get_model("messaging", "ConversationParticipant")
+    InboxEntry = apps.get_model("messaging", "InboxEntry")
+    Message = apps.get_model("messaging", "Message")
+
+    conversation_ids = list(Conversation.objects.order_by("id").values_list("id", flat=True))
+    for start in range(0, len(conversation_ids), BACKFILL_BATCH_SIZE):
+        batch = conversation_ids[start:start + BACKFILL_BATCH_SIZE]
+        conversations = Conversation.objects.in_bulk(batch)
+        last_message_ids = dict(
+            Conversation.objects.filter(id__in=batch)
+            .annotate(
+                last_message_id=Subquery(
+                    Message.objects.filter(conversation_id=OuterRef("pk"))
+                    .order_by("-created_at", "-id")
+                    .values("id")[:1]
+                )
+            )
+            .values_list("id", "last_message_id")
+        )
+        messages = Message.objects.in_bulk(
+            [message_id for message_id in last_message_ids.values() if message_id]
+        )
+
+        participants_by_conversation = {}
+        for participant in (
+            ConversationParticipant.objects.filter(conversation_id__in=batch)
+            .select_related("user")
+            .order_by("conversation_id", "id")
+        ):
+            participants_by_conversation.setdefault(participant.conversation_id, []).append(
+                participant
+            )
+
+        entries = []
+        for conversation_id, participants in participants_by_conversation.items():
+            message = messages.get(last_message_ids.get(conversation_id))
+            active = [participant for participant in participants if participant.status == "active"]
+            for participant in participants:
+                peer = next(
+                    (other.user for other in active if other.user_id != participant.user_id),
+                    None,
+                )
+                entries.append(
+                    InboxEntry(
+                        user_id=participant.user_id,
+                        conversation_id=conversation_id,
+                        status=participant.status,
+                        role=participant.role,
+                        is_pinned=participant.pinned_at is not None,
+                        pinned_at=participant.pinned_at,
+                        hidden_at=participant.hidden_at,
+                        last_read_at=participant.last_read_at,
+                        unread_count=participant.unread_count,
+                        participant_count=len(active),
+                        last_message_at=conversations[conversation_id].last_message_at,
+                        last_message_preview=(message.text or "") if message else "",
+                        last_message_sender_id=message.sender_id if message else None,
+                        last_message_is_deleted=bool(message and message.is_deleted),
+                        last_message_has_image=bool(message and message.image),
+                        last_message_type=message.message_type if message else None,
+                        **_peer_fields(peer),
+                    )
+                )
+        InboxEntry.objects.bulk_create(entries, batch_size=BACKFILL_BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('messaging', '0015_conversationparticipant_unread_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InboxEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('invited', 'Invited'), ('active', 'Active'), ('left', 'Left'), ('removed', 'Removed')], default='active', max_length=20)),
+                ('role', models.CharField(choices=[('owner', 'Owner'), ('member', 'Member')], default='member', max_length=20)),
+                ('is_pinned', models.BooleanField(default=False)),
+                ('pinned_at', models.DateTimeField(blank=True, null=True)),
+                ('hidden_at', models.DateTimeField(blank=True, null=True)),
+                ('last_read_at', models.DateTimeField(blank=True, null=True)),
+                ('unread_count', models.PositiveIntegerField(default=0)),
+                ('participant_count', models.PositiveIntegerField(default=0)),
+                ('last_message_at', models.DateTimeField(blank=True, null=True)),
+                ('last_message_preview', models.TextField(blank=True, default='')),
+                ('last_message_sender_id', models.BigIntegerField(blank=True, null=True)),
+                ('last_message_is_deleted', models.BooleanField(default=False)),
+                ('last_message_has_image', models.BooleanField(default=False)),
+                ('last_message_type', models.CharField(blank=True, max_length=32, null=True)),
+                ('peer_first_name', models.CharField(blank=True, default='', max_length=150)),
+                ('peer_last_name', models.CharField(blank=True, default='', max_length=150)),
+                ('peer_company_name', models.CharField(blank=True, default='', max_length=100)),
+                ('peer_username', models.CharField(blank=True, default='', max_length=150)),
+                ('peer_slug', models.CharField(blank=True, max_length=150, null=True)),
+                ('peer_user_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('peer_avatar', models.CharField(blank=True, max_length=255, null=True)),
+                ('peer_is_active', models.BooleanField(blank=True, null=True)),
+                ('peer_is_verified', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('conversation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbox_entries', to='messaging.conversation')),
+                ('peer_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbox_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(models.F('user'), models.OrderBy(models.F('is_pinned'), descending=True), models.OrderBy(models.F('last_message_at'), descending=True), name='inbox_user_sidebar_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='inboxentry',
+            constraint=models.UniqueConstraint(fields=('user', 'conversation'), name='uniq_inbox_entry_user_conversation'),
+        ),
+        migrations.RunPython(backfill_inbox_entries, migrations.RunPython.noop),
+    ]
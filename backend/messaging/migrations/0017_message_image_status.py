@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+def backfill_image_status(apps, schema_editor):
+    # Existujúce obrázky prešli synchrónnym stripom pri uploade – sú hotové.
+    Message = apps.get_model("messaging", "Message")
+    Message.objects.exclude(image__isnull=True).exclude(image="").update(
+        image_status="ready"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0016_inboxentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='image_status',
+            field=models.CharField(blank=True, choices=[('', 'No image'), ('processing', 'Processing'), ('ready', 'Ready'), ('failed', 'Failed')], default='', max_length=16),
+        ),
+        migrations.RunPython(backfill_image_status, migrations.RunPython.noop),
+    ]
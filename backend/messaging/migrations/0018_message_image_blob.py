@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import messaging.models
+import messaging.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0017_message_image_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageImageBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('image', models.ImageField(storage=messaging.storage.get_message_image_storage, upload_to=messaging.models.message_image_blob_upload_to)),
+                ('image_thumbnail', models.ImageField(blank=True, null=True, storage=messaging.storage.get_message_image_storage, upload_to=messaging.models.message_image_blob_thumbnail_upload_to)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='messages', to='messaging.messageimageblob'),
+        ),
+    ]
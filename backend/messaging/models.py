@@ -25,6 +25,18 @@ def message_thumbnail_upload_to(instance: "Message", filename: str) -> str:
     return f"messages/{conversation_id}/thumbnails/{uuid.uuid4().hex}{safe_suffix}"
 
 
+def message_image_blob_upload_to(instance: "MessageImageBlob", filename: str) -> str:
+    suffix = Path(filename or "").suffix.lower()
+    safe_suffix = suffix if suffix else ".jpg"
+    return f"messages/blobs/{instance.sha256[:2]}/{instance.sha256}{safe_suffix}"
+
+
+def message_image_blob_thumbnail_upload_to(instance: "MessageImageBlob", filename: str) -> str:
+    suffix = Path(filename or "").suffix.lower()
+    safe_suffix = suffix if suffix else ".webp"
+    return f"messages/blobs/{instance.sha256[:2]}/{instance.sha256}-thumbnail{safe_suffix}"
+
+
 def conversation_avatar_upload_to(instance: "Conversation", filename: str) -> str:
     suffix = Path(filename or "").suffix.lower()
     safe_suffix = suffix if suffix else ".jpg"
@@ -129,6 +141,9 @@ class ConversationParticipant(models.Model):
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.MEMBER)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.ACTIVE)
     left_at = models.DateTimeField(null=True, blank=True)
+    # Denormalizovaný počet neprečítaných správ – udržiava
+    # messaging.services.unread_counters (reconcile: manage.py reconcile_unread_counts).
+    unread_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         constraints = [
@@ -148,6 +163,114 @@ class ConversationParticipant(models.Model):
         return f"ConversationParticipant(conv={self.conversation_id}, user={self.user_id})"
 
 
+class InboxEntry(models.Model):
+    """
+    Materializovaný riadok sidebaru – jeden na (používateľ, konverzácia).
+
+    Drží snapshot poslednej správy, zobrazovacie polia protistrany a stav
+    účastníka (status/pin/skrytie/unread), aby zoznam konverzácií bol jeden
+    indexovaný range scan namiesto korelovaných subquery. Udržiava ho
+    messaging.services.inbox v tej istej transakcii ako zmenu zdroja
+    (rebuild: manage.py rebuild_inbox_entries). Polia konverzácie (názov,
+    request stav, avatar) sa čítajú živo cez join.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="inbox_entries",
+    )
+    conversation = models.ForeignKey(
+        Conversation,
+        on_delete=models.CASCADE,
+        related_name="inbox_entries",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=ConversationParticipant.Status.choices,
+        default=ConversationParticipant.Status.ACTIVE,
+    )
+    role = models.CharField(
+        max_length=20,
+        choices=ConversationParticipant.Role.choices,
+        default=ConversationParticipant.Role.MEMBER,
+    )
+    is_pinned = models.BooleanField(default=False)
+    pinned_at = models.DateTimeField(null=True, blank=True)
+    hidden_at = models.DateTimeField(null=True, blank=True)
+    last_read_at = models.DateTimeField(null=True, blank=True)
+    unread_count = models.PositiveIntegerField(default=0)
+    participant_count = models.PositiveIntegerField(default=0)
+
+    last_message_at = models.DateTimeField(null=True, blank=True)
+    last_message_preview = models.TextField(blank=True, default="")
+    last_message_sender_id = models.BigIntegerField(null=True, blank=True)
+    last_message_is_deleted = models.BooleanField(default=False)
+    last_message_has_image = models.BooleanField(default=False)
+    last_message_type = models.CharField(max_length=32, null=True, blank=True)
+
+    peer_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    peer_first_name = models.CharField(max_length=150, blank=True, default="")
+    peer_last_name = models.CharField(max_length=150, blank=True, default="")
+    peer_company_name = models.CharField(max_length=100, blank=True, default="")
+    peer_username = models.CharField(max_length=150, blank=True, default="")
+    peer_slug = models.CharField(max_length=150, null=True, blank=True)
+    peer_user_type = models.CharField(max_length=20, null=True, blank=True)
+    peer_avatar = models.CharField(max_length=255, null=True, blank=True)
+    peer_is_active = models.BooleanField(null=True, blank=True)
+    peer_is_verified = models.BooleanField(default=False)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "conversation"],
+                name="uniq_inbox_entry_user_conversation",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                "user",
+                models.F("is_pinned").desc(),
+                models.F("last_message_at").desc(),
+                name="inbox_user_sidebar_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"InboxEntry(user={self.user_id}, conv={self.conversation_id})"
+
+
+class MessageImageBlob(models.Model):
+    # Obsahovo adresovaný (sha256 stripnutých bajtov) obrázok správy zdieľaný
+    # forwardmi a duplicitnými uploadmi. ref_count = počet Message, ktoré naň
+    # odkazujú; súbory sa mažú až pri poslednej referencii
+    # (messaging.services.image_blobs).
+    sha256 = models.CharField(max_length=64, unique=True)
+    image = models.ImageField(
+        upload_to=message_image_blob_upload_to,
+        storage=get_message_image_storage,
+    )
+    image_thumbnail = models.ImageField(
+        upload_to=message_image_blob_thumbnail_upload_to,
+        storage=get_message_image_storage,
+        blank=True,
+        null=True,
+    )
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"MessageImageBlob#{self.pk} ({self.sha256[:12]}, refs={self.ref_count})"
+
+
 class Message(models.Model):
     class Type(models.TextChoices):
         USER = "user", "User"
@@ -156,6 +279,12 @@ class Message(models.Model):
         PROFILE_SHARE = "profile_share", "Profile share"
         OFFER_SHARE = "offer_share", "Offer share"
 
+    class ImageStatus(models.TextChoices):
+        NONE = "", "No image"
+        PROCESSING = "processing", "Processing"
+        READY = "ready", "Ready"
+        FAILED = "failed", "Failed"
+
     conversation = models.ForeignKey(
         Conversation,
         on_delete=models.CASCADE,
@@ -180,6 +309,23 @@ class Message(models.Model):
         blank=True,
         null=True,
     )
+    # Strip metadát + thumbnail bežia mimo zámku konverzácie (Celery);
+    # kým je PROCESSING, proxy view obrázok nevydá (originál môže niesť EXIF/GPS).
+    image_status = models.CharField(
+        max_length=16,
+        choices=ImageStatus.choices,
+        blank=True,
+        default=ImageStatus.NONE,
+    )
+    # image/image_thumbnail nesú rovnaké mená ako blob (views a serializéry
+    # ostávajú nezmenené); NULL = staršia správa s vlastnými súbormi.
+    image_blob = models.ForeignKey(
+        MessageImageBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="messages",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     edited_at = models.DateTimeField(null=True, blank=True)
     is_deleted = models.BooleanField(default=False)
@@ -12,6 +12,7 @@ from accounts.services.user_blocks import (
 )
 
 from ..models import Conversation, ConversationParticipant, Message
+from .inbox import refresh_inbox_entries
 from .message_requests import prepare_pending_request_for_message
 from .messages import _persist_message
 
@@ -121,6 +122,7 @@ def open_or_create_direct_conversation(
                 ConversationParticipant(conversation=convo, user=target, joined_at=now),
             ]
         )
+        refresh_inbox_entries(conversation_ids=[convo.id])
         return OpenConversationResult(conversation=convo, created=True)
 
 
@@ -130,16 +132,18 @@ def send_direct_message(
     target: User,
     text: str | None = None,
     image=None,
+    image_blob=None,
     message_type: str = Message.Type.USER,
     metadata: dict | None = None,
 ) -> StartDirectMessageResult:
     clean = (text or "").strip()
+    has_image = bool(image) or image_blob is not None
     valid_message_types = {choice for choice, _label in Message.Type.choices}
     if message_type not in valid_message_types:
         raise ValueError("Unsupported message type.")
-    if message_type == Message.Type.USER and not clean and not image:
+    if message_type == Message.Type.USER and not clean and not has_image:
         raise ValueError("Message must contain text or an image.")
-    if message_type != Message.Type.USER and image:
+    if message_type != Message.Type.USER and has_image:
         raise ValueError("Structured messages cannot include an image.")
     if actor.id == target.id:
         raise SelfConversationNotAllowed("Cannot open a conversation with self.")
@@ -189,6 +193,7 @@ def send_direct_message(
             recipient_user_ids=recipient_user_ids,
             text=clean,
             image=image,
+            image_blob=image_blob,
             message_type=message_type,
             metadata=metadata,
         )
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
 
 from django.contrib.auth import get_user_model
-from django.core.files.base import ContentFile
 from django.db import transaction
 
 from accounts.services.user_blocks import BlockedUserInteractionError
@@ -15,6 +13,12 @@ from .conversations import (
     find_direct_conversation,
     send_direct_message,
 )
+from .image_blobs import (
+    acquire_message_image_blob,
+    create_or_acquire_message_image_blob,
+    message_image_digest,
+    release_message_images,
+)
 from .message_requests import MessageRequestActionNotAllowed, MessageRequestLimitExceeded
 
 User = get_user_model()
@@ -65,16 +69,11 @@ def normalize_forward_recipient_ids(values) -> list[int]:
     return result
 
 
-@dataclass(frozen=True)
-class ForwardImagePayload:
-    data: bytes
-    suffix: str
-
-
-def _read_image_payload(source: Message) -> ForwardImagePayload | None:
-    if not source.image:
-        return None
-
+def _adopt_source_image_blob(source: Message) -> int:
+    """
+    Staršia správa (pred MessageImageBlob) má vlastné súbory – zaregistruj ich
+    ako blob (bez nového uploadu), aby sa dali zdieľať forwardmi.
+    """
     try:
         source.image.open("rb")
         data = source.image.read()
@@ -82,19 +81,44 @@ def _read_image_payload(source: Message) -> ForwardImagePayload | None:
         raise MessageForwardSourceUnavailable("Source image is unavailable.") from exc
     finally:
         source.image.close()
-
-    return ForwardImagePayload(
-        data=data,
-        suffix=Path(source.image.name or "").suffix.lower() or ".jpg",
-    )
+    digest = message_image_digest(data)
+
+    with transaction.atomic():
+        locked = (
+            Message.objects.select_for_update()
+            .filter(id=source.id, is_deleted=False)
+            .only("id", "image", "image_thumbnail", "image_blob")
+            .first()
+        )
+        if locked is None or locked.image.name != source.image.name:
+            raise MessageForwardSourceUnavailable("Message cannot be forwarded.")
+        if locked.image_blob_id:
+            return locked.image_blob_id
+        blob, created = create_or_acquire_message_image_blob(
+            sha256=digest,
+            image_name=locked.image.name,
+            thumbnail_name=locked.image_thumbnail.name or "",
+        )
+        Message.objects.filter(id=locked.id).update(
+            image=blob.image.name,
+            image_thumbnail=blob.image_thumbnail.name or None,
+            image_blob=blob,
+        )
+        if not created:
+            # Rovnaký obsah už existuje – vlastné súbory zdroja sú nadbytočné.
+            release_message_images([locked])
+        return blob.id
 
 
-def _clone_image_file(payload: ForwardImagePayload | None) -> ContentFile | None:
-    if payload is None:
+def _source_image_blob_id(source: Message) -> int | None:
+    if not source.image:
         return None
-    clone = ContentFile(payload.data)
-    clone.name = f"forwarded{payload.suffix}"
-    return clone
+    # Nespracovaný originál (PROCESSING) by mohol niesť EXIF/GPS odosielateľa.
+    if source.image_status != Message.ImageStatus.READY:
+        raise MessageForwardSourceUnavailable("Source image is not ready yet.")
+    if source.image_blob_id:
+        return source.image_blob_id
+    return _adopt_source_image_blob(source)
 
 
 def _can_forward_to_target(*, actor, target) -> bool:
@@ -117,14 +141,19 @@ def _forward_to_user(
     actor,
     source: Message,
     target,
-    image_payload: ForwardImagePayload | None,
+    image_blob_id: int | None,
 ) -> ForwardedMessageDelivery:
-    image = _clone_image_file(image_payload)
+    image_blob = None
+    if image_blob_id is not None:
+        # Referencia je súčasťou transakcie príjemcu – pri zlyhaní sa vráti rollbackom.
+        image_blob = acquire_message_image_blob(blob_id=image_blob_id)
+        if image_blob is None:
+            raise MessageForwardSourceUnavailable("Source image is unavailable.")
     result = send_direct_message(
         actor=actor,
         target=target,
         text=source.text or None,
-        image=image,
+        image_blob=image_blob,
     )
     return ForwardedMessageDelivery(
         user_id=int(target.id),
@@ -146,7 +175,7 @@ def forward_message_to_recipients(
         raise MessageForwardSourceUnavailable("Message cannot be forwarded.")
 
     normalized_ids = normalize_forward_recipient_ids(recipient_user_ids)[:MAX_FORWARD_RECIPIENTS]
-    image_payload = _read_image_payload(source_message)
+    image_blob_id = _source_image_blob_id(source_message)
     targets_by_id = {
         user.id: user
         for user in User.objects.filter(id__in=normalized_ids, is_active=True).only(
@@ -174,7 +203,7 @@ def forward_message_to_recipients(
                         actor=actor,
                         source=source_message,
                         target=target,
-                        image_payload=image_payload,
+                        image_blob_id=image_blob_id,
                     )
                 )
         except (SelfConversationNotAllowed, BlockedUserInteractionError):
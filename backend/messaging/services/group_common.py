@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from django.utils import timezone
 
 from ..models import Conversation, ConversationParticipant, GroupInvitation, Message
+from .inbox import refresh_inbox_entries
 
 
 MAX_GROUP_PARTICIPANTS = 50
@@ -121,4 +122,7 @@ def _create_system_message(*, conversation: Conversation, actor, text: str, meta
     )
     conversation.last_message_at = now
     conversation.save(update_fields=["last_message_at", "updated_at"])
+    # Systémová správa sprevádza každú zmenu členstva – prepočet sidebaru tu
+    # pokryje aj status/participant_count zmenené tesne pred ňou.
+    refresh_inbox_entries(conversation_ids=[conversation.id])
     return message
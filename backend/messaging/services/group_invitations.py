@@ -26,7 +26,9 @@ from .group_common import (
     _ensure_group,
     ensure_group_owner,
 )
+from .inbox import refresh_inbox_entries
 from .push_enqueue import schedule_message_push_delivery
+from .unread_counters import increment_unread_counts, recompute_unread_counts
 
 
 def invite_user_to_group(
@@ -87,11 +89,16 @@ def invite_user_to_group(
                 setattr(existing_participant, field, value)
             existing_participant.save(update_fields=["role", "status", "left_at"])
         else:
-            ConversationParticipant.objects.create(
+            new_participant = ConversationParticipant.objects.create(
                 conversation=conversation,
                 user=invited_user,
                 **participant_defaults,
             )
+            # Nový účastník s last_read_at=NULL vidí ako neprečítanú celú
+            # doterajšiu históriu – počítadlo nastav presným prepočtom.
+            recompute_unread_counts(
+                ConversationParticipant.objects.filter(id=new_participant.id)
+            )
 
         now = timezone.now()
         invitation = GroupInvitation.objects.create(
@@ -112,10 +119,12 @@ def invite_user_to_group(
             },
             created_at=now,
         )
+        increment_unread_counts(message=message)
         invitation.message = message
         invitation.save(update_fields=["message", "updated_at"])
         conversation.last_message_at = now
         conversation.save(update_fields=["last_message_at", "updated_at"])
+        refresh_inbox_entries(conversation_ids=[conversation.id])
 
         recipient_user_ids = tuple(
             sorted(set(_active_participant_user_ids(conversation=conversation) + (invited_user.id,)))
@@ -266,4 +275,7 @@ def close_open_group_invitations_for_blocked_pair(
             status=ConversationParticipant.Status.INVITED,
         ).update(status=ConversationParticipant.Status.REMOVED, left_at=now)
 
+    refresh_inbox_entries(
+        conversation_ids=[invitation.conversation_id for invitation in invitations]
+    )
     return len(invitations)
@@ -0,0 +1,136 @@
+"""
+Obsahovo adresované obrázky správ (``MessageImageBlob``) s počítaním referencií.
+
+Stripnutý obrázok sa po spracovaní uloží pod ``messages/blobs/<sha256>``; ďalšia
+správa s rovnakými bajtami (forward, opakovaný upload) len zvýši ``ref_count``
+a prevezme mená súborov – žiadny nový upload ani Pillow encode thumbnailu.
+
+Každá zmena ``ref_count`` beží pod ``select_for_update`` na riadku blobu, takže
+súbežné pripojenie (forward) a uvoľnenie (zmazanie správy, GDPR scrub, CASCADE)
+sa serializujú. Keď klesne na 0, riadok sa zmaže a súbory sa odstránia po
+commite. Správy bez blobu (pred zavedením) mažú svoje súbory priamo ako doteraz.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter
+from typing import Iterable
+
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from ..models import Message, MessageImageBlob
+
+
+def message_image_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _delete_storage_names(refs) -> None:
+    seen: set[str] = set()
+    for storage, name in refs:
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        try:
+            (storage or default_storage).delete(name)
+        except Exception:
+            # Radšej osamotený súbor než spadnuté mazanie (cleanup_orphan_message_images).
+            pass
+
+
+def _file_refs(*file_fields) -> list[tuple]:
+    refs = []
+    for file_field in file_fields:
+        name = (getattr(file_field, "name", "") or "").strip()
+        if name:
+            refs.append((getattr(file_field, "storage", None), name))
+    return refs
+
+
+def acquire_message_image_blob(*, blob_id: int | None = None, sha256: str | None = None):
+    """
+    Pridaj referenciu na existujúci blob; `None` ak (už) neexistuje.
+
+    Volajúci musí referenciu buď priradiť správe, alebo ju vrátiť cez
+    `release_message_image_blobs` (napr. pri rollbacku stačí samotný rollback).
+    """
+    if blob_id is None and not sha256:
+        return None
+    lookup = {"id": blob_id} if blob_id is not None else {"sha256": sha256}
+    with transaction.atomic():
+        blob = MessageImageBlob.objects.select_for_update().filter(**lookup).first()
+        if blob is None:
+            return None
+        MessageImageBlob.objects.filter(id=blob.id).update(ref_count=F("ref_count") + 1)
+        blob.ref_count += 1
+        return blob
+
+
+def create_or_acquire_message_image_blob(
+    *, sha256: str, image_name: str, thumbnail_name: str = ""
+) -> tuple[MessageImageBlob, bool]:
+    """
+    Zaregistruj práve uložené súbory ako blob s ref_count=1.
+
+    Ak medzičasom rovnaký obsah zaregistroval iný proces, pripojí sa k nemu
+    (`created=False`) – volajúci potom vlastné súbory zahodí.
+    """
+    blob = acquire_message_image_blob(sha256=sha256)
+    if blob is not None:
+        return blob, False
+    try:
+        with transaction.atomic():
+            blob = MessageImageBlob.objects.create(
+                sha256=sha256,
+                image=image_name,
+                image_thumbnail=thumbnail_name or None,
+                ref_count=1,
+            )
+        return blob, True
+    except IntegrityError:
+        blob = acquire_message_image_blob(sha256=sha256)
+        if blob is None:
+            raise
+        return blob, False
+
+
+def release_message_image_blobs(blob_ids: Iterable[int]) -> None:
+    """Uber referencie (opakované id = viac referencií); pri 0 zmaž blob po commite."""
+    counts = Counter(int(blob_id) for blob_id in blob_ids if blob_id)
+    if not counts:
+        return
+    with transaction.atomic():
+        # Stabilné poradie zámkov (súbežné uvoľnenia viacerých blobov).
+        for blob_id in sorted(counts):
+            blob = MessageImageBlob.objects.select_for_update().filter(id=blob_id).first()
+            if blob is None:
+                continue
+            remaining = blob.ref_count - counts[blob_id]
+            if remaining > 0:
+                MessageImageBlob.objects.filter(id=blob_id).update(ref_count=remaining)
+                continue
+            refs = _file_refs(blob.image, blob.image_thumbnail)
+            blob.delete()
+            transaction.on_commit(lambda refs=refs: _delete_storage_names(refs))
+
+
+def release_message_images(messages: Iterable[Message]) -> None:
+    """
+    Uvoľni obrázky správ, ktoré sa práve mažú (soft-delete, GDPR, CASCADE).
+
+    Blobové správy len vrátia referenciu; staršie správy zmažú vlastné súbory
+    po commite. Volajúci sám vyprázdni polia správy (update/bulk_update).
+    """
+    blob_ids: list[int] = []
+    file_refs: list[tuple] = []
+    for message in messages:
+        if message.image_blob_id:
+            blob_ids.append(message.image_blob_id)
+            continue
+        file_refs.extend(_file_refs(message.image, message.image_thumbnail))
+    release_message_image_blobs(blob_ids)
+    if file_refs:
+        transaction.on_commit(lambda: _delete_storage_names(file_refs))
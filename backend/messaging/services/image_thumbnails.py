@@ -1,14 +1,8 @@
 from __future__ import annotations
 
 import io
-from typing import TYPE_CHECKING
 
 from django.core.files.base import ContentFile
-from django.db import transaction
-
-if TYPE_CHECKING:
-    from ..models import Message
-
 
 MESSAGE_THUMBNAIL_MAX_SIDE = 512
 MESSAGE_THUMBNAIL_QUALITY = 82
@@ -63,36 +57,3 @@ def build_message_thumbnail(image_field) -> ContentFile | None:
             image_field.close()
         except Exception:
             pass
-
-
-def attach_message_thumbnail(message: "Message") -> None:
-    """Attach a generated thumbnail to a message, falling back silently on failure."""
-    if not message.image or message.image_thumbnail:
-        return
-
-    thumbnail = build_message_thumbnail(message.image)
-    if thumbnail is None:
-        return
-
-    message.image_thumbnail.name = message.image_thumbnail.field.generate_filename(
-        message,
-        thumbnail.name,
-    )
-
-    def save_thumbnail_after_commit() -> None:
-        saved_name = ""
-        try:
-            message.image_thumbnail.save(thumbnail.name, thumbnail, save=False)
-            saved_name = message.image_thumbnail.name
-            type(message).objects.filter(id=message.id).update(
-                image_thumbnail=saved_name,
-            )
-        except Exception:
-            if saved_name:
-                try:
-                    message.image_thumbnail.storage.delete(saved_name)
-                except Exception:
-                    pass
-            return
-
-    transaction.on_commit(save_thumbnail_after_commit)
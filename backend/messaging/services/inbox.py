@@ -0,0 +1,222 @@
+"""
+Materializovaný sidebar – ``InboxEntry`` na (používateľ, konverzácia).
+
+Zdroj pravdy ostáva v ``Conversation`` / ``ConversationParticipant`` /
+``Message``; ``InboxEntry`` je ich odvodená kópia pre zoznam konverzácií.
+Volajúci (send/read/hide/pin, skupinové služby, pozvánky) volajú
+``refresh_inbox_entries`` v TEJ ISTEJ transakcii ako zmenu zdroja, takže
+sidebar nikdy nevidí polovičný stav.
+
+Refresh je vždy prepočet celej konverzácie (alebo jej vybraných účastníkov)
+zo zdroja – pevný počet dotazov (konverzácie + posledné správy + účastníci +
+jeden upsert), žiadne inkrementálne delty, ktoré by sa mohli rozísť. Zmeny
+profilu protistrany (meno, avatar, anonymizácia) prepisuje
+``refresh_inbox_peer_fields`` z post_save signálu používateľa.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.db.models import Exists, OuterRef, Subquery
+
+from ..models import Conversation, ConversationParticipant, InboxEntry, Message
+
+PEER_USER_FIELDS = (
+    "first_name",
+    "last_name",
+    "company_name",
+    "username",
+    "slug",
+    "user_type",
+    "avatar",
+    "is_active",
+    "is_verified",
+)
+
+_ENTRY_UPDATE_FIELDS = (
+    "status",
+    "role",
+    "is_pinned",
+    "pinned_at",
+    "hidden_at",
+    "last_read_at",
+    "unread_count",
+    "participant_count",
+    "last_message_at",
+    "last_message_preview",
+    "last_message_sender_id",
+    "last_message_is_deleted",
+    "last_message_has_image",
+    "last_message_type",
+    "peer_user",
+    *(f"peer_{field}" for field in PEER_USER_FIELDS),
+    "updated_at",
+)
+
+
+def _normalize_ids(values) -> list[int]:
+    return sorted({int(value) for value in values or () if value})
+
+
+def peer_fields_for_user(user) -> dict[str, object]:
+    if user is None:
+        return {
+            "peer_user": None,
+            "peer_first_name": "",
+            "peer_last_name": "",
+            "peer_company_name": "",
+            "peer_username": "",
+            "peer_slug": None,
+            "peer_user_type": None,
+            "peer_avatar": None,
+            "peer_is_active": None,
+            "peer_is_verified": False,
+        }
+    return {
+        "peer_user": user,
+        "peer_first_name": user.first_name or "",
+        "peer_last_name": user.last_name or "",
+        "peer_company_name": user.company_name or "",
+        "peer_username": user.username or "",
+        "peer_slug": user.slug,
+        "peer_user_type": user.user_type,
+        "peer_avatar": getattr(user.avatar, "name", None) or None,
+        "peer_is_active": user.is_active,
+        "peer_is_verified": bool(user.is_verified),
+    }
+
+
+def _last_message_fields(message: Message | None) -> dict[str, object]:
+    if message is None:
+        return {
+            "last_message_preview": "",
+            "last_message_sender_id": None,
+            "last_message_is_deleted": False,
+            "last_message_has_image": False,
+            "last_message_type": None,
+        }
+    return {
+        "last_message_preview": message.text or "",
+        "last_message_sender_id": message.sender_id,
+        "last_message_is_deleted": bool(message.is_deleted),
+        "last_message_has_image": bool(getattr(message.image, "name", "")),
+        "last_message_type": message.message_type,
+    }
+
+
+def _conversation_snapshots(conversation_ids: list[int]):
+    rows = list(
+        Conversation.objects.filter(id__in=conversation_ids)
+        .annotate(
+            last_message_id=Subquery(
+                Message.objects.filter(conversation_id=OuterRef("pk"))
+                .order_by("-created_at", "-id")
+                .values("id")[:1]
+            )
+        )
+        .values_list("id", "last_message_at", "last_message_id")
+    )
+    messages = Message.objects.only(
+        "id", "sender_id", "text", "image", "is_deleted", "message_type"
+    ).in_bulk([message_id for _id, _at, message_id in rows if message_id])
+    return {
+        conversation_id: (last_message_at, messages.get(message_id))
+        for conversation_id, last_message_at, message_id in rows
+    }
+
+
+def refresh_inbox_entries(
+    *,
+    conversation_ids: Iterable[int],
+    user_ids: Iterable[int] | None = None,
+) -> int:
+    """
+    Prepočítaj ``InboxEntry`` riadky daných konverzácií zo zdroja (upsert).
+
+    ``user_ids`` zúži prepočet na vybraných účastníkov (read/hide/pin); bez
+    neho sa prepočítajú všetci. Vracia počet zapísaných riadkov.
+    """
+    conversation_ids = _normalize_ids(conversation_ids)
+    if not conversation_ids:
+        return 0
+    only_user_ids = None if user_ids is None else set(_normalize_ids(user_ids))
+
+    snapshots = _conversation_snapshots(conversation_ids)
+    participants_by_conversation: dict[int, list[ConversationParticipant]] = defaultdict(
+        list
+    )
+    for participant in (
+        ConversationParticipant.objects.filter(conversation_id__in=conversation_ids)
+        .select_related("user")
+        .order_by("conversation_id", "id")
+    ):
+        participants_by_conversation[participant.conversation_id].append(participant)
+
+    entries: list[InboxEntry] = []
+    for conversation_id, participants in participants_by_conversation.items():
+        last_message_at, last_message = snapshots.get(conversation_id, (None, None))
+        message_fields = _last_message_fields(last_message)
+        active = [
+            participant
+            for participant in participants
+            if participant.status == ConversationParticipant.Status.ACTIVE
+        ]
+        for participant in participants:
+            if only_user_ids is not None and participant.user_id not in only_user_ids:
+                continue
+            peer = next(
+                (other.user for other in active if other.user_id != participant.user_id),
+                None,
+            )
+            entries.append(
+                InboxEntry(
+                    user_id=participant.user_id,
+                    conversation_id=conversation_id,
+                    status=participant.status,
+                    role=participant.role,
+                    is_pinned=participant.pinned_at is not None,
+                    pinned_at=participant.pinned_at,
+                    hidden_at=participant.hidden_at,
+                    last_read_at=participant.last_read_at,
+                    unread_count=participant.unread_count,
+                    participant_count=len(active),
+                    last_message_at=last_message_at,
+                    **message_fields,
+                    **peer_fields_for_user(peer),
+                )
+            )
+
+    if not entries:
+        return 0
+    InboxEntry.objects.bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=["user", "conversation"],
+        update_fields=list(_ENTRY_UPDATE_FIELDS),
+    )
+    return len(entries)
+
+
+def refresh_inbox_peer_fields(*, user) -> int:
+    """Prepíš zobrazovacie polia ``user`` vo všetkých sidebaroch, kde je protistranou."""
+    fields = peer_fields_for_user(user)
+    fields.pop("peer_user")
+    return InboxEntry.objects.filter(peer_user_id=user.id).update(**fields)
+
+
+def delete_orphan_inbox_entries(*, conversation_ids: Iterable[int] | None = None) -> int:
+    """Zmaž riadky bez zodpovedajúceho účastníka (rebuild/reconcile)."""
+    qs = InboxEntry.objects.all()
+    if conversation_ids is not None:
+        qs = qs.filter(conversation_id__in=_normalize_ids(conversation_ids))
+    deleted, _ = qs.filter(
+        ~Exists(
+            ConversationParticipant.objects.filter(
+                conversation_id=OuterRef("conversation_id"),
+                user_id=OuterRef("user_id"),
+            )
+        )
+    ).delete()
+    return deleted
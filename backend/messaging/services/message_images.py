@@ -0,0 +1,279 @@
+"""
+Stupňovité spracovanie obrázkov v správach.
+
+`send_message` / `send_direct_message` držia `select_for_update` na konverzácii
+aj zámky oboch používateľov. Decode + re-encode (EXIF strip) a WEBP thumbnail
+preto nebežia v tej transakcii: správa sa uloží s originálom a stavom
+PROCESSING, po commite sa naplánuje `process_message_image_record` (Celery,
+alebo inline podľa `settings.MESSAGE_IMAGE_PROCESSING`) a po dokončení ide
+participantom realtime event `messaging_message_updated`.
+
+GDPR: kým je stav PROCESSING/FAILED, proxy view originál nevydá (môže niesť
+GPS). Po úspechu sa originál v storage nahradí stripnutou, obsahovo adresovanou
+kópiou (`MessageImageBlob`, zdieľaná s forwardmi), pri zlyhaní sa zmaže.
+"""
+
+from __future__ import annotations
+
+import logging
+from importlib import import_module
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.urls import reverse
+
+from ..models import ConversationParticipant, Message, MessageImageBlob
+from .image_blobs import (
+    acquire_message_image_blob,
+    create_or_acquire_message_image_blob,
+    message_image_digest,
+)
+from .image_processing import strip_image_metadata
+from .image_thumbnails import build_message_thumbnail
+from .inbox import refresh_inbox_entries
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_IMAGE_PROCESSING_CELERY = "celery"
+MESSAGE_IMAGE_PROCESSING_INLINE = "inline"
+
+
+class _LazyProcessMessageImageTask:
+    # Vzor push_enqueue: import tasku až pri volaní (services nesmú ťahať Celery app).
+    @staticmethod
+    def delay(*args, **kwargs):
+        task_module = import_module("swaply.tasks.message_images")
+        return task_module.process_message_image.delay(*args, **kwargs)
+
+
+process_message_image_task = _LazyProcessMessageImageTask()
+
+
+def _processing_mode() -> str:
+    mode = str(
+        getattr(settings, "MESSAGE_IMAGE_PROCESSING", MESSAGE_IMAGE_PROCESSING_CELERY) or ""
+    ).strip().lower()
+    if mode == MESSAGE_IMAGE_PROCESSING_INLINE:
+        return MESSAGE_IMAGE_PROCESSING_INLINE
+    return MESSAGE_IMAGE_PROCESSING_CELERY
+
+
+def schedule_message_image_processing(*, message_id: int) -> None:
+    """Po commite spusti spracovanie – nikdy nie v transakcii volajúceho."""
+
+    def _enqueue() -> None:
+        if _processing_mode() == MESSAGE_IMAGE_PROCESSING_CELERY:
+            try:
+                process_message_image_task.delay(int(message_id))
+                return
+            except Exception:
+                logger.warning(
+                    "Message image task could not be enqueued; processing inline.",
+                    extra={"message_id": int(message_id)},
+                    exc_info=True,
+                )
+        # Inline beh je už po commite (zámky sú uvoľnené); zlyhanie necháme
+        # na FAILED stav, nie na výnimku v requeste.
+        try:
+            process_message_image_record(int(message_id))
+        except Exception:
+            logger.exception(
+                "Inline message image processing failed",
+                extra={"message_id": int(message_id)},
+            )
+            mark_message_image_processing_failed(int(message_id))
+
+    transaction.on_commit(_enqueue)
+
+
+def _delete_names(storage, names) -> None:
+    for name in dict.fromkeys(n for n in names if n):
+        try:
+            storage.delete(name)
+        except Exception:
+            # Radšej osamotený súbor než spadnutý task (cleanup_orphan_message_images).
+            pass
+
+
+def _ready_image_urls(message: Message, *, has_thumbnail: bool) -> tuple[str | None, str | None]:
+    # Rovnaké relatívne URL ako MessageSerializer bez requestu (proxy views).
+    if message.image_status != Message.ImageStatus.READY:
+        return None, None
+    kwargs = {"conversation_id": message.conversation_id, "message_id": message.id}
+    image_url = reverse("accounts:messaging_message_image", kwargs=kwargs)
+    thumbnail_url = (
+        reverse("accounts:messaging_message_image_thumbnail", kwargs=kwargs)
+        if has_thumbnail
+        else None
+    )
+    return image_url, thumbnail_url
+
+
+def _notify_image_updated(message: Message, *, has_thumbnail: bool = False) -> None:
+    participant_user_ids = tuple(
+        ConversationParticipant.objects.filter(
+            conversation_id=message.conversation_id,
+            status=ConversationParticipant.Status.ACTIVE,
+        ).values_list("user_id", flat=True)
+    )
+    if not participant_user_ids:
+        return
+    from accounts.realtime import notify_users
+
+    image_url, image_thumbnail_url = _ready_image_urls(message, has_thumbnail=has_thumbnail)
+    event = {
+        "type": "messaging_message_updated",
+        "conversation_id": message.conversation_id,
+        "message_id": message.id,
+        "image_status": message.image_status,
+        "image_url": image_url,
+        "image_thumbnail_url": image_thumbnail_url,
+    }
+    notify_users({user_id: dict(event) for user_id in participant_user_ids})
+
+
+def _read_processed_image(message: Message) -> tuple[bytes, str]:
+    """Stripnuté bajty (alebo originál, ak strip nie je možný) + prípona."""
+    original_name = message.image.name
+    # Storage chyby (S3 timeout) prebublú von → Celery retry.
+    message.image.open("rb")
+    try:
+        stripped = strip_image_metadata(message.image.file, filename=original_name)
+        if stripped is not None:
+            return stripped.read(), Path(stripped.name).suffix.lower()
+        message.image.seek(0)
+        return message.image.read(), Path(original_name).suffix.lower()
+    finally:
+        message.image.close()
+
+
+def _store_blob_files(digest: str, data: bytes, suffix: str) -> tuple[str, str]:
+    """Ulož obrázok + thumbnail pod obsahovo adresované mená (bez DB zápisu)."""
+    pending = MessageImageBlob(sha256=digest)
+    image_name = pending.image.storage.save(
+        pending.image.field.generate_filename(pending, f"image{suffix or '.jpg'}"),
+        ContentFile(data),
+    )
+    pending.image.name = image_name
+    thumbnail_name = ""
+    thumbnail = build_message_thumbnail(pending.image)
+    if thumbnail is not None:
+        thumbnail_name = pending.image_thumbnail.storage.save(
+            pending.image_thumbnail.field.generate_filename(pending, thumbnail.name),
+            thumbnail,
+        )
+    return image_name, thumbnail_name
+
+
+def process_message_image_record(message_id: int) -> None:
+    """
+    PROCESSING → (strip + thumbnail) → READY.
+
+    Ťažká práca beží bez zámkov; stav sa prepína až v krátkej transakcii so
+    `select_for_update` na správe. Rovnaký obsah, aký už existuje ako
+    `MessageImageBlob`, sa neukladá ani nethumbnailuje znova – správa len
+    pridá referenciu (až v tej krátkej transakcii). Ak bola správa medzitým
+    zmazaná alebo už spracovaná, vyrobené súbory sa zahodia.
+    """
+    message = (
+        Message.objects.filter(
+            id=message_id,
+            is_deleted=False,
+            image_status=Message.ImageStatus.PROCESSING,
+        )
+        .only("id", "conversation_id", "image", "image_thumbnail", "image_status")
+        .first()
+    )
+    if message is None or not message.image:
+        return
+
+    original_name = message.image.name
+    storage = message.image.storage
+
+    data, suffix = _read_processed_image(message)
+    digest = message_image_digest(data)
+    # Len lookup bez referencie – tú berie až zamknutá transakcia nižšie, aby
+    # pád/odchod skôr (zmazaná správa) nenechal blob s visiacou referenciou.
+    new_names: list[str] = []
+    if not MessageImageBlob.objects.filter(sha256=digest).exists():
+        new_names.extend(_store_blob_files(digest, data, suffix))
+
+    try:
+        with transaction.atomic():
+            locked = (
+                Message.objects.select_for_update()
+                .filter(id=message_id)
+                .only("id", "conversation_id", "is_deleted", "image", "image_status")
+                .first()
+            )
+            if (
+                locked is None
+                or locked.is_deleted
+                or locked.image_status != Message.ImageStatus.PROCESSING
+                or locked.image.name != original_name
+            ):
+                discarded = list(new_names)
+                transaction.on_commit(lambda: _delete_names(storage, discarded))
+                return
+
+            blob = None
+            if not new_names:
+                blob = acquire_message_image_blob(sha256=digest)
+                if blob is None:
+                    # Blob medzitým zanikol (uvoľnená posledná referencia) –
+                    # uložíme vlastnú kópiu ako pri novom obsahu.
+                    new_names.extend(_store_blob_files(digest, data, suffix))
+            if blob is None:
+                blob, created = create_or_acquire_message_image_blob(
+                    sha256=digest,
+                    image_name=new_names[0],
+                    thumbnail_name=new_names[1],
+                )
+                if not created:
+                    # Rovnaký obsah medzitým zaregistroval iný proces.
+                    discarded = list(new_names)
+                    transaction.on_commit(lambda: _delete_names(storage, discarded))
+
+            image_name = blob.image.name
+            Message.objects.filter(id=message_id).update(
+                image=image_name,
+                image_thumbnail=blob.image_thumbnail.name or None,
+                image_blob=blob,
+                image_status=Message.ImageStatus.READY,
+            )
+            if image_name != original_name:
+                # Originál s EXIF/GPS už nie je potrebný.
+                transaction.on_commit(lambda: _delete_names(storage, [original_name]))
+            locked.image_status = Message.ImageStatus.READY
+            _notify_image_updated(locked, has_thumbnail=bool(blob.image_thumbnail.name))
+    except Exception:
+        # Referencia na blob sa vrátila rollbackom; zahodíme len vlastné súbory.
+        _delete_names(storage, new_names)
+        raise
+
+
+def mark_message_image_processing_failed(message_id: int) -> None:
+    """Po vyčerpaní retries: FAILED + zmazanie nespracovaného originálu (GDPR)."""
+    with transaction.atomic():
+        message = (
+            Message.objects.select_for_update()
+            .filter(id=message_id, image_status=Message.ImageStatus.PROCESSING)
+            .only("id", "conversation_id", "image", "image_status")
+            .first()
+        )
+        if message is None:
+            return
+        original_name = message.image.name if message.image else ""
+        storage = message.image.storage
+        Message.objects.filter(id=message_id).update(
+            image="",
+            image_status=Message.ImageStatus.FAILED,
+        )
+        # Bez obrázka – InboxEntry.last_message_has_image musí spadnúť v tej istej transakcii.
+        refresh_inbox_entries(conversation_ids=[message.conversation_id])
+        if original_name:
+            transaction.on_commit(lambda: _delete_names(storage, [original_name]))
+        message.image_status = Message.ImageStatus.FAILED
+        _notify_image_updated(message)
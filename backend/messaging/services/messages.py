@@ -2,17 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from django.core.files.storage import default_storage
 from django.db import transaction
 from django.utils import timezone
 
 from accounts.services.user_blocks import lock_users_and_ensure_interaction_allowed
 
-from ..models import Conversation, ConversationParticipant, Message
-from .image_processing import strip_image_metadata
-from .image_thumbnails import attach_message_thumbnail
+from ..models import Conversation, ConversationParticipant, Message, MessageImageBlob
+from .image_blobs import release_message_images
+from .inbox import refresh_inbox_entries
+from .message_images import schedule_message_image_processing
 from .message_requests import prepare_pending_request_for_message
 from .push_enqueue import schedule_message_push_delivery
+from .unread_counters import decrement_unread_counts, increment_unread_counts
 
 
 class MessageServiceError(Exception):
@@ -79,35 +80,52 @@ def _persist_message(
     recipient_user_ids: tuple[int, ...],
     text: str = "",
     image=None,
+    image_blob: MessageImageBlob | None = None,
     message_type: str = Message.Type.USER,
     metadata: dict | None = None,
 ) -> Message:
     """
     Spoločný finalizačný blok pri vytváraní správy (zdieľaný medzi send_message
-    a send_direct_message): odstránenie EXIF z obrázka, vytvorenie Message,
-    thumbnail, posun conversation.last_message_at a naplánovanie push doručenia.
+    a send_direct_message): vytvorenie Message, posun
+    conversation.last_message_at a naplánovanie push doručenia aj spracovania
+    obrázka.
 
     Volajúci musí byť v rámci transakcie a poskytnúť už vypočítané
     `recipient_user_ids` (líši sa medzi 1:1 a existujúcou konverzáciou).
+    EXIF strip a thumbnail (Pillow decode/encode) tu zámerne NEbežia – volajúci
+    drží zámok konverzácie aj používateľov; obrázok spracuje
+    `process_message_image_record` po commite. `image_blob` (forward) je už
+    spracovaný obrázok – volajúci naň získal referenciu, správa je hneď READY.
     """
-    if image:
-        # GDPR: odstráň EXIF/GPS metadáta z originálu pred uložením.
-        stripped = strip_image_metadata(image)
-        if stripped is not None:
-            image = stripped
-
+    if image_blob is not None:
+        image_fields = {
+            "image": image_blob.image.name,
+            "image_thumbnail": image_blob.image_thumbnail.name or None,
+            "image_blob": image_blob,
+            "image_status": Message.ImageStatus.READY,
+        }
+    else:
+        image_fields = {
+            "image": image,
+            "image_status": (
+                Message.ImageStatus.PROCESSING if image else Message.ImageStatus.NONE
+            ),
+        }
     message = Message.objects.create(
         conversation=conversation,
         sender=sender,
         text=text,
-        image=image,
         message_type=message_type,
         metadata=dict(metadata or {}),
         created_at=now,
+        **image_fields,
     )
-    attach_message_thumbnail(message)
+    if image:
+        schedule_message_image_processing(message_id=message.id)
+    increment_unread_counts(message=message)
     conversation.last_message_at = now
     conversation.save(update_fields=["last_message_at", "updated_at"])
+    refresh_inbox_entries(conversation_ids=[conversation.id])
     schedule_message_push_delivery(
         message_id=message.id,
         recipient_user_ids=recipient_user_ids,
@@ -206,12 +224,15 @@ def mark_conversation_read(*, conversation: Conversation, user) -> ConversationP
         raise NotParticipant("User is not a participant of this conversation.")
 
     updated = ConversationParticipant.objects.filter(id=participant.id).update(
-        last_read_at=now
+        last_read_at=now,
+        unread_count=0,
     )
     if not updated:
         raise NotParticipant("User is not a participant of this conversation.")
+    refresh_inbox_entries(conversation_ids=[conversation.id], user_ids=[user.id])
 
     participant.last_read_at = now
+    participant.unread_count = 0
     return participant
 
 
@@ -267,9 +288,6 @@ def delete_message_for_all(
                 changed=False,
             )
 
-        image_name = getattr(message.image, "name", "") or ""
-        thumbnail_name = getattr(message.image_thumbnail, "name", "") or ""
-
         if convo.pinned_message_id == message.id:
             Conversation.objects.filter(id=convo.id).update(pinned_message_id=None)
             convo.pinned_message_id = None
@@ -279,15 +297,17 @@ def delete_message_for_all(
             text="",
             image="",
             image_thumbnail="",
+            image_blob=None,
         )
+        decrement_unread_counts(message=message)
+        refresh_inbox_entries(conversation_ids=[convo.id])
+        # Zdieľaný blob (forward) sa zmaže až s poslednou referenciou.
+        release_message_images([message])
         message.is_deleted = True
         message.text = ""
-        if image_name:
-            message.image.name = ""
-            transaction.on_commit(lambda: default_storage.delete(image_name))
-        if thumbnail_name:
-            message.image_thumbnail.name = ""
-            transaction.on_commit(lambda: default_storage.delete(thumbnail_name))
+        message.image.name = ""
+        message.image_thumbnail.name = ""
+        message.image_blob = None
 
         return DeleteMessageResult(
             message=message,
@@ -331,9 +351,12 @@ def hide_conversation_for_user(
         ConversationParticipant.objects.filter(id=participant.id).update(
             hidden_at=now,
             last_read_at=now,
+            unread_count=0,
         )
+        refresh_inbox_entries(conversation_ids=[convo.id], user_ids=[user.id])
         participant.hidden_at = now
         participant.last_read_at = now
+        participant.unread_count = 0
 
         return HideConversationResult(participant=participant, changed=True)
 
@@ -366,6 +389,7 @@ def set_conversation_pinned_state_for_user(
         ConversationParticipant.objects.filter(id=participant.id).update(
             pinned_at=next_pinned_at,
         )
+        refresh_inbox_entries(conversation_ids=[convo.id], user_ids=[user.id])
         participant.pinned_at = next_pinned_at
 
         return SetConversationPinnedStateResult(participant=participant, changed=True)
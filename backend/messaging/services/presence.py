@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import json
+import logging
+from dataclasses import dataclass
 from time import time
 
+from django.conf import settings
 from django.core.cache import cache
 
+logger = logging.getLogger(__name__)
+
 MESSAGE_PRESENCE_CACHE_PREFIX = "msg_presence"
 MESSAGE_PRESENCE_TTL_SECONDS = 75
 MESSAGE_PRESENCE_FRESH_SECONDS = 35
+# Pri každom heartbeate sa z Redis hashu uprace najviac toľko expirovaných
+# používateľov – ohraničená práca, hash nerastie donekonečna.
+MESSAGE_PRESENCE_PRUNE_BATCH = 100
 
 
 def _normalize_positive_ids(values) -> tuple[int, ...]:
@@ -25,25 +34,308 @@ def _presence_cache_key(user_id: int) -> str:
     return f"{MESSAGE_PRESENCE_CACHE_PREFIX}:{int(user_id)}"
 
 
-def store_message_presence(
+def _is_fresh_in_conversation(payload, *, conversation_id: int, now: int) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("visible") is not True:
+        return False
+    if payload.get("active_conversation_id") != int(conversation_id):
+        return False
+    seen_at = payload.get("seen_at")
+    if not isinstance(seen_at, int):
+        return False
+    return now - seen_at <= MESSAGE_PRESENCE_FRESH_SECONDS
+
+
+class CachePresenceBackend:
+    """Jeden pickled dict na používateľa v Django cache (locmem/dev fallback)."""
+
+    def store(self, user_id: int, payload: dict) -> dict | None:
+        key = _presence_cache_key(user_id)
+        previous = cache.get(key)
+        cache.set(key, payload, timeout=MESSAGE_PRESENCE_TTL_SECONDS)
+        return previous if isinstance(previous, dict) else None
+
+    def get_many(self, user_ids: tuple[int, ...]) -> dict[int, dict]:
+        keys_by_user_id = {user_id: _presence_cache_key(user_id) for user_id in user_ids}
+        cached = cache.get_many(keys_by_user_id.values())
+        result: dict[int, dict] = {}
+        for user_id, cache_key in keys_by_user_id.items():
+            value = cached.get(cache_key)
+            if isinstance(value, dict):
+                result[user_id] = value
+        return result
+
+    def active_user_ids_in_conversation(
+        self, conversation_id: int, *, user_ids: tuple[int, ...], now: int
+    ) -> set[int]:
+        presence_by_user_id = self.get_many(user_ids)
+        return {
+            user_id
+            for user_id in user_ids
+            if _is_fresh_in_conversation(
+                presence_by_user_id.get(user_id),
+                conversation_id=conversation_id,
+                now=now,
+            )
+        }
+
+
+# KEYS[1] = hash user_id → JSON stav, KEYS[2] = zset user_id podľa seen_at,
+# KEYS[3] = zset novej konverzácie (len ak ARGV[4] ~= ''), posledný KEY = zset
+# predchádzajúcej konverzácie (len ak ARGV[5] == '1').
+# ARGV = user_id, JSON stav, seen_at, active_conversation_id ('' = žiadna),
+#        príznak predchádzajúcej konverzácie, očakávaný predchádzajúci JSON
+#        ('' = žiadny), TTL, prune batch.
+# Všetky kľúče idú cez KEYS (Redis Cluster / ACL). Predchádzajúcu konverzáciu
+# preto volajúci zistí vopred cez HGET; ak sa stav medzitým zmenil, skript nič
+# nezapíše a vráti {0} – volajúci to skúsi znova. Zset konverzácie drží len
+# viditeľných používateľov s aktívnou konverzáciou, skóre = seen_at. Vracia
+# {1, predchádzajúci JSON stav} (bez neho, ak žiadny nebol).
+_REDIS_STORE_SCRIPT = """
+local user_id = ARGV[1]
+local seen_at = tonumber(ARGV[3])
+local conversation_id = ARGV[4]
+local ttl = tonumber(ARGV[7])
+local previous = redis.call('HGET', KEYS[1], user_id)
+if (previous or '') ~= ARGV[6] then
+  return {0}
+end
+if ARGV[5] == '1' then
+  redis.call('ZREM', KEYS[#KEYS], user_id)
+end
+redis.call('HSET', KEYS[1], user_id, ARGV[2])
+redis.call('ZADD', KEYS[2], seen_at, user_id)
+if conversation_id ~= '' then
+  redis.call('ZADD', KEYS[3], seen_at, user_id)
+  redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', '(' .. (seen_at - ttl))
+  redis.call('EXPIRE', KEYS[3], ttl)
+end
+local expired = redis.call(
+  'ZRANGEBYSCORE', KEYS[2], '-inf', '(' .. (seen_at - ttl), 'LIMIT', 0, tonumber(ARGV[8])
+)
+if #expired > 0 then
+  redis.call('HDEL', KEYS[1], unpack(expired))
+  redis.call('ZREM', KEYS[2], unpack(expired))
+end
+return {1, previous}
+"""
+# Koľkokrát sa heartbeat zopakuje, ak stav používateľa medzi HGET a skriptom
+# zmenil súbežný heartbeat (iná karta toho istého používateľa).
+_REDIS_STORE_ATTEMPTS = 3
+
+
+class RedisPresenceBackend:
+    """
+    Presence v Redis hash + sorted setoch namiesto kľúča na používateľa.
+
+    * heartbeat = jeden Lua skript (EVALSHA), atomicky aj s presunom medzi
+      konverzáciami a upratovaním expirovaných záznamov,
+    * hromadný lookup stavu = jeden ``HMGET``,
+    * „kto je aktívny v konverzácii X" = jeden ``ZRANGEBYSCORE`` nad zsetom
+      konverzácie (skóre = seen_at).
+    Kľúče idú cez ``cache.make_key`` (KEY_PREFIX/verzia ako zvyšok cache).
+    """
+
+    def __init__(self, client=None):
+        self._client = client
+        self._script = None
+
+    def _get_client(self):
+        if self._client is None:
+            from django_redis import get_redis_connection
+
+            self._client = get_redis_connection("default")
+        return self._client
+
+    def _get_script(self):
+        if self._script is None:
+            self._script = self._get_client().register_script(_REDIS_STORE_SCRIPT)
+        return self._script
+
+    @staticmethod
+    def state_key() -> str:
+        return cache.make_key(f"{MESSAGE_PRESENCE_CACHE_PREFIX}:state")
+
+    @staticmethod
+    def seen_key() -> str:
+        return cache.make_key(f"{MESSAGE_PRESENCE_CACHE_PREFIX}:seen")
+
+    @staticmethod
+    def conversation_key_prefix() -> str:
+        return cache.make_key(f"{MESSAGE_PRESENCE_CACHE_PREFIX}:conversation:")
+
+    @staticmethod
+    def _decode(raw) -> dict | None:
+        if raw is None:
+            return None
+        try:
+            value = json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+        return value if isinstance(value, dict) else None
+
+    def conversation_key(self, conversation_id: int) -> str:
+        return f"{self.conversation_key_prefix()}{int(conversation_id)}"
+
+    def store(self, user_id: int, payload: dict) -> dict | None:
+        conversation_id = payload.get("active_conversation_id")
+        for _attempt in range(_REDIS_STORE_ATTEMPTS):
+            previous_raw = self._get_client().hget(self.state_key(), int(user_id))
+            previous = self._decode(previous_raw)
+            previous_conversation_id = (previous or {}).get("active_conversation_id")
+            if not isinstance(previous_conversation_id, int) or (
+                previous_conversation_id == conversation_id
+            ):
+                previous_conversation_id = None
+
+            keys = [self.state_key(), self.seen_key()]
+            if conversation_id is not None:
+                keys.append(self.conversation_key(conversation_id))
+            if previous_conversation_id is not None:
+                keys.append(self.conversation_key(previous_conversation_id))
+            result = self._get_script()(
+                keys=keys,
+                args=[
+                    int(user_id),
+                    json.dumps(payload, separators=(",", ":")),
+                    int(payload["seen_at"]),
+                    "" if conversation_id is None else int(conversation_id),
+                    "" if previous_conversation_id is None else "1",
+                    previous_raw or "",
+                    MESSAGE_PRESENCE_TTL_SECONDS,
+                    MESSAGE_PRESENCE_PRUNE_BATCH,
+                ],
+            )
+            if int(result[0]) == 1:
+                return previous
+        raise RuntimeError("Message presence state kept changing during store")
+
+    def get_many(self, user_ids: tuple[int, ...]) -> dict[int, dict]:
+        raw_values = self._get_client().hmget(self.state_key(), list(user_ids))
+        expired_before = int(time()) - MESSAGE_PRESENCE_TTL_SECONDS
+        result: dict[int, dict] = {}
+        for user_id, raw in zip(user_ids, raw_values):
+            value = self._decode(raw)
+            if value is None:
+                continue
+            # Hash nemá TTL na pole – expiráciu cache kľúča emulujeme cez seen_at.
+            seen_at = value.get("seen_at")
+            if isinstance(seen_at, int) and seen_at < expired_before:
+                continue
+            result[user_id] = value
+        return result
+
+    def active_user_ids_in_conversation(
+        self, conversation_id: int, *, user_ids: tuple[int, ...], now: int
+    ) -> set[int]:
+        members = self._get_client().zrangebyscore(
+            self.conversation_key(conversation_id),
+            now - MESSAGE_PRESENCE_FRESH_SECONDS,
+            "+inf",
+        )
+        active: set[int] = set()
+        for member in members:
+            try:
+                active.add(int(member))
+            except (TypeError, ValueError):
+                continue
+        return active.intersection(user_ids)
+
+
+_cache_backend = CachePresenceBackend()
+_redis_backend = None
+
+
+def get_presence_backend():
+    """
+    Backend podľa ``settings.MESSAGE_PRESENCE_BACKEND``: ``"redis"``, ``"cache"``
+    alebo ``"auto"`` (default) – Redis, ak default cache beží na django_redis.
+    """
+    global _redis_backend
+
+    choice = str(getattr(settings, "MESSAGE_PRESENCE_BACKEND", "auto") or "auto").lower()
+    if choice == "auto":
+        cache_backend = str(
+            (getattr(settings, "CACHES", {}) or {}).get("default", {}).get("BACKEND", "")
+        )
+        choice = "redis" if cache_backend.startswith("django_redis.") else "cache"
+    if choice != "redis":
+        return _cache_backend
+    if _redis_backend is None:
+        _redis_backend = RedisPresenceBackend()
+    return _redis_backend
+
+
+@dataclass(frozen=True)
+class MessagePresenceUpdate:
+    payload: dict[str, int | bool | None]
+    # Konverzácie, v ktorých sa zmenila aktívnosť používateľa (vstup/odchod,
+    # skrytie okna) – tým sa publikuje realtime event. Obyčajný heartbeat
+    # bez zmeny stavu je prázdny.
+    changed_conversation_ids: tuple[int, ...] = ()
+
+
+def _active_conversation_id(payload) -> int | None:
+    if not isinstance(payload, dict) or payload.get("visible") is not True:
+        return None
+    conversation_id = payload.get("active_conversation_id")
+    return conversation_id if isinstance(conversation_id, int) else None
+
+
+def _was_fresh(payload, *, now: int) -> bool:
+    seen_at = payload.get("seen_at") if isinstance(payload, dict) else None
+    return isinstance(seen_at, int) and now - seen_at <= MESSAGE_PRESENCE_FRESH_SECONDS
+
+
+def record_message_presence(
     *,
     user_id: int,
     visible: bool,
     active_conversation_id: int | None,
-) -> dict[str, int | bool | None]:
+) -> MessagePresenceUpdate:
+    now = int(time())
     payload = {
         "visible": bool(visible),
         "active_conversation_id": int(active_conversation_id)
         if bool(visible) and active_conversation_id is not None
         else None,
-        "seen_at": int(time()),
+        "seen_at": now,
     }
-    cache.set(
-        _presence_cache_key(user_id),
-        payload,
-        timeout=MESSAGE_PRESENCE_TTL_SECONDS,
+    try:
+        previous = get_presence_backend().store(int(user_id), payload)
+    except Exception as exc:
+        # fail-open: presence je best-effort, heartbeat nesmie zhodiť request
+        logger.warning("Message presence store failed", exc_info=exc)
+        return MessagePresenceUpdate(payload=payload)
+
+    previous_conversation_id = (
+        _active_conversation_id(previous) if _was_fresh(previous, now=now) else None
+    )
+    current_conversation_id = _active_conversation_id(payload)
+    changed = (
+        ()
+        if previous_conversation_id == current_conversation_id
+        else tuple(
+            conversation_id
+            for conversation_id in (previous_conversation_id, current_conversation_id)
+            if conversation_id is not None
+        )
     )
-    return payload
+    return MessagePresenceUpdate(payload=payload, changed_conversation_ids=changed)
+
+
+def store_message_presence(
+    *,
+    user_id: int,
+    visible: bool,
+    active_conversation_id: int | None,
+) -> dict[str, int | bool | None]:
+    return record_message_presence(
+        user_id=user_id,
+        visible=visible,
+        active_conversation_id=active_conversation_id,
+    ).payload
 
 
 def get_message_presence_for_users(*, user_ids) -> dict[int, dict[str, int | bool | None]]:
@@ -51,18 +343,11 @@ def get_message_presence_for_users(*, user_ids) -> dict[int, dict[str, int | boo
     if not normalized_user_ids:
         return {}
 
-    keys_by_user_id = {
-        user_id: _presence_cache_key(user_id) for user_id in normalized_user_ids
-    }
-    cached = cache.get_many(keys_by_user_id.values())
-    result: dict[int, dict[str, int | bool | None]] = {}
-
-    for user_id, cache_key in keys_by_user_id.items():
-        value = cached.get(cache_key)
-        if isinstance(value, dict):
-            result[user_id] = value
-
-    return result
+    try:
+        return get_presence_backend().get_many(normalized_user_ids)
+    except Exception as exc:
+        logger.warning("Message presence lookup failed", exc_info=exc)
+        return {}
 
 
 def get_suppressed_message_push_recipient_ids(
@@ -74,28 +359,15 @@ def get_suppressed_message_push_recipient_ids(
     if not normalized_user_ids:
         return ()
 
-    now = int(time())
-    suppressed: list[int] = []
-    presence_by_user_id = get_message_presence_for_users(user_ids=normalized_user_ids)
-
-    for user_id in normalized_user_ids:
-        payload = presence_by_user_id.get(user_id)
-        if not isinstance(payload, dict):
-            continue
-
-        if payload.get("visible") is not True:
-            continue
-
-        if payload.get("active_conversation_id") != int(conversation_id):
-            continue
-
-        seen_at = payload.get("seen_at")
-        if not isinstance(seen_at, int):
-            continue
-
-        if now - seen_at > MESSAGE_PRESENCE_FRESH_SECONDS:
-            continue
-
-        suppressed.append(user_id)
+    try:
+        active_user_ids = get_presence_backend().active_user_ids_in_conversation(
+            int(conversation_id),
+            user_ids=normalized_user_ids,
+            now=int(time()),
+        )
+    except Exception as exc:
+        # Bez presence radšej push pošleme (nič nepotlačíme).
+        logger.warning("Message presence lookup failed", exc_info=exc)
+        return ()
 
-    return tuple(suppressed)
+    return tuple(user_id for user_id in normalized_user_ids if user_id in active_user_ids)
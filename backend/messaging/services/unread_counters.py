@@ -0,0 +1,118 @@
+"""
+Denormalizovaný ``ConversationParticipant.unread_count``.
+
+Počítadlo drží presne to, čo predtým rátal ``COUNT(DISTINCT messages)`` pri
+každom čítaní badge: správy v konverzácii, ktoré nie sú zmazané, nie sú
+SYSTEM, neposlal ich daný účastník a sú novšie než jeho ``last_read_at``
+(NULL = všetky). Filter na status účastníka / skrytie konverzácie sa aplikuje
+až pri čítaní, preto sa počítadlo udržiava pre všetkých účastníkov bez ohľadu
+na status (opätovné pozvanie do skupiny tak nevyžaduje prepočet).
+
+Udržiavanie:
+
+* nová správa → ``increment_unread_counts`` (``_persist_message``, pozvánka),
+* prečítanie / skrytie → reset na 0 spolu s ``last_read_at``,
+* soft-delete správy → ``decrement_unread_counts``,
+* nový účastník existujúcej konverzácie, hromadné zásahy (GDPR scrub, seed)
+  → ``recompute_unread_counts`` (presný prepočet, rovnaký ako
+  ``manage.py reconcile_unread_counts``).
+"""
+
+from __future__ import annotations
+
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from ..models import ConversationParticipant, Message
+
+
+def _counted_recipients(message: Message):
+    return (
+        ConversationParticipant.objects.filter(conversation_id=message.conversation_id)
+        .exclude(user_id=message.sender_id)
+        .filter(Q(last_read_at__isnull=True) | Q(last_read_at__lt=message.created_at))
+    )
+
+
+def _is_counted(message: Message) -> bool:
+    return not message.is_deleted and message.message_type != Message.Type.SYSTEM
+
+
+def increment_unread_counts(*, message: Message) -> int:
+    """Pripočítaj novú správu všetkým účastníkom okrem odosielateľa."""
+    if not _is_counted(message):
+        return 0
+    return _counted_recipients(message).update(unread_count=F("unread_count") + 1)
+
+
+def decrement_unread_counts(*, message: Message) -> int:
+    """Odpočítaj práve soft-zmazanú správu tým, ktorým sa rátala.
+
+    Volá sa s ešte NEzmazaným stavom správy (typ/odosielateľ/created_at), teda
+    pred alebo nezávisle od nastavenia ``is_deleted``.
+    """
+    if message.message_type == Message.Type.SYSTEM:
+        return 0
+    return (
+        _counted_recipients(message)
+        .filter(unread_count__gt=0)
+        .update(unread_count=F("unread_count") - 1)
+    )
+
+
+def _unread_messages_subquery(*, since_last_read: bool) -> Subquery:
+    messages = (
+        Message.objects.filter(conversation_id=OuterRef("conversation_id"), is_deleted=False)
+        .exclude(message_type=Message.Type.SYSTEM)
+        .exclude(sender_id=OuterRef("user_id"))
+    )
+    if since_last_read:
+        messages = messages.filter(created_at__gt=OuterRef("last_read_at"))
+    return Subquery(
+        messages.order_by()
+        .values("conversation_id")
+        .annotate(c=Count("id"))
+        .values("c")[:1],
+        output_field=IntegerField(),
+    )
+
+
+def expected_unread_count_expression():
+    """Presná hodnota ``unread_count`` ako výraz nad ConversationParticipant."""
+    return Case(
+        When(
+            last_read_at__isnull=True,
+            then=Coalesce(_unread_messages_subquery(since_last_read=False), Value(0)),
+        ),
+        default=Coalesce(_unread_messages_subquery(since_last_read=True), Value(0)),
+        output_field=IntegerField(),
+    )
+
+
+def drifted_participants(participants=None):
+    """Účastníci, ktorých uložený ``unread_count`` nesedí s prepočtom."""
+    qs = ConversationParticipant.objects.all() if participants is None else participants
+    return qs.annotate(expected_unread_count=expected_unread_count_expression()).exclude(
+        unread_count=F("expected_unread_count")
+    )
+
+
+def recompute_unread_counts(participants=None) -> int:
+    """
+    Prepočítaj ``unread_count`` od nuly jedným UPDATE-om s korelovaným COUNT.
+
+    ``participants`` je voliteľný queryset ConversationParticipant na zúženie;
+    bez neho sa prepočítajú všetci. Vracia počet aktualizovaných riadkov.
+    """
+    qs = ConversationParticipant.objects.all() if participants is None else participants
+    return qs.update(unread_count=expected_unread_count_expression())
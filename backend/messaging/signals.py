@@ -4,20 +4,27 @@ Signály messaging aplikácie.
 post_delete na Message: pri tvrdom zmazaní záznamu (napr. CASCADE pri
 delete_group, alebo budúce čistenie) zmaže obrázkové súbory zo storage, aby
 v S3/lokáli nezostávali „orphaned" súbory (náklady + GDPR minimalizácia).
+Správa so zdieľaným MessageImageBlob len vráti referenciu.
 
 Pozn.: delete_message_for_all robí len soft-delete (is_deleted=True, riadok
 OSTÁVA v DB) a obrázky maže explicitne, takže post_delete sa pri ňom NEspúšťa
 a nedochádza k dvojitému mazaniu.
+
+post_save na User: prepíše zobrazovacie polia protistrany (meno, avatar, …)
+v materializovaných ``InboxEntry`` riadkoch sidebaru.
 """
 
 from __future__ import annotations
 
+from django.conf import settings
 from django.core.files.storage import default_storage
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from .models import Message
+from .services.image_blobs import release_message_image_blobs
+from .services.inbox import PEER_USER_FIELDS, refresh_inbox_peer_fields
 
 
 def _delete_message_image_storage(instance: Message) -> None:
@@ -44,6 +51,20 @@ def _delete_message_image_storage(instance: Message) -> None:
 
 @receiver(post_delete, sender=Message)
 def delete_message_image_files_after_delete(sender, instance, **kwargs):
+    if instance.image_blob_id:
+        # Zdieľaný obrázok (forward) – súbory zmaže až posledná referencia.
+        release_message_image_blobs([instance.image_blob_id])
+        return
     transaction.on_commit(
         lambda instance=instance: _delete_message_image_storage(instance)
     )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_inbox_peer_fields_after_user_save(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    # Napr. update_fields=["last_login"] pri každom prihlásení sidebar nemení.
+    if update_fields is not None and not set(update_fields) & set(PEER_USER_FIELDS):
+        return
+    refresh_inbox_peer_fields(user=instance)
@@ -2,16 +2,13 @@
 Privátne servírovanie portfólio obrázkov.
 
 Rovnaký vzor ako MessageImageView v messaging: proxy view overí prístup
-(vlastník / verejný profil), potom streamuje bajty zo storage cez FileResponse.
-Priama S3 URL je zablokovaná bucket policy – obrázky sú dostupné len cez tento
-endpoint.
+(vlastník / verejný profil), potom bajty doručí ``protected_image_response``
+(stream / X-Accel-Redirect / podpísaný 302 podľa nastavenia). Priama S3 URL je
+zablokovaná bucket policy – obrázky sú dostupné len cez tento endpoint.
 """
 
-import mimetypes
-
 from django.core.cache import cache
-from django.core.files.storage import default_storage
-from django.http import FileResponse, Http404
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -19,6 +16,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from accounts.services.user_blocks import user_block_exists_between
+from swaply.image_delivery import protected_image_response
 
 from .image_storage import PORTFOLIO_IMAGE_VARIANTS
 from .image_storage import variant_storage_key as _variant_storage_key
@@ -75,22 +73,13 @@ def _portfolio_image_response(request, item_id: int, image_id: int, variant: str
     if not is_owner and image.status != PortfolioImage.Status.APPROVED:
         raise Http404
 
-    key = _variant_storage_key(image, variant)
-    if not key:
-        return Response(status=status.HTTP_404_NOT_FOUND)
-
-    try:
-        stored_file = default_storage.open(key, "rb")
-    except Exception:
+    response = protected_image_response(
+        _variant_storage_key(image, variant),
+        request=request,
+        immutable=image.status == PortfolioImage.Status.APPROVED,
+    )
+    if response is None:
         return Response(status=status.HTTP_404_NOT_FOUND)
-
-    content_type = mimetypes.guess_type(key)[0]
-    if content_type is None and key.lower().endswith(".webp"):
-        content_type = "image/webp"
-    content_type = content_type or "application/octet-stream"
-    response = FileResponse(stored_file, content_type=content_type)
-    response["Cache-Control"] = "private, max-age=3600"
-    response["X-Content-Type-Options"] = "nosniff"
     return response
 
 
@@ -12,6 +12,12 @@ from django.core.files.storage import default_storage
 from django.db import transaction
 
 from swaply.image_moderation import check_image_safety
+from swaply.image_variants import (
+    VariantSpec,
+    decode_image,
+    render_variants,
+    upload_variants,
+)
 
 from .image_storage import delete_storage_keys
 from .image_storage import get_s3_client as _s3_client
@@ -55,53 +61,6 @@ def _now():
     return datetime.now(timezone.utc)
 
 
-def _register_heif_support() -> None:
-    try:
-        from pillow_heif import register_heif_opener
-
-        register_heif_opener()
-    except Exception:
-        return
-
-
-def _normalize_image_mode(image):
-    if image.mode in ("RGBA", "LA"):
-        return image
-    if image.mode == "P" and "transparency" in image.info:
-        return image.convert("RGBA")
-    if image.mode != "RGB":
-        return image.convert("RGB")
-    return image
-
-
-def _decode_image(raw_bytes: bytes):
-    from PIL import Image, ImageOps
-
-    _register_heif_support()
-    with Image.open(io.BytesIO(raw_bytes)) as source:
-        source.load()
-        return ImageOps.exif_transpose(source).copy()
-
-
-def _variant_bytes(
-    source, *, max_side: int, quality: int
-) -> tuple[bytes, tuple[int, int]]:
-    image = source.copy()
-    image.thumbnail((max_side, max_side))
-    image = _normalize_image_mode(image)
-
-    # GDPR: explicitne zahoď EXIF/XMP (vrátane GPS) z info dictu pred uložením.
-    # Orientácia je už "zapečená" v pixeloch cez exif_transpose v _decode_image.
-    # Save bez exif= síce metadáta nateraz nezapisuje (Pillow 10), ale novšie
-    # verzie ich vedia prevziať z im.info – tento pop to poistí naprieč verziami.
-    image.info.pop("exif", None)
-    image.info.pop("xmp", None)
-
-    output = io.BytesIO()
-    image.save(output, format="WEBP", quality=quality, method=6)
-    return output.getvalue(), image.size
-
-
 def _variant_settings() -> dict[str, int]:
     return {
         "thumbnail": int(os.getenv("PORTFOLIO_IMAGE_THUMBNAIL_MAX_SIDE", "480")),
@@ -169,7 +128,11 @@ def _upload_variant(s3, bucket: str, key: str, payload: bytes) -> None:
     )
 
 
-def process_portfolio_image_record(portfolio_image_id: int) -> None:
+def process_portfolio_image_record(portfolio_image_id: int, *, s3=None) -> None:
+    """PENDING → varianty + moderácia → APPROVED/REJECTED.
+
+    `s3` umožní dávke (process_portfolio_image_batch) zdieľať jeden klient.
+    """
     bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
     use_local_storage = local_portfolio_upload_enabled()
     if not bucket and not use_local_storage:
@@ -200,7 +163,7 @@ def process_portfolio_image_record(portfolio_image_id: int) -> None:
         raw_bytes = _read_local_key(pending_key)
         delete_key = _delete_local_key
     else:
-        s3 = _s3_client()
+        s3 = s3 or _s3_client()
         raw_bytes = s3.get_object(Bucket=bucket, Key=pending_key)["Body"].read()
 
         # Pomenovaná funkcia (nie lambda) kvôli čitateľnosti a debugovaniu
@@ -208,8 +171,9 @@ def process_portfolio_image_record(portfolio_image_id: int) -> None:
         def delete_key(key):
             return _delete_s3_key(s3, bucket, key)
 
+    settings_map = _variant_settings()
     try:
-        decoded = _decode_image(raw_bytes)
+        decoded = decode_image(raw_bytes, max_side=settings_map["large"])
     except Exception:
         _reject_image(
             portfolio_image_id,
@@ -219,25 +183,19 @@ def process_portfolio_image_record(portfolio_image_id: int) -> None:
         )
         return
 
-    settings_map = _variant_settings()
-    thumbnail_bytes, _thumbnail_size = _variant_bytes(
-        decoded,
-        max_side=settings_map["thumbnail"],
-        quality=settings_map["quality"],
-    )
-    medium_bytes, _medium_size = _variant_bytes(
-        decoded,
-        max_side=settings_map["medium"],
-        quality=settings_map["quality"],
-    )
-    large_bytes, large_size = _variant_bytes(
+    variants = render_variants(
         decoded,
-        max_side=settings_map["large"],
+        (
+            VariantSpec("large", settings_map["large"]),
+            VariantSpec("medium", settings_map["medium"]),
+            VariantSpec("thumbnail", settings_map["thumbnail"]),
+        ),
         quality=settings_map["quality"],
     )
+    large = variants["large"]
 
     try:
-        check_image_safety(io.BytesIO(large_bytes))
+        check_image_safety(io.BytesIO(large.payload))
     except ValidationError:
         _reject_image(
             portfolio_image_id,
@@ -252,23 +210,23 @@ def process_portfolio_image_record(portfolio_image_id: int) -> None:
     thumbnail_key = f"{key_prefix}-thumbnail.webp"
     medium_key = f"{key_prefix}-medium.webp"
     large_key = f"{key_prefix}-large.webp"
-    uploaded_keys: list[str] = []
 
-    try:
-        for key, payload in (
-            (thumbnail_key, thumbnail_bytes),
-            (medium_key, medium_bytes),
-            (large_key, large_bytes),
-        ):
-            if use_local_storage:
-                _upload_local_variant(key, payload)
-            else:
-                _upload_variant(s3, bucket, key, payload)
-            uploaded_keys.append(key)
-    except Exception:
-        for key in uploaded_keys:
-            delete_key(key)
-        raise
+    if use_local_storage:
+        upload = _upload_local_variant
+    else:
+
+        def upload(key, payload):
+            return _upload_variant(s3, bucket, key, payload)
+
+    uploaded_keys = upload_variants(
+        (
+            (thumbnail_key, variants["thumbnail"].payload),
+            (medium_key, variants["medium"].payload),
+            (large_key, large.payload),
+        ),
+        upload=upload,
+        delete=delete_key,
+    )
 
     delete_key(pending_key)
 
@@ -296,9 +254,9 @@ def process_portfolio_image_record(portfolio_image_id: int) -> None:
         image.large_key = large_key
         image.approved_key = large_key
         image.content_type = "image/webp"
-        image.size_bytes = len(large_bytes)
-        image.width = large_size[0]
-        image.height = large_size[1]
+        image.size_bytes = len(large.payload)
+        image.width = large.size[0]
+        image.height = large.size[1]
         image.processed_at = _now()
         image.rejected_reason = ""
         image.save(
@@ -68,11 +68,11 @@ def _next_image_order(item: PortfolioItem) -> int:
     return 0 if current_max is None else current_max + 1
 
 
-def _validate_upload_metadata(request):
-    filename = str(request.data.get("filename") or "").strip()
-    content_type = str(request.data.get("content_type") or "").strip()
+def _validate_upload_metadata(data):
+    filename = str(data.get("filename") or "").strip()
+    content_type = str(data.get("content_type") or "").strip()
     try:
-        size_bytes = int(request.data.get("size_bytes") or 0)
+        size_bytes = int(data.get("size_bytes") or 0)
     except Exception:
         size_bytes = 0
 
@@ -126,92 +126,64 @@ def _serialize_image(request, image: PortfolioImage):
     ).data
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-@api_rate_limit
-def portfolio_image_upload_init_view(request, item_id: int):
-    try:
-        item = PortfolioItem.objects.only("id", "owner_id").get(
-            id=item_id,
-            owner=request.user,
-        )
-    except PortfolioItem.DoesNotExist:
-        return _portfolio_item_not_found()
+def _storage_not_configured_response():
+    return Response(
+        {"error": "Storage nie je nakonfigurovane."},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
 
-    if _active_images_count(item) >= MAX_PORTFOLIO_IMAGES:
-        return _images_limit_response()
 
-    filename, content_type, size_bytes, error_response = _validate_upload_metadata(
-        request
+def _upload_prepare_failed_response():
+    return Response(
+        {"error": "Nepodarilo sa pripravit upload."},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
-    if error_response is not None:
-        return error_response
 
+
+def _upload_not_found_response():
+    return Response(
+        {"error": "Upload nebol najdeny."},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _upload_target(
+    request, *, item_id, filename, content_type, size_bytes, bucket, s3=None
+) -> dict:
+    """Presigned POST (S3) alebo lokálny upload pre nový staging kľúč."""
     ext = os.path.splitext(filename)[1].lower()
     key = f"uploads/portfolio/{item_id}/{uuid.uuid4().hex}{ext}"
-    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
     if not bucket:
-        if local_portfolio_upload_enabled():
-            return Response(
-                {
-                    "url": local_upload_url(request),
-                    "fields": make_local_upload_fields(
-                        item_id=item_id,
-                        key=key,
-                        size_bytes=size_bytes,
-                    ),
-                    "key": key,
-                    "expires_in": LOCAL_UPLOAD_EXPIRES_SECONDS,
-                    "content_type": content_type or None,
-                },
-                status=status.HTTP_200_OK,
-            )
-        return Response(
-            {"error": "Storage nie je nakonfigurovane."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    try:
-        presigned = _get_s3_client().generate_presigned_post(
-            Bucket=bucket,
-            Key=key,
-            Conditions=[
-                ["content-length-range", 1, max_image_bytes()],
-            ],
-            ExpiresIn=LOCAL_UPLOAD_EXPIRES_SECONDS,
-        )
-    except Exception:
-        return Response(
-            {"error": "Nepodarilo sa pripravit upload."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    return Response(
-        {
-            "url": presigned.get("url"),
-            "fields": presigned.get("fields", {}),
+        return {
+            "url": local_upload_url(request),
+            "fields": make_local_upload_fields(
+                item_id=item_id,
+                key=key,
+                size_bytes=size_bytes,
+            ),
             "key": key,
             "expires_in": LOCAL_UPLOAD_EXPIRES_SECONDS,
             "content_type": content_type or None,
-        },
-        status=status.HTTP_200_OK,
+        }
+
+    presigned = (s3 or _get_s3_client()).generate_presigned_post(
+        Bucket=bucket,
+        Key=key,
+        Conditions=[
+            ["content-length-range", 1, max_image_bytes()],
+        ],
+        ExpiresIn=LOCAL_UPLOAD_EXPIRES_SECONDS,
     )
+    return {
+        "url": presigned.get("url"),
+        "fields": presigned.get("fields", {}),
+        "key": key,
+        "expires_in": LOCAL_UPLOAD_EXPIRES_SECONDS,
+        "content_type": content_type or None,
+    }
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-@api_rate_limit
-def portfolio_image_upload_complete_view(request, item_id: int):
-    try:
-        PortfolioItem.objects.only("id", "owner_id").get(
-            id=item_id,
-            owner=request.user,
-        )
-    except PortfolioItem.DoesNotExist:
-        return _portfolio_item_not_found()
-
-    filename = str(request.data.get("filename") or "").strip()
-    key = str(request.data.get("key") or "").strip()
+def _validate_complete_key(key: str, *, item_id: int):
     if not key:
         return Response({"error": "Chyba key."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -228,39 +200,40 @@ def portfolio_image_upload_complete_view(request, item_id: int):
             {"error": "Neplatny typ suboru."},
             status=status.HTTP_400_BAD_REQUEST,
         )
+    return None
 
-    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+
+def _verify_staged_upload(key: str, *, filename: str, bucket, s3=None):
+    """
+    Over nahraný staging objekt: (size_bytes, content_type, error_response).
+
+    Neplatný alebo moderáciou odmietnutý upload sa hneď zmaže – DB záznam
+    ešte neexistuje, takže post_delete signál by ho neupratal.
+    """
     if bucket:
         try:
-            head = _get_s3_client().head_object(Bucket=bucket, Key=key)
+            head = (s3 or _get_s3_client()).head_object(Bucket=bucket, Key=key)
         except Exception:
-            return Response(
-                {"error": "Upload nebol najdeny."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            return 0, "", _upload_not_found_response()
         size_bytes = int(head.get("ContentLength") or 0)
         content_type = str(head.get("ContentType") or "")
-    elif local_portfolio_upload_enabled():
+    else:
         from django.core.files.storage import default_storage
 
         if not default_storage.exists(key):
-            return Response(
-                {"error": "Upload nebol najdeny."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            return 0, "", _upload_not_found_response()
         size_bytes = int(default_storage.size(key) or 0)
         content_type = mimetypes.guess_type(filename or key)[0] or ""
-    else:
-        return Response(
-            {"error": "Storage nie je nakonfigurovane."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
 
     if size_bytes <= 0 or size_bytes > max_image_bytes():
         delete_storage_keys([key])
-        return Response(
-            {"error": "Neplatny subor."},
-            status=status.HTTP_400_BAD_REQUEST,
+        return (
+            0,
+            "",
+            Response(
+                {"error": "Neplatny subor."},
+                status=status.HTTP_400_BAD_REQUEST,
+            ),
         )
 
     # Preflight SafeSearch moderation before creating any DB record.
@@ -277,11 +250,117 @@ def portfolio_image_upload_complete_view(request, item_id: int):
             # by ten delete zlyhal, DB záznam ešte neexistuje (post_delete signál
             # sa nespustí), takže by staging upload ostal navždy (náklady + GDPR).
             delete_storage_keys([key])
-            return Response(
-                {"error": e.user_message, "code": e.code},
-                status=status.HTTP_400_BAD_REQUEST,
+            return (
+                0,
+                "",
+                Response(
+                    {"error": e.user_message, "code": e.code},
+                    status=status.HTTP_400_BAD_REQUEST,
+                ),
             )
 
+    return size_bytes, content_type, None
+
+
+def _reject_unqueued_images(pending_keys: dict[int, str]) -> None:
+    """Spracovanie sa nepodarilo spustiť: REJECTED + zmazaný staging."""
+    PortfolioImage.objects.filter(
+        id__in=list(pending_keys),
+        status=PortfolioImage.Status.PENDING,
+    ).update(
+        status=PortfolioImage.Status.REJECTED,
+        rejected_reason=PROCESSING_ENQUEUE_ERROR,
+        processed_at=timezone.now(),
+    )
+    delete_storage_keys(list(pending_keys.values()))
+
+
+def _batch_entries(value):
+    """Zoznam 1..MAX_PORTFOLIO_IMAGES objektov z batch requestu."""
+    if (
+        not isinstance(value, list)
+        or not 1 <= len(value) <= MAX_PORTFOLIO_IMAGES
+        or not all(isinstance(entry, dict) for entry in value)
+    ):
+        return None, Response(
+            {"error": "Neplatny zoznam suborov."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return value, None
+
+
+def _batch_entry_error(index: int, key: str, response) -> dict:
+    return {"index": index, "key": key, **response.data}
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def portfolio_image_upload_init_view(request, item_id: int):
+    try:
+        item = PortfolioItem.objects.only("id", "owner_id").get(
+            id=item_id,
+            owner=request.user,
+        )
+    except PortfolioItem.DoesNotExist:
+        return _portfolio_item_not_found()
+
+    if _active_images_count(item) >= MAX_PORTFOLIO_IMAGES:
+        return _images_limit_response()
+
+    filename, content_type, size_bytes, error_response = _validate_upload_metadata(
+        request.data
+    )
+    if error_response is not None:
+        return error_response
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket and not local_portfolio_upload_enabled():
+        return _storage_not_configured_response()
+
+    try:
+        payload = _upload_target(
+            request,
+            item_id=item_id,
+            filename=filename,
+            content_type=content_type,
+            size_bytes=size_bytes,
+            bucket=bucket,
+        )
+    except Exception:
+        return _upload_prepare_failed_response()
+
+    return Response(payload, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def portfolio_image_upload_complete_view(request, item_id: int):
+    try:
+        PortfolioItem.objects.only("id", "owner_id").get(
+            id=item_id,
+            owner=request.user,
+        )
+    except PortfolioItem.DoesNotExist:
+        return _portfolio_item_not_found()
+
+    filename = str(request.data.get("filename") or "").strip()
+    key = str(request.data.get("key") or "").strip()
+    error_response = _validate_complete_key(key, item_id=item_id)
+    if error_response is not None:
+        return error_response
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket and not local_portfolio_upload_enabled():
+        return _storage_not_configured_response()
+
+    size_bytes, content_type, error_response = _verify_staged_upload(
+        key, filename=filename, bucket=bucket
+    )
+    if error_response is not None:
+        return error_response
+
     with transaction.atomic():
         try:
             item = PortfolioItem.objects.select_for_update().get(
@@ -323,19 +402,7 @@ def portfolio_image_upload_complete_view(request, item_id: int):
                         "error": str(exc),
                     },
                 )
-                processed_at = timezone.now()
-                image.status = PortfolioImage.Status.REJECTED
-                image.rejected_reason = PROCESSING_ENQUEUE_ERROR
-                image.processed_at = processed_at
-                PortfolioImage.objects.filter(
-                    id=image.id,
-                    status=PortfolioImage.Status.PENDING,
-                ).update(
-                    status=image.status,
-                    rejected_reason=image.rejected_reason,
-                    processed_at=processed_at,
-                )
-                delete_storage_keys([key])
+                _reject_unqueued_images({image.id: key})
 
         transaction.on_commit(enqueue_processing)
 
@@ -350,6 +417,210 @@ def portfolio_image_upload_complete_view(request, item_id: int):
     )
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def portfolio_image_batch_upload_init_view(request, item_id: int):
+    """
+    Pripraví upload viacerých fotiek naraz (`files`: filename/content_type/size_bytes).
+
+    Jeden ownership check, jedno počítanie limitu a jeden S3 klient pre všetky
+    presigned POSTy; odpoveď `uploads` má rovnaký tvar ako upload-init.
+    """
+    try:
+        item = PortfolioItem.objects.only("id", "owner_id").get(
+            id=item_id,
+            owner=request.user,
+        )
+    except PortfolioItem.DoesNotExist:
+        return _portfolio_item_not_found()
+
+    entries, error_response = _batch_entries(request.data.get("files"))
+    if error_response is not None:
+        return error_response
+
+    if _active_images_count(item) + len(entries) > MAX_PORTFOLIO_IMAGES:
+        return _images_limit_response()
+
+    validated = []
+    for index, entry in enumerate(entries):
+        filename, content_type, size_bytes, error_response = _validate_upload_metadata(
+            entry
+        )
+        if error_response is not None:
+            return Response(
+                {**error_response.data, "index": index},
+                status=error_response.status_code,
+            )
+        validated.append((filename, content_type, size_bytes))
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket and not local_portfolio_upload_enabled():
+        return _storage_not_configured_response()
+
+    try:
+        s3 = _get_s3_client() if bucket else None
+        uploads = [
+            _upload_target(
+                request,
+                item_id=item_id,
+                filename=filename,
+                content_type=content_type,
+                size_bytes=size_bytes,
+                bucket=bucket,
+                s3=s3,
+            )
+            for filename, content_type, size_bytes in validated
+        ]
+    except Exception:
+        return _upload_prepare_failed_response()
+
+    return Response({"uploads": uploads}, status=status.HTTP_200_OK)
+
+
+def _enqueue_batch_processing(pending_keys: dict[int, str], *, item_id: int) -> None:
+    image_ids = list(pending_keys)
+    if local_portfolio_upload_enabled():
+        from portfolio.image_processing import process_portfolio_image_record
+
+        failed = {}
+        for image_id in image_ids:
+            try:
+                process_portfolio_image_record(image_id)
+            except Exception:
+                logger.exception(
+                    "Local portfolio image processing failed",
+                    extra={"portfolio_image_id": image_id, "portfolio_item_id": item_id},
+                )
+                failed[image_id] = pending_keys[image_id]
+        if failed:
+            _reject_unqueued_images(failed)
+        return
+
+    try:
+        from swaply.tasks.portfolio_images import process_portfolio_image_batch
+
+        process_portfolio_image_batch.delay(image_ids)
+    except Exception as exc:
+        logger.exception(
+            "Failed to enqueue portfolio image batch processing",
+            extra={
+                "portfolio_image_ids": image_ids,
+                "portfolio_item_id": item_id,
+                "error": str(exc),
+            },
+        )
+        _reject_unqueued_images(pending_keys)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@api_rate_limit
+def portfolio_image_batch_upload_complete_view(request, item_id: int):
+    """
+    Potvrdí viacero nahraných fotiek (`uploads`: key/filename) v jednej transakcii.
+
+    Neplatný kľúč odmietne celý request; nenájdený alebo moderáciou odmietnutý
+    upload sa vráti v `errors` a ostatné fotky sa vytvoria. Limit sa kontroluje
+    raz pod `select_for_update` na iteme pre celú dávku a spracovanie ide ako
+    jeden Celery task.
+    """
+    try:
+        PortfolioItem.objects.only("id", "owner_id").get(
+            id=item_id,
+            owner=request.user,
+        )
+    except PortfolioItem.DoesNotExist:
+        return _portfolio_item_not_found()
+
+    entries, error_response = _batch_entries(request.data.get("uploads"))
+    if error_response is not None:
+        return error_response
+
+    uploads = []
+    for index, entry in enumerate(entries):
+        key = str(entry.get("key") or "").strip()
+        error_response = _validate_complete_key(key, item_id=item_id)
+        if error_response is not None:
+            return Response(
+                {**error_response.data, "index": index},
+                status=error_response.status_code,
+            )
+        uploads.append((key, str(entry.get("filename") or "").strip()))
+    if len({key for key, _ in uploads}) != len(uploads):
+        return Response(
+            {"error": "Duplicitny key."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+    if not bucket and not local_portfolio_upload_enabled():
+        return _storage_not_configured_response()
+
+    try:
+        s3 = _get_s3_client() if bucket else None
+    except Exception:
+        return _upload_not_found_response()
+
+    verified = []
+    errors = []
+    for index, (key, filename) in enumerate(uploads):
+        size_bytes, content_type, error_response = _verify_staged_upload(
+            key, filename=filename, bucket=bucket, s3=s3
+        )
+        if error_response is not None:
+            errors.append(_batch_entry_error(index, key, error_response))
+            continue
+        verified.append((key, filename, size_bytes, content_type))
+
+    if not verified:
+        return Response(
+            {"error": "Ziadna fotka nebola prijata.", "errors": errors},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    with transaction.atomic():
+        try:
+            item = PortfolioItem.objects.select_for_update().get(
+                id=item_id,
+                owner=request.user,
+            )
+        except PortfolioItem.DoesNotExist:
+            return _portfolio_item_not_found()
+        if _active_images_count(item) + len(verified) > MAX_PORTFOLIO_IMAGES:
+            verified_keys = [key for key, *_ in verified]
+            transaction.on_commit(lambda: delete_storage_keys(verified_keys))
+            return _images_limit_response()
+
+        first_order = _next_image_order(item)
+        pending_keys = {}
+        for offset, (key, filename, size_bytes, content_type) in enumerate(verified):
+            image = PortfolioImage.objects.create(
+                item=item,
+                order=first_order + offset,
+                status=PortfolioImage.Status.PENDING,
+                pending_key=key,
+                original_filename=filename,
+                content_type=content_type,
+                size_bytes=size_bytes,
+            )
+            pending_keys[image.id] = key
+
+        transaction.on_commit(
+            lambda: _enqueue_batch_processing(pending_keys, item_id=item_id)
+        )
+
+    images = list(
+        PortfolioImage.objects.filter(id__in=list(pending_keys))
+        .order_by("order", "id")
+        .values("id", "status", "order")
+    )
+    return Response(
+        {"images": images, "errors": errors},
+        status=status.HTTP_201_CREATED,
+    )
+
+
 @api_view(["DELETE"])
 @permission_classes([IsAuthenticated])
 @api_rate_limit
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -53,7 +54,7 @@ class PortfolioImageFileApiTests(APITestCase):
 
     def _get_streamed(self, url):
         with patch(
-            "portfolio.image_file_views.default_storage.open",
+            "swaply.image_delivery.default_storage.open",
             return_value=io.BytesIO(b"webp-bytes"),
         ) as open_mock:
             response = self.client.get(url)
@@ -67,9 +68,36 @@ class PortfolioImageFileApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         open_mock.assert_called_once_with(self.image.large_key, "rb")
         self.assertEqual(response["Content-Type"], "image/webp")
-        self.assertEqual(response["Cache-Control"], "private, max-age=3600")
+        self.assertEqual(
+            response["Cache-Control"], "private, max-age=31536000, immutable"
+        )
+        self.assertTrue(response["ETag"].startswith('"'))
         self.assertEqual(response["X-Content-Type-Options"], "nosniff")
 
+    def test_matching_if_none_match_returns_304_without_storage_access(self):
+        self.client.force_authenticate(user=self.visitor)
+        first, _ = self._get_streamed(self._url())
+
+        with patch("swaply.image_delivery.default_storage.open") as open_mock:
+            response = self.client.get(self._url(), HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], first["ETag"])
+        self.assertEqual(
+            response["Cache-Control"], "private, max-age=31536000, immutable"
+        )
+        open_mock.assert_not_called()
+
+    def test_etag_differs_per_variant(self):
+        self.client.force_authenticate(user=self.owner)
+
+        large, _ = self._get_streamed(self._url())
+        response, open_mock = self._get_streamed(self._url(variant="thumbnail"))
+
+        self.assertNotEqual(large["ETag"], response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        open_mock.assert_called_once_with(self.image.thumbnail_key, "rb")
+
     def test_variant_param_selects_thumbnail_key(self):
         self.client.force_authenticate(user=self.owner)
 
@@ -152,7 +180,7 @@ class PortfolioImageFileApiTests(APITestCase):
         self.client.force_authenticate(user=self.owner)
 
         with patch(
-            "portfolio.image_file_views.default_storage.open",
+            "swaply.image_delivery.default_storage.open",
             side_effect=FileNotFoundError("missing"),
         ):
             response = self.client.get(self._url())
@@ -178,3 +206,33 @@ class PortfolioImageFileApiTests(APITestCase):
         self.assertEqual(first.status_code, status.HTTP_200_OK)
         self.assertEqual(second.status_code, status.HTTP_200_OK)
         open_mock.assert_called_once_with(self.image.medium_key, "rb")
+
+    @override_settings(PROTECTED_IMAGE_DELIVERY="redirect")
+    def test_redirect_mode_hands_off_after_access_check(self):
+        self.client.force_authenticate(user=self.visitor)
+        signed_url = "https://bucket.s3.amazonaws.com/x-large.webp?X-Amz-Signature=abc"
+
+        with patch(
+            "swaply.image_delivery._presigned_url", return_value=signed_url
+        ) as presign_mock, patch(
+            "swaply.image_delivery.default_storage.open"
+        ) as open_mock:
+            response = self.client.get(self._url())
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(response["Location"], signed_url)
+        presign_mock.assert_called_once()
+        self.assertEqual(presign_mock.call_args.args[1], self.image.large_key)
+        open_mock.assert_not_called()
+
+    @override_settings(PROTECTED_IMAGE_DELIVERY="redirect")
+    def test_redirect_mode_still_enforces_private_profile(self):
+        self.owner.is_public = False
+        self.owner.save(update_fields=["is_public"])
+        self.client.force_authenticate(user=self.visitor)
+
+        with patch("swaply.image_delivery._presigned_url") as presign_mock:
+            response = self.client.get(self._url())
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        presign_mock.assert_not_called()
@@ -10,7 +10,11 @@ from portfolio.image_processing import (
     mark_processing_failed,
 )
 from portfolio.models import PortfolioImage, PortfolioItem
-from swaply.tasks.portfolio_images import process_portfolio_image
+from swaply.tasks.portfolio_images import (
+    SoftTimeLimitExceeded,
+    process_portfolio_image,
+    process_portfolio_image_batch,
+)
 
 User = get_user_model()
 
@@ -112,3 +116,45 @@ class PortfolioImageTaskFailureTests(TestCase):
         image.refresh_from_db()
         self.assertEqual(image.status, PortfolioImage.Status.PENDING)
         delete_mock.assert_not_called()
+
+
+class PortfolioImageBatchTaskTests(TestCase):
+    def test_batch_shares_one_s3_client_and_hands_off_failed_images(self):
+        s3 = object()
+        processed = []
+
+        def _process(image_id, *, s3=None):
+            processed.append((image_id, s3))
+            if image_id == 2:
+                raise RuntimeError("S3 down")
+
+        with (
+            patch("swaply.tasks.portfolio_images.get_s3_client", return_value=s3) as client_mock,
+            patch(
+                "swaply.tasks.portfolio_images.process_portfolio_image_record",
+                side_effect=_process,
+            ),
+            patch(
+                "swaply.tasks.portfolio_images.process_portfolio_image.delay"
+            ) as delay_mock,
+        ):
+            process_portfolio_image_batch.run([1, 2, 3])
+
+        client_mock.assert_called_once_with()
+        self.assertEqual(processed, [(1, s3), (2, s3), (3, s3)])
+        delay_mock.assert_called_once_with(2)
+
+    def test_batch_soft_time_limit_hands_off_remaining_images(self):
+        with (
+            patch("swaply.tasks.portfolio_images.get_s3_client"),
+            patch(
+                "swaply.tasks.portfolio_images.process_portfolio_image_record",
+                side_effect=[None, SoftTimeLimitExceeded()],
+            ),
+            patch(
+                "swaply.tasks.portfolio_images.process_portfolio_image.delay"
+            ) as delay_mock,
+        ):
+            process_portfolio_image_batch.run([1, 2, 3])
+
+        self.assertEqual([call.args[0] for call in delay_mock.call_args_list], [2, 3])
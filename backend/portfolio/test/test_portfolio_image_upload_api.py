@@ -417,6 +417,218 @@ class PortfolioImageUploadApiTests(APITestCase):
             ),
             [first.id, second.id],
         )
+    def test_batch_upload_init_presigns_all_files_with_one_client(self):
+        self.client.force_authenticate(user=self.owner)
+        s3 = _s3_mock()
+        files = [
+            {"filename": f"work-{index}.jpg", "size_bytes": 1024} for index in range(3)
+        ]
+
+        with patch("portfolio.image_views._get_s3_client", return_value=s3) as client_mock:
+            response = self.client.post(
+                reverse("accounts:portfolio_image_batch_upload_init", args=[self.item.id]),
+                data={"files": files},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        keys = [upload["key"] for upload in response.data["uploads"]]
+        self.assertEqual(len(set(keys)), 3)
+        self.assertTrue(
+            all(key.startswith(f"uploads/portfolio/{self.item.id}/") for key in keys)
+        )
+        self.assertEqual(client_mock.call_count, 1)
+        self.assertEqual(s3.generate_presigned_post.call_count, 3)
+
+    def test_batch_upload_init_rejects_batch_exceeding_image_limit(self):
+        for index in range(6):
+            self._image(order=index)
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.post(
+            reverse("accounts:portfolio_image_batch_upload_init", args=[self.item.id]),
+            data={
+                "files": [
+                    {"filename": f"work-{index}.jpg", "size_bytes": 1024}
+                    for index in range(3)
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["code"], "portfolio_images_limit_reached")
+
+    def test_batch_upload_init_reports_index_of_invalid_file(self):
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.post(
+            reverse("accounts:portfolio_image_batch_upload_init", args=[self.item.id]),
+            data={
+                "files": [
+                    {"filename": "work.jpg", "size_bytes": 1024},
+                    {"filename": "notes.txt", "size_bytes": 1024},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["index"], 1)
+
+    def test_batch_upload_complete_creates_images_and_enqueues_one_task(self):
+        self.client.force_authenticate(user=self.owner)
+        self._image(order=0)
+        keys = [f"uploads/portfolio/{self.item.id}/work-{index}.jpg" for index in range(3)]
+        s3 = _s3_mock(head={"ContentLength": 2048, "ContentType": "image/jpeg"})
+
+        with (
+            patch("portfolio.image_views._get_s3_client", return_value=s3) as client_mock,
+            patch(
+                "swaply.tasks.portfolio_images.process_portfolio_image_batch.delay"
+            ) as delay_mock,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse(
+                        "accounts:portfolio_image_batch_upload_complete",
+                        args=[self.item.id],
+                    ),
+                    data={"uploads": [{"key": key, "filename": "work.jpg"} for key in keys]},
+                    format="json",
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["errors"], [])
+        image_ids = [image["id"] for image in response.data["images"]]
+        self.assertEqual([image["order"] for image in response.data["images"]], [1, 2, 3])
+        self.assertEqual(
+            list(
+                PortfolioImage.objects.filter(id__in=image_ids)
+                .order_by("order")
+                .values_list("pending_key", flat=True)
+            ),
+            keys,
+        )
+        self.assertEqual(client_mock.call_count, 1)
+        self.assertEqual(s3.head_object.call_count, 3)
+        delay_mock.assert_called_once_with(image_ids)
+
+    @override_settings(SAFESEARCH_ENABLED=True)
+    def test_batch_upload_complete_reports_rejected_upload_and_keeps_others(self):
+        from swaply.staged_image_moderation import ModerationRejectedError
+
+        self.client.force_authenticate(user=self.owner)
+        good_key = f"uploads/portfolio/{self.item.id}/good.jpg"
+        bad_key = f"uploads/portfolio/{self.item.id}/bad.jpg"
+
+        def _moderate(bucket, key):
+            if key == bad_key:
+                raise ModerationRejectedError("Nevhodny obsah.")
+
+        with (
+            patch("portfolio.image_views._get_s3_client", return_value=_s3_mock()),
+            patch(
+                "swaply.staged_image_moderation.moderate_staged_s3_image",
+                side_effect=_moderate,
+            ),
+            patch("portfolio.image_views.delete_storage_keys") as delete_mock,
+            patch("swaply.tasks.portfolio_images.process_portfolio_image_batch.delay"),
+        ):
+            response = self.client.post(
+                reverse(
+                    "accounts:portfolio_image_batch_upload_complete",
+                    args=[self.item.id],
+                ),
+                data={"uploads": [{"key": good_key}, {"key": bad_key}]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["images"]), 1)
+        self.assertEqual(response.data["errors"][0]["index"], 1)
+        self.assertEqual(response.data["errors"][0]["code"], "image_moderation_rejected")
+        self.assertEqual(
+            list(self.item.images.values_list("pending_key", flat=True)), [good_key]
+        )
+        delete_mock.assert_called_once_with([bad_key])
+
+    def test_batch_upload_complete_over_limit_creates_nothing_and_cleans_uploads(self):
+        for index in range(7):
+            self._image(order=index)
+        self.client.force_authenticate(user=self.owner)
+        keys = [f"uploads/portfolio/{self.item.id}/work-{index}.jpg" for index in range(2)]
+
+        with (
+            patch("portfolio.image_views._get_s3_client", return_value=_s3_mock()),
+            patch("portfolio.image_views.delete_storage_keys") as delete_mock,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse(
+                        "accounts:portfolio_image_batch_upload_complete",
+                        args=[self.item.id],
+                    ),
+                    data={"uploads": [{"key": key} for key in keys]},
+                    format="json",
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.item.images.count(), 7)
+        delete_mock.assert_called_once_with(keys)
+
+    def test_batch_upload_complete_rejects_foreign_key_before_head_object(self):
+        self.client.force_authenticate(user=self.owner)
+        s3 = _s3_mock()
+
+        with patch("portfolio.image_views._get_s3_client", return_value=s3):
+            response = self.client.post(
+                reverse(
+                    "accounts:portfolio_image_batch_upload_complete",
+                    args=[self.item.id],
+                ),
+                data={
+                    "uploads": [
+                        {"key": f"uploads/portfolio/{self.item.id}/work.jpg"},
+                        {"key": "uploads/portfolio/999/work.jpg"},
+                    ]
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["index"], 1)
+        self.assertEqual(s3.head_object.call_count, 0)
+
+    def test_batch_upload_complete_enqueue_failure_rejects_whole_batch(self):
+        self.client.force_authenticate(user=self.owner)
+        keys = [f"uploads/portfolio/{self.item.id}/work-{index}.jpg" for index in range(2)]
+
+        with (
+            patch("portfolio.image_views._get_s3_client", return_value=_s3_mock()),
+            patch(
+                "swaply.tasks.portfolio_images.process_portfolio_image_batch.delay",
+                side_effect=RuntimeError("queue down"),
+            ),
+            patch("portfolio.image_views.delete_storage_keys") as delete_mock,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse(
+                        "accounts:portfolio_image_batch_upload_complete",
+                        args=[self.item.id],
+                    ),
+                    data={"uploads": [{"key": key} for key in keys]},
+                    format="json",
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            set(self.item.images.values_list("status", flat=True)),
+            {PortfolioImage.Status.REJECTED},
+        )
+        delete_mock.assert_called_once_with(keys)
+
 
 def _s3_mock(*, head=None):
     from unittest.mock import Mock
@@ -29,6 +29,16 @@ urlpatterns = [
         image_views.portfolio_image_upload_complete_view,
         name="portfolio_image_upload_complete",
     ),
+    path(
+        "portfolio/<int:item_id>/images/batch-upload-init/",
+        image_views.portfolio_image_batch_upload_init_view,
+        name="portfolio_image_batch_upload_init",
+    ),
+    path(
+        "portfolio/<int:item_id>/images/batch-upload-complete/",
+        image_views.portfolio_image_batch_upload_complete_view,
+        name="portfolio_image_batch_upload_complete",
+    ),
     path(
         "portfolio/images/local-upload/",
         local_upload_views.portfolio_image_local_upload_view,
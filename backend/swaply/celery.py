@@ -25,6 +25,9 @@ app.conf.imports = tuple(
             "swaply.tasks.notifications",
             "swaply.tasks.profile_visits",
             "swaply.tasks.feed_images",
+            "swaply.tasks.message_images",
+            "swaply.tasks.feed_counters",
+            "swaply.tasks.dashboard_recommendations",
         )
     )
 )
@@ -36,6 +39,15 @@ app.conf.beat_schedule = {
         "task": "accounts.tasks.recover_pending_bug_report_notifications_task",
         "schedule": crontab(minute="*/5"),
     },
+    # Dobehne e-maily z outboxu po výpadku brokera a po backoffe zlyhaných pokusov.
+    "send-pending-emails": {
+        "task": "accounts.tasks.send_pending_emails_task",
+        "schedule": crontab(minute="*"),
+    },
+    "purge-failed-emails-daily": {
+        "task": "accounts.tasks.purge_failed_emails_task",
+        "schedule": crontab(hour=3, minute=50),
+    },
     "purge-old-bug-reports-daily": {
         "task": "accounts.tasks.purge_old_bug_reports_task",
         "schedule": crontab(hour=3, minute=30),
@@ -49,4 +61,20 @@ app.conf.beat_schedule = {
         "task": "swaply.tasks.profile_visits.purge_old_profile_visits_task",
         "schedule": crontab(hour=3, minute=15),
     },
+    "reconcile-feed-counters-daily": {
+        "task": "swaply.tasks.feed_counters.reconcile_feed_counters_task",
+        "schedule": crontab(hour=3, minute=45),
+    },
+    "flush-profile-visits": {
+        "task": "swaply.tasks.profile_visits.flush_profile_visits_task",
+        "schedule": crontab(minute="*"),
+    },
+    "refresh-stale-dashboard-recommendations": {
+        "task": "swaply.tasks.dashboard_recommendations.refresh_stale_dashboard_recommendations_task",
+        "schedule": crontab(minute="*/5"),
+    },
+    "refresh-dashboard-recommendations-hourly": {
+        "task": "swaply.tasks.dashboard_recommendations.refresh_dashboard_recommendations_task",
+        "schedule": crontab(minute=20),
+    },
 }
@@ -0,0 +1,207 @@
+"""Doručenie chránených obrázkov z proxy views (portfólio, feed, správy).
+
+Views najprv overia prístup a až potom zavolajú ``protected_image_response``.
+Spôsob doručenia bajtov určuje ``settings.PROTECTED_IMAGE_DELIVERY``:
+
+* ``"stream"`` (default) – ``FileResponse`` zo storage; gunicorn worker drží
+  spojenie počas celého sťahovania zo S3. Fallback pre DEV/testy a pre prípad,
+  že storage nevie vydať podpísanú URL.
+* ``"accel"`` – prázdna odpoveď s ``X-Accel-Redirect``; bajty dotiahne nginx
+  z internej location (S3 cez krátko platnú podpísanú URL, lokálny FS cez
+  ``alias``). Klient internú cestu nikdy nevidí.
+* ``"redirect"`` – 302 na krátko platnú podpísanú S3 URL; bajty idú priamo
+  zo S3 do prehliadača.
+
+Bucket je privátny (bucket policy), takže aj accel mód ide cez podpísanú URL –
+nginx nemá vlastné AWS credentials.
+
+Kľúče variantov obsahujú náhodný hex (nový upload = nový kľúč), takže obsah pod
+kľúčom sa nemení. Silný ETag sa preto odvodí zo samotného kľúča a
+``If-None-Match`` sa vyhodnotí ešte pred akýmkoľvek prístupom do storage –
+revalidácia nestojí žiadny S3 request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mimetypes
+from typing import Optional
+from urllib.parse import quote, urlsplit
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseNotModified,
+    HttpResponseRedirect,
+)
+from django.utils.http import parse_etags
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_STREAM = "stream"
+DELIVERY_ACCEL = "accel"
+DELIVERY_REDIRECT = "redirect"
+DELIVERY_MODES = frozenset({DELIVERY_STREAM, DELIVERY_ACCEL, DELIVERY_REDIRECT})
+
+DEFAULT_CACHE_CONTROL = "private, max-age=3600"
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def delivery_mode() -> str:
+    mode = str(getattr(settings, "PROTECTED_IMAGE_DELIVERY", DELIVERY_STREAM) or "")
+    mode = mode.strip().lower()
+    return mode if mode in DELIVERY_MODES else DELIVERY_STREAM
+
+
+def _url_ttl_seconds() -> int:
+    return max(int(getattr(settings, "PROTECTED_IMAGE_URL_TTL_SECONDS", 300) or 0), 1)
+
+
+def guess_image_content_type(key: str) -> str:
+    content_type = mimetypes.guess_type(key or "")[0]
+    if content_type is None and (key or "").lower().endswith(".webp"):
+        content_type = "image/webp"
+    return content_type or "application/octet-stream"
+
+
+def image_etag(key: str) -> str:
+    """Silný ETag z storage kľúča (kľúč je interný – von ide len hash)."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH", "") if request is not None else ""
+    if not header:
+        return False
+    # If-None-Match používa slabé porovnanie – W/ prefix ignorujeme.
+    candidates = parse_etags(header)
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def _presigned_url(storage, key: str) -> Optional[str]:
+    """Podpísaná GET URL pre S3 storage, inak None.
+
+    Ide priamo cez boto klienta: default storage má ``AWS_QUERYSTRING_AUTH=False``
+    a pri ``AWS_S3_CUSTOM_DOMAIN`` by ``storage.url()`` vrátil nepodpísanú URL.
+    """
+    bucket_name = getattr(storage, "bucket_name", None)
+    if not bucket_name:
+        return None
+    normalize = getattr(storage, "_normalize_name", None)
+    name = normalize(key) if callable(normalize) else key
+    try:
+        return storage.bucket.meta.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket_name, "Key": name},
+            ExpiresIn=_url_ttl_seconds(),
+        )
+    except Exception:
+        logger.warning("Presigned image URL unavailable", exc_info=True)
+        return None
+
+
+def _filesystem_relative_path(storage, key: str) -> Optional[str]:
+    """Cesta kľúča voči MEDIA_ROOT pre lokálny FS storage, inak None."""
+    try:
+        # Remote storage (S3) path() nepodporuje – NotImplementedError.
+        storage.path(key)
+    except Exception:
+        return None
+    if not storage.exists(key):
+        return None
+    return key.lstrip("/")
+
+
+def _apply_image_headers(response, cache_control: str, etag: str):
+    response["Cache-Control"] = cache_control
+    response["ETag"] = etag
+    response["X-Content-Type-Options"] = "nosniff"
+    return response
+
+
+def _accel_response(
+    storage, key: str, cache_control: str, etag: str
+) -> Optional[HttpResponse]:
+    signed_url = _presigned_url(storage, key)
+    if signed_url:
+        parts = urlsplit(signed_url)
+        target = f"{settings.PROTECTED_IMAGE_ACCEL_S3_PREFIX}{parts.netloc}{parts.path}"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+    else:
+        relative_path = _filesystem_relative_path(storage, key)
+        if relative_path is None:
+            return None
+        target = f"{settings.PROTECTED_IMAGE_ACCEL_FILES_PREFIX}{quote(relative_path)}"
+
+    response = HttpResponse(content_type=guess_image_content_type(key))
+    response["X-Accel-Redirect"] = target
+    # nginx po redirecte ETag z tejto odpovede nepreberá – internal location ho
+    # znovu vyšle z X-Image-ETag (viď nginx.conf).
+    response["X-Image-ETag"] = etag
+    return _apply_image_headers(response, cache_control, etag)
+
+
+def _redirect_response(storage, key: str, etag: str) -> Optional[HttpResponseRedirect]:
+    signed_url = _presigned_url(storage, key)
+    if not signed_url:
+        return None
+    response = HttpResponseRedirect(signed_url)
+    # Presmerovanie sa smie cachovať len kratšie, než platí podpis.
+    return _apply_image_headers(
+        response, f"private, max-age={_url_ttl_seconds() // 2}", etag
+    )
+
+
+def _stream_response(
+    storage, key: str, cache_control: str, etag: str
+) -> Optional[FileResponse]:
+    try:
+        stored_file = storage.open(key, "rb")
+    except Exception:
+        return None
+    response = FileResponse(stored_file, content_type=guess_image_content_type(key))
+    return _apply_image_headers(response, cache_control, etag)
+
+
+def protected_image_response(
+    key: str,
+    *,
+    request=None,
+    storage=None,
+    immutable: bool = False,
+):
+    """Odpoveď s obrázkom pod ``key`` podľa nastaveného módu doručenia.
+
+    Volať až PO kontrole prístupu. Zhodný ``If-None-Match`` vráti 304 bez
+    dotyku storage. ``immutable=True`` pre schválené varianty (obsah pod
+    kľúčom sa už nezmení). Vracia None, ak súbor v storage nie je (volajúci
+    view vráti 404). Ak zvolený mód pre daný storage nejde (napr. redirect na
+    lokálnom FS), použije sa streamovanie.
+    """
+    if not key:
+        return None
+    etag = image_etag(key)
+    cache_control = IMMUTABLE_CACHE_CONTROL if immutable else DEFAULT_CACHE_CONTROL
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+        response["Cache-Control"] = cache_control
+        response["ETag"] = etag
+        return response
+
+    storage = storage or default_storage
+    mode = delivery_mode()
+    response = None
+    if mode == DELIVERY_ACCEL:
+        response = _accel_response(storage, key, cache_control, etag)
+    elif mode == DELIVERY_REDIRECT:
+        response = _redirect_response(storage, key, etag)
+    if response is not None:
+        return response
+    return _stream_response(storage, key, cache_control, etag)
@@ -2,8 +2,12 @@
 Zdieľaný util na odstránenie EXIF/metadát z nahraných obrázkov.
 
 GDPR: obrázky nahraté používateľom (správy, avatary) môžu obsahovať EXIF s GPS
-lokáciou. Metadáta odstránime re-enkódovaním cez Pillow (orientáciu „zapečieme"
-cez `exif_transpose` ešte pred stripom), takže uložený súbor už GPS neobsahuje.
+lokáciou. JPEG/PNG/WEBP čistíme na úrovni kontajnera – zahodíme APPn/COM
+segmenty, ancillary PNG chunky a RIFF EXIF/XMP chunky, pixelové dáta sa
+nedekódujú ani neprekódujú (bezstratové a rádovo rýchlejšie). Orientáciu JPEG
+zachováme minimálnym EXIF blokom len s tagom Orientation. Re-enkódovanie cez
+Pillow (`exif_transpose` + save) ostáva len ako fallback pre HEIF, poškodené či
+exotické vstupy a PNG/WEBP s netriviálnou EXIF orientáciou.
 
 Ponuky/portfólio EXIF neriešia tu – ich pipeline ukladá WebP cez `save()` bez
 `exif=`, čím sa metadáta zahodia automaticky.
@@ -13,6 +17,7 @@ from __future__ import annotations
 
 import io
 import logging
+import struct
 from pathlib import Path
 
 from django.core.files.base import ContentFile
@@ -22,6 +27,53 @@ logger = logging.getLogger(__name__)
 _JPEG_SOURCE_FORMATS = {"JPEG", "MPO"}
 _HEIF_SOURCE_FORMATS = {"HEIF", "HEIC"}
 
+_EXIF_ORIENTATION_TAG = 0x0112
+_EXIF_HEADER = b"Exif\x00\x00"
+
+_JPEG_SOI = b"\xff\xd8"
+_JPEG_EOI_MARKER = 0xD9
+_JPEG_SOS_MARKER = 0xDA
+_JPEG_APP1_MARKER = 0xE1
+_JPEG_COM_MARKER = 0xFE
+# APPn segmenty potrebné na správne vykreslenie (JFIF, ICC profil, Adobe
+# color transform pre CMYK/YCCK). Exif/XMP (APP1), IPTC (APP13), MPF a ostatné
+# APPn aj COM sa zahodia.
+_JPEG_KEEP_APP_PREFIXES = {
+    0xE0: (b"JFIF\x00",),
+    0xE2: (b"ICC_PROFILE\x00",),
+    0xEE: (b"Adobe",),
+}
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Kritické + farebné/priehľadnostné chunky a APNG. eXIf, tEXt/zTXt/iTXt (XMP),
+# tIME a neznáme ancillary chunky sa zahodia.
+_PNG_KEEP_CHUNKS = frozenset(
+    {
+        b"IHDR",
+        b"PLTE",
+        b"IDAT",
+        b"IEND",
+        b"tRNS",
+        b"gAMA",
+        b"cHRM",
+        b"sRGB",
+        b"iCCP",
+        b"sBIT",
+        b"pHYs",
+        b"bKGD",
+        b"acTL",
+        b"fcTL",
+        b"fdAT",
+    }
+)
+
+_WEBP_KEEP_CHUNKS = frozenset(
+    {b"VP8 ", b"VP8L", b"VP8X", b"ALPH", b"ANIM", b"ANMF", b"ICCP"}
+)
+_WEBP_IMAGE_CHUNKS = frozenset({b"VP8 ", b"VP8L", b"ANMF"})
+_WEBP_VP8X_EXIF_FLAG = 0x08
+_WEBP_VP8X_XMP_FLAG = 0x04
+
 
 def _register_heif_support() -> None:
     """Povoľ dekódovanie HEIC/HEIF ak je dostupný pillow-heif."""
@@ -40,9 +92,226 @@ def _normalize_for_jpeg(image):
     return image.convert("RGB")
 
 
+def _exif_orientation(payload: bytes) -> int:
+    """Orientation tag z EXIF bloku (s aj bez Exif hlavičky); poškodený EXIF = 1."""
+    try:
+        from PIL import Image
+
+        exif = Image.Exif()
+        exif.load(payload)
+        orientation = int(exif.get(_EXIF_ORIENTATION_TAG, 1) or 1)
+    except Exception:
+        return 1
+    return orientation if 1 <= orientation <= 8 else 1
+
+
+def _jpeg_orientation_segment(orientation: int) -> bytes:
+    """APP1 s minimálnym EXIF (big-endian TIFF, jeden IFD0 záznam Orientation)."""
+    tiff = (
+        b"MM\x00\x2a"
+        + struct.pack(">I", 8)
+        + struct.pack(">H", 1)
+        + struct.pack(">HHIHH", _EXIF_ORIENTATION_TAG, 3, 1, orientation, 0)
+        + struct.pack(">I", 0)
+    )
+    payload = _EXIF_HEADER + tiff
+    return bytes((0xFF, _JPEG_APP1_MARKER)) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _jpeg_scan_end(data: bytes, pos: int) -> int:
+    """Koniec entropy-coded dát za SOS (index nasledujúceho markera)."""
+    while True:
+        index = data.find(b"\xff", pos)
+        if index < 0 or index + 1 >= len(data):
+            raise ValueError("truncated JPEG scan")
+        following = data[index + 1]
+        # 0xFF00 = stuffed bajt, RSTn sú súčasť skenu, 0xFFFF = fill bajt.
+        if following == 0x00 or 0xD0 <= following <= 0xD7:
+            pos = index + 2
+        elif following == 0xFF:
+            pos = index + 1
+        else:
+            return index
+
+
+def _strip_jpeg(data: bytes) -> bytes:
+    out = [_JPEG_SOI]
+    insert_at = 1
+    orientation = 1
+    pos = 2
+    size = len(data)
+    while True:
+        if pos >= size or data[pos] != 0xFF:
+            raise ValueError("invalid JPEG marker")
+        while pos < size and data[pos] == 0xFF:
+            pos += 1
+        if pos >= size:
+            raise ValueError("truncated JPEG")
+        marker = data[pos]
+        pos += 1
+        if marker == _JPEG_EOI_MARKER:
+            # Všetko za prvým EOI (MPO snímky s vlastným EXIF, trailery
+            # výrobcov) sa zahodí.
+            out.append(bytes((0xFF, marker)))
+            break
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:
+            out.append(bytes((0xFF, marker)))
+            continue
+        if pos + 2 > size:
+            raise ValueError("truncated JPEG segment")
+        (length,) = struct.unpack(">H", data[pos : pos + 2])
+        if length < 2 or pos + length > size:
+            raise ValueError("invalid JPEG segment length")
+        payload = data[pos + 2 : pos + length]
+        segment = bytes((0xFF, marker)) + data[pos : pos + length]
+        pos += length
+
+        if marker == _JPEG_SOS_MARKER:
+            scan_end = _jpeg_scan_end(data, pos)
+            out.append(segment)
+            out.append(data[pos:scan_end])
+            pos = scan_end
+            continue
+        if 0xE0 <= marker <= 0xEF or marker == _JPEG_COM_MARKER:
+            if marker == _JPEG_APP1_MARKER and payload.startswith(_EXIF_HEADER):
+                if orientation == 1:
+                    orientation = _exif_orientation(payload)
+                continue
+            prefixes = _JPEG_KEEP_APP_PREFIXES.get(marker, ())
+            if not any(payload.startswith(prefix) for prefix in prefixes):
+                continue
+            out.append(segment)
+            if marker == 0xE0 and insert_at == len(out) - 1:
+                # EXIF APP1 patrí hneď za JFIF APP0.
+                insert_at = len(out)
+            continue
+        out.append(segment)
+
+    if orientation != 1:
+        out.insert(insert_at, _jpeg_orientation_segment(orientation))
+    return b"".join(out)
+
+
+def _strip_png(data: bytes) -> bytes:
+    out = [_PNG_SIGNATURE]
+    pos = len(_PNG_SIGNATURE)
+    size = len(data)
+    while pos + 12 <= size:
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        chunk_type = data[pos + 4 : pos + 8]
+        end = pos + 12 + length
+        if end > size:
+            raise ValueError("truncated PNG chunk")
+        if chunk_type == b"eXIf" and _exif_orientation(data[pos + 8 : pos + 8 + length]) != 1:
+            # Orientáciu PNG prehliadače nerešpektujú spoľahlivo – zapeč ju re-encode.
+            raise ValueError("PNG with EXIF orientation")
+        if chunk_type in _PNG_KEEP_CHUNKS:
+            # CRC ostáva platné – chunk kopírujeme bez zmeny.
+            out.append(data[pos:end])
+        pos = end
+        if chunk_type == b"IEND":
+            return b"".join(out)
+    raise ValueError("PNG without IEND")
+
+
+def _strip_webp(data: bytes) -> bytes:
+    (riff_size,) = struct.unpack("<I", data[4:8])
+    riff_end = min(len(data), 8 + riff_size)
+    chunks: list[bytes] = []
+    has_image = False
+    pos = 12
+    while pos + 8 <= riff_end:
+        fourcc = data[pos : pos + 4]
+        (chunk_size,) = struct.unpack("<I", data[pos + 4 : pos + 8])
+        payload_end = pos + 8 + chunk_size
+        if payload_end > riff_end:
+            raise ValueError("truncated WEBP chunk")
+        if fourcc == b"EXIF" and _exif_orientation(data[pos + 8 : payload_end]) != 1:
+            raise ValueError("WEBP with EXIF orientation")
+        if fourcc in _WEBP_KEEP_CHUNKS:
+            chunk = bytearray(data[pos:payload_end])
+            if chunk_size & 1:
+                chunk += b"\x00"
+            if fourcc == b"VP8X" and chunk_size >= 1:
+                chunk[8] &= ~(_WEBP_VP8X_EXIF_FLAG | _WEBP_VP8X_XMP_FLAG) & 0xFF
+            chunks.append(bytes(chunk))
+            has_image = has_image or fourcc in _WEBP_IMAGE_CHUNKS
+        pos = payload_end + (chunk_size & 1)
+    if not has_image:
+        raise ValueError("WEBP without image data")
+    body = b"WEBP" + b"".join(chunks)
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def _strip_container_metadata(data: bytes) -> tuple[bytes, str] | None:
+    """
+    Bezstratový strip bez dekódovania pixelov; vracia (bajty, prípona).
+
+    `None` = formát nie je podporovaný alebo kontajner nevieme bezpečne
+    prepísať – volajúci prejde na re-encode cez Pillow.
+    """
+    try:
+        if data.startswith(b"\xff\xd8\xff"):
+            return _strip_jpeg(data), ".jpg"
+        if data.startswith(_PNG_SIGNATURE):
+            return _strip_png(data), ".png"
+        if len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return _strip_webp(data), ".webp"
+    except (ValueError, struct.error) as exc:
+        logger.debug("Container metadata strip not possible (%s); re-encoding.", exc)
+    return None
+
+
+def _output_name(image, filename: str | None, suffix: str) -> str:
+    base = filename or getattr(image, "name", None) or "image"
+    stem = Path(base).stem or "image"
+    return f"{stem}{suffix}"
+
+
+def _reencode_without_metadata(image, *, filename: str | None = None):
+    """Fallback: dekóduj, zapeč orientáciu a ulož znova bez metadát."""
+    from PIL import Image, ImageOps
+
+    _register_heif_support()
+    image.seek(0)
+    with Image.open(image) as source:
+        source_format = (source.format or "").upper()
+        if source_format == "GIF":
+            return None
+
+        # Zapeč orientáciu z EXIF do pixelov, potom EXIF zahodíme.
+        oriented = ImageOps.exif_transpose(source)
+
+        # exif_transpose zapečie LEN orientáciu; zvyšok EXIF (vrátane GPS) aj
+        # XMP ostáva v oriented.info. PNG (eXIf chunk) aj WebP (exif/xmp) by ho
+        # pri save() zapísali späť do súboru, preto tieto PII-nesúce metadáta
+        # odstránime. JPEG ich pri save() bez exif= aj tak ignoruje.
+        oriented.info.pop("exif", None)
+        oriented.info.pop("xmp", None)
+
+        output = io.BytesIO()
+        if source_format in _JPEG_SOURCE_FORMATS or source_format in _HEIF_SOURCE_FORMATS:
+            _normalize_for_jpeg(oriented).save(output, format="JPEG", quality=90, optimize=True)
+            suffix = ".jpg"
+        elif source_format == "PNG":
+            oriented.save(output, format="PNG", optimize=True)
+            suffix = ".png"
+        elif source_format == "WEBP":
+            oriented.save(output, format="WEBP", quality=90, method=6)
+            suffix = ".webp"
+        else:
+            # Neznámy/nepodporovaný formát – radšej ponechaj originál.
+            return None
+
+        return ContentFile(output.getvalue(), name=_output_name(image, filename, suffix))
+
+
 def strip_image_metadata(image, *, filename: str | None = None):
     """
-    Re-enkóduj nahraný obrázok bez EXIF/metadát, so zachovaním orientácie.
+    Odstráň EXIF/XMP/metadáta z nahraného obrázka, so zachovaním orientácie.
+
+    JPEG/PNG/WEBP sa čistia bezstratovo na úrovni kontajnera; ostatné formáty
+    (HEIF, MPO bez platnej štruktúry, …) sa re-enkódujú cez Pillow.
 
     Vracia `ContentFile` pripravený na priradenie do `ImageField`, alebo `None`
     ak strip nie je možný/potrebný – vtedy volajúci ponechá originál (fail-open,
@@ -55,48 +324,14 @@ def strip_image_metadata(image, *, filename: str | None = None):
     if not image:
         return None
 
-    _register_heif_support()
     try:
-        from PIL import Image, ImageOps
-
         if hasattr(image, "seek"):
             image.seek(0)
-
-        with Image.open(image) as source:
-            source_format = (source.format or "").upper()
-            if source_format == "GIF":
-                return None
-
-            # Zapeč orientáciu z EXIF do pixelov, potom EXIF zahodíme.
-            oriented = ImageOps.exif_transpose(source)
-
-            # exif_transpose zapečie LEN orientáciu; zvyšok EXIF (vrátane GPS) aj
-            # XMP ostáva v oriented.info. PNG (eXIf chunk) aj WebP (exif/xmp) by ho
-            # pri save() zapísali späť do súboru, preto tieto PII-nesúce metadáta
-            # odstránime. JPEG ich pri save() bez exif= aj tak ignoruje.
-            oriented.info.pop("exif", None)
-            oriented.info.pop("xmp", None)
-
-            output = io.BytesIO()
-            if source_format in _JPEG_SOURCE_FORMATS or source_format in _HEIF_SOURCE_FORMATS:
-                _normalize_for_jpeg(oriented).save(
-                    output, format="JPEG", quality=90, optimize=True
-                )
-                suffix = ".jpg"
-            elif source_format == "PNG":
-                oriented.save(output, format="PNG", optimize=True)
-                suffix = ".png"
-            elif source_format == "WEBP":
-                oriented.save(output, format="WEBP", quality=90, method=6)
-                suffix = ".webp"
-            else:
-                # Neznámy/nepodporovaný formát – radšej ponechaj originál.
-                return None
-
-            output.seek(0)
-            base = filename or getattr(image, "name", None) or "image"
-            stem = Path(base).stem or "image"
-            return ContentFile(output.read(), name=f"{stem}{suffix}")
+        stripped = _strip_container_metadata(image.read())
+        if stripped is not None:
+            content, suffix = stripped
+            return ContentFile(content, name=_output_name(image, filename, suffix))
+        return _reencode_without_metadata(image, filename=filename)
     except Exception:
         logger.warning(
             "Image metadata strip failed; falling back to original.",
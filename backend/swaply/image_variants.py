@@ -0,0 +1,209 @@
+"""
+Zdieľaný engine na WEBP varianty obrázkov (portfólio, ponuky, feed).
+
+Pôvodne každá pipeline robila ``source.copy()`` + ``thumbnail`` pre každý
+variant zvlášť z plného zdroja a varianty enkódovala aj uploadovala sériovo.
+Na worker čase to bolo pri väčších fotkách najdrahšie, preto:
+
+* JPEG sa dekóduje v draft režime (DCT škálovanie libjpeg) rovno na najmenšiu
+  mierku, ktorá ešte pokryje najväčší variant,
+* varianty sa zmenšujú progresívne (large → medium → thumbnail, každý z
+  predchádzajúceho) s celočíselným ``Image.reduce`` pred LANCZOS resamplom,
+* enkódovanie aj upload variantov bežia súbežne v thread poole (Pillow aj
+  boto3 počas C/sieťovej práce púšťajú GIL).
+
+WEBP effort (``method`` 0–6) je nastaviteľný cez ``IMAGE_WEBP_METHOD``,
+počet vlákien cez ``IMAGE_VARIANT_WORKERS`` (1 = sériovo, napr. pri ladení).
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, NamedTuple, Sequence, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Pred finálnym LANCZOS resamplom necháme aspoň 2× rezervu – rovnaký princíp
+# ako ``reducing_gap`` v Pillow ``thumbnail``; kvalita je na oko nerozlíšiteľná.
+_REDUCING_GAP = 2
+
+_JPEG_SOURCE_FORMATS = {"JPEG", "MPO"}
+
+
+class VariantSpec(NamedTuple):
+    name: str
+    max_side: int
+
+
+class EncodedVariant(NamedTuple):
+    name: str
+    payload: bytes
+    size: tuple[int, int]
+
+
+def webp_method() -> int:
+    """WEBP effort (0 = najrýchlejšie, 6 = najmenší súbor), default 6."""
+    try:
+        method = int(os.getenv("IMAGE_WEBP_METHOD", "6"))
+    except ValueError:
+        return 6
+    return min(max(method, 0), 6)
+
+
+def variant_workers() -> int:
+    try:
+        workers = int(os.getenv("IMAGE_VARIANT_WORKERS", "3"))
+    except ValueError:
+        return 3
+    return max(workers, 1)
+
+
+def register_heif_support() -> None:
+    """Povoľ dekódovanie HEIC/HEIF ak je dostupný pillow-heif."""
+    try:
+        from pillow_heif import register_heif_opener
+
+        register_heif_opener()
+    except Exception:
+        return
+
+
+def normalize_image_mode(image):
+    """Vráť režim, ktorý Pillow spoľahlivo enkóduje do WEBP."""
+    if image.mode in ("RGB", "RGBA", "LA"):
+        return image
+    if image.mode == "P" and "transparency" in image.info:
+        return image.convert("RGBA")
+    return image.convert("RGB")
+
+
+def decode_image(raw_bytes: bytes, *, max_side: int | None = None):
+    """
+    Dekóduj nahrané bajty do orientovaného (``exif_transpose``) obrázka.
+
+    Pri JPEG zdroji a zadanom ``max_side`` sa použije draft režim – libjpeg
+    dekóduje rovno v 1/2, 1/4 alebo 1/8 mierke, no vždy aspoň na ``max_side``,
+    takže najväčší variant o nič nepríde.
+    """
+    from PIL import Image, ImageOps
+
+    register_heif_support()
+    with Image.open(io.BytesIO(raw_bytes)) as source:
+        if max_side and source.format in _JPEG_SOURCE_FORMATS:
+            source.draft(source.mode, (max_side, max_side))
+        source.load()
+        return ImageOps.exif_transpose(source).copy()
+
+
+def fit_within(image, max_side: int):
+    """Nová kópia obrázka zmenšená tak, aby dlhšia strana bola ≤ ``max_side``."""
+    from PIL import Image
+
+    width, height = image.size
+    longest = max(width, height)
+    if longest <= max_side:
+        return image.copy()
+
+    factor = longest // (max_side * _REDUCING_GAP)
+    if factor >= 2:
+        image = image.reduce(factor)
+        width, height = image.size
+        longest = max(width, height)
+
+    scale = max_side / longest
+    target = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(target, Image.Resampling.LANCZOS)
+
+
+def _strip_metadata(image) -> None:
+    # GDPR: explicitne zahoď EXIF/XMP (vrátane GPS) z info dictu pred uložením.
+    # Orientácia je už "zapečená" v pixeloch cez exif_transpose v decode_image.
+    # Save bez exif= síce metadáta nateraz nezapisuje (Pillow 10), ale novšie
+    # verzie ich vedia prevziať z im.info – tento pop to poistí naprieč verziami.
+    image.info.pop("exif", None)
+    image.info.pop("xmp", None)
+
+
+def encode_webp(image, *, quality: int, method: int | None = None) -> bytes:
+    output = io.BytesIO()
+    image.save(
+        output,
+        format="WEBP",
+        quality=quality,
+        method=webp_method() if method is None else method,
+    )
+    return output.getvalue()
+
+
+def _run_concurrently(func: Callable[[_T], _R], items: Sequence[_T]) -> list[_R]:
+    """``map`` cez thread pool; výsledky v poradí vstupu, prvá chyba prebuble."""
+    workers = min(variant_workers(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
+def render_variants(
+    source,
+    specs: Iterable[VariantSpec],
+    *,
+    quality: int,
+    method: int | None = None,
+) -> dict[str, EncodedVariant]:
+    """
+    Zmenši ``source`` na všetky ``specs`` a enkóduj ich do WEBP.
+
+    Zmenšovanie je progresívne od najväčšieho variantu (každý ďalší vzniká z
+    predchádzajúceho, nie z plného zdroja), enkódovanie beží súbežne.
+    Vracia ``{spec.name: EncodedVariant}``.
+    """
+    method = webp_method() if method is None else method
+    current = normalize_image_mode(source)
+    resized = []
+    for spec in sorted(specs, key=lambda spec: spec.max_side, reverse=True):
+        current = fit_within(current, spec.max_side)
+        _strip_metadata(current)
+        resized.append((spec.name, current))
+
+    def encode(item) -> EncodedVariant:
+        name, image = item
+        payload = encode_webp(image, quality=quality, method=method)
+        return EncodedVariant(name, payload, image.size)
+
+    return {variant.name: variant for variant in _run_concurrently(encode, resized)}
+
+
+def upload_variants(
+    items: Sequence[tuple[str, bytes]],
+    *,
+    upload: Callable[[str, bytes], None],
+    delete: Callable[[str], None],
+) -> list[str]:
+    """
+    Nahraj ``(key, payload)`` dvojice súbežne cez ``upload``.
+
+    Všetko-alebo-nič: ak ktorýkoľvek upload zlyhá, úspešne nahraté kľúče sa
+    zmažú cez ``delete`` a prvá chyba prebuble (Celery retry). Pri úspechu
+    vracia nahraté kľúče v poradí vstupu.
+    """
+
+    def upload_one(item) -> tuple[str, BaseException | None]:
+        key, payload = item
+        try:
+            upload(key, payload)
+        except Exception as exc:
+            return key, exc
+        return key, None
+
+    results = _run_concurrently(upload_one, list(items))
+    errors = [error for _key, error in results if error is not None]
+    uploaded_keys = [key for key, error in results if error is None]
+    if errors:
+        for key in uploaded_keys:
+            delete(key)
+        raise errors[0]
+    return uploaded_keys
@@ -2,11 +2,13 @@
 Rate limiting utilities pre Swaply
 """
 
+from datetime import datetime, timedelta
 from django.conf import settings
 from django.core.cache import cache
 from django.http import JsonResponse
 from django.utils import timezone
 from functools import wraps
+from typing import NamedTuple
 import hashlib
 import json
 import logging
@@ -30,114 +32,276 @@ class RateLimitExceeded(Throttled):
             self.code = code
 
 
-class RateLimiter:
-    """
-    Jednoduchý rate limiter používajúci Django cache
-    """
+class RateLimitDecision(NamedTuple):
+    """Výsledok jednej kontroly limitu – allowed/remaining/reset naraz."""
 
-    def __init__(self, max_attempts=5, window_minutes=15, block_minutes=60):
-        self.max_attempts = max_attempts
-        self.window_minutes = window_minutes
-        self.block_minutes = block_minutes
+    allowed: bool
+    remaining: int
+    reset_time: datetime | None
 
-    def get_key(self, identifier, action):
-        """
-        Generuje cache key pre rate limiting
-        """
-        # Hash slúži len na skrátenie cache key (nie na kryptografickú bezpečnosť).
-        return f"rate_limit:{action}:{hashlib.md5(identifier.encode(), usedforsecurity=False).hexdigest()}"
 
-    def is_allowed(self, identifier, action):
-        """
-        Kontroluje, či je akcia povolená
-        """
-        key = self.get_key(identifier, action)
+def _rate_limit_fail_open() -> bool:
+    return bool(getattr(settings, "RATE_LIMIT_FAIL_OPEN", settings.DEBUG))
+
+
+class CacheRateLimitBackend:
+    """
+    Fallback backend nad Django cache (locmem/dev): pickled dict
+    {"attempts", "first_attempt"} cez cache.get + cache.set. Nie je atomický –
+    súbežné požiadavky môžu stratiť inkrement; pre Redis sa používa
+    RedisRateLimitBackend.
+    """
+
+    def hit(self, key, *, max_attempts, window_seconds, block_seconds, action):
         try:
             data = cache.get(key, {"attempts": 0, "first_attempt": None})
         except Exception as e:
-            fail_open = bool(getattr(settings, "RATE_LIMIT_FAIL_OPEN", settings.DEBUG))
+            fail_open = _rate_limit_fail_open()
             logger.warning(
                 "Rate limiter cache.get failed",
                 extra={"fail_open": fail_open, "action": action},
                 exc_info=e,
             )
-            return fail_open
+            return RateLimitDecision(fail_open, max_attempts if fail_open else 0, None)
 
         now = timezone.now()
 
-        # Ak je prvý pokus, inicializuj
-        if data["first_attempt"] is None:
-            data["first_attempt"] = now
-            data["attempts"] = 1
-            try:
-                cache.set(key, data, timeout=self.window_minutes * 60)
-            except Exception as e:
-                logger.warning("Rate limiter cache.set failed (init)", exc_info=e)
-            return True
-
-        # Ak je okno vypršané, resetuj
-        if (now - data["first_attempt"]).total_seconds() > self.window_minutes * 60:
+        # Ak je prvý pokus alebo je okno vypršané, začni nové okno
+        if (
+            data["first_attempt"] is None
+            or (now - data["first_attempt"]).total_seconds() > window_seconds
+        ):
             data = {"attempts": 1, "first_attempt": now}
             try:
-                cache.set(key, data, timeout=self.window_minutes * 60)
+                cache.set(key, data, timeout=window_seconds)
             except Exception as e:
-                logger.warning(
-                    "Rate limiter cache.set failed (reset window)", exc_info=e
-                )
-            return True
+                logger.warning("Rate limiter cache.set failed (init)", exc_info=e)
+            return self._decision(True, data, max_attempts, window_seconds)
 
         # Ak je počet pokusov prekročený, zablokuj
-        if data["attempts"] >= self.max_attempts:
+        if data["attempts"] >= max_attempts:
             # Nastav dlhšie blokovanie
             try:
-                cache.set(key, data, timeout=self.block_minutes * 60)
+                cache.set(key, data, timeout=block_seconds)
             except Exception as e:
                 logger.warning("Rate limiter cache.set failed (block)", exc_info=e)
-            return False
+            return self._decision(False, data, max_attempts, window_seconds)
 
         # Inkrementuj počet pokusov
         data["attempts"] += 1
         try:
-            cache.set(key, data, timeout=self.window_minutes * 60)
+            cache.set(key, data, timeout=window_seconds)
         except Exception as e:
             logger.warning("Rate limiter cache.set failed (increment)", exc_info=e)
-        return True
+        return self._decision(True, data, max_attempts, window_seconds)
 
-    def get_remaining_attempts(self, identifier, action):
-        """
-        Vráti počet zostávajúcich pokusov
-        """
-        key = self.get_key(identifier, action)
+    def peek(self, key, *, max_attempts, window_seconds):
         try:
             data = cache.get(key, {"attempts": 0, "first_attempt": None})
         except Exception as e:
-            logger.warning("Rate limiter cache.get failed (remaining)", exc_info=e)
-            return self.max_attempts
+            logger.warning("Rate limiter cache.get failed (peek)", exc_info=e)
+            return RateLimitDecision(True, max_attempts, None)
 
         if data["first_attempt"] is None:
-            return self.max_attempts
+            return RateLimitDecision(True, max_attempts, None)
+        if (timezone.now() - data["first_attempt"]).total_seconds() > window_seconds:
+            # Okno vypršalo – reset_time ostáva pôvodný (historické správanie).
+            return RateLimitDecision(
+                True,
+                max_attempts,
+                data["first_attempt"] + timedelta(seconds=window_seconds),
+            )
+        return self._decision(
+            data["attempts"] < max_attempts, data, max_attempts, window_seconds
+        )
+
+    @staticmethod
+    def _decision(allowed, data, max_attempts, window_seconds):
+        return RateLimitDecision(
+            allowed,
+            max(0, max_attempts - data["attempts"]),
+            data["first_attempt"] + timedelta(seconds=window_seconds),
+        )
+
+
+# KEYS[1] = počítadlo; ARGV = max_attempts, window_ms.
+# Okno začína prvým pokusom (rovnako ako cache backend); po vyčerpaní sa ďalšie
+# pokusy nepočítajú a blok končí spolu s oknom. Vracia {allowed, remaining, pttl}.
+_REDIS_HIT_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current >= limit then
+  return {0, 0, redis.call('PTTL', KEYS[1])}
+end
+current = redis.call('INCR', KEYS[1])
+local ttl = redis.call('PTTL', KEYS[1])
+if current == 1 or ttl < 0 then
+  redis.call('PEXPIRE', KEYS[1], window_ms)
+  ttl = window_ms
+end
+return {1, limit - current, ttl}
+"""
 
-        now = timezone.now()
-        if (now - data["first_attempt"]).total_seconds() > self.window_minutes * 60:
-            return self.max_attempts
 
-        return max(0, self.max_attempts - data["attempts"])
+class RedisRateLimitBackend:
+    """
+    Atomický backend: jeden Lua skript (EVALSHA) na kontrolu = jeden round-trip,
+    bez lost-update race pri súbežných požiadavkách. Počítadlo je čistý Redis
+    integer pod vlastným kľúčom (``<key>:n`` s KEY_PREFIX cache), takže sa
+    nebije so starými pickled dict záznamami cache backendu.
+    """
 
-    def get_reset_time(self, identifier, action):
-        """
-        Vráti čas, kedy sa rate limit resetuje
-        """
-        key = self.get_key(identifier, action)
+    def __init__(self, client=None):
+        self._client = client
+        self._script = None
+
+    def _get_client(self):
+        if self._client is None:
+            from django_redis import get_redis_connection
+
+            self._client = get_redis_connection("default")
+        return self._client
+
+    def _get_script(self):
+        if self._script is None:
+            self._script = self._get_client().register_script(_REDIS_HIT_SCRIPT)
+        return self._script
+
+    @staticmethod
+    def counter_key(key):
+        return cache.make_key(f"{key}:n")
+
+    @staticmethod
+    def _reset_time(pttl):
         try:
-            data = cache.get(key, {"attempts": 0, "first_attempt": None})
-        except Exception as e:
-            logger.warning("Rate limiter cache.get failed (reset_time)", exc_info=e)
+            pttl = int(pttl)
+        except (TypeError, ValueError):
             return None
-
-        if data["first_attempt"] is None:
+        if pttl <= 0:
             return None
+        return timezone.now() + timedelta(milliseconds=pttl)
+
+    def hit(self, key, *, max_attempts, window_seconds, block_seconds, action):
+        try:
+            allowed, remaining, pttl = self._get_script()(
+                keys=[self.counter_key(key)],
+                args=[int(max_attempts), max(1, int(window_seconds * 1000))],
+            )
+        except Exception as e:
+            fail_open = _rate_limit_fail_open()
+            logger.warning(
+                "Rate limiter redis script failed",
+                extra={"fail_open": fail_open, "action": action},
+                exc_info=e,
+            )
+            return RateLimitDecision(fail_open, max_attempts if fail_open else 0, None)
+        return RateLimitDecision(
+            bool(int(allowed)), max(0, int(remaining)), self._reset_time(pttl)
+        )
+
+    def peek(self, key, *, max_attempts, window_seconds):
+        counter_key = self.counter_key(key)
+        try:
+            pipe = self._get_client().pipeline(transaction=False)
+            pipe.get(counter_key)
+            pipe.pttl(counter_key)
+            raw_count, pttl = pipe.execute()
+        except Exception as e:
+            logger.warning("Rate limiter redis peek failed", exc_info=e)
+            return RateLimitDecision(True, max_attempts, None)
+        attempts = int(raw_count or 0)
+        return RateLimitDecision(
+            attempts < max_attempts,
+            max(0, max_attempts - attempts),
+            self._reset_time(pttl) if attempts else None,
+        )
+
+
+_cache_backend = CacheRateLimitBackend()
+_redis_backend = None
+
+
+def get_rate_limit_backend():
+    """
+    Backend podľa ``settings.RATE_LIMIT_BACKEND``: ``"redis"``, ``"cache"`` alebo
+    ``"auto"`` (default) – Redis, ak default cache beží na django_redis, inak
+    cache-dict fallback (locmem/sqlite dev).
+    """
+    global _redis_backend
+
+    choice = str(getattr(settings, "RATE_LIMIT_BACKEND", "auto") or "auto").lower()
+    if choice == "auto":
+        cache_backend = str(
+            (getattr(settings, "CACHES", {}) or {}).get("default", {}).get("BACKEND", "")
+        )
+        choice = "redis" if cache_backend.startswith("django_redis.") else "cache"
+    if choice != "redis":
+        return _cache_backend
+    if _redis_backend is None:
+        _redis_backend = RedisRateLimitBackend()
+    return _redis_backend
+
+
+class RateLimiter:
+    """
+    Rate limiter nad pluggable backendom (atomický Redis / Django cache fallback)
+    """
+
+    def __init__(
+        self, max_attempts=5, window_minutes=15, block_minutes=60, backend=None
+    ):
+        self.max_attempts = max_attempts
+        self.window_minutes = window_minutes
+        self.block_minutes = block_minutes
+        self.backend = backend
 
-        return data["first_attempt"] + timezone.timedelta(minutes=self.window_minutes)
+    def _backend(self):
+        return self.backend or get_rate_limit_backend()
+
+    def get_key(self, identifier, action):
+        """
+        Generuje cache key pre rate limiting
+        """
+        # Hash slúži len na skrátenie cache key (nie na kryptografickú bezpečnosť).
+        return f"rate_limit:{action}:{hashlib.md5(identifier.encode(), usedforsecurity=False).hexdigest()}"
+
+    def check(self, identifier, action) -> RateLimitDecision:
+        """
+        Zaznamená pokus a vráti allowed/remaining/reset v jednom kroku
+        """
+        return self._backend().hit(
+            self.get_key(identifier, action),
+            max_attempts=self.max_attempts,
+            window_seconds=self.window_minutes * 60,
+            block_seconds=self.block_minutes * 60,
+            action=action,
+        )
+
+    def is_allowed(self, identifier, action):
+        """
+        Kontroluje, či je akcia povolená
+        """
+        return self.check(identifier, action).allowed
+
+    def _peek(self, identifier, action) -> RateLimitDecision:
+        return self._backend().peek(
+            self.get_key(identifier, action),
+            max_attempts=self.max_attempts,
+            window_seconds=self.window_minutes * 60,
+        )
+
+    def get_remaining_attempts(self, identifier, action):
+        """
+        Vráti počet zostávajúcich pokusov
+        """
+        return self._peek(identifier, action).remaining
+
+    def get_reset_time(self, identifier, action):
+        """
+        Vráti čas, kedy sa rate limit resetuje
+        """
+        return self._peek(identifier, action).reset_time
 
 
 def rate_limit(
@@ -219,7 +383,8 @@ def rate_limit(
 
             # Timing: rate limiting overhead (cache/redis) per request
             _t0_rl = time.perf_counter()
-            if not limiter.is_allowed(identifier, action):
+            decision = limiter.check(identifier, action)
+            if not decision.allowed:
                 _rl_ms = (time.perf_counter() - _t0_rl) * 1000.0
                 try:
                     st = getattr(request, "_server_timing", None)
@@ -229,8 +394,8 @@ def rate_limit(
                     request._server_timing = st
                 except Exception:
                     pass
-                remaining = limiter.get_remaining_attempts(identifier, action)
-                reset_time = limiter.get_reset_time(identifier, action)
+                remaining = decision.remaining
+                reset_time = decision.reset_time
 
                 logger.warning(
                     f"Rate limit exceeded for {identifier} on action {action}",
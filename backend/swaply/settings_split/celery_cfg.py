@@ -1,5 +1,6 @@
 import os
 
+from .env import sys
 from .security import DEBUG
 
 
@@ -16,3 +17,19 @@ CELERY_RESULT_SERIALIZER = "json"
 # Safer defaults for production: don't block web on task failures.
 CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "0") in ("1", "true", "yes", "on")
 CELERY_TASK_EAGER_PROPAGATES = bool(DEBUG)
+
+# Spracovanie obrázkov v správach (EXIF strip + thumbnail) po commite:
+# "celery" = task na workeri, "inline" = v tom istom procese (testy/DEV bez workera).
+MESSAGE_IMAGE_PROCESSING = os.getenv("MESSAGE_IMAGE_PROCESSING") or (
+    "inline" if ("test" in sys.argv or "pytest" in sys.modules) else "celery"
+)
+
+# Odosielanie e-mailov z EmailOutbox po commite (rovnaké režimy ako vyššie).
+EMAIL_OUTBOX_DELIVERY = os.getenv("EMAIL_OUTBOX_DELIVERY") or (
+    "inline" if ("test" in sys.argv or "pytest" in sys.modules) else "celery"
+)
+
+# Prepočet zastaraných dashboard odporúčaní viewera po commite (rovnaké režimy).
+DASHBOARD_RECOMMENDATIONS_REFRESH = os.getenv("DASHBOARD_RECOMMENDATIONS_REFRESH") or (
+    "inline" if ("test" in sys.argv or "pytest" in sys.modules) else "celery"
+)
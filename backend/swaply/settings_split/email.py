@@ -52,6 +52,20 @@ if BUG_REPORT_NOTIFICATION_STALE_CLAIM_SECONDS < 60:
         "BUG_REPORT_NOTIFICATION_STALE_CLAIM_SECONDS must be at least 60"
     )
 
+# Transakčné e-maily (EmailOutbox): veľkosť dávky na jedno spojenie a počet
+# pokusov s exponenciálnym odstupom, kým sa riadok označí ako zlyhaný.
+try:
+    EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+    EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "10"))
+except ValueError as exc:
+    raise ValueError(
+        "EMAIL_OUTBOX_BATCH_SIZE and EMAIL_OUTBOX_MAX_ATTEMPTS must be integers"
+    ) from exc
+if EMAIL_OUTBOX_BATCH_SIZE < 1 or EMAIL_OUTBOX_MAX_ATTEMPTS < 1:
+    raise ValueError(
+        "EMAIL_OUTBOX_BATCH_SIZE and EMAIL_OUTBOX_MAX_ATTEMPTS must be positive"
+    )
+
 _configured_bug_report_origin = (
     os.getenv("BUG_REPORT_ADMIN_ORIGIN") or os.getenv("BACKEND_ORIGIN") or ""
 ).strip()
@@ -11,3 +11,13 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Doručenie chránených obrázkov (portfólio/feed/správy), viď swaply/image_delivery.py:
+# "stream" (FileResponse cez Django), "accel" (X-Accel-Redirect na internú nginx
+# location) alebo "redirect" (302 na krátko platnú podpísanú S3 URL).
+PROTECTED_IMAGE_DELIVERY = os.getenv("PROTECTED_IMAGE_DELIVERY", "stream")
+PROTECTED_IMAGE_URL_TTL_SECONDS = int(os.getenv("PROTECTED_IMAGE_URL_TTL_SECONDS", "300"))
+PROTECTED_IMAGE_ACCEL_S3_PREFIX = os.getenv("PROTECTED_IMAGE_ACCEL_S3_PREFIX", "/_protected_s3/")
+PROTECTED_IMAGE_ACCEL_FILES_PREFIX = os.getenv(
+    "PROTECTED_IMAGE_ACCEL_FILES_PREFIX", "/_protected_files/"
+)
@@ -22,3 +22,9 @@ WEB_PUSH_MESSAGES_ROLLOUT_PERCENT = _env_rollout_percent(
     "WEB_PUSH_MESSAGES_ROLLOUT_PERCENT",
     100,
 )
+# Concurrent delivery: bounded worker pool per task + keep-alive session per
+# push-service origin (accounts.services.webpush_delivery).
+WEB_PUSH_DELIVERY_MAX_WORKERS = int(os.getenv("WEB_PUSH_DELIVERY_MAX_WORKERS", "8"))
+WEB_PUSH_REQUEST_TIMEOUT_SECONDS = float(
+    os.getenv("WEB_PUSH_REQUEST_TIMEOUT_SECONDS", "10")
+)
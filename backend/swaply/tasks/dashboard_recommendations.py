@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+from django.core.management import call_command
+
+logger = logging.getLogger(__name__)
+
+# Viewerov na jeden subtask hodinového prepočtu.
+REFRESH_CHUNK_SIZE = 200
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=300,
+)
+def refresh_stale_dashboard_recommendations_task(self) -> None:
+    """
+    Častá údržba: prepočíta odporúčania, ktoré signály označili ako zastarané
+    (zmena ponúk/lokality viewera) – manage.py precompute_dashboard_recommendations
+    --stale-only.
+    """
+    logger.info("refresh_stale_dashboard_recommendations_task: starting")
+    call_command("precompute_dashboard_recommendations", "--stale-only")
+    logger.info("refresh_stale_dashboard_recommendations_task: finished")
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=60,
+)
+def refresh_viewer_dashboard_recommendations_task(self, viewer_user_id: int) -> None:
+    """
+    Prepočet zoznamu jedného viewera po zmene jeho ponúk/lokality (naplánuje
+    signál po commite). Už obnovený zoznam preskočí.
+    """
+    from accounts.views.dashboard_views.recommendations import (
+        refresh_stale_dashboard_recommendations,
+    )
+
+    refresh_stale_dashboard_recommendations(int(viewer_user_id))
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=300,
+)
+def refresh_dashboard_recommendations_chunk_task(self, viewer_user_ids: list[int]) -> int:
+    """Prepočet jednej dávky viewerov z hodinového fan-outu."""
+    from django.contrib.auth import get_user_model
+
+    from accounts.views.dashboard_views.recommendations import (
+        precompute_dashboard_recommendations,
+    )
+
+    users = get_user_model().objects.filter(
+        pk__in=[int(user_id) for user_id in viewer_user_ids], is_active=True
+    )
+    refreshed = 0
+    for user in users.order_by("pk"):
+        precompute_dashboard_recommendations(user)
+        refreshed += 1
+    return refreshed
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=300,
+)
+def refresh_dashboard_recommendations_task(self) -> int:
+    """
+    Hodinový plný prepočet pre aktívnych používateľov – nové ponuky ostatných
+    sa tak dostanú do predpočítaných zoznamov.
+
+    Task len rozdelí viewerov do dávok po REFRESH_CHUNK_SIZE a každú pošle ako
+    samostatný subtask – prepočet sa rozloží medzi workery a zlyhanie/time limit
+    jednej dávky neruší zvyšok. Vracia počet naplánovaných dávok.
+    """
+    from accounts.views.dashboard_views.recommendations import (
+        dashboard_recommendation_viewer_ids,
+    )
+
+    viewer_ids = dashboard_recommendation_viewer_ids()
+    chunks = 0
+    for start in range(0, len(viewer_ids), REFRESH_CHUNK_SIZE):
+        refresh_dashboard_recommendations_chunk_task.delay(
+            viewer_ids[start : start + REFRESH_CHUNK_SIZE]
+        )
+        chunks += 1
+    logger.info(
+        "refresh_dashboard_recommendations_task: dispatched %s chunks for %s viewers",
+        chunks,
+        len(viewer_ids),
+    )
+    return chunks
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+from django.core.management import call_command
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=300,
+)
+def reconcile_feed_counters_task(self) -> None:
+    """
+    Nočná údržba: prepočíta denormalizované FeedPost.likes_count/comments_count
+    (manage.py reconcile_feed_counters) – oprava driftu po zásahoch mimo API.
+
+    Odolnosť: autoretry_for + retry_backoff (max 3×), time_limit=300s.
+    """
+    logger.info("reconcile_feed_counters_task: starting scheduled reconcile")
+    call_command("reconcile_feed_counters")
+    logger.info("reconcile_feed_counters_task: finished")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from messaging.services.message_images import (
+    mark_message_image_processing_failed,
+    process_message_image_record,
+)
+
+logger = logging.getLogger(__name__)
+
+_MAX_RETRIES = 5
+
+
+def _is_final_attempt(task) -> bool:
+    """True na poslednom pokuse – vzor swaply.tasks.feed_images."""
+    retries = getattr(getattr(task, "request", None), "retries", None)
+    return isinstance(retries, int) and retries >= _MAX_RETRIES
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": _MAX_RETRIES},
+    soft_time_limit=60,
+    time_limit=90,
+)
+def process_message_image(self, message_id: int) -> None:
+    """EXIF strip + thumbnail obrázka správy mimo zámku konverzácie."""
+    try:
+        process_message_image_record(message_id)
+    except Exception:
+        # Po vyčerpaní retries by správa ostala navždy PROCESSING a originál
+        # s metadátami v storage – na poslednom pokuse označ FAILED a zmaž ho.
+        if _is_final_attempt(self):
+            mark_message_image_processing_failed(message_id)
+        raise
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import io
+import logging
 import os
 from datetime import datetime, timezone
 
 import boto3
 from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
 from django.conf import settings
 from django.db import transaction
 
@@ -13,8 +15,11 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 
 from accounts.models import OfferedSkillImage
 from swaply.image_moderation import check_image_safety
+from swaply.image_variants import VariantSpec, decode_image, render_variants
 from swaply.staged_image_moderation import IMAGE_MODERATION_REJECTED_CODE
 
+logger = logging.getLogger(__name__)
+
 
 def _s3_client():
     return boto3.client(
@@ -42,6 +47,63 @@ def _now():
     time_limit=150,
 )
 def process_offered_skill_image(self, offered_skill_image_id: int) -> None:
+    """Retrying wrapper around the offer image pipeline."""
+    _process_offered_skill_image(offered_skill_image_id)
+
+
+@shared_task(
+    bind=True,
+    # Celá dávka (max 6 obrázkov z batch upload-complete) v jednom behu.
+    soft_time_limit=600,
+    time_limit=660,
+)
+def process_offered_skill_image_batch(self, offered_skill_image_ids: list[int]) -> None:
+    """
+    Process a batch of offer images with one S3 client.
+
+    The batch itself is not retried (finished images would be redone): an image
+    that fails is handed to `process_offered_skill_image` with its own retries,
+    and on the soft time limit all remaining images are handed over as well.
+    """
+    image_ids = [int(image_id) for image_id in offered_skill_image_ids]
+    try:
+        s3 = _s3_client()
+    except Exception:
+        # Each image creates its own client (and fails individually if it must).
+        logger.warning("Offer image batch could not create S3 client", exc_info=True)
+        s3 = None
+    for index, image_id in enumerate(image_ids):
+        try:
+            _process_offered_skill_image(image_id, s3=s3)
+        except SoftTimeLimitExceeded:
+            logger.warning(
+                "Offer image batch hit soft time limit; handing off remaining images",
+                extra={"offered_skill_image_ids": image_ids[index:]},
+            )
+            for remaining_id in image_ids[index:]:
+                _hand_off_offered_skill_image(remaining_id)
+            return
+        except Exception as exc:
+            logger.warning(
+                "Offer image batch item failed; retrying individually",
+                extra={"offered_skill_image_id": image_id, "error": str(exc)},
+            )
+            _hand_off_offered_skill_image(image_id)
+
+
+def _hand_off_offered_skill_image(offered_skill_image_id: int) -> None:
+    # One broker hiccup must not drop the rest of the hand-offs; an image that
+    # cannot be enqueued stays PENDING for reprocess_pending_offer_images.
+    try:
+        process_offered_skill_image.delay(offered_skill_image_id)
+    except Exception:
+        logger.exception(
+            "Offer image could not be handed off; left pending",
+            extra={"offered_skill_image_id": offered_skill_image_id},
+        )
+
+
+def _process_offered_skill_image(offered_skill_image_id: int, *, s3=None) -> None:
     """
     Background pipeline:
     - download from S3 `uploads/`
@@ -69,33 +131,18 @@ def process_offered_skill_image(self, offered_skill_image_id: int) -> None:
         if not pending_key:
             raise RuntimeError("pending_key missing")
 
-    s3 = _s3_client()
+    s3 = s3 or _s3_client()
     obj = s3.get_object(Bucket=bucket, Key=pending_key)
     raw_bytes = obj["Body"].read()
 
-    # Decode/convert with Pillow (HEIC support via pillow-heif if installed)
-    from PIL import Image, ImageOps
+    max_side = int(os.getenv("OFFER_IMAGE_MAX_SIDE", "1600"))
+    quality = int(os.getenv("OFFER_IMAGE_WEBP_QUALITY", "82"))
 
+    # Decode with Pillow (HEIC support via pillow-heif if installed). EXIF
+    # orientation is baked into pixels before resizing, so portrait photos
+    # (including ones rotated in desktop editors) don't rely on EXIF.
     try:
-        from pillow_heif import register_heif_opener
-
-        register_heif_opener()
-    except Exception:
-        # If pillow-heif/libheif isn't available, HEIC will fail on Image.open -> handled below.
-        pass
-
-    try:
-        pil = Image.open(io.BytesIO(raw_bytes))
-        pil.load()
-
-        # Normalize orientation based on EXIF before any resizing/conversion.
-        # This makes sure portrait photos (including ones rotated in desktop editors)
-        # are stored "physically" in the correct orientation and do not rely on EXIF.
-        try:
-            pil = ImageOps.exif_transpose(pil)
-        except Exception:
-            # If EXIF is missing or Pillow can't transpose, keep original.
-            pass
+        pil = decode_image(raw_bytes, max_side=max_side)
     except Exception:
         with transaction.atomic():
             img = OfferedSkillImage.objects.select_for_update().get(id=offered_skill_image_id)
@@ -110,19 +157,11 @@ def process_offered_skill_image(self, offered_skill_image_id: int) -> None:
             pass
         return
 
-    # Normalize color mode for output
-    if pil.mode not in ("RGB", "RGBA"):
-        pil = pil.convert("RGB")
-
-    # Create one "display" variant (kept simple; can add more sizes later)
-    max_side = int(os.getenv("OFFER_IMAGE_MAX_SIDE", "1600"))
-    pil.thumbnail((max_side, max_side))
-
-    # Encode to WebP (good balance of size/quality)
-    out = io.BytesIO()
-    quality = int(os.getenv("OFFER_IMAGE_WEBP_QUALITY", "82"))
-    pil.save(out, format="WEBP", quality=quality, method=6)
-    processed_bytes = out.getvalue()
+    # One "display" variant (kept simple; can add more sizes via the shared engine)
+    display = render_variants(
+        pil, (VariantSpec("display", max_side),), quality=quality
+    )["display"]
+    processed_bytes = display.payload
 
     # SafeSearch on processed bytes (avoids format incompatibilities).
     # ValidationError with code='image_moderation_rejected' = content violation → REJECTED, no retry.
@@ -154,6 +193,8 @@ def process_offered_skill_image(self, offered_skill_image_id: int) -> None:
         key_base,
         ExtraArgs={
             "ContentType": "image/webp",
+            # Verejná URL s náhodným hex kľúčom – obsah sa pod ňou nikdy nezmení.
+            "CacheControl": "public, max-age=31536000, immutable",
         },
     )
 
@@ -163,7 +204,7 @@ def process_offered_skill_image(self, offered_skill_image_id: int) -> None:
     except Exception:
         pass
 
-    width, height = pil.size
+    width, height = display.size
     with transaction.atomic():
         img = OfferedSkillImage.objects.select_for_update().get(id=offered_skill_image_id)
         img.status = OfferedSkillImage.Status.APPROVED
@@ -6,8 +6,12 @@ logger = logging.getLogger(__name__)
 
 try:
     from celery import shared_task
+    from celery.exceptions import SoftTimeLimitExceeded
 except ModuleNotFoundError:
 
+    class SoftTimeLimitExceeded(Exception):
+        pass
+
     def shared_task(*decorator_args, **decorator_kwargs):
         def decorator(func):
             class FallbackTask:
@@ -33,6 +37,8 @@ from portfolio.image_processing import (  # noqa: E402
     mark_processing_failed,
     process_portfolio_image_record,
 )
+from portfolio.image_storage import get_s3_client  # noqa: E402
+from portfolio.local_upload import local_portfolio_upload_enabled  # noqa: E402
 
 _MAX_RETRIES = 5
 
@@ -70,3 +76,41 @@ def process_portfolio_image(self, portfolio_image_id: int) -> None:
         if _is_final_attempt(self):
             mark_processing_failed(portfolio_image_id)
         raise
+
+
+@shared_task(
+    bind=True,
+    # Celá dávka (max 8 fotiek z batch upload-complete) v jednom behu.
+    soft_time_limit=600,
+    time_limit=660,
+)
+def process_portfolio_image_batch(self, portfolio_image_ids: list[int]) -> None:
+    """
+    Spracuje dávku fotiek jedným S3 klientom.
+
+    Dávka sa neretryuje ako celok (hotové fotky by sa spracovali znova):
+    fotka, ktorá zlyhá, prejde na samostatný `process_portfolio_image` s vlastnými
+    retries a final-failure cleanupom. Pri soft time limite sa tak odovzdajú
+    aj všetky ešte nespracované fotky.
+    """
+    image_ids = [int(image_id) for image_id in portfolio_image_ids]
+    s3 = None
+    if not local_portfolio_upload_enabled():
+        try:
+            s3 = get_s3_client()
+        except Exception:
+            # Každá fotka si klienta vytvorí sama (a prípadne zlyhá jednotlivo).
+            logger.warning("Portfolio image batch could not create S3 client", exc_info=True)
+    for index, image_id in enumerate(image_ids):
+        try:
+            process_portfolio_image_record(image_id, s3=s3)
+        except SoftTimeLimitExceeded:
+            for remaining_id in image_ids[index:]:
+                process_portfolio_image.delay(remaining_id)
+            return
+        except Exception as exc:
+            logger.warning(
+                "Portfolio image batch item failed; retrying individually",
+                extra={"portfolio_image_id": image_id, "error": str(exc)},
+            )
+            process_portfolio_image.delay(image_id)
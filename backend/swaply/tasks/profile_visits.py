@@ -28,3 +28,24 @@ def purge_old_profile_visits_task(self) -> None:
     logger.info("purge_old_profile_visits_task: starting scheduled purge")
     call_command("purge_old_profile_visits", "--execute", "--confirm")
     logger.info("purge_old_profile_visits_task: finished")
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    time_limit=120,
+)
+def flush_profile_visits_task(self) -> None:
+    """
+    Write-behind flush: zapíše návštevy profilu z Redis bufferu do DB
+    (accounts.services.profile_visits.flush_buffered_profile_visits).
+
+    Pri zlyhaní zápisu dávka ostáva v bufferi a autoretry to skúsi znova.
+    """
+    from accounts.services.profile_visits import flush_buffered_profile_visits
+
+    flushed = flush_buffered_profile_visits()
+    if flushed:
+        logger.info("flush_profile_visits_task: flushed %s visits", flushed)
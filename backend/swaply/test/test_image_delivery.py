@@ -0,0 +1,175 @@
+"""Testy pre módy doručenia chránených obrázkov (swaply.image_delivery)."""
+
+import io
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import RequestFactory, override_settings
+
+from swaply.image_delivery import image_etag, protected_image_response
+
+_SIGNED_URL = (
+    "https://swaply-media.s3.eu-central-1.amazonaws.com/media/portfolio/1/x-large.webp"
+    "?X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Expires=300&X-Amz-Signature=abc"
+)
+
+
+class _FakePresignClient:
+    def __init__(self):
+        self.calls = []
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.calls.append((operation, Params, ExpiresIn))
+        return _SIGNED_URL
+
+
+class _FakeS3Storage:
+    """Minimum rozhrania S3Boto3Storage, ktoré helper používa."""
+
+    bucket_name = "swaply-media"
+
+    def __init__(self):
+        self.client = _FakePresignClient()
+        self.bucket = type("Bucket", (), {"meta": type("Meta", (), {"client": self.client})})
+        self.opened = []
+
+    def _normalize_name(self, name):
+        return name
+
+    def open(self, name, mode="rb"):
+        self.opened.append(name)
+        return io.BytesIO(b"webp-bytes")
+
+
+def test_stream_mode_is_default_and_keeps_headers():
+    storage = _FakeS3Storage()
+
+    response = protected_image_response("media/portfolio/1/x-large.webp", storage=storage)
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"webp-bytes"
+    assert response["Content-Type"] == "image/webp"
+    assert response["Cache-Control"] == "private, max-age=3600"
+    assert response["X-Content-Type-Options"] == "nosniff"
+    assert storage.client.calls == []
+
+
+@override_settings(PROTECTED_IMAGE_DELIVERY="redirect", PROTECTED_IMAGE_URL_TTL_SECONDS=300)
+def test_redirect_mode_returns_short_lived_presigned_302():
+    storage = _FakeS3Storage()
+
+    response = protected_image_response("media/portfolio/1/x-large.webp", storage=storage)
+
+    assert response.status_code == 302
+    assert response["Location"] == _SIGNED_URL
+    assert response["Cache-Control"] == "private, max-age=150"
+    assert storage.opened == []
+    assert storage.client.calls == [
+        (
+            "get_object",
+            {"Bucket": "swaply-media", "Key": "media/portfolio/1/x-large.webp"},
+            300,
+        )
+    ]
+
+
+@override_settings(PROTECTED_IMAGE_DELIVERY="accel")
+def test_accel_mode_hands_presigned_s3_fetch_to_nginx():
+    storage = _FakeS3Storage()
+
+    response = protected_image_response("media/portfolio/1/x-large.webp", storage=storage)
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response["X-Accel-Redirect"] == (
+        "/_protected_s3/swaply-media.s3.eu-central-1.amazonaws.com"
+        "/media/portfolio/1/x-large.webp"
+        "?X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Expires=300&X-Amz-Signature=abc"
+    )
+    assert response["Content-Type"] == "image/webp"
+    assert response["Cache-Control"] == "private, max-age=3600"
+    # nginx po X-Accel-Redirect znovu vyšle ETag backendu z X-Image-ETag.
+    assert response["X-Image-ETag"] == image_etag("media/portfolio/1/x-large.webp")
+    assert storage.opened == []
+
+
+@override_settings(PROTECTED_IMAGE_DELIVERY="accel")
+def test_accel_mode_on_filesystem_storage_uses_internal_alias(tmp_path):
+    storage = FileSystemStorage(location=str(tmp_path))
+    storage.save("media/feed/7/large.webp", ContentFile(b"webp-bytes"))
+
+    response = protected_image_response("media/feed/7/large.webp", storage=storage)
+
+    assert response["X-Accel-Redirect"] == "/_protected_files/media/feed/7/large.webp"
+    assert response.content == b""
+
+
+@override_settings(PROTECTED_IMAGE_DELIVERY="accel")
+def test_accel_mode_missing_filesystem_object_returns_none(tmp_path):
+    storage = FileSystemStorage(location=str(tmp_path))
+
+    assert protected_image_response("media/feed/7/missing.webp", storage=storage) is None
+
+
+@override_settings(PROTECTED_IMAGE_DELIVERY="redirect")
+def test_redirect_mode_without_signing_falls_back_to_stream(tmp_path):
+    storage = FileSystemStorage(location=str(tmp_path))
+    storage.save("media/feed/7/large.webp", ContentFile(b"webp-bytes"))
+
+    response = protected_image_response("media/feed/7/large.webp", storage=storage)
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"webp-bytes"
+    response.file_to_stream.close()
+
+
+def test_empty_key_returns_none():
+    assert protected_image_response("", storage=_FakeS3Storage()) is None
+
+
+def _request(if_none_match=None):
+    headers = {"HTTP_IF_NONE_MATCH": if_none_match} if if_none_match else {}
+    return RequestFactory().get("/image/", **headers)
+
+
+def test_etag_is_strong_and_does_not_expose_key():
+    etag = image_etag("media/portfolio/1/abc-large.webp")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert "portfolio" not in etag
+    assert etag != image_etag("media/portfolio/1/abc-thumbnail.webp")
+
+
+@pytest.mark.parametrize("mode", ["stream", "accel", "redirect"])
+def test_matching_if_none_match_returns_304_before_storage(mode):
+    storage = _FakeS3Storage()
+    key = "media/portfolio/1/x-large.webp"
+
+    with override_settings(PROTECTED_IMAGE_DELIVERY=mode):
+        response = protected_image_response(
+            key,
+            request=_request(f'W/"nope", W/{image_etag(key)}'),
+            storage=storage,
+            immutable=True,
+        )
+
+    assert response.status_code == 304
+    assert response["ETag"] == image_etag(key)
+    assert response["Cache-Control"] == "private, max-age=31536000, immutable"
+    assert storage.opened == []
+    assert storage.client.calls == []
+
+
+def test_stale_if_none_match_serves_full_response_with_etag():
+    storage = _FakeS3Storage()
+    key = "media/portfolio/1/x-large.webp"
+
+    response = protected_image_response(
+        key, request=_request('"stale"'), storage=storage, immutable=True
+    )
+
+    assert response.status_code == 200
+    assert response["ETag"] == image_etag(key)
+    assert response["Cache-Control"] == "private, max-age=31536000, immutable"
+    assert storage.opened == [key]
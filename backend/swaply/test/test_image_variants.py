@@ -0,0 +1,115 @@
+"""Testy pre zdieľaný WEBP variant engine (swaply.image_variants)."""
+
+import io
+import threading
+
+import pytest
+from PIL import Image
+
+from swaply import image_variants
+from swaply.image_variants import (
+    VariantSpec,
+    decode_image,
+    render_variants,
+    upload_variants,
+)
+
+
+def _jpeg(size, color=(120, 80, 40)) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, color=color).save(output, format="JPEG")
+    return output.getvalue()
+
+
+def test_decode_uses_jpeg_draft_but_never_below_max_side():
+    decoded = decode_image(_jpeg((4000, 3000)), max_side=1000)
+    # DCT škálovanie 1/2 – 1/8, no kratšia strana ostane ≥ max_side.
+    assert decoded.size == (2000, 1500)
+
+    assert decode_image(_jpeg((4000, 3000))).size == (4000, 3000)
+
+
+def test_render_variants_progressive_sizes_and_webp_payloads():
+    source = Image.new("RGB", (3000, 2000), color=(10, 20, 30))
+    source.info["exif"] = b"Exif\x00\x00SecretCamera"
+
+    variants = render_variants(
+        source,
+        (
+            VariantSpec("thumbnail", 480),
+            VariantSpec("large", 2048),
+            VariantSpec("medium", 1200),
+        ),
+        quality=80,
+        method=0,
+    )
+
+    assert {name: variant.size for name, variant in variants.items()} == {
+        "large": (2048, 1365),
+        "medium": (1200, 800),
+        "thumbnail": (480, 320),
+    }
+    for variant in variants.values():
+        assert b"SecretCamera" not in variant.payload
+        with Image.open(io.BytesIO(variant.payload)) as encoded:
+            assert encoded.format == "WEBP"
+            assert encoded.size == variant.size
+
+
+def test_render_variants_keeps_small_source_and_normalizes_palette():
+    source = Image.new("P", (300, 200))
+    source.info["transparency"] = 0
+
+    variant = render_variants(source, (VariantSpec("large", 2048),), quality=80)["large"]
+
+    assert variant.size == (300, 200)
+    with Image.open(io.BytesIO(variant.payload)) as encoded:
+        assert encoded.mode == "RGBA"
+
+
+def test_webp_method_env_is_clamped(monkeypatch):
+    monkeypatch.setenv("IMAGE_WEBP_METHOD", "9")
+    assert image_variants.webp_method() == 6
+    monkeypatch.setenv("IMAGE_WEBP_METHOD", "2")
+    assert image_variants.webp_method() == 2
+    monkeypatch.setenv("IMAGE_WEBP_METHOD", "fast")
+    assert image_variants.webp_method() == 6
+
+
+def test_upload_variants_runs_concurrently(monkeypatch):
+    monkeypatch.setenv("IMAGE_VARIANT_WORKERS", "3")
+    barrier = threading.Barrier(3, timeout=5)
+    stored = {}
+
+    def upload(key, payload):
+        # Prejde len vtedy, ak všetky tri uploady bežia naraz.
+        barrier.wait()
+        stored[key] = payload
+
+    keys = upload_variants(
+        (("a", b"1"), ("b", b"2"), ("c", b"3")), upload=upload, delete=stored.pop
+    )
+
+    assert keys == ["a", "b", "c"]
+    assert stored == {"a": b"1", "b": b"2", "c": b"3"}
+
+
+@pytest.mark.parametrize("workers", ["1", "3"])
+def test_upload_variants_rolls_back_on_failure(monkeypatch, workers):
+    monkeypatch.setenv("IMAGE_VARIANT_WORKERS", workers)
+    stored = {}
+    deleted = []
+
+    def upload(key, payload):
+        if key == "b":
+            raise ConnectionError("S3 down")
+        stored[key] = payload
+
+    with pytest.raises(ConnectionError):
+        upload_variants(
+            (("a", b"1"), ("b", b"2"), ("c", b"3")),
+            upload=upload,
+            delete=deleted.append,
+        )
+
+    assert sorted(deleted) == ["a", "c"]
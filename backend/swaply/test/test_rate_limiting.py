@@ -2,6 +2,7 @@
 Testy pre rate limiting funkcionalitu
 """
 
+import json
 import time
 from django.test import TestCase, RequestFactory, override_settings
 from django.core.cache import cache
@@ -379,3 +380,100 @@ def test_search_limit_does_not_block_other_api_endpoints(settings):
     # Ten istý klient stále prejde na inom (api) endpointe.
     assert api_view_stub(api_req).status_code == 200
     assert api_view_stub(api_req).status_code == 200
+
+
+class _StubRedisScript:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class _StubRedisClient:
+    def __init__(self, result):
+        self.script = _StubRedisScript(result)
+        self.pipeline_calls = 0
+
+    def register_script(self, source):
+        assert "INCR" in source and "PEXPIRE" in source
+        return self.script
+
+    def pipeline(self, transaction=True):
+        self.pipeline_calls += 1
+        raise AssertionError("hit nesmie robiť ďalšie round-tripy")
+
+
+def test_redis_backend_single_script_call_returns_full_decision():
+    from swaply.rate_limiting import RedisRateLimitBackend
+
+    client = _StubRedisClient([0, 0, 30_000])
+    limiter = RateLimiter(
+        max_attempts=3,
+        window_minutes=1,
+        block_minutes=5,
+        backend=RedisRateLimitBackend(client=client),
+    )
+    decision = limiter.check("ip:1.2.3.4", "unit_redis")
+
+    assert decision.allowed is False
+    assert decision.remaining == 0
+    assert decision.reset_time is not None
+    assert len(client.script.calls) == 1
+    keys, args = client.script.calls[0]
+    assert keys[0].endswith(limiter.get_key("ip:1.2.3.4", "unit_redis") + ":n")
+    assert args == [3, 60_000]
+    assert client.pipeline_calls == 0
+
+
+@override_settings(RATE_LIMIT_FAIL_OPEN=False)
+def test_redis_backend_failure_respects_fail_open_setting():
+    from swaply.rate_limiting import RedisRateLimitBackend
+
+    backend = RedisRateLimitBackend(client=_StubRedisClient(ConnectionError("down")))
+    limiter = RateLimiter(max_attempts=3, window_minutes=1, backend=backend)
+    assert limiter.is_allowed("ip:1.2.3.4", "unit_redis") is False
+
+
+def test_backend_selection_follows_settings():
+    from swaply.rate_limiting import (
+        CacheRateLimitBackend,
+        RedisRateLimitBackend,
+        get_rate_limit_backend,
+    )
+
+    redis_caches = {"default": {"BACKEND": "django_redis.cache.RedisCache"}}
+    with override_settings(RATE_LIMIT_BACKEND="auto", CACHES=redis_caches):
+        assert isinstance(get_rate_limit_backend(), RedisRateLimitBackend)
+    with override_settings(RATE_LIMIT_BACKEND="cache", CACHES=redis_caches):
+        assert isinstance(get_rate_limit_backend(), CacheRateLimitBackend)
+    with override_settings(RATE_LIMIT_BACKEND="auto"):
+        assert isinstance(get_rate_limit_backend(), CacheRateLimitBackend)
+
+
+@override_settings(
+    RATE_LIMITING_ENABLED=True,
+    RATE_LIMIT_DISABLED=False,
+    RATE_LIMIT_ALLOW_PATHS=[],
+)
+def test_rate_limit_429_uses_single_backend_check():
+    """429 odpoveď berie remaining/reset z tej istej kontroly (bez peek)."""
+    cache.clear()
+
+    @rate_limit(max_attempts=1, window_minutes=1, block_minutes=1, action="one_rt")
+    def view(request):
+        return HttpResponse("ok")
+
+    rf = RequestFactory()
+    assert view(rf.post("/api/one-rt/")).status_code == 200
+    with patch("swaply.rate_limiting.CacheRateLimitBackend.peek") as peek:
+        response = view(rf.post("/api/one-rt/"))
+    assert response.status_code == 429
+    peek.assert_not_called()
+    payload = json.loads(response.content)
+    assert payload["remaining_attempts"] == 0
+    assert payload["reset_time"]
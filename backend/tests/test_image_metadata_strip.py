@@ -9,15 +9,18 @@ oriented.info a PNG/WebP by ho pri save() zapísali späť do súboru.
 from __future__ import annotations
 
 from io import BytesIO
+from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
 from PIL.TiffImagePlugin import IFDRational
 
+from swaply import image_metadata
 from swaply.image_metadata import strip_image_metadata
 
 GPS_TAG = 0x8825
 MAKE_TAG = 0x010F
+ORIENTATION_TAG = 0x0112
 
 
 def _gps_exif_bytes() -> bytes:
@@ -128,3 +131,142 @@ def test_gif_is_skipped():
     upload = SimpleUploadedFile("x.gif", buffer.getvalue(), content_type="image/gif")
     # GIF sa preskakuje (fail-open) – vracia None, volajúci ponechá originál.
     assert strip_image_metadata(upload) is None
+
+
+def _pixels(data: bytes):
+    with Image.open(BytesIO(data)) as im:
+        return im.mode, im.size, im.tobytes()
+
+
+def _jpeg_bytes(*, orientation=None, trailer=b"") -> bytes:
+    image = Image.new("RGB", (16, 8), (200, 30, 60))
+    exif = image.getexif()
+    exif[MAKE_TAG] = "EvilCam"
+    gps = exif.get_ifd(GPS_TAG)
+    gps[1] = "N"
+    gps[2] = (IFDRational(48, 1), IFDRational(8, 1), IFDRational(0, 1))
+    exif[GPS_TAG] = gps
+    if orientation is not None:
+        exif[ORIENTATION_TAG] = orientation
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", exif=exif, quality=75)
+    data = buffer.getvalue()
+    # XMP APP1 + COM hneď za SOI, trailer za EOI (MPO/výrobca).
+    xmp = b"http://ns.adobe.com/xap/1.0/\x00<x:xmpmeta>GPS leak</x:xmpmeta>"
+    comment = b"secret comment"
+    extra = (
+        b"\xff\xe1" + (len(xmp) + 2).to_bytes(2, "big") + xmp
+        + b"\xff\xfe" + (len(comment) + 2).to_bytes(2, "big") + comment
+    )
+    return data[:2] + extra + data[2:] + trailer
+
+
+def test_jpeg_strip_is_lossless_and_does_not_reencode():
+    data = _jpeg_bytes(trailer=b"SEFHtrailer-with-gps")
+    upload = SimpleUploadedFile("x.jpg", data, content_type="image/jpeg")
+
+    with patch.object(image_metadata, "_reencode_without_metadata") as reencode:
+        result = strip_image_metadata(upload)
+    reencode.assert_not_called()
+
+    stripped = result.read()
+    assert result.name == "x.jpg"
+    assert _pixels(stripped) == _pixels(data)
+    assert b"EvilCam" not in stripped
+    assert b"GPS leak" not in stripped
+    assert b"secret comment" not in stripped
+    assert stripped.endswith(b"\xff\xd9")
+    with Image.open(BytesIO(stripped)) as im:
+        assert len(im.getexif()) == 0
+
+
+def test_jpeg_orientation_is_kept_as_only_exif_tag():
+    upload = SimpleUploadedFile(
+        "x.jpg", _jpeg_bytes(orientation=6), content_type="image/jpeg"
+    )
+
+    result = strip_image_metadata(upload)
+
+    with Image.open(BytesIO(result.read())) as im:
+        assert dict(im.getexif()) == {ORIENTATION_TAG: 6}
+        assert im.size == (16, 8)
+
+
+def test_png_ancillary_text_chunks_are_dropped_losslessly():
+    from PIL.PngImagePlugin import PngInfo
+
+    info = PngInfo()
+    info.add_text("Comment", "secret comment")
+    info.add_itxt("XML:com.adobe.xmp", "<x:xmpmeta>GPS leak</x:xmpmeta>")
+    buffer = BytesIO()
+    Image.new("RGBA", (8, 8), (0, 128, 255, 100)).save(
+        buffer, format="PNG", pnginfo=info, exif=_gps_exif_bytes()
+    )
+    data = buffer.getvalue()
+
+    with patch.object(image_metadata, "_reencode_without_metadata") as reencode:
+        result = strip_image_metadata(
+            SimpleUploadedFile("x.png", data, content_type="image/png")
+        )
+    reencode.assert_not_called()
+
+    stripped = result.read()
+    assert _pixels(stripped) == _pixels(data)
+    assert b"eXIf" not in stripped
+    assert b"secret comment" not in stripped
+    assert b"GPS leak" not in stripped
+
+
+def test_webp_exif_and_xmp_chunks_are_dropped_and_flags_cleared():
+    buffer = BytesIO()
+    Image.new("RGB", (8, 8), (0, 128, 255)).save(
+        buffer, format="WEBP", lossless=True, exif=_gps_exif_bytes(), xmp=b"<x>GPS leak</x>"
+    )
+    data = buffer.getvalue()
+
+    with patch.object(image_metadata, "_reencode_without_metadata") as reencode:
+        result = strip_image_metadata(
+            SimpleUploadedFile("x.webp", data, content_type="image/webp")
+        )
+    reencode.assert_not_called()
+
+    stripped = result.read()
+    assert _pixels(stripped) == _pixels(data)
+    assert b"EXIF" not in stripped
+    assert b"GPS leak" not in stripped
+    assert int.from_bytes(stripped[4:8], "little") == len(stripped) - 8
+    vp8x = stripped.find(b"VP8X")
+    if vp8x >= 0:
+        assert stripped[vp8x + 8] & 0x0C == 0
+
+
+def test_png_with_exif_orientation_falls_back_to_reencode():
+    image = Image.new("RGB", (16, 8), (0, 128, 255))
+    exif = image.getexif()
+    exif[ORIENTATION_TAG] = 6
+    buffer = BytesIO()
+    image.save(buffer, format="PNG", exif=exif.tobytes())
+
+    result = strip_image_metadata(
+        SimpleUploadedFile("x.png", buffer.getvalue(), content_type="image/png")
+    )
+
+    with Image.open(BytesIO(result.read())) as im:
+        # Orientácia zapečená do pixelov (90° rotácia), EXIF preč.
+        assert im.size == (8, 16)
+        assert len(im.getexif()) == 0
+
+
+def test_truncated_jpeg_falls_back_to_reencode():
+    data = _jpeg_bytes()
+    truncated = data[: len(data) - 2]
+
+    with patch.object(
+        image_metadata, "_reencode_without_metadata", return_value=None
+    ) as reencode:
+        result = strip_image_metadata(
+            SimpleUploadedFile("x.jpg", truncated, content_type="image/jpeg")
+        )
+
+    reencode.assert_called_once()
+    assert result is None
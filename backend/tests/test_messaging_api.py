@@ -7,7 +7,9 @@ from datetime import timedelta
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from PIL import Image
@@ -25,6 +27,18 @@ from messaging.services.presence import store_message_presence
 User = get_user_model()
 
 
+def _notified(notify_users_mock):
+    """(user_id, event) páry zo všetkých batch notify_users volaní."""
+    pairs = []
+    for call in notify_users_mock.call_args_list:
+        (events_by_user,) = call.args
+        for user_id, events in events_by_user.items():
+            if isinstance(events, dict):
+                events = [events]
+            pairs.extend((user_id, event) for event in events)
+    return pairs
+
+
 def _strictly_increasing_now_patch():
     """
     Patch `timezone.now()` na striktne rastúce hodnoty (každé volanie +1s).
@@ -214,7 +228,7 @@ class TestMessagingApi(APITestCase):
         self.client.force_authenticate(user=self.u1)
         url = reverse("accounts:messaging_send_direct_message")
 
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             with self.captureOnCommitCallbacks(execute=True):
                 response = self.client.post(
                     url,
@@ -234,8 +248,7 @@ class TestMessagingApi(APITestCase):
         assert convo.requested_by_id == self.u1.id
         assert convo.requested_to_id == self.u2.id
 
-        notify_user_mock.assert_called_once()
-        called_user_id, event = notify_user_mock.call_args.args
+        [(called_user_id, event)] = _notified(notify_users_mock)
         assert called_user_id == self.u2.id
         assert event["type"] == "messaging_message"
         assert event["conversation_id"] == response.data["conversation_id"]
@@ -339,7 +352,7 @@ class TestMessagingApi(APITestCase):
             "accounts:messaging_send_message",
             kwargs={"conversation_id": conversation_id},
         )
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             reply = self.client.post(send_url, {"text": "Jasne, odpovedam"}, format="json")
 
         assert reply.status_code == status.HTTP_201_CREATED
@@ -355,8 +368,7 @@ class TestMessagingApi(APITestCase):
         conversations = self.client.get(reverse("accounts:messaging_list_conversations"))
         assert [item["id"] for item in self._results(conversations)] == [conversation_id]
 
-        notify_user_mock.assert_called_once()
-        called_user_id, event = notify_user_mock.call_args.args
+        [(called_user_id, event)] = _notified(notify_users_mock)
         assert called_user_id == self.u1.id
         assert event["type"] == "messaging_message"
         assert event["sender_id"] == self.u2.id
@@ -376,12 +388,12 @@ class TestMessagingApi(APITestCase):
             "accounts:messaging_delete_message_request",
             kwargs={"conversation_id": conversation_id},
         )
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             deleted = self.client.post(delete_url, {}, format="json")
 
         assert deleted.status_code == status.HTTP_200_OK
         assert deleted.data["message_request_unseen_count"] == 0
-        assert notify_user_mock.call_count == 0
+        assert len(_notified(notify_users_mock)) == 0
         assert Conversation.objects.get(id=conversation_id).request_status == Conversation.RequestStatus.DELETED
         assert self._results(self.client.get(reverse("accounts:messaging_list_message_requests"))) == []
 
@@ -402,11 +414,11 @@ class TestMessagingApi(APITestCase):
         assert messages_response.data["peer_last_read_at"] is None
 
         read_url = reverse("accounts:messaging_mark_read", kwargs={"conversation_id": conversation_id})
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             read_response = self.client.post(read_url, {}, format="json")
 
         assert read_response.status_code == status.HTTP_200_OK
-        emitted_types = [call.args[1]["type"] for call in notify_user_mock.call_args_list]
+        emitted_types = [event["type"] for _, event in _notified(notify_users_mock)]
         assert "messaging_read" in emitted_types
         assert "messaging_peer_read" not in emitted_types
 
@@ -461,23 +473,41 @@ class TestMessagingApi(APITestCase):
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["text"] is None
         assert response.data["has_image"] is True
-        assert response.data["image_url"].endswith(
+        # Strip + thumbnail bežia až po commite – odpoveď ešte URL nemá.
+        assert response.data["image_status"] == Message.ImageStatus.PROCESSING
+        assert response.data["image_url"] is None
+        assert response.data["image_thumbnail_url"] is None
+
+        message = Message.objects.get(id=response.data["id"])
+        assert message.image_status == Message.ImageStatus.READY
+        assert bool(message.image) is True
+        assert bool(message.image_thumbnail) is True
+
+        list_response = self.client.get(
+            reverse(
+                "accounts:messaging_list_messages",
+                kwargs={"conversation_id": convo.id},
+            )
+        )
+        listed = next(
+            item
+            for item in self._results(list_response)
+            if item["id"] == response.data["id"]
+        )
+        assert listed["image_status"] == Message.ImageStatus.READY
+        assert listed["image_url"].endswith(
             reverse(
                 "accounts:messaging_message_image",
                 kwargs={"conversation_id": convo.id, "message_id": response.data["id"]},
             )
         )
-        assert response.data["image_thumbnail_url"].endswith(
+        assert listed["image_thumbnail_url"].endswith(
             reverse(
                 "accounts:messaging_message_image_thumbnail",
                 kwargs={"conversation_id": convo.id, "message_id": response.data["id"]},
             )
         )
 
-        message = Message.objects.get(id=response.data["id"])
-        assert bool(message.image) is True
-        assert bool(message.image_thumbnail) is True
-
     def test_send_message_strips_exif_gps_metadata(self):
         upload = self._jpeg_with_gps_exif()
 
@@ -572,7 +602,10 @@ class TestMessagingApi(APITestCase):
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["message"]["text"] == "Ahoj"
         assert response.data["message"]["has_image"] is True
-        assert response.data["message"]["image_thumbnail_url"]
+        assert response.data["message"]["image_status"] == Message.ImageStatus.PROCESSING
+        message = Message.objects.get(id=response.data["message"]["id"])
+        assert message.image_status == Message.ImageStatus.READY
+        assert bool(message.image_thumbnail) is True
 
     def test_message_image_endpoint_serves_participants_only(self):
         convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
@@ -602,21 +635,31 @@ class TestMessagingApi(APITestCase):
         self.client.force_authenticate(user=self.u2)
         response = self.client.get(image_url)
         assert response.status_code == status.HTTP_200_OK
-        assert response["Cache-Control"] == "private, max-age=3600"
+        assert response["Cache-Control"] == "private, max-age=31536000, immutable"
         assert response["X-Content-Type-Options"] == "nosniff"
         assert response["Content-Type"].startswith("image/")
         assert b"PNG" in b"".join(response.streaming_content)
 
         thumbnail_response = self.client.get(thumbnail_url)
         assert thumbnail_response.status_code == status.HTTP_200_OK
-        assert thumbnail_response["Cache-Control"] == "private, max-age=3600"
+        assert thumbnail_response["Cache-Control"] == "private, max-age=31536000, immutable"
         assert thumbnail_response["X-Content-Type-Options"] == "nosniff"
         assert thumbnail_response["Content-Type"].startswith("image/")
         assert b"WEBP" in b"".join(thumbnail_response.streaming_content)
 
+        revalidated = self.client.get(image_url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated["ETag"] == response["ETag"]
+        assert response["ETag"] != thumbnail_response["ETag"]
+
         self.client.force_authenticate(user=self.u3)
         forbidden_response = self.client.get(image_url)
         assert forbidden_response.status_code == status.HTTP_404_NOT_FOUND
+        # Prístup sa overuje pred ETag porovnaním – cudzí ETag nič neprezradí.
+        forbidden_revalidation = self.client.get(
+            image_url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        assert forbidden_revalidation.status_code == status.HTTP_404_NOT_FOUND
         forbidden_thumbnail_response = self.client.get(thumbnail_url)
         assert forbidden_thumbnail_response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -673,7 +716,7 @@ class TestMessagingApi(APITestCase):
 
         self.client.force_authenticate(user=self.u1)
         read_url = reverse("accounts:messaging_mark_read", kwargs={"conversation_id": convo.id})
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             read_response = self.client.post(read_url, {}, format="json")
 
         assert read_response.status_code == status.HTTP_200_OK
@@ -681,9 +724,9 @@ class TestMessagingApi(APITestCase):
         assert read_response.data["total_unread_count"] == 0
         participant = ConversationParticipant.objects.get(conversation_id=convo.id, user=self.u1)
         assert participant.last_read_at is not None
-        assert notify_user_mock.call_count == 2
+        assert len(_notified(notify_users_mock)) == 2
 
-        calls = [call.args for call in notify_user_mock.call_args_list]
+        calls = _notified(notify_users_mock)
         self_read_call = next(args for args in calls if args[1]["type"] == "messaging_read")
         peer_read_call = next(
             args for args in calls if args[1]["type"] == "messaging_peer_read"
@@ -742,7 +785,7 @@ class TestMessagingApi(APITestCase):
 
         self.client.force_authenticate(user=self.u1)
         read_url = reverse("accounts:messaging_mark_read", kwargs={"conversation_id": convo.id})
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             first = self.client.post(read_url, {}, format="json")
             second = self.client.post(read_url, {}, format="json")
 
@@ -750,7 +793,7 @@ class TestMessagingApi(APITestCase):
         assert second.status_code == status.HTTP_200_OK
         participant = ConversationParticipant.objects.get(conversation_id=convo.id, user=self.u1)
         assert participant.last_read_at is not None
-        assert notify_user_mock.call_count == 4
+        assert len(_notified(notify_users_mock)) == 4
 
     def test_message_author_can_delete_message_for_everyone_and_keep_placeholder_in_thread(self):
         convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
@@ -767,7 +810,7 @@ class TestMessagingApi(APITestCase):
         )
         convo.refresh_from_db()
         last_message_at_before_delete = convo.last_message_at
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             delete_response = self.client.post(delete_url, {}, format="json")
 
         assert delete_response.status_code == status.HTTP_200_OK
@@ -798,8 +841,8 @@ class TestMessagingApi(APITestCase):
         convo.refresh_from_db()
         assert convo.last_message_at == last_message_at_before_delete
 
-        assert notify_user_mock.call_count == 2
-        events = [call.args for call in notify_user_mock.call_args_list]
+        assert len(_notified(notify_users_mock)) == 2
+        events = _notified(notify_users_mock)
         for called_user_id, event in events:
             assert called_user_id in {self.u1.id, self.u2.id}
             assert event["type"] == "messaging_message_deleted"
@@ -888,14 +931,14 @@ class TestMessagingApi(APITestCase):
             "accounts:messaging_delete_message",
             kwargs={"conversation_id": convo.id, "message_id": message_id},
         )
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             first = self.client.post(delete_url, {}, format="json")
             second = self.client.post(delete_url, {}, format="json")
 
         assert first.status_code == status.HTTP_200_OK
         assert second.status_code == status.HTTP_200_OK
         assert Message.objects.get(id=message_id).is_deleted is True
-        assert notify_user_mock.call_count == 2
+        assert len(_notified(notify_users_mock)) == 2
 
     def test_user_cannot_delete_someone_elses_message(self):
         convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
@@ -927,7 +970,7 @@ class TestMessagingApi(APITestCase):
 
         self.client.force_authenticate(user=self.u2)
         pin_url = reverse("accounts:messaging_pin_message", kwargs={"conversation_id": convo.id})
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             pin_response = self.client.post(pin_url, {"message_id": message_id}, format="json")
 
         assert pin_response.status_code == status.HTTP_200_OK
@@ -936,16 +979,16 @@ class TestMessagingApi(APITestCase):
 
         convo.refresh_from_db()
         assert convo.pinned_message_id == message_id
-        assert notify_user_mock.call_count == 2
+        assert len(_notified(notify_users_mock)) == 2
 
-        for called_user_id, event in [call.args for call in notify_user_mock.call_args_list]:
+        for called_user_id, event in _notified(notify_users_mock):
             assert called_user_id in {self.u1.id, self.u2.id}
             assert event["type"] == "messaging_pinned_message_updated"
             assert event["conversation_id"] == convo.id
             assert event["actor_id"] == self.u2.id
             assert event["pinned_message"]["id"] == message_id
 
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             unpin_response = self.client.post(pin_url, {"message_id": None}, format="json")
 
         assert unpin_response.status_code == status.HTTP_200_OK
@@ -953,8 +996,8 @@ class TestMessagingApi(APITestCase):
 
         convo.refresh_from_db()
         assert convo.pinned_message_id is None
-        assert notify_user_mock.call_count == 2
-        for called_user_id, event in [call.args for call in notify_user_mock.call_args_list]:
+        assert len(_notified(notify_users_mock)) == 2
+        for called_user_id, event in _notified(notify_users_mock):
             assert called_user_id in {self.u1.id, self.u2.id}
             assert event["type"] == "messaging_pinned_message_updated"
             assert event["conversation_id"] == convo.id
@@ -1071,6 +1114,76 @@ class TestMessagingApi(APITestCase):
         assert list_response.data["peer_last_read_at"] == peer_participant.last_read_at.isoformat()
         assert len(list_response.data["results"]) == 1
 
+    def test_message_list_cursor_mode_pages_history_without_count(self):
+        convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
+        base = timezone.now()
+        # Dvojice správ s rovnakým created_at – tie-break musí ísť cez id.
+        Message.objects.bulk_create(
+            Message(
+                conversation=convo,
+                sender=self.u1,
+                text=f"m{index}",
+                created_at=base + timedelta(seconds=index // 2),
+            )
+            for index in range(7)
+        )
+        convo.last_message_at = base + timedelta(seconds=3)
+        convo.save(update_fields=["last_message_at"])
+        self.client.force_authenticate(user=self.u2)
+        list_url = reverse("accounts:messaging_list_messages", kwargs={"conversation_id": convo.id})
+
+        first = self.client.get(list_url, {"page_size": 3})
+        assert first.status_code == status.HTTP_200_OK
+        assert [item["text"] for item in first.data["results"]] == ["m6", "m5", "m4"]
+        assert first.data["count"] == 7
+        cursor = first.data["next_cursor"]
+
+        seen = []
+        while cursor:
+            page = self.client.get(list_url, {"page_size": 3, "before": cursor})
+            assert page.status_code == status.HTTP_200_OK
+            assert "count" not in page.data
+            seen.extend(item["text"] for item in page.data["results"])
+            cursor = page.data["next_cursor"]
+        assert seen == ["m3", "m2", "m1", "m0"]
+        assert page.data["next"] is None
+
+        newer = self.client.get(list_url, {"page_size": 2, "after": page.data["previous_cursor"]})
+        assert [item["text"] for item in newer.data["results"]] == ["m2", "m1"]
+        assert newer.data["previous_cursor"] is not None
+        assert "before=" in newer.data["next"] and "after=" not in newer.data["next"]
+
+        invalid = self.client.get(list_url, {"before": "not-a-cursor"})
+        assert invalid.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_message_list_loads_conversation_context_in_one_query(self):
+        convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
+        self.client.force_authenticate(user=self.u1)
+        send_url = reverse("accounts:messaging_send_message", kwargs={"conversation_id": convo.id})
+        pinned_id = self.client.post(send_url, {"text": "Pripnutá"}, format="json").data["id"]
+        self.client.post(send_url, {"text": "Posledná"}, format="json")
+        convo.pinned_message_id = pinned_id
+        convo.save(update_fields=["pinned_message"])
+        self.client.force_authenticate(user=self.u2)
+        self.client.post(
+            reverse("accounts:messaging_mark_read", kwargs={"conversation_id": convo.id}),
+            {},
+            format="json",
+        )
+
+        self.client.force_authenticate(user=self.u1)
+        list_url = reverse("accounts:messaging_list_messages", kwargs={"conversation_id": convo.id})
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(list_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["pinned_message"]["id"] == pinned_id
+        assert response.data["peer_last_read_at"] is not None
+        assert response.data["conversation"]["id"] == convo.id
+        assert response.data["conversation"]["last_message_preview"] == "Posledná"
+        # kontext konverzácie + prefetch účastníkov + COUNT + stránka správ
+        assert len(ctx.captured_queries) == 4
+
     def test_hide_conversation_hides_it_only_for_the_actor(self):
         now_patcher = _strictly_increasing_now_patch()
         now_patcher.start()
@@ -24,6 +24,7 @@ from messaging.services.conversations import (
     send_direct_message,
 )
 from messaging.services.groups import create_group_conversation
+from messaging.services.inbox import refresh_inbox_entries
 from messaging.services.group_invitations import (
     invite_user_to_group,
     respond_to_group_invitation,
@@ -76,6 +77,8 @@ class TestMessagingBlockEnforcement(APITestCase):
         )
         conversation.last_message_at = now
         conversation.save(update_fields=["last_message_at", "updated_at"])
+        # História je zapísaná priamo (mimo služieb) – dopočítaj sidebar.
+        refresh_inbox_entries(conversation_ids=[conversation.id])
         return conversation
 
     def test_blocked_pair_cannot_open_or_start_direct_conversation(self):
@@ -119,8 +122,8 @@ class TestMessagingBlockEnforcement(APITestCase):
                 )
                 history_response = self.client.get(list_url)
                 with patch(
-                    "messaging.api.notification_dispatch.notify_user"
-                ) as notify_user_mock:
+                    "messaging.api.notification_dispatch.notify_users"
+                ) as notify_users_mock:
                     blocked_send = self.client.post(
                         send_url,
                         {"text": "Must not be sent"},
@@ -143,7 +146,7 @@ class TestMessagingBlockEnforcement(APITestCase):
                 )
                 assert blocked_send.status_code == status.HTTP_403_FORBIDDEN
                 assert blocked_send.data["code"] == "recipient_unavailable"
-                notify_user_mock.assert_not_called()
+                notify_users_mock.assert_not_called()
 
         assert Message.objects.filter(conversation=conversation).count() == 1
         self.push_delay_mock.assert_not_called()
@@ -315,8 +318,8 @@ class TestMessagingBlockEnforcement(APITestCase):
         self.client.force_authenticate(user=self.u1)
 
         with patch(
-            "messaging.api.notification_dispatch.notify_user"
-        ) as notify_user_mock:
+            "messaging.api.notification_dispatch.notify_users"
+        ) as notify_users_mock:
             forward_response = self.client.post(
                 reverse(
                     "accounts:messaging_forward_message",
@@ -358,7 +361,7 @@ class TestMessagingBlockEnforcement(APITestCase):
             assert response.data["failed"] == expected_failure
 
         assert Message.objects.count() == 1
-        notify_user_mock.assert_not_called()
+        notify_users_mock.assert_not_called()
         self.push_delay_mock.assert_not_called()
 
     def test_block_does_not_stop_existing_group_messages_but_prevents_new_invite(self):
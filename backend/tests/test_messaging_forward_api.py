@@ -20,6 +20,18 @@ from messaging.services.conversations import open_or_create_direct_conversation
 User = get_user_model()
 
 
+def _notified(notify_users_mock):
+    """(user_id, event) páry zo všetkých batch notify_users volaní."""
+    pairs = []
+    for call in notify_users_mock.call_args_list:
+        (events_by_user,) = call.args
+        for user_id, events in events_by_user.items():
+            if isinstance(events, dict):
+                events = [events]
+            pairs.extend((user_id, event) for event in events)
+    return pairs
+
+
 @pytest.mark.django_db
 class TestMessagingForwardApi(APITestCase):
     def setUp(self):
@@ -94,7 +106,7 @@ class TestMessagingForwardApi(APITestCase):
         source_response = self._send_source_message(source_convo, {"text": "Ahoj dalej"})
         assert source_response.status_code == status.HTTP_201_CREATED
 
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             forward_response = self.client.post(
                 self._forward_url(source_convo, source_response.data["id"]),
                 {"recipient_user_ids": [self.u2.id, self.u3.id]},
@@ -114,10 +126,10 @@ class TestMessagingForwardApi(APITestCase):
             requested_to=self.u3,
         )
         assert new_conversation.request_status == Conversation.RequestStatus.PENDING
-        notified_user_ids = [call.args[0] for call in notify_user_mock.call_args_list]
+        notified_user_ids = [user_id for user_id, _ in _notified(notify_users_mock)]
         assert notified_user_ids == [self.u2.id, self.u3.id]
 
-    def test_forward_image_message_copies_attachment(self):
+    def test_forward_image_message_shares_attachment_blob(self):
         source_convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
         with self.captureOnCommitCallbacks(execute=True):
             source_response = self._send_source_message(
@@ -142,8 +154,13 @@ class TestMessagingForwardApi(APITestCase):
         )
         assert bool(forwarded_message.image) is True
         assert bool(forwarded_message.image_thumbnail) is True
-        assert forwarded_message.image.name != source_message.image.name
-        assert forwarded_message.image_thumbnail.name != source_message.image_thumbnail.name
+        assert forwarded_message.image_status == Message.ImageStatus.READY
+        # Forward nenahráva kópiu – pripojí rovnaký obsahovo adresovaný blob.
+        assert forwarded_message.image_blob_id == source_message.image_blob_id
+        assert forwarded_message.image.name == source_message.image.name
+        assert forwarded_message.image_thumbnail.name == source_message.image_thumbnail.name
+        source_message.image_blob.refresh_from_db()
+        assert source_message.image_blob.ref_count == 2
 
     def test_forward_message_respects_pending_request_limit(self):
         source_convo = self._create_direct_conversation(actor=self.u1, target=self.u2)
@@ -19,7 +19,7 @@ from PIL import Image
 from rest_framework.test import APITestCase
 
 from accounts.account_deletion import anonymize_user
-from messaging.models import Conversation, Message
+from messaging.models import Conversation, Message, MessageImageBlob
 from messaging.services.conversations import open_or_create_direct_conversation
 from messaging.services.messages import send_message
 
@@ -137,6 +137,10 @@ class TestMessagingGdpr(APITestCase):
             send_message(
                 conversation=convo, sender=self.sender, image=self._image_upload()
             )
+        # Správa spred MessageImageBlob – vlastné súbory, maže ich scrub priamo
+        # (blobové správy pokrýva test_messaging_image_blobs).
+        Message.objects.filter(sender=self.sender).update(image_blob=None)
+        MessageImageBlob.objects.all().delete()
 
         recorded: list[tuple] = []
 
@@ -0,0 +1,249 @@
+"""
+Testy obsahovo adresovaných obrázkov správ (MessageImageBlob + ref_count).
+
+Forward a duplicitný upload zdieľajú jeden blob; súbory zmaže až posledná
+referencia (soft-delete, GDPR scrub, CASCADE).
+"""
+
+import shutil
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from accounts.account_deletion import anonymize_user
+from messaging.management.commands.cleanup_orphan_message_images import Command
+from messaging.models import Message, MessageImageBlob
+from messaging.services import message_images
+from messaging.services.conversations import open_or_create_direct_conversation
+from messaging.services.forwarding import (
+    MessageForwardSourceUnavailable,
+    forward_message_to_recipients,
+)
+from messaging.services.messages import delete_message_for_all, send_message
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestMessageImageBlobs(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.temp_media_root = tempfile.mkdtemp()
+        media_override = override_settings(
+            MEDIA_ROOT=self.temp_media_root,
+            SAFESEARCH_ENABLED=False,
+            MESSAGE_IMAGE_PROCESSING="inline",
+        )
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.addCleanup(lambda: shutil.rmtree(self.temp_media_root, ignore_errors=True))
+        for target in (
+            "messaging.services.push_enqueue.deliver_message_push_task.delay",
+            "accounts.realtime.notify_users",
+        ):
+            patcher = patch(target, return_value=None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.users = [
+            User.objects.create_user(
+                username=f"blob-u{index}",
+                email=f"blob-u{index}@example.com",
+                password="StrongPass123",
+                is_active=True,
+                is_verified=True,
+                is_public=True,
+            )
+            for index in range(4)
+        ]
+        self.u1, self.u2, self.u3, self.u4 = self.users
+        self.conversation = open_or_create_direct_conversation(
+            actor=self.u1, target=self.u2
+        ).conversation
+
+    def _png_upload(self, color=(0, 128, 255)):
+        buffer = BytesIO()
+        Image.new("RGB", (4, 4), color).save(buffer, format="PNG")
+        return SimpleUploadedFile("chat.png", buffer.getvalue(), content_type="image/png")
+
+    def _send_image(self, *, sender=None, conversation=None, color=(0, 128, 255)):
+        with self.captureOnCommitCallbacks(execute=True):
+            message = send_message(
+                conversation=conversation or self.conversation,
+                sender=sender or self.u1,
+                image=self._png_upload(color),
+            ).message
+        message.refresh_from_db()
+        return message
+
+    def _forward(self, source, *, actor, recipients):
+        with self.captureOnCommitCallbacks(execute=True):
+            result = forward_message_to_recipients(
+                actor=actor,
+                source_message=source,
+                recipient_user_ids=[user.id for user in recipients],
+            )
+        assert result.failed == ()
+        return [delivery.message for delivery in result.sent]
+
+    def _blob_files(self, blob):
+        return [blob.image.name, blob.image_thumbnail.name]
+
+    def test_identical_upload_reuses_blob_without_new_thumbnail(self):
+        first = self._send_image()
+
+        with patch.object(
+            message_images,
+            "build_message_thumbnail",
+            wraps=message_images.build_message_thumbnail,
+        ) as build_thumbnail:
+            second = self._send_image()
+
+        build_thumbnail.assert_not_called()
+        assert second.image_blob_id == first.image_blob_id
+        assert second.image.name == first.image.name
+        assert first.image.name.startswith(f"messages/blobs/{first.image_blob.sha256[:2]}/")
+        assert MessageImageBlob.objects.get().ref_count == 2
+
+    def test_forward_attaches_existing_blob_without_upload(self):
+        source = self._send_image()
+
+        with patch.object(default_storage, "save") as save:
+            forwarded = self._forward(source, actor=self.u1, recipients=[self.u3, self.u4])
+
+        save.assert_not_called()
+        assert {message.image_blob_id for message in forwarded} == {source.image_blob_id}
+        assert all(
+            message.image_status == Message.ImageStatus.READY for message in forwarded
+        )
+        assert MessageImageBlob.objects.get().ref_count == 3
+
+    def test_files_are_deleted_only_with_last_reference(self):
+        source = self._send_image()
+        forwarded = self._forward(source, actor=self.u1, recipients=[self.u3])[0]
+        blob = source.image_blob
+        files = self._blob_files(blob)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_message_for_all(
+                conversation=self.conversation, message_id=source.id, actor=self.u1
+            )
+
+        blob.refresh_from_db()
+        assert blob.ref_count == 1
+        assert all(default_storage.exists(name) for name in files)
+        source.refresh_from_db()
+        assert source.image_blob_id is None
+
+        with self.captureOnCommitCallbacks(execute=True):
+            forwarded.delete()
+
+        assert not MessageImageBlob.objects.exists()
+        assert not any(default_storage.exists(name) for name in files)
+
+    def test_gdpr_scrub_keeps_blob_for_other_senders_forward(self):
+        source = self._send_image()
+        files = self._blob_files(source.image_blob)
+        self._forward(source, actor=self.u2, recipients=[self.u3])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            anonymize_user(self.u1)
+
+        assert MessageImageBlob.objects.get().ref_count == 1
+        assert all(default_storage.exists(name) for name in files)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            anonymize_user(self.u2)
+
+        assert not MessageImageBlob.objects.exists()
+        assert not any(default_storage.exists(name) for name in files)
+
+    def test_forward_adopts_legacy_source_files_as_blob(self):
+        source = self._send_image()
+        legacy_names = self._blob_files(source.image_blob)
+        # Správa spred MessageImageBlob: vlastné súbory, žiadny blob.
+        Message.objects.filter(id=source.id).update(image_blob=None)
+        MessageImageBlob.objects.all().delete()
+        source.refresh_from_db()
+
+        with patch.object(default_storage, "save") as save:
+            forwarded = self._forward(source, actor=self.u1, recipients=[self.u3])[0]
+
+        save.assert_not_called()
+        source.refresh_from_db()
+        blob = MessageImageBlob.objects.get()
+        assert source.image_blob_id == blob.id == forwarded.image_blob_id
+        assert self._blob_files(blob) == legacy_names
+        assert blob.ref_count == 2
+
+    def test_message_deleted_during_processing_takes_no_blob_reference(self):
+        first = self._send_image()
+        real_read = message_images._read_processed_image
+
+        def _read_then_delete(message):
+            result = real_read(message)
+            # Súbežné zmazanie správy počas ťažkej práce (bez zámku).
+            Message.objects.filter(id=message.id).update(is_deleted=True)
+            return result
+
+        with patch.object(
+            message_images, "_read_processed_image", side_effect=_read_then_delete
+        ), patch.object(message_images, "_store_blob_files") as store:
+            self._send_image()
+
+        store.assert_not_called()
+        assert MessageImageBlob.objects.get(id=first.image_blob_id).ref_count == 1
+
+    def test_blob_vanishing_before_lock_falls_back_to_own_files(self):
+        first = self._send_image()
+        real_acquire = message_images.acquire_message_image_blob
+
+        def _release_then_acquire(**kwargs):
+            # Posledná referencia zmizne medzi exists() a zamknutou transakciou.
+            delete_message_for_all(
+                conversation=self.conversation, message_id=first.id, actor=self.u1
+            )
+            return real_acquire(**kwargs)
+
+        with patch.object(
+            message_images,
+            "acquire_message_image_blob",
+            side_effect=_release_then_acquire,
+        ):
+            second = self._send_image()
+
+        assert second.image_status == Message.ImageStatus.READY
+        blob = MessageImageBlob.objects.get()
+        assert second.image_blob_id == blob.id != first.image_blob_id
+        assert blob.ref_count == 1
+        assert all(default_storage.exists(name) for name in self._blob_files(blob))
+
+    def test_forward_fails_cleanly_when_blob_vanishes_mid_forward(self):
+        source = self._send_image()
+
+        with patch(
+            "messaging.services.forwarding.acquire_message_image_blob", return_value=None
+        ), pytest.raises(MessageForwardSourceUnavailable):
+            forward_message_to_recipients(
+                actor=self.u1, source_message=source, recipient_user_ids=[self.u3.id]
+            )
+
+        assert not Message.objects.filter(sender=self.u1).exclude(id=source.id).exists()
+        assert MessageImageBlob.objects.get().ref_count == 1
+
+    def test_orphan_cleanup_treats_blob_files_as_referenced(self):
+        source = self._send_image()
+        files = self._blob_files(source.image_blob)
+        Message.objects.filter(id=source.id).update(image="", image_thumbnail="")
+
+        referenced = Command()._referenced_names(files + ["messages/blobs/xx/orphan.png"])
+
+        assert referenced == set(files)
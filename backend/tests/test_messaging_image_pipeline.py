@@ -0,0 +1,209 @@
+"""
+Testy stupňovitého spracovania obrázkov v správach (messaging.services.message_images).
+
+Správa sa uloží so stavom PROCESSING, strip + thumbnail bežia až po commite
+(Celery / inline) a originál s EXIF sa nikdy nevydá.
+"""
+
+import shutil
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from messaging.models import InboxEntry, Message
+from messaging.services.conversations import open_or_create_direct_conversation
+from messaging.services.message_images import (
+    mark_message_image_processing_failed,
+    process_message_image_record,
+)
+from messaging.services.messages import send_message
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestMessageImagePipeline(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.temp_media_root = tempfile.mkdtemp()
+        media_override = override_settings(
+            MEDIA_ROOT=self.temp_media_root,
+            SAFESEARCH_ENABLED=False,
+        )
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.addCleanup(lambda: shutil.rmtree(self.temp_media_root, ignore_errors=True))
+        push_patcher = patch(
+            "messaging.services.push_enqueue.deliver_message_push_task.delay",
+            return_value=None,
+        )
+        push_patcher.start()
+        self.addCleanup(push_patcher.stop)
+        self.sender = User.objects.create_user(
+            username="pipe-sender",
+            email="pipe-sender@example.com",
+            password="StrongPass123",
+            is_active=True,
+            is_verified=True,
+        )
+        self.other = User.objects.create_user(
+            username="pipe-other",
+            email="pipe-other@example.com",
+            password="StrongPass123",
+            is_active=True,
+            is_verified=True,
+        )
+        self.conversation = open_or_create_direct_conversation(
+            actor=self.sender, target=self.other
+        ).conversation
+
+    def _png_upload(self, name="chat.png"):
+        buffer = BytesIO()
+        Image.new("RGB", (4, 4), (0, 128, 255)).save(buffer, format="PNG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+    def _send_without_processing(self):
+        """Pošle správu s obrázkom, ale po commite nič nespracuje."""
+        with patch(
+            "messaging.services.messages.schedule_message_image_processing"
+        ) as schedule:
+            message = send_message(
+                conversation=self.conversation,
+                sender=self.sender,
+                text="",
+                image=self._png_upload(),
+            ).message
+        schedule.assert_called_once_with(message_id=message.id)
+        message.refresh_from_db()
+        return message
+
+    def test_send_commits_processing_row_and_enqueues_task_after_commit(self):
+        with override_settings(MESSAGE_IMAGE_PROCESSING="celery"), patch(
+            "messaging.services.message_images.process_message_image_task.delay"
+        ) as delay:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                message = send_message(
+                    conversation=self.conversation,
+                    sender=self.sender,
+                    text="",
+                    image=self._png_upload(),
+                ).message
+            delay.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        delay.assert_called_once_with(message.id)
+        message.refresh_from_db()
+        assert message.image_status == Message.ImageStatus.PROCESSING
+        assert bool(message.image) is True
+        assert not message.image_thumbnail
+
+    def test_processing_image_is_not_served(self):
+        message = self._send_without_processing()
+        self.client.force_authenticate(self.other)
+
+        response = self.client.get(
+            reverse(
+                "accounts:messaging_message_image",
+                kwargs={"conversation_id": self.conversation.id, "message_id": message.id},
+            )
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_processing_marks_ready_replaces_original_and_notifies(self):
+        message = self._send_without_processing()
+        original_name = message.image.name
+
+        with patch("accounts.realtime.notify_users") as notify:
+            with self.captureOnCommitCallbacks(execute=True):
+                process_message_image_record(message.id)
+
+        message.refresh_from_db()
+        assert message.image_status == Message.ImageStatus.READY
+        assert message.image.name != original_name
+        assert bool(message.image_thumbnail) is True
+        assert not default_storage.exists(original_name)
+        assert default_storage.exists(message.image.name)
+
+        payload = notify.call_args.args[0]
+        url_kwargs = {"conversation_id": self.conversation.id, "message_id": message.id}
+        assert set(payload) == {self.sender.id, self.other.id}
+        assert payload[self.other.id] == {
+            "type": "messaging_message_updated",
+            "conversation_id": self.conversation.id,
+            "message_id": message.id,
+            "image_status": Message.ImageStatus.READY,
+            "image_url": reverse("accounts:messaging_message_image", kwargs=url_kwargs),
+            "image_thumbnail_url": reverse(
+                "accounts:messaging_message_image_thumbnail", kwargs=url_kwargs
+            ),
+        }
+
+    def test_message_deleted_during_processing_discards_outputs(self):
+        message = self._send_without_processing()
+        saved = []
+        real_save = default_storage.save
+
+        def _tracking_save(name, content, *args, **kwargs):
+            stored = real_save(name, content, *args, **kwargs)
+            saved.append(stored)
+            # Súbežné zmazanie správy počas ťažkej práce (bez zámku).
+            Message.objects.filter(id=message.id).update(is_deleted=True)
+            return stored
+
+        with patch.object(default_storage, "save", side_effect=_tracking_save):
+            with self.captureOnCommitCallbacks(execute=True):
+                process_message_image_record(message.id)
+
+        message.refresh_from_db()
+        assert message.image_status == Message.ImageStatus.PROCESSING
+        assert saved
+        assert not any(default_storage.exists(name) for name in saved)
+
+    def test_mark_failed_clears_and_deletes_original(self):
+        message = self._send_without_processing()
+        original_name = message.image.name
+        assert InboxEntry.objects.filter(
+            conversation_id=message.conversation_id, last_message_has_image=True
+        ).exists()
+
+        with patch("accounts.realtime.notify_users"):
+            with self.captureOnCommitCallbacks(execute=True):
+                mark_message_image_processing_failed(message.id)
+
+        message.refresh_from_db()
+        assert message.image_status == Message.ImageStatus.FAILED
+        assert not message.image
+        assert not default_storage.exists(original_name)
+        entries = InboxEntry.objects.filter(conversation_id=message.conversation_id)
+        assert entries.exists()
+        assert not entries.filter(last_message_has_image=True).exists()
+
+    def test_inline_failure_marks_message_failed(self):
+        with override_settings(MESSAGE_IMAGE_PROCESSING="inline"), patch(
+            "messaging.services.message_images.strip_image_metadata",
+            side_effect=OSError("decoder crashed"),
+        ), patch("accounts.realtime.notify_users"):
+            with self.captureOnCommitCallbacks(execute=True):
+                message = send_message(
+                    conversation=self.conversation,
+                    sender=self.sender,
+                    text="",
+                    image=self._png_upload(),
+                ).message
+
+        message.refresh_from_db()
+        assert message.image_status == Message.ImageStatus.FAILED
+        assert not message.image
@@ -0,0 +1,169 @@
+"""Materializované InboxEntry riadky sidebaru + rebuild príkaz."""
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from messaging.models import GroupInvitation, InboxEntry
+from messaging.services.conversations import send_direct_message
+from messaging.services.groups import create_group_conversation, leave_group
+from messaging.services.group_invitations import respond_to_group_invitation
+from messaging.services.messages import (
+    hide_conversation_for_user,
+    mark_conversation_read,
+    send_message,
+    set_conversation_pinned_state_for_user,
+)
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class InboxEntryTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = patch(
+            "messaging.services.push_enqueue.deliver_message_push_task.delay",
+            return_value=None,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.u1, self.u2, self.u3, self.u4 = (
+            User.objects.create_user(
+                username=f"inbox{index}",
+                email=f"inbox{index}@example.com",
+                password="StrongPass123",
+                first_name=f"Inbox{index}",
+                is_public=True,
+            )
+            for index in range(4)
+        )
+
+    def _entry(self, conversation, user):
+        return InboxEntry.objects.get(conversation=conversation, user=user)
+
+    def _list(self, user, **params):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse("accounts:messaging_list_conversations"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.data["results"]
+
+    def test_entries_follow_send_read_pin_and_hide(self):
+        convo = send_direct_message(actor=self.u1, target=self.u2, text="ahoj").conversation
+        send_message(conversation=convo, sender=self.u1, text="druhá")
+        convo.refresh_from_db()
+
+        entry = self._entry(convo, self.u2)
+        self.assertEqual(entry.unread_count, 2)
+        self.assertEqual(entry.last_message_preview, "druhá")
+        self.assertEqual(entry.last_message_sender_id, self.u1.id)
+        self.assertEqual(entry.last_message_at, convo.last_message_at)
+        self.assertEqual(entry.peer_user_id, self.u1.id)
+        self.assertEqual(entry.peer_first_name, "Inbox0")
+        self.assertEqual(self._entry(convo, self.u1).peer_user_id, self.u2.id)
+
+        mark_conversation_read(conversation=convo, user=self.u2)
+        self.assertEqual(self._entry(convo, self.u2).unread_count, 0)
+
+        set_conversation_pinned_state_for_user(conversation=convo, user=self.u2, is_pinned=True)
+        self.assertTrue(self._entry(convo, self.u2).is_pinned)
+        self.assertFalse(self._entry(convo, self.u1).is_pinned)
+
+        hide_conversation_for_user(conversation=convo, user=self.u1)
+        self.assertEqual(self._list(self.u1), [])
+        send_message(conversation=convo, sender=self.u2, text="späť")
+        [item] = self._list(self.u1)
+        self.assertEqual(item["last_message_preview"], "späť")
+        self.assertEqual(item["unread_count"], 1)
+
+    def test_list_orders_pinned_first_and_searches_peer_names(self):
+        first = send_direct_message(actor=self.u2, target=self.u1, text="a").conversation
+        second = send_direct_message(actor=self.u3, target=self.u1, text="b").conversation
+        for convo in (first, second):
+            self.client.force_authenticate(user=self.u1)
+            self.client.post(
+                reverse("accounts:messaging_accept_message_request", args=[convo.id])
+            )
+
+        self.assertEqual([item["id"] for item in self._list(self.u1)], [second.id, first.id])
+        set_conversation_pinned_state_for_user(conversation=first, user=self.u1, is_pinned=True)
+        items = self._list(self.u1)
+        self.assertEqual([item["id"] for item in items], [first.id, second.id])
+        self.assertTrue(items[0]["is_pinned"])
+        self.assertEqual(items[0]["other_user"]["id"], self.u2.id)
+
+        self.assertEqual(
+            [item["id"] for item in self._list(self.u1, search="inbox2")], [second.id]
+        )
+
+    def test_peer_profile_change_updates_entries(self):
+        convo = send_direct_message(actor=self.u1, target=self.u2, text="ahoj").conversation
+
+        self.u2.first_name = "Premenovaný"
+        self.u2.save(update_fields=["first_name"])
+
+        self.assertEqual(self._entry(convo, self.u1).peer_first_name, "Premenovaný")
+        self.u2.save(update_fields=["last_login"])
+        [item] = self._list(self.u1)
+        self.assertIn("Premenovaný", item["other_user"]["display_name"])
+
+    def test_group_membership_changes_refresh_entries(self):
+        group = create_group_conversation(
+            actor=self.u1, name="Skupina", invited_user_ids=[self.u2.id, self.u3.id]
+        ).conversation
+        self.assertEqual(self._entry(group, self.u2).status, "invited")
+        self.assertEqual(self._entry(group, self.u1).participant_count, 1)
+
+        invitation = GroupInvitation.objects.get(conversation=group, invited_user=self.u2)
+        respond_to_group_invitation(invitation=invitation, actor=self.u2, accept=True)
+        self.assertEqual(self._entry(group, self.u2).status, "active")
+        self.assertEqual(self._entry(group, self.u3).participant_count, 2)
+
+        leave_group(conversation=group, actor=self.u2)
+        self.assertEqual(self._entry(group, self.u2).status, "left")
+        self.assertEqual(self._list(self.u2), [])
+
+    def test_list_query_count_does_not_grow_with_conversations(self):
+        send_direct_message(actor=self.u1, target=self.u2, text="a")
+        with CaptureQueriesContext(connection) as single:
+            self._list(self.u1)
+
+        send_direct_message(actor=self.u1, target=self.u3, text="b")
+        send_direct_message(actor=self.u1, target=self.u4, text="c")
+        create_group_conversation(actor=self.u1, name="G", invited_user_ids=[self.u2.id])
+        with CaptureQueriesContext(connection) as many:
+            items = self._list(self.u1)
+
+        self.assertEqual(len(items), 4)
+        self.assertEqual(len(many.captured_queries), len(single.captured_queries))
+        page_sql = [
+            query["sql"]
+            for query in many.captured_queries
+            if "messaging_inboxentry" in query["sql"]
+        ]
+        self.assertEqual(len(page_sql), 1)
+        self.assertNotIn("messaging_message", page_sql[0])
+
+    def test_rebuild_command_repairs_drift_and_orphans(self):
+        convo = send_direct_message(actor=self.u1, target=self.u2, text="a").conversation
+        InboxEntry.objects.filter(conversation=convo).update(
+            unread_count=9, last_message_preview="stale"
+        )
+        orphan = send_direct_message(actor=self.u3, target=self.u4, text="b").conversation
+        orphan.participants.filter(user=self.u4).delete()
+
+        out = StringIO()
+        call_command("rebuild_inbox_entries", stdout=out)
+
+        self.assertIn("zmazané osirelé: 1", out.getvalue())
+        entry = self._entry(convo, self.u2)
+        self.assertEqual((entry.unread_count, entry.last_message_preview), (1, "a"))
+        self.assertFalse(InboxEntry.objects.filter(conversation=orphan, user=self.u4).exists())
@@ -14,6 +14,18 @@ from messaging.models import Conversation, Message
 User = get_user_model()
 
 
+def _notified(notify_users_mock):
+    """(user_id, event) páry zo všetkých batch notify_users volaní."""
+    pairs = []
+    for call in notify_users_mock.call_args_list:
+        (events_by_user,) = call.args
+        for user_id, events in events_by_user.items():
+            if isinstance(events, dict):
+                events = [events]
+            pairs.extend((user_id, event) for event in events)
+    return pairs
+
+
 @pytest.mark.django_db
 class TestMessagingOfferShareApi(APITestCase):
     def setUp(self):
@@ -99,7 +111,7 @@ class TestMessagingOfferShareApi(APITestCase):
     def test_send_offer_share_to_recipient(self):
         self.client.force_authenticate(user=self.sender)
 
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             response = self.client.post(
                 self._url(),
                 {
@@ -128,7 +140,7 @@ class TestMessagingOfferShareApi(APITestCase):
             requested_to=self.recipient,
             request_status=Conversation.RequestStatus.PENDING,
         ).exists()
-        assert [call.args[0] for call in notify_user_mock.call_args_list] == [
+        assert [user_id for user_id, _ in _notified(notify_users_mock)] == [
             self.recipient.id
         ]
 
@@ -136,7 +148,7 @@ class TestMessagingOfferShareApi(APITestCase):
         unavailable_recipient_id = self.sender.id
         self.client.force_authenticate(user=self.sender)
 
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             response = self.client.post(
                 self._url(),
                 {
@@ -166,7 +178,7 @@ class TestMessagingOfferShareApi(APITestCase):
             requested_by=self.sender,
             requested_to=self.sender,
         ).count() == 0
-        assert [call.args[0] for call in notify_user_mock.call_args_list] == [
+        assert [user_id for user_id, _ in _notified(notify_users_mock)] == [
             self.recipient.id
         ]
 
@@ -1,3 +1,7 @@
+import json
+from time import time
+from unittest.mock import patch
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
@@ -6,7 +10,12 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from messaging.models import Conversation, ConversationParticipant
-from messaging.services.presence import get_message_presence_for_users
+from messaging.services.presence import (
+    MESSAGE_PRESENCE_TTL_SECONDS,
+    RedisPresenceBackend,
+    get_message_presence_for_users,
+    get_suppressed_message_push_recipient_ids,
+)
 
 User = get_user_model()
 
@@ -98,3 +107,140 @@ class TestMessagingPresenceApi(APITestCase):
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert get_message_presence_for_users(user_ids=[self.u1.id]) == {}
+
+    def _heartbeat(self, **data):
+        with patch(
+            "messaging.api.notification_dispatch.notify_users"
+        ) as notify_users_mock:
+            response = self.client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        return notify_users_mock
+
+    def test_presence_change_is_published_but_plain_heartbeat_is_not(self):
+        self.client.force_authenticate(user=self.u1)
+
+        entered = self._heartbeat(
+            visible=True, active_conversation_id=self.conversation.id
+        )
+        entered.assert_called_once_with(
+            {
+                self.u2.id: [
+                    {
+                        "type": "messaging_presence",
+                        "conversation_id": self.conversation.id,
+                        "user_id": self.u1.id,
+                        "active": True,
+                    }
+                ]
+            }
+        )
+        assert get_suppressed_message_push_recipient_ids(
+            user_ids=[self.u1.id, self.u2.id], conversation_id=self.conversation.id
+        ) == (self.u1.id,)
+
+        repeated = self._heartbeat(
+            visible=True, active_conversation_id=self.conversation.id
+        )
+        repeated.assert_not_called()
+
+        left = self._heartbeat(visible=False)
+        assert left.call_args.args[0][self.u2.id][0]["active"] is False
+        assert get_suppressed_message_push_recipient_ids(
+            user_ids=[self.u1.id], conversation_id=self.conversation.id
+        ) == ()
+
+
+class _StubPresenceRedis:
+    def __init__(self, state=None, conversation_members=(), script_results=()):
+        self.state = state or {}
+        self.conversation_members = list(conversation_members)
+        self.zrange_calls = []
+        self.script_calls = []
+        self.script_results = list(script_results)
+
+    def hget(self, key, user_id):
+        return self.state.get(user_id)
+
+    def hmget(self, key, user_ids):
+        return [self.state.get(user_id) for user_id in user_ids]
+
+    def register_script(self, source):
+        def _run(*, keys, args):
+            self.script_calls.append((keys, args))
+            return self.script_results.pop(0) if self.script_results else [1]
+
+        return _run
+
+    def zrangebyscore(self, key, minimum, maximum):
+        self.zrange_calls.append((key, minimum, maximum))
+        return self.conversation_members
+
+
+def test_redis_presence_bulk_lookup_is_single_hmget_and_drops_expired():
+    now = int(time())
+    client = _StubPresenceRedis(
+        state={
+            1: json.dumps({"visible": True, "active_conversation_id": 5, "seen_at": now}),
+            2: json.dumps(
+                {
+                    "visible": True,
+                    "active_conversation_id": None,
+                    "seen_at": now - MESSAGE_PRESENCE_TTL_SECONDS - 5,
+                }
+            ),
+            3: b"not-json",
+        }
+    )
+
+    presence = RedisPresenceBackend(client=client).get_many((1, 2, 3, 4))
+
+    assert list(presence) == [1]
+    assert presence[1]["active_conversation_id"] == 5
+
+
+def test_redis_presence_conversation_query_is_one_range_scan():
+    client = _StubPresenceRedis(conversation_members=[b"1", b"2", b"9"])
+    backend = RedisPresenceBackend(client=client)
+
+    active = backend.active_user_ids_in_conversation(7, user_ids=(1, 2, 3), now=1000)
+
+    assert active == {1, 2}
+    ((key, minimum, maximum),) = client.zrange_calls
+    assert key.endswith("msg_presence:conversation:7")
+    assert (minimum, maximum) == (965, "+inf")
+
+
+def test_redis_presence_store_passes_every_touched_key_through_keys():
+    now = int(time())
+    previous = json.dumps({"visible": True, "active_conversation_id": 5, "seen_at": now})
+    client = _StubPresenceRedis(state={1: previous})
+    backend = RedisPresenceBackend(client=client)
+
+    stored_previous = backend.store(
+        1, {"visible": True, "active_conversation_id": 7, "seen_at": now}
+    )
+
+    assert stored_previous["active_conversation_id"] == 5
+    ((keys, args),) = client.script_calls
+    assert keys == [
+        backend.state_key(),
+        backend.seen_key(),
+        backend.conversation_key(7),
+        backend.conversation_key(5),
+    ]
+    # ARGV nenesie žiadny kľúč ani prefix kľúča.
+    assert not any("msg_presence" in str(arg) for arg in args)
+    assert args[4] == "1" and args[5] == previous
+
+
+def test_redis_presence_store_retries_when_state_changed_concurrently():
+    now = int(time())
+    client = _StubPresenceRedis(script_results=[[0], [1]])
+    backend = RedisPresenceBackend(client=client)
+
+    backend.store(1, {"visible": False, "active_conversation_id": None, "seen_at": now})
+
+    assert len(client.script_calls) == 2
+    keys, args = client.script_calls[-1]
+    assert keys == [backend.state_key(), backend.seen_key()]
+    assert args[3:6] == ["", "", ""]
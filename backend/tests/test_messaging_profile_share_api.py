@@ -14,6 +14,18 @@ from messaging.models import Conversation, Message
 User = get_user_model()
 
 
+def _notified(notify_users_mock):
+    """(user_id, event) páry zo všetkých batch notify_users volaní."""
+    pairs = []
+    for call in notify_users_mock.call_args_list:
+        (events_by_user,) = call.args
+        for user_id, events in events_by_user.items():
+            if isinstance(events, dict):
+                events = [events]
+            pairs.extend((user_id, event) for event in events)
+    return pairs
+
+
 @pytest.mark.django_db
 class TestMessagingProfileShareApi(APITestCase):
     def setUp(self):
@@ -65,7 +77,7 @@ class TestMessagingProfileShareApi(APITestCase):
     def test_send_profile_share_to_multiple_recipients(self):
         self.client.force_authenticate(user=self.sender)
 
-        with patch("messaging.api.notification_dispatch.notify_user") as notify_user_mock:
+        with patch("messaging.api.notification_dispatch.notify_users") as notify_users_mock:
             response = self.client.post(
                 self._url(),
                 {
@@ -102,7 +114,7 @@ class TestMessagingProfileShareApi(APITestCase):
             ).count()
             == 2
         )
-        notified_user_ids = [call.args[0] for call in notify_user_mock.call_args_list]
+        notified_user_ids = [user_id for user_id, _ in _notified(notify_users_mock)]
         assert notified_user_ids == [self.recipient.id, self.second_recipient.id]
 
     def test_profile_share_requires_public_active_shared_profile(self):
@@ -0,0 +1,111 @@
+"""Denormalizované ConversationParticipant.unread_count + reconcile príkaz."""
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from messaging.api.view_helpers_unread import (
+    _conversation_unread_messages_count_for_user,
+    _total_unread_messages_count_for_user_id,
+    unread_payload_for_recipients,
+)
+from messaging.models import ConversationParticipant
+from messaging.services.conversations import send_direct_message
+from messaging.services.group_invitations import invite_user_to_group
+from messaging.services.groups import create_group_conversation
+from messaging.services.messages import (
+    delete_message_for_all,
+    mark_conversation_read,
+    send_message,
+)
+from messaging.services.unread_counters import drifted_participants
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        patcher = patch(
+            "messaging.services.push_enqueue.deliver_message_push_task.delay",
+            return_value=None,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.u1, self.u2, self.u3 = (
+            User.objects.create_user(
+                username=f"unread{index}",
+                email=f"unread{index}@example.com",
+                password="StrongPass123",
+                is_public=True,
+            )
+            for index in range(3)
+        )
+
+    def _unread(self, conversation, user):
+        return ConversationParticipant.objects.get(
+            conversation=conversation, user=user
+        ).unread_count
+
+    def _assert_no_drift(self):
+        self.assertEqual(list(drifted_participants().values_list("id", flat=True)), [])
+
+    def test_send_read_and_delete_keep_counter_exact(self):
+        convo = send_direct_message(actor=self.u1, target=self.u2, text="a").conversation
+        second = send_message(conversation=convo, sender=self.u1, text="b").message
+        self.assertEqual(self._unread(convo, self.u2), 2)
+        self.assertEqual(self._unread(convo, self.u1), 0)
+        self._assert_no_drift()
+
+        delete_message_for_all(conversation=convo, message_id=second.id, actor=self.u1)
+        self.assertEqual(self._unread(convo, self.u2), 1)
+        self._assert_no_drift()
+
+        mark_conversation_read(conversation=convo, user=self.u2)
+        self.assertEqual(self._unread(convo, self.u2), 0)
+        self._assert_no_drift()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(_total_unread_messages_count_for_user_id(self.u2.id), 0)
+        self.assertNotIn("messaging_message", ctx.captured_queries[0]["sql"])
+
+    def test_invite_into_group_with_history_counts_existing_messages(self):
+        group = create_group_conversation(
+            actor=self.u1, name="Skupina", invited_user_ids=[self.u2.id]
+        ).conversation
+        send_message(conversation=group, sender=self.u1, text="história")
+        invite_user_to_group(conversation=group, actor=self.u1, invited_user=self.u3)
+
+        # pozvánka u2 + história + vlastná pozvánka; SYSTEM správa sa nepočíta
+        self.assertEqual(self._unread(group, self.u3), 3)
+        self._assert_no_drift()
+        payload = unread_payload_for_recipients(
+            conversation_id=group.id, recipient_user_ids=[self.u3.id]
+        )
+        self.assertEqual(payload[self.u3.id]["conversation_unread_count"], 3)
+        self.assertEqual(
+            _conversation_unread_messages_count_for_user(
+                conversation_id=group.id, user_id=self.u3.id
+            ),
+            3,
+        )
+
+    def test_reconcile_command_repairs_drift(self):
+        convo = send_direct_message(actor=self.u1, target=self.u2, text="a").conversation
+        ConversationParticipant.objects.filter(conversation=convo).update(unread_count=7)
+
+        out = StringIO()
+        call_command("reconcile_unread_counts", "--dry-run", stdout=out)
+        self.assertIn("Drift: 2", out.getvalue())
+        self.assertEqual(self._unread(convo, self.u2), 7)
+
+        call_command("reconcile_unread_counts", stdout=StringIO())
+        self.assertEqual(self._unread(convo, self.u2), 1)
+        self.assertEqual(self._unread(convo, self.u1), 0)
+        self._assert_no_drift()
@@ -14,6 +14,7 @@ from messaging.api.view_helpers_unread import (
     _total_unread_messages_count_for_user,
 )
 from messaging.models import Conversation, ConversationParticipant, Message
+from messaging.services.unread_counters import recompute_unread_counts
 
 User = get_user_model()
 
@@ -75,6 +76,8 @@ class TestHiddenConversationUnread:
             status=ConversationParticipant.Status.ACTIVE,
         )
         Message.objects.create(conversation=convo, sender=sender, text="hi")
+        # Priamy ORM zápis obchádza service vrstvu → dorovnaj unread_count.
+        recompute_unread_counts(convo.participants.all())
         return convo, viewer_p, t0
 
     def test_hidden_conversation_excluded_from_total_unread(self):
@@ -11,9 +11,13 @@ import {
   dispatchMessagingRealtimeRead,
   dispatchMessagingRealtimeMessage,
   dispatchMessagingRealtimeReconnected,
+  dispatchMessagingRealtimeUpdated,
   requestConversationsRefresh,
 } from '@/components/dashboard/modules/messages/messagesEvents';
-import type { MessageItem } from '@/components/dashboard/modules/messages/types';
+import type {
+  MessageImageStatus,
+  MessageItem,
+} from '@/components/dashboard/modules/messages/types';
 import { dispatchNotificationsChanged } from '@/components/dashboard/modules/notifications/useNotificationsFeed';
 import type { DashboardNotification } from '@/components/dashboard/modules/notifications/types';
 import {
@@ -90,6 +94,9 @@ type WsNotificationPayload = {
   deleted_by_id?: number;
   actor_id?: number;
   pinned_message?: MessageItem | null;
+  image_status?: MessageImageStatus | null;
+  image_url?: string | null;
+  image_thumbnail_url?: string | null;
   profile_user_id?: number;
   profile_likes_count?: number;
 };
@@ -832,6 +839,23 @@ export function RequestsNotificationsProvider({
         return;
       }
 
+      // Obrázok správy dobehol na pozadí (READY / FAILED) – otvorené vlákno
+      // si správu prepíše bez refetchu.
+      if (
+        payload.type === 'messaging_message_updated' &&
+        typeof payload.conversation_id === 'number' &&
+        typeof payload.message_id === 'number'
+      ) {
+        dispatchMessagingRealtimeUpdated({
+          conversationId: payload.conversation_id,
+          messageId: payload.message_id,
+          imageStatus: payload.image_status ?? null,
+          imageUrl: payload.image_url ?? null,
+          imageThumbnailUrl: payload.image_thumbnail_url ?? null,
+        });
+        return;
+      }
+
       if (
         payload.type === 'messaging_pinned_message_updated' &&
         typeof payload.conversation_id === 'number' &&
@@ -14,6 +14,7 @@ import {
   MESSAGING_REALTIME_PINNED_MESSAGE_EVENT,
   MESSAGING_REALTIME_READ_EVENT,
   MESSAGING_REALTIME_RECONNECTED_EVENT,
+  MESSAGING_REALTIME_UPDATED_EVENT,
 } from '@/components/dashboard/modules/messages/messagesEvents';
 import {
   PROFILE_OFFER_LIKED_EVENT,
@@ -867,6 +868,47 @@ describe('RequestsNotificationsProvider', () => {
     window.removeEventListener(MESSAGING_REALTIME_DELETED_EVENT, realtimeDeletedSpy);
   });
 
+  it('bridges message image updates into browser events without a conversations refresh', async () => {
+    const conversationsRefreshSpy = jest.fn();
+    const realtimeUpdatedSpy = jest.fn();
+    window.addEventListener(MESSAGING_CONVERSATIONS_REFRESH_EVENT, conversationsRefreshSpy);
+    window.addEventListener(MESSAGING_REALTIME_UPDATED_EVENT, realtimeUpdatedSpy);
+
+    render(
+      <RequestsNotificationsProvider>
+        <Consumer />
+        <MessageConsumer />
+      </RequestsNotificationsProvider>,
+    );
+    await flushAsyncEffects();
+
+    expect(MockWebSocket.instances).toHaveLength(1);
+
+    act(() => {
+      MockWebSocket.instances[0].emitMessage({
+        type: 'messaging_message_updated',
+        conversation_id: 9,
+        message_id: 12,
+        image_status: 'ready',
+        image_url: '/api/auth/messaging/conversations/9/messages/12/image/',
+        image_thumbnail_url: null,
+      });
+    });
+
+    expect(conversationsRefreshSpy).not.toHaveBeenCalled();
+    expect(realtimeUpdatedSpy).toHaveBeenCalledTimes(1);
+    expect(realtimeUpdatedSpy.mock.calls[0][0].detail).toEqual({
+      conversationId: 9,
+      messageId: 12,
+      imageStatus: 'ready',
+      imageUrl: '/api/auth/messaging/conversations/9/messages/12/image/',
+      imageThumbnailUrl: null,
+    });
+
+    window.removeEventListener(MESSAGING_CONVERSATIONS_REFRESH_EVENT, conversationsRefreshSpy);
+    window.removeEventListener(MESSAGING_REALTIME_UPDATED_EVENT, realtimeUpdatedSpy);
+  });
+
   it('bridges pinned-message websocket payloads into browser events for message modules', async () => {
     const conversationsRefreshSpy = jest.fn();
     const realtimePinnedSpy = jest.fn();
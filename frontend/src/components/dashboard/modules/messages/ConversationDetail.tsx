@@ -163,6 +163,7 @@ export function ConversationDetail({
     openConversationActions: actions.openConversationActions,
     hasLoadedMessage,
     markMessageDeletedLocally: thread.markMessageDeletedLocally,
+    applyMessageImageUpdateLocally: thread.applyMessageImageUpdateLocally,
     setPeerLastReadAt: thread.setPeerLastReadAt,
     setMessageActionsTarget: actions.setMessageActionsTarget,
     setMessagePendingDeleteId: actions.setMessagePendingDeleteId,
@@ -281,6 +282,7 @@ export function ConversationDetail({
     'messages.openMessageActions',
     'Otvoriť možnosti správy',
   );
+  const imageProcessingLabel = t('messages.imageProcessing', 'Spracúvam obrázok…');
   const seenLabel = t('messages.seen', 'Prečítané');
   const scrollToBottomLabel = t('messages.scrollToBottom', 'Prejsť na najnovšie správy');
   const chooseImageLabel = t('messages.chooseImage', 'Vybrať obrázok');
@@ -405,6 +407,7 @@ export function ConversationDetail({
         imagePreviewAlt={imagePreviewAlt}
         deletedMessageText={deletedMessageText}
         openImagePreviewLabel={openImagePreviewLabel}
+        imageProcessingLabel={imageProcessingLabel}
         openMessageActionsLabel={openMessageActionsLabel}
         seenLabel={seenLabel}
         selectedMessageId={isMobileMessageActionsOpen ? actions.messageActionsTarget?.messageId ?? null : null}
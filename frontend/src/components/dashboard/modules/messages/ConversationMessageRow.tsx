@@ -33,6 +33,7 @@ type ConversationMessageRowProps = {
   imagePreviewAlt: string;
   deletedMessageText: string;
   openImagePreviewLabel: string;
+  imageProcessingLabel: string;
   openMessageActionsLabel: string;
   seenLabel: string;
   isSelectedForMobileMessageActions: boolean;
@@ -61,6 +62,7 @@ export function ConversationMessageRow({
   imagePreviewAlt,
   deletedMessageText,
   openImagePreviewLabel,
+  imageProcessingLabel,
   openMessageActionsLabel,
   seenLabel,
   isSelectedForMobileMessageActions,
@@ -108,6 +110,9 @@ export function ConversationMessageRow({
       ? resolveMessagingImageUrl(message.image_thumbnail_url)
       : null;
   const messagePreviewImageUrl = messageThumbnailUrl ?? messageImageUrl;
+  // URL príde až s READY (realtime `messaging_message_updated`); dovtedy placeholder.
+  const messageImageProcessing =
+    !message.is_deleted && Boolean(message.has_image) && message.image_status === 'processing';
   const messageLightboxImageUrl = messageImageUrl ?? messagePreviewImageUrl;
   const displayText = message.is_deleted ? deletedMessageText : message.text ?? '';
   const suppressMobileMessageSelection = isMobile && messageHasActions;
@@ -278,6 +283,15 @@ export function ConversationMessageRow({
           />
         </button>
       ) : null}
+      {!isStructuredShareMessage && !messagePreviewImageUrl && messageImageProcessing ? (
+        <div
+          role="status"
+          data-testid={`message-image-processing-${message.id}`}
+          className="flex h-32 w-48 max-w-[min(75vw,18rem)] animate-pulse items-center justify-center rounded-xl bg-black/10 px-3 text-center text-xs opacity-80 dark:bg-white/10"
+        >
+          {imageProcessingLabel}
+        </div>
+      ) : null}
       {!isStructuredShareMessage && displayText ? (
         <MessageTextWithLinks
           text={displayText}
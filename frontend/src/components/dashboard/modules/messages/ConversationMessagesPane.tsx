@@ -22,6 +22,7 @@ type ConversationMessagesPaneProps = {
   imagePreviewAlt: string;
   deletedMessageText: string;
   openImagePreviewLabel: string;
+  imageProcessingLabel: string;
   openMessageActionsLabel: string;
   seenLabel: string;
   selectedMessageId: number | null;
@@ -59,6 +60,7 @@ export function ConversationMessagesPane({
   imagePreviewAlt,
   deletedMessageText,
   openImagePreviewLabel,
+  imageProcessingLabel,
   openMessageActionsLabel,
   seenLabel,
   selectedMessageId,
@@ -112,6 +114,7 @@ export function ConversationMessagesPane({
                   imagePreviewAlt={imagePreviewAlt}
                   deletedMessageText={deletedMessageText}
                   openImagePreviewLabel={openImagePreviewLabel}
+                  imageProcessingLabel={imageProcessingLabel}
                   openMessageActionsLabel={openMessageActionsLabel}
                   seenLabel={seenLabel}
                   isSelectedForMobileMessageActions={isMobile && selectedMessageId === message.id}
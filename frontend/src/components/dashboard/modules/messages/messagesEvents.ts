@@ -1,11 +1,12 @@
 'use client';
 
-import type { MessageItem } from './types';
+import type { MessageImageStatus, MessageItem } from './types';
 
 export const MESSAGING_CONVERSATIONS_REFRESH_EVENT = 'messaging:conversations:refresh';
 export const MESSAGING_REALTIME_MESSAGE_EVENT = 'messaging:realtime:message';
 export const MESSAGING_REALTIME_READ_EVENT = 'messaging:realtime:read';
 export const MESSAGING_REALTIME_DELETED_EVENT = 'messaging:realtime:deleted';
+export const MESSAGING_REALTIME_UPDATED_EVENT = 'messaging:realtime:updated';
 export const MESSAGING_REALTIME_PINNED_MESSAGE_EVENT = 'messaging:realtime:pinned-message';
 export const MESSAGING_REALTIME_GROUP_EVENT = 'messaging:realtime:group';
 export const MESSAGING_REALTIME_RECONNECTED_EVENT = 'messaging:realtime:reconnected';
@@ -35,6 +36,14 @@ export type MessagingRealtimeDeletedPayload = {
   deletedById?: number;
 };
 
+export type MessagingRealtimeUpdatedPayload = {
+  conversationId: number;
+  messageId: number;
+  imageStatus: MessageImageStatus | null;
+  imageUrl: string | null;
+  imageThumbnailUrl: string | null;
+};
+
 export type MessagingRealtimePinnedMessagePayload = {
   conversationId: number;
   pinnedMessage: MessageItem | null;
@@ -115,6 +124,17 @@ export function dispatchMessagingRealtimeDeleted(
   );
 }
 
+export function dispatchMessagingRealtimeUpdated(
+  payload: MessagingRealtimeUpdatedPayload,
+): void {
+  if (typeof window === 'undefined') return;
+  window.dispatchEvent(
+    new CustomEvent<MessagingRealtimeUpdatedPayload>(MESSAGING_REALTIME_UPDATED_EVENT, {
+      detail: payload,
+    }),
+  );
+}
+
 export function dispatchMessagingRealtimePinnedMessage(
   payload: MessagingRealtimePinnedMessagePayload,
 ): void {
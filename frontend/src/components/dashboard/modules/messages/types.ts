@@ -88,6 +88,8 @@ export type ConversationDraft = {
 
 export type OpenConversationResult = ConversationListItem | ConversationDraft;
 
+export type MessageImageStatus = 'processing' | 'ready' | 'failed';
+
 export type MessageItem = {
   id: number;
   conversation: number;
@@ -96,6 +98,7 @@ export type MessageItem = {
   image_url?: string | null;
   image_thumbnail_url?: string | null;
   has_image?: boolean;
+  image_status?: MessageImageStatus | null;
   created_at: string;
   edited_at: string | null;
   is_deleted: boolean;
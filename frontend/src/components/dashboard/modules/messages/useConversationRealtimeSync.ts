@@ -10,12 +10,14 @@ import {
   MESSAGING_REALTIME_PINNED_MESSAGE_EVENT,
   MESSAGING_REALTIME_READ_EVENT,
   MESSAGING_REALTIME_RECONNECTED_EVENT,
+  MESSAGING_REALTIME_UPDATED_EVENT,
   isPassiveMessagingRefreshSuppressed,
   type MessagingRealtimeDeletedPayload,
   type MessagingRealtimeGroupPayload,
   type MessagingRealtimeMessagePayload,
   type MessagingRealtimePinnedMessagePayload,
   type MessagingRealtimeReadPayload,
+  type MessagingRealtimeUpdatedPayload,
 } from './messagesEvents';
 import { MESSAGE_POLL_INTERVAL_MS } from './conversationDetailConstants';
 import { pickLatestTimestamp } from './conversationDetailUtils';
@@ -37,6 +39,7 @@ type UseConversationRealtimeSyncArgs = {
   openConversationActions: (anchorRect: DOMRect | null) => void;
   hasLoadedMessage: (messageId: number) => boolean;
   markMessageDeletedLocally: (messageId: number) => void;
+  applyMessageImageUpdateLocally: (update: MessagingRealtimeUpdatedPayload) => void;
   setPeerLastReadAt: React.Dispatch<React.SetStateAction<string | null>>;
   setMessageActionsTarget: React.Dispatch<React.SetStateAction<MessageActionsTarget>>;
   setMessagePendingDeleteId: React.Dispatch<React.SetStateAction<number | null>>;
@@ -87,6 +90,7 @@ export function useConversationRealtimeSync({
   openConversationActions,
   hasLoadedMessage,
   markMessageDeletedLocally,
+  applyMessageImageUpdateLocally,
   setPeerLastReadAt,
   setMessageActionsTarget,
   setMessagePendingDeleteId,
@@ -303,6 +307,21 @@ export function useConversationRealtimeSync({
     setPinnedMessage,
   ]);
 
+  useEffect(() => {
+    const handleRealtimeUpdated = (event: Event) => {
+      const detail = (event as CustomEvent<MessagingRealtimeUpdatedPayload>).detail;
+      if (!detail || detail.conversationId !== conversationId) return;
+
+      applyMessageImageUpdateLocally(detail);
+    };
+
+    window.addEventListener(MESSAGING_REALTIME_UPDATED_EVENT, handleRealtimeUpdated);
+
+    return () => {
+      window.removeEventListener(MESSAGING_REALTIME_UPDATED_EVENT, handleRealtimeUpdated);
+    };
+  }, [conversationId, applyMessageImageUpdateLocally]);
+
   useEffect(() => {
     const handleRealtimePinnedMessage = (event: Event) => {
       const detail = (event as CustomEvent<MessagingRealtimePinnedMessagePayload>).detail;
@@ -10,7 +10,10 @@ import {
   listMessages,
   updateConversationPinnedMessage,
 } from './messagingApi';
-import { requestConversationsRefresh } from './messagesEvents';
+import {
+  requestConversationsRefresh,
+  type MessagingRealtimeUpdatedPayload,
+} from './messagesEvents';
 import {
   MOBILE_LATEST_SCROLL_THRESHOLD_PX,
   MOBILE_SCROLL_TO_BOTTOM_BUTTON_THRESHOLD_PX,
@@ -90,6 +93,28 @@ export function useConversationThreadController({
     );
     setPinnedMessage((current) => (current?.id === messageId ? null : current));
   }, []);
+  const applyMessageImageUpdateLocally = useCallback(
+    ({ messageId, imageStatus, imageUrl, imageThumbnailUrl }: MessagingRealtimeUpdatedPayload) => {
+      const patchMessage = (item: MessageItem): MessageItem =>
+        item.is_deleted
+          ? item
+          : {
+              ...item,
+              image_status: imageStatus,
+              image_url: imageUrl,
+              image_thumbnail_url: imageThumbnailUrl,
+              // FAILED: backend originál zmazal – správa už obrázok nemá.
+              has_image: imageStatus !== 'failed' && Boolean(item.has_image || imageUrl),
+            };
+      setMessages((current) =>
+        current.map((item) => (item.id === messageId ? patchMessage(item) : item)),
+      );
+      setPinnedMessage((current) =>
+        current?.id === messageId ? patchMessage(current) : current,
+      );
+    },
+    [],
+  );
   const findMessageRowElement = useCallback((messageId: number) => {
     const scrollContainer = messagesScrollRef.current;
     if (!scrollContainer) return null;
@@ -493,6 +518,7 @@ export function useConversationThreadController({
     setPeerLastReadAt,
     setPinnedMessage,
     markMessageDeletedLocally,
+    applyMessageImageUpdateLocally,
     refresh,
     handleUpdatePinnedMessage,
     handlePinnedMessageBannerClick,